@@ -0,0 +1,151 @@
+# benchmark_html_rendering.py
+"""
+HTML rendering benchmark
+Renders every curriculum JSON in a directory through curriculum.html.j2 and
+reports per-document time and peak traced memory for string rendering
+(render the whole document, then write it) against streamed rendering, plus
+the template compile cost with and without the bytecode cache. With
+--legacy REF the f-string builder from that git revision is measured too.
+"""
+
+import sys
+import json
+import time
+import argparse
+import subprocess
+import tempfile
+import tracemalloc
+import importlib.util
+from pathlib import Path
+from types import SimpleNamespace
+
+# Shared ECM services live in the project root package
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from jinja2 import FileSystemBytecodeCache
+
+from ecm.assets import AssetWriter, template_asset
+from ecm.templating import create_environment, render_template, write_template
+from generate_curricula_toggle import EnhancedD4SCurriculumGenerator
+
+TEMPLATE = 'curriculum.html.j2'
+GENERATOR_PATH = 'analysis/scripts/generate_curricula_toggle.py'
+
+
+def _context(curriculum):
+    # Standalone documents, like the f-string builder produced
+    stylesheet = AssetWriter(inline=True).tag(template_asset('curriculum.css'))
+    return EnhancedD4SCurriculumGenerator.curriculum_html_context(curriculum, stylesheet)
+
+
+def render_to_string(curriculum, path):
+    """The whole document is held in memory before it is written"""
+    html_content = render_template(TEMPLATE, **_context(curriculum))
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(html_content)
+
+
+def render_streamed(curriculum, path):
+    write_template(TEMPLATE, path, **_context(curriculum))
+
+
+def load_legacy_renderer(ref, scratch):
+    """save_curriculum_html from the generator at a git revision"""
+    source = subprocess.run(['git', 'show', f'{ref}:{GENERATOR_PATH}'], cwd=PROJECT_ROOT,
+                            capture_output=True, text=True, check=True).stdout
+    module_path = Path(scratch) / 'legacy_generator.py'
+    module_path.write_text(source, encoding='utf-8')
+    spec = importlib.util.spec_from_file_location('legacy_generator', module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    save_curriculum_html = module.EnhancedD4SCurriculumGenerator.save_curriculum_html
+
+    def render(curriculum, path):
+        save_curriculum_html(SimpleNamespace(output_dir=path.parent), curriculum, path.stem)
+    return render
+
+
+def measure(render, curricula, output_dir, repeat):
+    """Mean milliseconds per document and the largest traced peak (KiB)"""
+    render(curricula[0], output_dir / 'warmup.html')
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for i, curriculum in enumerate(curricula):
+            render(curriculum, output_dir / f"{i:03d}.html")
+    milliseconds = 1000 * (time.perf_counter() - started) / (repeat * len(curricula))
+
+    peak = 0
+    for i, curriculum in enumerate(curricula):
+        tracemalloc.start()
+        render(curriculum, output_dir / f"{i:03d}.html")
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return milliseconds, peak / 1024
+
+
+def compile_time(cache_dir=None):
+    """Milliseconds to load the template in a fresh environment"""
+    environment = create_environment(FileSystemBytecodeCache(cache_dir) if cache_dir else None)
+    started = time.perf_counter()
+    environment.get_template(TEMPLATE)
+    return 1000 * (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark string vs streamed HTML rendering')
+    parser.add_argument('--input', default=str(PROJECT_ROOT / 'output' / 'curricula'),
+                        help='Directory with curriculum JSON files')
+    parser.add_argument('--repeat', type=int, default=20,
+                        help='Timed passes over the curricula')
+    parser.add_argument('--legacy', metavar='REF',
+                        help='Also measure the f-string builder from this git revision')
+    args = parser.parse_args()
+
+    # Only the enhanced generator's output fits the template; the generators/ scripts
+    # write their own JSON shape to the same directory
+    curricula = []
+    skipped = 0
+    for json_file in sorted(Path(args.input).glob('*.json')):
+        with open(json_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if isinstance(data, dict) and 'curriculum_identification' in data:
+            curricula.append(data)
+        else:
+            skipped += 1
+    if skipped:
+        print(f"⚠️ Skipped {skipped} JSON files without curriculum_identification")
+    if not curricula:
+        print(f"❌ No curriculum JSON files found in {args.input}")
+        return False
+
+    print(f"📊 Rendering {len(curricula)} curricula x {args.repeat} passes")
+
+    with tempfile.TemporaryDirectory() as scratch:
+        output_dir = Path(scratch)
+        renderers = {}
+        if args.legacy:
+            renderers[f'f-string ({args.legacy})'] = load_legacy_renderer(args.legacy, scratch)
+        renderers['string'] = render_to_string
+        renderers['streamed'] = render_streamed
+        results = {name: measure(render, curricula, output_dir, args.repeat) for name, render in renderers.items()}
+
+        cache_dir = output_dir / 'bytecode'
+        cache_dir.mkdir()
+        compile_time(str(cache_dir))
+        cold = compile_time()
+        cached = compile_time(str(cache_dir))
+
+    width = max(len(name) for name in results)
+    print(f"\n{'mode':<{width}} {'ms/doc':>10} {'peak KiB':>10}")
+    for name, (milliseconds, peak) in results.items():
+        print(f"{name:<{width}} {milliseconds:>10.3f} {peak:>10.1f}")
+    print(f"\n⏱️ Template load: {cold:.1f} ms compiled, {cached:.1f} ms from bytecode cache")
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -6,6 +6,7 @@ Addresses critique: enhanced verb precision, assessment formatting, professional
 
 import json
 import os
+import sys
 from datetime import datetime
 from pathlib import Path
 from docx import Document
@@ -14,6 +15,13 @@ from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.shared import RGBColor
 from docx.oxml.shared import OxmlElement, qn
 
+# Shared ECM services live in the project root package
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from ecm.templating import write_template
+
 class ECMCurriculumGenerator:
     """Generate comprehensive ECM curricula with enhanced precision and professional formatting"""
     
@@ -708,66 +716,8 @@ class ECMCurriculumGenerator:
         
         info = curriculum['curriculum_info']
         
-        html = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{info['title']}</title>
-    <style>
-        body {{ font-family: 'Segoe UI', Arial, sans-serif; margin: 20px; line-height: 1.6; color: #333; }}
-        .header {{ background: linear-gradient(135deg, #1e3c72 0%, #2a5298 100%); color: white; padding: 30px; border-radius: 10px; margin-bottom: 30px; text-align: center; }}
-        .info-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px; margin: 20px 0; }}
-        .info-item {{ background-color: #f8f9fa; padding: 15px; border-radius: 8px; border-left: 4px solid #1e3c72; }}
-        .section {{ margin: 30px 0; }}
-        h1 {{ margin: 0; font-size: 2.2em; }}
-        h2 {{ color: #1e3c72; border-bottom: 2px solid #1e3c72; padding-bottom: 5px; }}
-        h3 {{ color: #495057; }}
-        ul {{ padding-left: 20px; }}
-        li {{ margin: 5px 0; }}
-        .limitation {{ background-color: #fff3cd; padding: 15px; border-radius: 5px; border-left: 4px solid #ffc107; margin: 15px 0; }}
-        .module {{ background-color: #e3f2fd; padding: 15px; margin: 10px 0; border-radius: 8px; }}
-        .note-box {{ background: #e7f3ff; border-left: 4px solid #007bff; padding: 15px; margin: 15px 0; }}
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>{info['title']}</h1>
-        <p>EQF Level {info['eqf_level']} | {info['target_ects']} ECTS Credits | {info['total_hours']} Hours</p>
-        <p>Specialization: {info['specialization']}</p>
-    </div>
-    
-    <div class="info-grid">
-        <div class="info-item">
-            <strong>Delivery Mode</strong><br>
-            {info['delivery']}
-        </div>
-        <div class="info-item">
-            <strong>Modules</strong><br>
-            {len(info['modules'])} Modules
-        </div>
-        <div class="info-item">
-            <strong>Study Hours</strong><br>
-            {info['total_hours']} total hours
-        </div>
-        <div class="info-item">
-            <strong>Generated</strong><br>
-            {info['generated_date'][:19]}
-        </div>
-    </div>
-    
-    <footer style="text-align: center; margin-top: 40px; padding: 20px; background-color: #f8f9fa; border-radius: 8px;">
-        <p><em>Professional curriculum with comprehensive EQF alignment and framework integration</em></p>
-        <p><em>Enhanced with precision competency mapping, visual assessment matrices, and stakeholder validation</em></p>
-    </footer>
-</body>
-</html>
-"""
-        
         html_file = self.output_dir / f"{filename_base}.html"
-        with open(html_file, 'w', encoding='utf-8') as f:
-            f.write(html)
+        write_template('generators/curricula_v2.html.j2', html_file, info=info)
         return html_file
     
     def save_curriculum(self, curriculum, filename_base, curriculum_number):
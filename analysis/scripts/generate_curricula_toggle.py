@@ -28,19 +28,42 @@ ALIGNS WITH TASK OBJECTIVES T3.2/T3.4:
 
 import json
 import os
+import sys
 import argparse
 from datetime import datetime
+from io import BytesIO
 from pathlib import Path
-from docx import Document
 from docx.shared import Inches, Pt
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.shared import RGBColor
 from docx.enum.style import WD_STYLE_TYPE
 
+# Shared ECM services live in the project root package
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from ecm.catalog import get_catalog_snapshot
+from ecm.module_table import ModuleTable
+from ecm.ects_solver import solve_ects_selection
+from ecm.pareto import ParetoProblem, pareto_fronts
+from ecm.prerequisites import PrerequisiteGraph
+from ecm.templating import render_template, write_template
+from ecm.assets import AssetWriter, template_asset
+from ecm.docx_templates import open_base_document
+from ecm.docx_blocks import (
+    PageBreak as DocxPageBreak, Paragraph as DocxParagraph, Run as DocxRun, Table as DocxTable,
+    add_blocks, heading as docx_heading, labelled
+)
+from ecm.docx_stream import write_docx
+from ecm.metrics import timed
+from ecm.tracing import add_profile_arguments, traced, tracing
+
 class EnhancedD4SCurriculumGenerator:
     """Generate curricula addressing ALL critique points with enhanced educational standards"""
     
-    def __init__(self, config_path='config/settings.json', visual_mapping=True):
+    def __init__(self, config_path='config/settings.json', visual_mapping=True, catalog=None, inline_assets=False,
+                 docx_backend='python-docx'):
         print("=== Digital4Sustainability Curriculum Generator - ENHANCED v2.0 ===")
         print("✓ REMOVED all DigComp references")
         print("✓ REMOVED EU frameworks alignment statement")
@@ -55,10 +78,17 @@ class EnhancedD4SCurriculumGenerator:
         print("✓ CREATED competence-based learning unit catalog")
         
         self.visual_mapping = visual_mapping
+        self.inline_assets = inline_assets
+        self.docx_backend = docx_backend
+        self.config_path = config_path
         self.config = self.load_config(config_path)
         self.setup_paths()
         
-        # Load learning units data - NO FALLBACKS
+        # Shared stylesheets go to output/curricula/assets unless inlined
+        self.assets = AssetWriter(self.output_dir, inline=inline_assets)
+        
+        # Load learning units data from the shared catalog snapshot - NO FALLBACKS
+        self.catalog_snapshot = catalog
         self.learning_units_data = self.load_learning_units_data()
         self.validate_data_integrity()
         
@@ -81,6 +111,8 @@ class EnhancedD4SCurriculumGenerator:
         print(f"✓ Created competence-based catalog with {len(self.learning_unit_catalog)} learning units")
         print(f"✓ Defined {len(self.curricula_specs)} curricula with standardised WBL")
         print(f"✓ Visual mapping: {'Enabled' if visual_mapping else 'Disabled'}")
+        print(f"✓ HTML assets: {'Inline' if inline_assets else 'Linked'}")
+        print(f"✓ DOCX backend: {docx_backend}")
     
     def create_competence_based_catalog(self):
         """Create competence-based learning unit catalog for flexible pathways"""
@@ -144,6 +176,12 @@ class EnhancedD4SCurriculumGenerator:
         if eqf_level >= 7:
             prerequisites.append("Professional experience in sustainability domain")
         
+        # Catalog prerequisites from the compiled graph (self-references dropped)
+        prerequisite_graph = PrerequisiteGraph.for_snapshot(self.catalog_snapshot)
+        for prerequisite_id in prerequisite_graph.prerequisites_of(learning_unit.get('id'), transitive=False):
+            prerequisite_name = self.catalog_snapshot.by_id[prerequisite_id].get('name', prerequisite_id)
+            prerequisites.append(f"Learning unit {prerequisite_id}: {prerequisite_name}")
+        
         return prerequisites
     
     def determine_pathway_options(self, learning_unit):
@@ -577,50 +615,36 @@ class EnhancedD4SCurriculumGenerator:
         return extended_descriptions.get(curriculum_spec['id'], 
             f"This curriculum prepares learners to develop expertise in {curriculum_spec.get('title', 'professional sustainability')} within digital sustainability contexts.")
     
-    def select_appropriate_learning_units_strict_eqf(self, curriculum_spec):
-        """Select learning units with STRICT EQF compliance and standardised WBL (minimum 20%)"""
-        role_id = curriculum_spec['role_id']
+    def eligibility_window(self, curriculum_spec):
+        """EQF window and role relevance threshold for a curriculum's learning units"""
         eqf_level = curriculum_spec['eqf_level']
-        target_ects = curriculum_spec['ects']
         
         # STRICT EQF filtering - maximum 1 level below programme
         min_eqf_level = max(eqf_level - 1, 4)  # Never below EQF 4
         max_eqf_level = eqf_level
         
-        # Filter learning units with strict EQF compliance - NO FALLBACKS
-        suitable_learning_units = []
-        defined_roles = set(self.roles.keys())  # Only use roles defined in the code
+        # Role relevance threshold
+        min_relevance = 50 if curriculum_spec['ects'] <= 2.0 else 60
         
-        for learning_unit in self.learning_units_data:
-            learning_unit_eqf = learning_unit.get('eqf_level', 6)
-            
-            # Get role relevance, filtering for only defined roles
-            learning_unit_role_relevance = learning_unit.get('role_relevance', {})
-            role_relevance = learning_unit_role_relevance.get(role_id, 0)
-            
-            # STRICT EQF compliance - only learning units at programme level or 1 below
-            if learning_unit_eqf < min_eqf_level or learning_unit_eqf > max_eqf_level:
-                continue
-                
-            # Role relevance threshold
-            min_relevance = 50 if target_ects <= 2.0 else 60
-            if role_relevance < min_relevance:
-                continue
-                
-            suitable_learning_units.append({
-                'learning_unit': learning_unit,
-                'relevance': role_relevance,
-                'ects': learning_unit.get('ects_points', 5),
-                'eqf_level': learning_unit_eqf
-            })
+        return min_eqf_level, max_eqf_level, min_relevance
+    
+    @timed('select_learning_units')
+    def select_appropriate_learning_units_strict_eqf(self, curriculum_spec):
+        """Select learning units with STRICT EQF compliance and standardised WBL (minimum 20%)"""
+        role_id = curriculum_spec['role_id']
+        eqf_level = curriculum_spec['eqf_level']
+        target_ects = curriculum_spec['ects']
+        min_eqf_level, max_eqf_level, min_relevance = self.eligibility_window(curriculum_spec)
+        
+        # Filter learning units with strict EQF compliance - NO FALLBACKS
+        # (vectorised: EQF window + relevance mask, sorted by relevance)
+        module_table = ModuleTable.for_snapshot(self.catalog_snapshot)
+        ranked_rows = module_table.rank(role_id, min_eqf_level, max_eqf_level, min_relevance)
         
         # NO FALLBACKS - fail if no suitable learning units
-        if not suitable_learning_units:
+        if len(ranked_rows) == 0:
             raise ValueError(f"No EQF-compliant learning units found for {curriculum_spec['id']} (EQF {eqf_level}). Check modules_v5.json data.")
         
-        # Sort by relevance
-        suitable_learning_units.sort(key=lambda x: x['relevance'], reverse=True)
-        
         # Calculate target learning units based on ECTS
         if target_ects <= 1.0:
             target_learning_units = 1
@@ -633,13 +657,41 @@ class EnhancedD4SCurriculumGenerator:
         else:
             target_learning_units = min(25, max(8, int(target_ects / 8)))
         
-        # Select learning units to meet ECTS target
+        # Greedy allocation in relevance order (partial ECTS for the last unit)
+        greedy_selection = self._select_learning_units_greedy(
+            ranked_rows[:target_learning_units * 2], role_id, target_ects
+        )
+        
+        # Exact selection: most relevant ECTS within the target and the unit count window;
+        # the greedy result is kept when the solver is infeasible, out of time or not better
+        max_units = target_learning_units * 2
+        selection = solve_ects_selection(
+            module_table.ects[ranked_rows],
+            module_table.role_relevance(role_id)[ranked_rows],
+            target_ects,
+            min_units=min(max(1, target_learning_units // 2), len(ranked_rows)),
+            max_units=max_units
+        )
+        if selection is None or not selection.indices:
+            return greedy_selection
+        
+        solved_selection = self._allocate_solved_learning_units(
+            ranked_rows, selection.indices, role_id, target_ects, max_units
+        )
+        if self._allocated_relevance(solved_selection[0]) <= self._allocated_relevance(greedy_selection[0]):
+            return greedy_selection
+        return solved_selection
+    
+    def _select_learning_units_greedy(self, candidate_rows, role_id, target_ects):
+        """Fill the ECTS target in relevance order"""
         selected_learning_units = []
         allocated_ects = 0
         
-        for learning_unit_data in suitable_learning_units[:target_learning_units * 2]:
+        for row in candidate_rows:
             if allocated_ects >= target_ects:
                 break
+            
+            learning_unit_data = self._learning_unit_selection_entry(row, role_id)
                 
             learning_unit_ects = learning_unit_data['ects']
             remaining_ects = target_ects - allocated_ects
@@ -663,6 +715,52 @@ class EnhancedD4SCurriculumGenerator:
         
         return selected_learning_units, allocated_ects
     
+    @staticmethod
+    def _allocated_relevance(selected_learning_units):
+        """Role relevance weighted by allocated ECTS"""
+        return sum(unit['relevance'] * unit['allocated_ects'] for unit in selected_learning_units)
+    
+    def _learning_unit_selection_entry(self, row, role_id):
+        """Selection record for one catalog row"""
+        learning_unit = self.learning_units_data[row]
+        return {
+            'learning_unit': learning_unit,
+            'relevance': learning_unit.get('role_relevance', {}).get(role_id, 0),
+            'ects': learning_unit.get('ects_points', 5),
+            'eqf_level': learning_unit.get('eqf_level', 6)
+        }
+    
+    def _allocate_solved_learning_units(self, ranked_rows, solved_positions, role_id, target_ects, max_units):
+        """Allocate full ECTS to the solver's units, topping up any remainder with a partial unit"""
+        selected_learning_units = []
+        allocated_ects = 0
+        
+        for position in solved_positions:
+            learning_unit_data = self._learning_unit_selection_entry(ranked_rows[position], role_id)
+            selected_learning_units.append({
+                **learning_unit_data,
+                'allocated_ects': learning_unit_data['ects']
+            })
+            allocated_ects += learning_unit_data['ects']
+        
+        # Remaining ECTS below any whole unit: partial allocation of the best unused unit
+        remaining_ects = target_ects - allocated_ects
+        if remaining_ects >= 0.25 and len(selected_learning_units) < max_units:
+            solved = set(solved_positions)
+            for position, row in enumerate(ranked_rows):
+                if position in solved:
+                    continue
+                learning_unit_data = self._learning_unit_selection_entry(row, role_id)
+                allocated_ects_for_learning_unit = min(learning_unit_data['ects'], remaining_ects)
+                selected_learning_units.append({
+                    **learning_unit_data,
+                    'allocated_ects': allocated_ects_for_learning_unit
+                })
+                allocated_ects += allocated_ects_for_learning_unit
+                break
+        
+        return selected_learning_units, allocated_ects
+    
     def create_authentic_learning_outcomes(self, learning_unit_data, learning_unit_number, curriculum_spec):
         """Create authentic, role-specific learning outcomes with direct framework mapping"""
         learning_unit = learning_unit_data['learning_unit']
@@ -811,6 +909,9 @@ class EnhancedD4SCurriculumGenerator:
         
         return outcomes
     
+    @timed('learning_unit_info', args=lambda self, unit, number, spec: {
+        'learning_unit': unit['learning_unit'].get('id'), 'number': number
+    })
     def create_detailed_learning_unit_info(self, learning_unit_data, learning_unit_number, curriculum_spec):
         """Create detailed learning unit information with standardised WBL (minimum 20%)"""
         learning_unit = learning_unit_data['learning_unit']
@@ -870,6 +971,7 @@ class EnhancedD4SCurriculumGenerator:
             'catalog_reference': self.learning_unit_catalog.get(learning_unit.get('id', 'UNKNOWN'), {})
         }
     
+    @timed('assessment_strategies')
     def define_curriculum_assessment_strategies(self, curriculum_spec):
         """Define unique assessment strategies for each curriculum (British spelling)"""
         
@@ -957,6 +1059,7 @@ class EnhancedD4SCurriculumGenerator:
             'wbl_component': 'Workplace project and professional development'
         })
     
+    @traced('curriculum', 'curriculum', args=lambda self, spec: {'id': spec['id'], 'ects': spec['ects']})
     def generate_curriculum(self, curriculum_spec):
         """Generate a complete curriculum with standardised WBL and flexible pathways"""
         try:
@@ -1084,8 +1187,7 @@ class EnhancedD4SCurriculumGenerator:
         
         # JSON file
         json_path = self.output_dir / f"{filename}.json"
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(curriculum, f, indent=2, ensure_ascii=False)
+        json_path.write_bytes(self.render_json(curriculum))
         
         # HTML file  
         html_path = self.save_curriculum_html(curriculum, filename)
@@ -1095,524 +1197,49 @@ class EnhancedD4SCurriculumGenerator:
         
         return [json_path, html_path, docx_path]
     
-    def save_curriculum_html(self, curriculum, filename):
-        """Save curriculum as professional HTML with learning unit terminology and WBL features"""
-        info = curriculum['curriculum_identification']
-        role_profile = curriculum['role_profile']
-        assessment = curriculum['assessment_framework']
-        delivery = curriculum['delivery_framework']
-        dual_education = curriculum.get('dual_education_model', {})
-        flexible_pathways = curriculum.get('flexible_learning_pathways', {})
-        
-        # Generate current date for footer
-        current_date = datetime.now().strftime("%B %d, %Y")
-        
-        html_content = f"""
-<!DOCTYPE html>
-<html lang="en-GB">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{info['formatted_title']}</title>
-    <style>
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            line-height: 1.6;
-            color: #333;
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 20px;
-            background-color: #fafafa;
-        }}
-        
-        .header {{
-            background: linear-gradient(135deg, #2c5530, #1e3a5f);
-            color: white;
-            padding: 2.5rem;
-            border-radius: 12px;
-            margin-bottom: 2.5rem;
-            text-align: center;
-            box-shadow: 0 4px 20px rgba(0,0,0,0.15);
-        }}
-        
-        .header h1 {{
-            font-size: 2.8rem;
-            margin-bottom: 1rem;
-            font-weight: 600;
-        }}
-        
-        .pathway-guidance {{
-            background: rgba(255,255,255,0.15);
-            padding: 1.5rem;
-            border-radius: 8px;
-            margin: 1.5rem 0;
-            text-align: left;
-            border-left: 4px solid rgba(255,255,255,0.6);
-        }}
-        
-        .pathway-guidance h3 {{
-            margin-top: 0;
-            color: rgba(255,255,255,0.9);
-            font-size: 1.1rem;
-        }}
-        
-        .professional-context {{
-            background: rgba(255,255,255,0.1);
-            padding: 1.5rem;
-            border-radius: 8px;
-            margin: 1rem 0;
-            text-align: left;
-            border-left: 4px solid rgba(255,255,255,0.5);
-        }}
-        
-        .metrics {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(160px, 1fr));
-            gap: 1.5rem;
-            margin: 2.5rem 0;
-        }}
-        
-        .metric-card {{
-            background: white;
-            padding: 2rem;
-            border-radius: 10px;
-            text-align: center;
-            box-shadow: 0 3px 15px rgba(0,0,0,0.1);
-            border-left: 4px solid #28a745;
-            transition: transform 0.2s ease;
-        }}
-        
-        .metric-card:hover {{
-            transform: translateY(-2px);
-        }}
-        
-        .metric-value {{
-            font-size: 1.8rem;
-            font-weight: bold;
-            color: #2c5530;
-            margin-bottom: 0.5rem;
-        }}
-        
-        .metric-label {{
-            font-size: 0.9rem;
-            color: #666;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }}
-        
-        .section {{
-            background: white;
-            padding: 2.5rem;
-            margin-bottom: 2.5rem;
-            border-radius: 12px;
-            box-shadow: 0 3px 20px rgba(0,0,0,0.08);
-        }}
-        
-        .section h2 {{
-            color: #2c5530;
-            border-bottom: 3px solid #28a745;
-            padding-bottom: 0.8rem;
-            margin-bottom: 2rem;
-            font-size: 1.8rem;
-        }}
-        
-        .section h3 {{
-            color: #2c5530;
-            margin-top: 2rem;
-            margin-bottom: 1rem;
-            font-size: 1.3rem;
-        }}
-        
-        .learning-unit-card {{
-            background: #f8f9fa;
-            border: 1px solid #dee2e6;
-            border-radius: 10px;
-            padding: 2rem;
-            margin-bottom: 2rem;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.05);
-        }}
-        
-        .learning-unit-header {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 1.5rem;
-            flex-wrap: wrap;
-            gap: 1rem;
-        }}
-        
-        .learning-unit-title {{
-            color: #2c5530;
-            font-size: 1.3rem;
-            font-weight: 600;
-        }}
-        
-        .badges {{
-            display: flex;
-            gap: 0.5rem;
-            flex-wrap: wrap;
-        }}
-        
-        .ects-badge {{
-            background: #28a745;
-            color: white;
-            padding: 0.4rem 1rem;
-            border-radius: 20px;
-            font-size: 0.9rem;
-            font-weight: 500;
-        }}
-        
-        .eqf-badge {{
-            background: #17a2b8;
-            color: white;
-            padding: 0.4rem 1rem;
-            border-radius: 20px;
-            font-size: 0.9rem;
-            font-weight: 500;
-        }}
-        
-        .wbl-badge {{
-            background: #fd7e14;
-            color: white;
-            padding: 0.4rem 1rem;
-            border-radius: 20px;
-            font-size: 0.9rem;
-            font-weight: 500;
-        }}
-        
-        .workload-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(120px, 1fr));
-            gap: 1.5rem;
-            margin: 1.5rem 0;
-        }}
-        
-        .workload-item {{
-            text-align: center;
-            padding: 1rem;
-            background: white;
-            border-radius: 8px;
-            border: 1px solid #dee2e6;
-            box-shadow: 0 1px 5px rgba(0,0,0,0.05);
-        }}
-        
-        .workload-value {{
-            font-weight: bold;
-            color: #2c5530;
-            font-size: 1.2rem;
-        }}
-        
-        .workload-label {{
-            font-size: 0.8rem;
-            color: #666;
-            margin-top: 0.3rem;
-        }}
-        
-        .learning-outcomes {{
-            background: linear-gradient(135deg, #e3f2fd, #f3e5f5);
-            border-left: 4px solid #28a745;
-            border-radius: 8px;
-            padding: 1.5rem;
-            margin: 1.5rem 0;
-        }}
-        
-        .learning-outcomes h4 {{
-            margin-top: 0;
-            color: #2c5530;
-            margin-bottom: 1rem;
-        }}
-        
-        .outcome-item {{
-            margin: 1rem 0;
-            padding: 1rem;
-            background: rgba(255,255,255,0.7);
-            border-radius: 6px;
-            border-left: 3px solid #28a745;
-        }}
-        
-        .outcome-text {{
-            margin-bottom: 0.5rem;
-            line-height: 1.5;
-        }}
-        
-        .framework-mapping {{
-            font-size: 0.85rem;
-            color: #666;
-            font-style: italic;
-            margin-top: 0.5rem;
-        }}
-        
-        .pathway-note {{
-            background: #e8f5e8;
-            border: 1px solid #c3e6c3;
-            border-radius: 6px;
-            padding: 1rem;
-            margin: 1rem 0;
-            font-style: italic;
-            color: #2c5530;
-        }}
-        
-        .wbl-section {{
-            background: #fff3cd;
-            border: 1px solid #ffeaa7;
-            border-radius: 6px;
-            padding: 1rem;
-            margin: 1rem 0;
-            color: #856404;
-        }}
-        
-        .footer {{
-            margin-top: 3rem;
-            padding: 2rem;
-            text-align: center;
-            font-size: 0.9rem;
-            color: #666;
-            border-top: 2px solid #e9ecef;
-            background: white;
-            border-radius: 8px;
-        }}
-        
-        @media (max-width: 768px) {{
-            .header h1 {{ font-size: 2.2rem; }}
-            .metrics {{ grid-template-columns: 1fr; }}
-            .learning-unit-header {{ flex-direction: column; align-items: flex-start; }}
-            .badges {{ justify-content: flex-start; }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>{info['formatted_title']}</h1>
-        
-        <div class="pathway-guidance">
-            <h3>Learning Pathway Position</h3>
-            {info.get('pathway_position', 'Professional development pathway')}
-        </div>
-        
-        <div class="professional-context">
-            {role_profile['professional_context']}
-        </div>
-        
-        <div class="metrics">
-            <div class="metric-card">
-                <div class="metric-value">{info['total_learning_units']}</div>
-                <div class="metric-label">Learning Units</div>
-            </div>
-            <div class="metric-card">
-                <div class="metric-value">EQF {info['eqf_level']}</div>
-                <div class="metric-label">Level</div>
-            </div>
-            <div class="metric-card">
-                <div class="metric-value">{info['total_ects']}</div>
-                <div class="metric-label">ECTS</div>
-            </div>
-            <div class="metric-card">
-                <div class="metric-value">{delivery['wbl_percentage']:.1f}%</div>
-                <div class="metric-label">Work-Based</div>
-            </div>
-        </div>
-    </div>
-    
-    <div class="section">
-        <h2>Programme Overview</h2>
-        <p><strong>Role Focus:</strong> {role_profile['focus']}</p>
-        <p><strong>Target Audience:</strong> {curriculum['target_audience']}</p>
-        <p><strong>Learning Approach:</strong> {curriculum['learning_approach']}</p>
-        <p><strong>Core Tools & Platforms:</strong> {', '.join(role_profile.get('core_tools', []))}</p>
-    </div>
-    
-    <div class="section">
-        <h2>Competence Frameworks Alignment</h2>
-        <h3>GreenComp Framework</h3>
-        <p>{', '.join(curriculum['competence_frameworks_alignment']['greencomp'])}</p>
-        
-        <h3>e-CF Framework (Detailed Mapping)</h3>
-        <ul>"""
-        
-        for ecf_code, ecf_description in curriculum['competence_frameworks_alignment']['ecf_detailed'].items():
-            html_content += f"<li><strong>{ecf_code}:</strong> {ecf_description}</li>"
-        
-        html_content += f"""
-        </ul>
-        
-        <div class="pathway-note">
-            <strong>Framework Note:</strong> {curriculum['competence_frameworks_alignment']['framework_note']}
-        </div>
-    </div>
-    
-    <div class="section">
-        <h2>Dual Education Model & Work-Based Learning</h2>
-        <div class="wbl-section">
-            <h3>WBL Compliance</h3>
-            <p>{dual_education.get('wbl_compliance', 'Standardised work-based learning integration')}</p>
-        </div>
-        
-        <h3>Model Implementation</h3>
-        <ul>"""
-        
-        if 'model_implementation' in dual_education:
-            for key, value in dual_education['model_implementation'].items():
-                html_content += f"<li><strong>{key.replace('_', ' ').title()}:</strong> {value}</li>"
-        
-        html_content += f"""
-        </ul>
-        
-        <h3>Quality Assurance</h3>
-        <ul>"""
-        
-        if 'quality_assurance' in dual_education:
-            for key, value in dual_education['quality_assurance'].items():
-                html_content += f"<li><strong>{key.replace('_', ' ').title()}:</strong> {value}</li>"
-        
-        html_content += f"""
-        </ul>
-    </div>
+    @staticmethod
+    def curriculum_html_context(curriculum, stylesheet):
+        """Template variables for curriculum.html.j2"""
+        return {
+            'curriculum': curriculum,
+            'stylesheet': stylesheet,
+            'info': curriculum['curriculum_identification'],
+            'role_profile': curriculum['role_profile'],
+            'assessment': curriculum['assessment_framework'],
+            'delivery': curriculum['delivery_framework'],
+            'dual_education': curriculum.get('dual_education_model', {}),
+            'flexible_pathways': curriculum.get('flexible_learning_pathways', {}),
+            # Generate current date for footer
+            'current_date': datetime.now().strftime("%B %d, %Y")
+        }
     
-    <div class="section">
-        <h2>Flexible Learning Pathways</h2>
-        <ul>"""
-        
-        for key, value in flexible_pathways.items():
-            html_content += f"<li><strong>{key.replace('_', ' ').title()}:</strong> {value}</li>"
-        
-        html_content += f"""
-        </ul>
-    </div>
+    @timed('render_json')
+    def render_json(self, curriculum):
+        """Curriculum JSON as UTF-8 bytes"""
+        return json.dumps(curriculum, indent=2, ensure_ascii=False).encode('utf-8')
     
-    <div class="section">
-        <h2>Assessment Framework</h2>
-        <p><strong>Primary Method:</strong> {assessment['primary']}</p>
-        <p><strong>Work-Based Component:</strong> {assessment.get('wbl_component', 'Workplace assessment integration')}</p>
-        <p><strong>Components:</strong></p>
-        <ul>"""
-        
-        for i, component in enumerate(assessment['components']):
-            weighting = assessment['weightings'][i]
-            html_content += f"<li>{component}: <strong>{weighting}%</strong></li>"
-        
-        html_content += f"""
-        </ul>
-        <p><strong>Rationale:</strong> {assessment['rationale']}</p>
-    </div>
+    @timed('render_html')
+    def render_html(self, curriculum):
+        """Standalone curriculum HTML as UTF-8 bytes; the stylesheet is always inlined"""
+        stylesheet = AssetWriter(inline=True).tag(template_asset('curriculum.css'))
+        return render_template('curriculum.html.j2', **self.curriculum_html_context(curriculum, stylesheet)).encode('utf-8')
     
-    <div class="section">
-        <h2>Delivery Framework</h2>
-        <div class="workload-grid">
-            <div class="workload-item">
-                <div class="workload-value">{delivery['total_contact_hours']}h</div>
-                <div class="workload-label">Contact Hours</div>
-            </div>
-            <div class="workload-item">
-                <div class="workload-value">{delivery['total_self_study_hours']}h</div>
-                <div class="workload-label">Self-Study</div>
-            </div>
-            <div class="workload-item">
-                <div class="workload-value">{delivery['total_workplace_hours']}h</div>
-                <div class="workload-label">Workplace</div>
-            </div>
-            <div class="workload-item">
-                <div class="workload-value">{delivery['wbl_percentage']:.1f}%</div>
-                <div class="workload-label">WBL %</div>
-            </div>
-        </div>
-        <p><strong>Work-Based Learning:</strong> {'Integrated (exceeds 20% minimum)' if delivery['work_based_learning'] else 'Not applicable'}</p>
-        <p><strong>Dual Education Model:</strong> {'Implemented' if delivery['dual_principle_applicable'] else 'Not applicable'}</p>
-    </div>
+    def render_docx(self, curriculum):
+        """Curriculum DOCX as bytes, built without touching the output directory"""
+        buffer = BytesIO()
+        self.write_curriculum_docx(curriculum, buffer)
+        return buffer.getvalue()
     
-    <div class="section">
-        <h2>Learning Unit Structure</h2>"""
-        
-        for learning_unit in curriculum['learning_units']:
-            html_content += f"""
-        <div class="learning-unit-card">
-            <div class="learning-unit-header">
-                <div class="learning-unit-title">Learning Unit {learning_unit['learning_unit_number']}: {learning_unit['learning_unit_title']}</div>
-                <div class="badges">
-                    <span class="ects-badge">{learning_unit['ects_credits']} ECTS</span>
-                    <span class="eqf-badge">EQF {learning_unit['eqf_level']}</span>
-                    <span class="wbl-badge">{learning_unit['wbl_percentage']}% WBL</span>
-                </div>
-            </div>
-            
-            <p><strong>Description:</strong> {learning_unit['learning_unit_description']}</p>
-            <p><strong>Thematic Area:</strong> {learning_unit['thematic_area']}</p>
-            
-            <div class="pathway-note">
-                {learning_unit.get('pathway_guidance', 'Professional development learning unit')}
-            </div>
-            
-            <div class="wbl-section">
-                <strong>Work-Based Learning Integration:</strong>
-                <ul>"""
-            
-            wbl_integration = learning_unit.get('dual_education_integration', {})
-            workplace_activities = wbl_integration.get('workplace_activities', [])
-            for activity in workplace_activities[:3]:  # Show first 3 activities
-                html_content += f"<li>{activity}</li>"
-            
-            html_content += f"""
-                </ul>
-                <p><strong>Employer Partnerships:</strong> {wbl_integration.get('employer_partnerships', 'Professional sector partnerships')}</p>
-            </div>
-            
-            <div class="workload-grid">
-                <div class="workload-item">
-                    <div class="workload-value">{learning_unit['total_workload_hours']}h</div>
-                    <div class="workload-label">Total</div>
-                </div>
-                <div class="workload-item">
-                    <div class="workload-value">{learning_unit['contact_hours']}h</div>
-                    <div class="workload-label">Contact</div>
-                </div>
-                <div class="workload-item">
-                    <div class="workload-value">{learning_unit['self_study_hours']}h</div>
-                    <div class="workload-label">Self-Study</div>
-                </div>
-                <div class="workload-item">
-                    <div class="workload-value">{learning_unit['workplace_hours']}h</div>
-                    <div class="workload-label">Workplace</div>
-                </div>
-            </div>
-            
-            <div class="learning-outcomes">
-                <h4>Learning Outcomes</h4>
-                
-                <div class="outcome-item">
-                    <div class="outcome-text"><strong>Knowledge:</strong> {learning_unit['learning_outcomes']['knowledge']}</div>
-                    <div class="framework-mapping">{learning_unit['learning_outcomes']['framework_mapping']['knowledge_framework']}</div>
-                </div>
-                
-                <div class="outcome-item">
-                    <div class="outcome-text"><strong>Skills:</strong> {learning_unit['learning_outcomes']['skills']}</div>
-                    <div class="framework-mapping">{learning_unit['learning_outcomes']['framework_mapping']['skills_framework']}</div>
-                </div>
-                
-                <div class="outcome-item">
-                    <div class="outcome-text"><strong>Competence:</strong> {learning_unit['learning_outcomes']['competence']}</div>
-                    <div class="framework-mapping">{learning_unit['learning_outcomes']['framework_mapping']['competence_framework']}</div>
-                </div>
-            </div>
-        </div>"""
-        
-        html_content += f"""
-    </div>
-    
-    <div class="footer">
-        Educational Curriculum Modeller (ECM) - Version 2.0 - {current_date}
-    </div>
-</body>
-</html>"""
-        
+    @timed('render_html')
+    def save_curriculum_html(self, curriculum, filename):
+        """Save curriculum as professional HTML with learning unit terminology and WBL features"""
         html_path = self.output_dir / f"{filename}.html"
-        with open(html_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        return html_path
+        stylesheet = self.assets.tag(template_asset('curriculum.css'))
+        return write_template('curriculum.html.j2', html_path, **self.curriculum_html_context(curriculum, stylesheet))
     
-    def save_curriculum_docx(self, curriculum, filename):
-        """Save curriculum as professional DOCX with learning unit terminology and WBL features"""
-        doc = Document()
-        
-        # Create custom styles for better formatting
+    @staticmethod
+    def create_curriculum_docx_styles(doc):
+        """Custom styles of the curriculum DOCX base template"""
         styles = doc.styles
         
         # Enhanced heading styles
@@ -1628,141 +1255,96 @@ class EnhancedD4SCurriculumGenerator:
         style = doc.styles['Normal']
         style.font.name = 'Calibri'
         style.font.size = Pt(11)
-        
+    
+    def curriculum_docx_blocks(self, curriculum):
+        """Document blocks of the curriculum DOCX, rendered by either DOCX backend"""
         info = curriculum['curriculum_identification']
         role_profile = curriculum['role_profile']
         dual_education = curriculum.get('dual_education_model', {})
         flexible_pathways = curriculum.get('flexible_learning_pathways', {})
+        blocks = []
         
         # Title with enhanced formatting
-        title = doc.add_heading(info['formatted_title'], 0)
-        title.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        blocks.append(DocxParagraph((DocxRun(info['formatted_title']),), 'Title', WD_ALIGN_PARAGRAPH.CENTER))
         
         # Add pathway guidance prominently
-        pathway_para = doc.add_paragraph()
-        pathway_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        pathway_run = pathway_para.add_run(f"Learning Pathway: {info.get('pathway_position', 'Professional development pathway')}")
-        pathway_run.font.size = Pt(12)
-        pathway_run.font.bold = True
-        pathway_run.font.color.rgb = RGBColor(102, 102, 102)
+        blocks.append(DocxParagraph((
+            DocxRun(f"Learning Pathway: {info.get('pathway_position', 'Professional development pathway')}",
+                    bold=True, size=12, color='666666'),
+        ), alignment=WD_ALIGN_PARAGRAPH.CENTER))
         
         # Extended professional context
-        context_para = doc.add_paragraph()
-        context_para.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-        context_run = context_para.add_run(role_profile['professional_context'])
-        context_run.font.size = Pt(12)
+        blocks.append(DocxParagraph((DocxRun(role_profile['professional_context'], size=12),),
+                                    alignment=WD_ALIGN_PARAGRAPH.JUSTIFY))
         
         # Programme metrics with better spacing
-        doc.add_paragraph()
-        metrics_para = doc.add_paragraph()
-        metrics_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        metrics_run = metrics_para.add_run(
-            f"EQF Level {info['eqf_level']} | {info['total_ects']} ECTS | {info['total_learning_units']} Learning Units | "
-            f"Work-Based Learning: {curriculum['delivery_framework']['wbl_percentage']:.1f}% (exceeds 20% minimum)"
-        )
-        metrics_run.font.size = Pt(10)
-        metrics_run.font.color.rgb = RGBColor(102, 102, 102)
+        blocks.append(DocxParagraph())
+        blocks.append(DocxParagraph((
+            DocxRun(
+                f"EQF Level {info['eqf_level']} | {info['total_ects']} ECTS | {info['total_learning_units']} Learning Units | "
+                f"Work-Based Learning: {curriculum['delivery_framework']['wbl_percentage']:.1f}% (exceeds 20% minimum)",
+                size=10, color='666666'
+            ),
+        ), alignment=WD_ALIGN_PARAGRAPH.CENTER))
         
-        doc.add_paragraph()
-        doc.add_paragraph()  # Better spacing
+        blocks.append(DocxParagraph())
+        blocks.append(DocxParagraph())  # Better spacing
         
         # Programme Overview with enhanced formatting
-        doc.add_heading('Programme Overview', level=1)
-        
-        focus_para = doc.add_paragraph()
-        focus_para.add_run('Role Focus: ').bold = True
-        focus_para.add_run(role_profile['focus'])
-        
-        target_para = doc.add_paragraph()
-        target_para.add_run('Target Audience: ').bold = True
-        target_para.add_run(curriculum['target_audience'])
-        
-        approach_para = doc.add_paragraph()
-        approach_para.add_run('Learning Approach: ').bold = True
-        approach_para.add_run(curriculum['learning_approach'])
-        
-        tools_para = doc.add_paragraph()
-        tools_para.add_run('Core Tools & Platforms: ').bold = True
-        tools_para.add_run(', '.join(role_profile.get('core_tools', [])))
+        blocks.append(docx_heading('Programme Overview', level=1))
+        blocks.append(labelled('Role Focus: ', role_profile['focus']))
+        blocks.append(labelled('Target Audience: ', curriculum['target_audience']))
+        blocks.append(labelled('Learning Approach: ', curriculum['learning_approach']))
+        blocks.append(labelled('Core Tools & Platforms: ', ', '.join(role_profile.get('core_tools', []))))
         
         # Competence Frameworks Alignment (NO DIGCOMP)
-        doc.add_heading('Competence Frameworks Alignment', level=1)
+        blocks.append(docx_heading('Competence Frameworks Alignment', level=1))
+        blocks.append(labelled('GreenComp Framework: ', ', '.join(curriculum['competence_frameworks_alignment']['greencomp'])))
         
-        greencomp_para = doc.add_paragraph()
-        greencomp_para.add_run('GreenComp Framework: ').bold = True
-        greencomp_para.add_run(', '.join(curriculum['competence_frameworks_alignment']['greencomp']))
-        
-        doc.add_heading('e-CF Framework (Detailed Mapping)', level=2)
+        blocks.append(docx_heading('e-CF Framework (Detailed Mapping)', level=2))
         for ecf_code, ecf_description in curriculum['competence_frameworks_alignment']['ecf_detailed'].items():
-            ecf_para = doc.add_paragraph()
-            ecf_para.add_run(f'{ecf_code}: ').bold = True
-            ecf_para.add_run(ecf_description)
+            blocks.append(labelled(f'{ecf_code}: ', ecf_description))
         
-        framework_note_para = doc.add_paragraph()
-        framework_note_run = framework_note_para.add_run(curriculum['competence_frameworks_alignment']['framework_note'])
-        framework_note_run.italic = True
+        blocks.append(DocxParagraph((DocxRun(curriculum['competence_frameworks_alignment']['framework_note'], italic=True),)))
         
         # Dual Education Model & Work-Based Learning
-        doc.add_heading('Dual Education Model & Work-Based Learning', level=1)
-        
-        wbl_compliance_para = doc.add_paragraph()
-        wbl_compliance_para.add_run('WBL Compliance: ').bold = True
-        wbl_compliance_para.add_run(dual_education.get('wbl_compliance', 'Standardised work-based learning integration'))
+        blocks.append(docx_heading('Dual Education Model & Work-Based Learning', level=1))
+        blocks.append(labelled('WBL Compliance: ', dual_education.get('wbl_compliance', 'Standardised work-based learning integration')))
         
         if 'model_implementation' in dual_education:
-            doc.add_heading('Model Implementation', level=2)
+            blocks.append(docx_heading('Model Implementation', level=2))
             for key, value in dual_education['model_implementation'].items():
-                impl_para = doc.add_paragraph()
-                impl_para.add_run(f'{key.replace("_", " ").title()}: ').bold = True
-                impl_para.add_run(str(value))
+                blocks.append(labelled(f'{key.replace("_", " ").title()}: ', str(value)))
         
         if 'quality_assurance' in dual_education:
-            doc.add_heading('Quality Assurance', level=2)
+            blocks.append(docx_heading('Quality Assurance', level=2))
             for key, value in dual_education['quality_assurance'].items():
-                qa_para = doc.add_paragraph()
-                qa_para.add_run(f'{key.replace("_", " ").title()}: ').bold = True
-                qa_para.add_run(str(value))
+                blocks.append(labelled(f'{key.replace("_", " ").title()}: ', str(value)))
         
         # Flexible Learning Pathways
-        doc.add_heading('Flexible Learning Pathways', level=1)
+        blocks.append(docx_heading('Flexible Learning Pathways', level=1))
         for key, value in flexible_pathways.items():
-            pathway_para = doc.add_paragraph()
-            pathway_para.add_run(f'{key.replace("_", " ").title()}: ').bold = True
-            pathway_para.add_run(str(value))
+            blocks.append(labelled(f'{key.replace("_", " ").title()}: ', str(value)))
         
         # Assessment Framework with better formatting
-        doc.add_heading('Assessment Framework', level=1)
+        blocks.append(docx_heading('Assessment Framework', level=1))
         assessment = curriculum['assessment_framework']
         
-        method_para = doc.add_paragraph()
-        method_para.add_run('Primary Method: ').bold = True
-        method_para.add_run(assessment['primary'])
-        
-        wbl_component_para = doc.add_paragraph()
-        wbl_component_para.add_run('Work-Based Component: ').bold = True
-        wbl_component_para.add_run(assessment.get('wbl_component', 'Workplace assessment integration'))
-        
-        components_para = doc.add_paragraph()
-        components_para.add_run('Assessment Components:').bold = True
+        blocks.append(labelled('Primary Method: ', assessment['primary']))
+        blocks.append(labelled('Work-Based Component: ', assessment.get('wbl_component', 'Workplace assessment integration')))
+        blocks.append(DocxParagraph((DocxRun('Assessment Components:', bold=True),)))
         
         for i, component in enumerate(assessment['components']):
             weighting = assessment['weightings'][i]
-            comp_para = doc.add_paragraph()
-            comp_para.add_run(f"• {component}: ").bold = True
-            comp_para.add_run(f"{weighting}%")
+            blocks.append(labelled(f"• {component}: ", f"{weighting}%"))
         
-        rationale_para = doc.add_paragraph()
-        rationale_para.add_run('Rationale: ').bold = True
-        rationale_para.add_run(assessment['rationale'])
+        blocks.append(labelled('Rationale: ', assessment['rationale']))
         
         # Delivery Framework with enhanced table
-        doc.add_heading('Delivery Framework', level=1)
+        blocks.append(docx_heading('Delivery Framework', level=1))
         delivery = curriculum['delivery_framework']
         
         # Enhanced workload summary table
-        workload_table = doc.add_table(rows=6, cols=2)
-        workload_table.style = 'Table Grid'
-        
         workload_data = [
             ('Total Contact Hours', f"{delivery['total_contact_hours']} hours"),
             ('Self-Study Hours', f"{delivery['total_self_study_hours']} hours"),
@@ -1771,30 +1353,21 @@ class EnhancedD4SCurriculumGenerator:
             ('Work-Based Learning', 'Integrated (dual education model)' if delivery['work_based_learning'] else 'Not applicable'),
             ('Delivery Methods', ', '.join(delivery['delivery_methods']))
         ]
-        
-        for i, (label, value) in enumerate(workload_data):
-            workload_table.cell(i, 0).text = label
-            workload_table.cell(i, 1).text = value
-            # Make labels bold
-            workload_table.cell(i, 0).paragraphs[0].runs[0].bold = True
+        blocks.append(self._docx_label_table(workload_data))
         
         # Learning Unit Structure with enhanced formatting
-        doc.add_heading('Learning Unit Structure', level=1)
+        blocks.append(docx_heading('Learning Unit Structure', level=1))
         
         for learning_unit in curriculum['learning_units']:
             # Learning unit heading with better spacing
-            doc.add_heading(f"Learning Unit {learning_unit['learning_unit_number']}: {learning_unit['learning_unit_title']}", level=2)
+            blocks.append(docx_heading(f"Learning Unit {learning_unit['learning_unit_number']}: {learning_unit['learning_unit_title']}", level=2))
             
             # Add pathway guidance
-            pathway_para = doc.add_paragraph()
-            pathway_run = pathway_para.add_run(learning_unit.get('pathway_guidance', 'Professional development learning unit'))
-            pathway_run.italic = True
-            pathway_run.font.color.rgb = RGBColor(102, 102, 102)
+            blocks.append(DocxParagraph((
+                DocxRun(learning_unit.get('pathway_guidance', 'Professional development learning unit'), italic=True, color='666666'),
+            )))
             
             # Enhanced learning unit details table
-            unit_table = doc.add_table(rows=8, cols=2)
-            unit_table.style = 'Table Grid'
-            
             unit_details = [
                 ('ECTS Credits', str(learning_unit['ects_credits'])),
                 ('EQF Level', f"{learning_unit['eqf_level']} (Programme: {info['eqf_level']})"),
@@ -1805,73 +1378,85 @@ class EnhancedD4SCurriculumGenerator:
                 ('WBL Percentage', f"{learning_unit['wbl_percentage']}%"),
                 ('Thematic Area', learning_unit['thematic_area'])
             ]
-            
-            for i, (label, value) in enumerate(unit_details):
-                unit_table.cell(i, 0).text = label
-                unit_table.cell(i, 1).text = value
-                # Make labels bold
-                unit_table.cell(i, 0).paragraphs[0].runs[0].bold = True
+            blocks.append(self._docx_label_table(unit_details))
             
             # Description
-            desc_para = doc.add_paragraph()
-            desc_para.add_run('Description: ').bold = True
-            desc_para.add_run(learning_unit['learning_unit_description'])
+            blocks.append(labelled('Description: ', learning_unit['learning_unit_description']))
             
             # Work-Based Learning Integration
-            doc.add_heading('Work-Based Learning Integration', level=3)
+            blocks.append(docx_heading('Work-Based Learning Integration', level=3))
             wbl_integration = learning_unit.get('dual_education_integration', {})
             
-            employer_para = doc.add_paragraph()
-            employer_para.add_run('Employer Partnerships: ').bold = True
-            employer_para.add_run(wbl_integration.get('employer_partnerships', 'Professional sector partnerships'))
-            
-            mentor_para = doc.add_paragraph()
-            mentor_para.add_run('Mentor Support: ').bold = True
-            mentor_para.add_run(wbl_integration.get('mentor_support', 'Workplace mentor assigned'))
+            blocks.append(labelled('Employer Partnerships: ', wbl_integration.get('employer_partnerships', 'Professional sector partnerships')))
+            blocks.append(labelled('Mentor Support: ', wbl_integration.get('mentor_support', 'Workplace mentor assigned')))
             
             workplace_activities = wbl_integration.get('workplace_activities', [])
             if workplace_activities:
-                activities_para = doc.add_paragraph()
-                activities_para.add_run('Workplace Activities:').bold = True
+                blocks.append(DocxParagraph((DocxRun('Workplace Activities:', bold=True),)))
                 for activity in workplace_activities[:3]:  # Show first 3
-                    activity_para = doc.add_paragraph()
-                    activity_para.add_run(f"• {activity}")
+                    blocks.append(DocxParagraph((DocxRun(f"• {activity}"),)))
             
             # Learning outcomes with framework mapping
-            doc.add_heading('Learning Outcomes', level=3)
+            blocks.append(docx_heading('Learning Outcomes', level=3))
             outcomes = learning_unit['learning_outcomes']
             
             for outcome_type, outcome_text in outcomes.items():
                 if outcome_type != 'framework_mapping':  # Skip the framework_mapping dict
-                    outcome_para = doc.add_paragraph()
-                    outcome_para.add_run(f"{outcome_type.title()}: ").bold = True
-                    outcome_para.add_run(outcome_text)
+                    blocks.append(labelled(f"{outcome_type.title()}: ", outcome_text))
                     
                     # Add framework mapping
                     if 'framework_mapping' in outcomes:
                         framework_key = f"{outcome_type}_framework"
                         if framework_key in outcomes['framework_mapping']:
-                            framework_para = doc.add_paragraph()
-                            framework_run = framework_para.add_run(f"   Framework: {outcomes['framework_mapping'][framework_key]}")
-                            framework_run.font.size = Pt(9)
-                            framework_run.font.color.rgb = RGBColor(102, 102, 102)
-                            framework_run.italic = True
+                            blocks.append(DocxParagraph((
+                                DocxRun(f"   Framework: {outcomes['framework_mapping'][framework_key]}",
+                                        italic=True, size=9, color='666666'),
+                            )))
         
         # Enhanced ECM footer
-        doc.add_page_break()
-        footer_para = doc.add_paragraph()
-        footer_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        blocks.append(DocxPageBreak())
         current_date = datetime.now().strftime("%B %d, %Y")
-        footer_run = footer_para.add_run(f"Educational Curriculum Modeller (ECM) - Version 2.0 - {current_date}")
-        footer_run.font.size = Pt(10)
-        footer_run.font.color.rgb = RGBColor(102, 102, 102)
+        blocks.append(DocxParagraph((
+            DocxRun(f"Educational Curriculum Modeller (ECM) - Version 2.0 - {current_date}", size=10, color='666666'),
+        ), alignment=WD_ALIGN_PARAGRAPH.CENTER))
         
+        return blocks
+    
+    @staticmethod
+    def _docx_label_table(rows):
+        """Two-column Table Grid with bold labels"""
+        return DocxTable(tuple(
+            (DocxParagraph((DocxRun(label, bold=True),)), DocxParagraph((DocxRun(value),)))
+            for label, value in rows
+        ), 'Table Grid')
+    
+    @timed('render_docx')
+    def write_curriculum_docx(self, curriculum, target):
+        """Write the curriculum DOCX to a path or binary file object"""
+        blocks = self.curriculum_docx_blocks(curriculum)
+        
+        if self.docx_backend == 'stream':
+            # Body XML streamed straight into the .docx, other parts copied from the base template
+            write_docx(target, blocks, 'd4s_curriculum', self.create_curriculum_docx_styles)
+        else:
+            # Styled once per process, then opened from the cached base template
+            doc = open_base_document('d4s_curriculum', self.create_curriculum_docx_styles)
+            add_blocks(doc, blocks)
+            doc.save(target)
+    
+    def save_curriculum_docx(self, curriculum, filename):
+        """Save curriculum as professional DOCX with learning unit terminology and WBL features"""
         docx_path = self.output_dir / f"{filename}.docx"
-        doc.save(docx_path)
+        self.write_curriculum_docx(curriculum, str(docx_path))
         return docx_path
     
-    def generate_all_curricula(self):
-        """Generate all 10 curricula with standardised WBL and flexible pathways"""
+    def generate_all_curricula(self, jobs=1):
+        """Generate all 10 curricula with standardised WBL and flexible pathways
+        
+        With jobs > 1 the curricula specs are fanned out to a process pool whose
+        workers each hold a warm generator; results are reported in spec order
+        and a failing spec does not abort the rest of the batch.
+        """
         print(f"\n=== GENERATING ENHANCED DIGITAL4SUSTAINABILITY CURRICULA v2.0 ===")
         print("✓ REMOVED all DigComp references")
         print("✓ REMOVED EU frameworks alignment statement")
@@ -1889,46 +1474,52 @@ class EnhancedD4SCurriculumGenerator:
         role_distribution = {}
         eqf_distribution = {}
         wbl_compliance = []
+        failed_specs = []
+        total_specs = len(self.curricula_specs)
         
         for curriculum_spec in self.curricula_specs:
             role_id = curriculum_spec['role_id']
             eqf_level = curriculum_spec['eqf_level']
             
-            print(f"\n[{curriculum_spec['number']}/10] Generating: {curriculum_spec['title']}")
-            
             # Track distributions
             role_distribution[role_id] = role_distribution.get(role_id, 0) + 1
             eqf_distribution[eqf_level] = eqf_distribution.get(eqf_level, 0) + 1
+        
+        if jobs > 1:
+            results = self.generate_curricula_batch(self.curricula_specs, jobs)
+        else:
+            results = []
+            for curriculum_spec in self.curricula_specs:
+                print(f"\n[{curriculum_spec['number']}/{total_specs}] Generating: {curriculum_spec['title']}")
+                try:
+                    results.append(self.generate_and_save_curriculum(curriculum_spec, isolate_errors=False))
+                except Exception as e:
+                    print(f"Error generating {curriculum_spec['id']}: {e}")
+                    import traceback
+                    traceback.print_exc()
+                    raise
+        
+        for result in results:
+            curriculum_spec = result['spec']
             
-            try:
-                # Generate curriculum
-                curriculum = self.generate_curriculum(curriculum_spec)
-                
-                # Track WBL compliance
-                wbl_percentage = curriculum['delivery_framework']['wbl_percentage']
-                wbl_compliance.append(wbl_percentage)
-                
-                # Save with exact filename format
-                files = self.save_curriculum_files(curriculum, curriculum_spec['filename'])
-                generated_files.extend(files)
-                
-                info = curriculum['curriculum_identification']
-                delivery = curriculum['delivery_framework']
-                
-                print(f"✓ {info['total_ects']} ECTS | {info['total_learning_units']} learning units | {delivery['wbl_percentage']:.1f}% WBL")
-                print(f"  Title: {info['formatted_title']}")
-                print(f"  Pathway: {info.get('pathway_position', 'Professional pathway')}")
-                print(f"  Files: {curriculum_spec['filename']}.json, {curriculum_spec['filename']}.html, {curriculum_spec['filename']}.docx")
-                
-            except Exception as e:
-                print(f"Error generating {curriculum_spec['id']}: {e}")
-                import traceback
-                traceback.print_exc()
-                raise
+            if result['error']:
+                failed_specs.append(curriculum_spec['id'])
+                continue
+            
+            # Track WBL compliance
+            wbl_compliance.append(result['wbl_percentage'])
+            generated_files.extend(result['files'])
+            
+            print(f"✓ [{curriculum_spec['number']}/{total_specs}] {result['total_ects']} ECTS | {result['total_learning_units']} learning units | {result['wbl_percentage']:.1f}% WBL")
+            print(f"  Title: {result['formatted_title']}")
+            print(f"  Pathway: {result['pathway_position']}")
+            print(f"  Files: {curriculum_spec['filename']}.json, {curriculum_spec['filename']}.html, {curriculum_spec['filename']}.docx")
         
         print(f"\n=== GENERATION COMPLETE - ALL REQUIREMENTS ADDRESSED ===")
-        print(f"✓ Generated {len(self.curricula_specs)} curricula with standardised features")
+        print(f"✓ Generated {total_specs - len(failed_specs)} curricula with standardised features")
         print(f"✓ Created {len(generated_files)} files (3 per curriculum)")
+        if failed_specs:
+            print(f"❌ Failed curricula ({len(failed_specs)}): {', '.join(failed_specs)}")
         
         print("\n📊 ROLE DISTRIBUTION:")
         for role_id, count in role_distribution.items():
@@ -1941,13 +1532,16 @@ class EnhancedD4SCurriculumGenerator:
             print(f"   • EQF Level {eqf_level}: {count} programmes")
         
         print("\n📊 WORK-BASED LEARNING COMPLIANCE:")
-        avg_wbl = sum(wbl_compliance) / len(wbl_compliance)
-        min_wbl = min(wbl_compliance)
-        max_wbl = max(wbl_compliance)
-        print(f"   • Average WBL: {avg_wbl:.1f}%")
-        print(f"   • Minimum WBL: {min_wbl:.1f}% (target: ≥20%)")
-        print(f"   • Maximum WBL: {max_wbl:.1f}%")
-        print(f"   • Compliance: {'✅ All programmes exceed 20%' if min_wbl >= 20 else '❌ Some programmes below 20%'}")
+        if wbl_compliance:
+            avg_wbl = sum(wbl_compliance) / len(wbl_compliance)
+            min_wbl = min(wbl_compliance)
+            max_wbl = max(wbl_compliance)
+            print(f"   • Average WBL: {avg_wbl:.1f}%")
+            print(f"   • Minimum WBL: {min_wbl:.1f}% (target: ≥20%)")
+            print(f"   • Maximum WBL: {max_wbl:.1f}%")
+            print(f"   • Compliance: {'✅ All programmes exceed 20%' if min_wbl >= 20 else '❌ Some programmes below 20%'}")
+        else:
+            print("   • No curricula generated")
         
         print(f"\n✓ Output directory: {self.output_dir}")
         print(f"✓ Competence-based catalog created with {len(self.learning_unit_catalog)} learning units")
@@ -1970,7 +1564,136 @@ class EnhancedD4SCurriculumGenerator:
         
         return generated_files
     
+    def generate_and_save_curriculum(self, curriculum_spec, isolate_errors=True):
+        """Generate and save a single curriculum, returning a picklable result record
+        
+        With isolate_errors the exception is captured in the record instead of raised.
+        """
+        result = {
+            'spec': curriculum_spec,
+            'files': [],
+            'error': None,
+            'traceback': None
+        }
+        
+        try:
+            curriculum = self.generate_curriculum(curriculum_spec)
+            files = self.save_curriculum_files(curriculum, curriculum_spec['filename'])
+            
+            info = curriculum['curriculum_identification']
+            result.update({
+                'files': [str(path) for path in files],
+                'total_ects': info['total_ects'],
+                'total_learning_units': info['total_learning_units'],
+                'formatted_title': info['formatted_title'],
+                'pathway_position': info.get('pathway_position', 'Professional pathway'),
+                'wbl_percentage': curriculum['delivery_framework']['wbl_percentage']
+            })
+        except Exception as e:
+            if not isolate_errors:
+                raise
+            import traceback
+            result['error'] = f"{type(e).__name__}: {e}"
+            result['traceback'] = traceback.format_exc()
+        
+        return result
+    
+    def iter_curricula_artifacts(self, curricula_specs=None):
+        """Yield (filename, bytes) for each curriculum's JSON, HTML and DOCX as soon as it is generated
+        
+        Nothing is written to disk; a failing spec is reported and skipped so the
+        remaining curricula still come through.
+        """
+        curricula_specs = self.curricula_specs if curricula_specs is None else curricula_specs
+        
+        for curriculum_spec in curricula_specs:
+            try:
+                curriculum = self.generate_curriculum(curriculum_spec)
+                artifacts = [
+                    (f"{curriculum_spec['filename']}.json", self.render_json(curriculum)),
+                    (f"{curriculum_spec['filename']}.html", self.render_html(curriculum)),
+                    (f"{curriculum_spec['filename']}.docx", self.render_docx(curriculum))
+                ]
+            except Exception as e:
+                print(f"❌ {curriculum_spec['id']} failed: {type(e).__name__}: {e}")
+                continue
+            yield from artifacts
+    
+    def generate_curricula_batch(self, curricula_specs, jobs):
+        """Generate curricula in a process pool; results are returned in spec order"""
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+        
+        total_specs = len(curricula_specs)
+        jobs = max(1, min(jobs, total_specs))
+        results = [None] * total_specs
+        
+        print(f"\n⚡ Batch mode: {total_specs} curricula across {jobs} worker processes")
+        
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_batch_worker,
+            initargs=(self.config_path, self.visual_mapping, self.inline_assets, self.docx_backend)
+        ) as executor:
+            futures = {
+                executor.submit(_generate_spec_in_worker, curriculum_spec): index
+                for index, curriculum_spec in enumerate(curricula_specs)
+            }
+            
+            for future in as_completed(futures):
+                index = futures[future]
+                curriculum_spec = curricula_specs[index]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    # Worker crashed (e.g. killed); isolate the failure to this spec
+                    result = {
+                        'spec': curriculum_spec,
+                        'files': [],
+                        'error': f"{type(e).__name__}: {e}",
+                        'traceback': None
+                    }
+                results[index] = result
+                
+                if result['error']:
+                    print(f"❌ [{curriculum_spec['number']}/{total_specs}] {curriculum_spec['id']} failed: {result['error']}")
+                    if result['traceback']:
+                        print(result['traceback'])
+                else:
+                    print(f"  ✓ Finished [{curriculum_spec['number']}/{total_specs}] {curriculum_spec['title']}")
+        
+        return results
+    
     # Utility methods (NO FALLBACKS)
+    def generate_pareto_fronts(self, jobs=1, **search_options):
+        """Non-dominated learning unit selections (coverage vs ECTS vs sharing) for every spec"""
+        problems = []
+        for curriculum_spec in self.curricula_specs:
+            min_eqf_level, max_eqf_level, min_relevance = self.eligibility_window(curriculum_spec)
+            problems.append(ParetoProblem(
+                spec_id=curriculum_spec['id'],
+                role_id=curriculum_spec['role_id'],
+                target_ects=curriculum_spec['ects'],
+                min_eqf=min_eqf_level,
+                max_eqf=max_eqf_level,
+                min_relevance=min_relevance
+            ))
+        
+        print(f"\n🔀 Pareto search for {len(problems)} curricula (jobs: {jobs})")
+        fronts = pareto_fronts(self.catalog_snapshot, problems, jobs=jobs, **search_options)
+        for front in fronts:
+            print(f"   {front['spec_id']}: {len(front['front'])} non-dominated selections "
+                  f"from {front['candidate_units']} candidate learning units")
+        
+        return {
+            'catalog_version': self.catalog_snapshot.version,
+            'objectives': {
+                'coverage': 'maximise - relevance-weighted share of the target ECTS',
+                'total_ects': 'minimise - ECTS used (never above the target)',
+                'sharing': 'maximise - ECTS-weighted share of other roles each learning unit also serves'
+            },
+            'curricula': fronts
+        }
+    
     def load_config(self, config_path):
         """Load configuration file - NO FALLBACKS"""
         script_dir = Path(__file__).parent
@@ -2044,12 +1767,13 @@ class EnhancedD4SCurriculumGenerator:
         print(f"✓ Output directory: {self.output_dir}")
     
     def load_learning_units_data(self):
-        """Load learning units data from modules_v5.json - NO FALLBACKS"""
+        """Load learning units data from the shared modules_v5.json catalog - NO FALLBACKS"""
         try:
-            with open(self.learning_units_file, 'r', encoding='utf-8') as f:
-                learning_units = json.load(f)
+            if self.catalog_snapshot is None:
+                self.catalog_snapshot = get_catalog_snapshot(self.learning_units_file)
+            learning_units = self.catalog_snapshot.modules
             
-            if not isinstance(learning_units, list) or len(learning_units) == 0:
+            if len(learning_units) == 0:
                 raise ValueError("Invalid learning units data structure in modules_v5.json")
             
             return learning_units
@@ -2057,14 +1781,31 @@ class EnhancedD4SCurriculumGenerator:
             raise RuntimeError(f"Failed to load learning units from {self.learning_units_file}: {e}")
     
     def validate_data_integrity(self):
-        """Validate learning units data - NO FALLBACKS"""
-        required_fields = ['id', 'name', 'eqf_level', 'ects_points', 'role_relevance']
-        for i, learning_unit in enumerate(self.learning_units_data):
-            for field in required_fields:
-                if field not in learning_unit:
-                    raise ValueError(f"Learning unit {i+1} (ID: {learning_unit.get('id', 'unknown')}) missing field: {field}")
-        
-        print("✓ Data integrity validation passed")
+        """Validate learning units data - NO FALLBACKS (checked once per catalog snapshot)"""
+        self.catalog_snapshot.require_integrity()
+        
+        # Prerequisite data problems are reported, not fatal
+        for warning in PrerequisiteGraph.for_snapshot(self.catalog_snapshot).warnings():
+            print(f"⚠️ Prerequisites: {warning}")
+        
+        print(f"✓ Data integrity validation passed (catalog version {self.catalog_snapshot.version})")
+
+# Process-pool batch workers: each worker builds one generator and reuses it
+_batch_worker_generator = None
+
+def _init_batch_worker(config_path, visual_mapping, inline_assets, docx_backend):
+    """Build the warm generator held by a batch worker process"""
+    global _batch_worker_generator
+    _batch_worker_generator = EnhancedD4SCurriculumGenerator(
+        config_path=config_path,
+        visual_mapping=visual_mapping,
+        inline_assets=inline_assets,
+        docx_backend=docx_backend
+    )
+
+def _generate_spec_in_worker(curriculum_spec):
+    """Generate and save one curriculum spec with the worker's warm generator"""
+    return _batch_worker_generator.generate_and_save_curriculum(curriculum_spec)
 
 def main():
     """Main execution function"""
@@ -2073,9 +1814,23 @@ def main():
                        help='Path to configuration file')
     parser.add_argument('--no-visual-map', action='store_true',
                        help='Disable visual mapping features')
+    parser.add_argument('--inline-assets', action='store_true',
+                       help='Embed stylesheets in each HTML file instead of linking shared assets/<hash>.css files')
+    parser.add_argument('--docx-backend', choices=['python-docx', 'stream'], default='python-docx',
+                       help='DOCX writer: python-docx object model, or streamed WordprocessingML for large curricula')
+    parser.add_argument('--jobs', type=int, default=1,
+                       help='Number of worker processes for batch generation (0 = one per CPU core)')
+    parser.add_argument('--pareto', metavar='PATH',
+                       help='Write the Pareto front (coverage vs ECTS vs sharing) per curriculum to PATH and exit')
+    add_profile_arguments(parser)
     
     args = parser.parse_args()
     
+    with tracing(args.profile_trace, cprofile=args.profile_cprofile, name='generate_curricula_toggle'):
+        return run(args)
+
+def run(args):
+    """Generate the curricula for parsed command line options"""
     try:
         print("Starting Enhanced Digital4Sustainability Curriculum Generator v2.0...")
         print("Addressing ALL requirements: critique points, WBL standardisation, and flexible pathways...")
@@ -2084,11 +1839,26 @@ def main():
         visual_mapping = not args.no_visual_map
         generator = EnhancedD4SCurriculumGenerator(
             config_path=args.config,
-            visual_mapping=visual_mapping
+            visual_mapping=visual_mapping,
+            inline_assets=args.inline_assets,
+            docx_backend=args.docx_backend
         )
         
+        jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+        if args.profile_trace and jobs > 1:
+            # Spans are recorded in this process only
+            print("✓ Profiling: generating in-process (--jobs 1)")
+            jobs = 1
+        
+        if args.pareto:
+            fronts = generator.generate_pareto_fronts(jobs=jobs)
+            with open(args.pareto, 'w', encoding='utf-8') as f:
+                json.dump(fronts, f, indent=2, ensure_ascii=False)
+            print(f"\n✓ Pareto fronts saved: {args.pareto}")
+            return True
+        
         # Generate all curricula
-        files = generator.generate_all_curricula()
+        files = generator.generate_all_curricula(jobs=jobs)
         
         print(f"\n🎉 SUCCESS: Generated {len(files)} files addressing ALL requirements")
         print("✅ REMOVED all DigComp references")
@@ -98,11 +98,8 @@ class CompetencyModuleSelector:
         
         # Use enhanced topic scoring and role relevance
         scored_modules = []
-        for module in self.modules:
-            # Topic relevance score
-            topic_score, topic_debug = self.topic_scorer.score_module_topic_relevance(
-                module, topic, f"{role_id}_{module.get('id', 'unknown')}"
-            )
+        topic_scores = self.topic_scorer.score_matrix(self.modules, [topic])[:, 0].tolist()
+        for module, topic_score in zip(self.modules, topic_scores):
             
             # Role relevance score from module's role_relevance field
             role_relevance = 0
@@ -6,13 +6,15 @@ Forces use of rich module database content
 """
 
 import json
-from pathlib import Path
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Tuple, Optional
+
+from ecm.catalog import CatalogSnapshot, get_catalog_snapshot
 
 class ContentValidator:
     """Validates curriculum content and stops on generic fallbacks"""
     
-    def __init__(self):
+    def __init__(self, catalog: Optional[CatalogSnapshot] = None):
+        self.catalog = catalog if catalog is not None else get_catalog_snapshot()
         self.module_database = self._load_module_database()
         self.generic_patterns = [
             'Foundation Module',
@@ -27,41 +29,13 @@ class ContentValidator:
         ]
         
     def _load_module_database(self) -> Dict:
-        """Load the rich module database"""
-        module_paths = [
-            "DSCG/input/modules/modules_v5.json",
-            "input/modules/modules_v5.json", 
-            "data/modules/modules_v5_full.json"
-        ]
-        
-        for path in module_paths:
-            if Path(path).exists():
-                try:
-                    with open(path, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                        
-                    # Handle both list and dict formats
-                    if isinstance(data, list):
-                        # Convert list to dict using id as key
-                        modules = {}
-                        for module in data:
-                            if isinstance(module, dict) and "id" in module:
-                                modules[module["id"]] = module
-                        print(f"✅ Loaded {len(modules)} modules from {path} (list format)")
-                        return modules
-                    elif isinstance(data, dict):
-                        print(f"✅ Loaded {len(data)} modules from {path} (dict format)")
-                        return data
-                    else:
-                        print(f"⚠️ Unknown format in {path}")
-                        continue
-                        
-                except Exception as e:
-                    print(f"⚠️ Error loading {path}: {e}")
-                    continue
+        """Take the rich module database (keyed by module id) from the catalog snapshot"""
+        if not self.catalog.by_id:
+            print("❌ CRITICAL: No module database found!")
+            return {}
         
-        print("❌ CRITICAL: No module database found!")
-        return {}
+        print(f"✅ Using {len(self.catalog.by_id)} modules from catalog {self.catalog.version}")
+        return self.catalog.by_id
     
     def validate_curriculum_content(self, curriculum_text: str, role_id: str, 
                                   selected_modules: List[Dict]) -> Tuple[bool, List[str]]:
@@ -11,6 +11,7 @@ from pathlib import Path
 
 # Import the consolidated topic scorer
 from scripts.curriculum_generator.components.topic_scorer import ConsolidatedTopicScorer
+from ecm.prerequisites import PrerequisiteGraph
 
 class EducationalProfileLoader:
     """Loads and manages educational profiles from JSON configuration"""
@@ -161,9 +162,12 @@ class SemesterPlanner:
 class ModuleSelector:
     """Module selector using consolidated topic scoring"""
 
-    def __init__(self, modules: List[Dict[str, Any]]):
+    def __init__(self, modules: List[Dict[str, Any]], enforce_prerequisites: bool = False):
         self.modules = modules
         self.modules_dict = {m.get('id', ''): m for m in modules}
+        self.enforce_prerequisites = enforce_prerequisites
+        # Catalog snapshot graph when the modules come from one (compiled once per snapshot)
+        self.prerequisite_graph = PrerequisiteGraph.for_modules(modules)
         self.topic_scorer = ConsolidatedTopicScorer()
         self.topic_scorer.debug_mode = False
         print("✅ ModuleSelector initialized with quiet ConsolidatedTopicScorer")
@@ -180,11 +184,9 @@ class ModuleSelector:
         print(f"🎯 Module selection: {role_id}, topic: {topic or 'General'}")
         
         scored_modules = []
-        for module in self.modules:
-            topic_score, topic_debug = self.topic_scorer.score_module_topic_relevance(
-                module, topic, f"{role_id}_{module.get('id', 'unknown')}"
-            )
-            
+        # One batch over the catalog (snapshot text index when the modules come from one)
+        topic_scores, topic_debug_rows = self.topic_scorer.score_matrix(self.modules, [topic], include_debug=True)
+        for module, topic_score, (topic_debug,) in zip(self.modules, topic_scores[:, 0].tolist(), topic_debug_rows):
             overall_score = self._calculate_overall_module_score(
                 module, role_id, topic_score, eqf_level
             )
@@ -204,6 +206,16 @@ class ModuleSelector:
                     selected_modules.append(module)
                     current_ects += module_ects
 
+        # Report (or add) prerequisites the selection does not cover
+        missing = self.prerequisite_graph.missing(module.get('id') for module in selected_modules)
+        if missing and self.enforce_prerequisites:
+            added = [self.modules_dict[module_id] for module_id in missing if module_id in self.modules_dict]
+            selected_modules = added + selected_modules
+            current_ects += sum(module.get('ects_points', 5) for module in added)
+            print(f"🔗 Added {len(added)} prerequisite modules: {', '.join(m.get('id', '') for m in added)}")
+        elif missing:
+            print(f"⚠️  Missing prerequisites: {', '.join(missing)}")
+
         print(f"✅ Selected {len(selected_modules)} modules, {current_ects} ECTS")
         return selected_modules
 
@@ -230,9 +242,10 @@ class ModuleSelector:
 class EnhancedCurriculumBuilder:
     """Enhanced curriculum builder with RESTORED full functionality"""
 
-    def __init__(self, modules: List[Dict[str, Any]], profiles_file: str = "input/educational_profiles/educational_profiles.json"):
+    def __init__(self, modules: List[Dict[str, Any]], profiles_file: str = "input/educational_profiles/educational_profiles.json",
+                 enforce_prerequisites: bool = False):
         self.modules = modules
-        self.module_selector = ModuleSelector(modules)
+        self.module_selector = ModuleSelector(modules, enforce_prerequisites=enforce_prerequisites)
         self.semester_planner = SemesterPlanner()
         self.profile_loader = EducationalProfileLoader(profiles_file)
 
@@ -19,6 +19,7 @@ try:
     from docx.oxml.shared import OxmlElement, qn
     from docx.oxml.ns import nsdecls
     from docx.oxml import parse_xml
+    from ecm.docx_templates import open_base_document
     DOCX_AVAILABLE = True
 except ImportError:
     print("⚠️  python-docx not available. Install with: pip install python-docx")
@@ -65,11 +66,8 @@ class DocxGenerator:
         print(f"🔧 Generating Curriculum DOCX: {output_path}")
         
         try:
-            # Create document
-            doc = Document()
-            
-            # Create styles for curriculum (different from educational profiles)
-            self._create_curriculum_styles(doc)
+            # Create document from the curriculum base template for the current theme
+            doc = self._new_document('curriculum', self._create_curriculum_styles)
             
             # Add curriculum content
             lines = curriculum_text.split('\n')
@@ -173,11 +171,8 @@ class DocxGenerator:
         print(f"🔧 Generating CEN/TS 17699:2022 Educational Profile: {output_path}")
         
         try:
-            # Create document
-            doc = Document()
-            
-            # Create styles for educational profiles (different from curricula)
-            self._create_educational_profile_styles(doc)
+            # Create document from the educational profile base template for the current theme
+            doc = self._new_document('educational_profile', self._create_educational_profile_styles)
             
             # Extract key information
             metadata = profile_data.get('metadata', {})
@@ -431,6 +426,11 @@ class DocxGenerator:
     # UTILITY METHODS (SHARED)
     # ===============================
     
+    def _new_document(self, kind: str, create_styles) -> Document:
+        """Open a document from the cached base template of kind, styled for the current theme colors"""
+        key = (kind, tuple(sorted(self.theme_colors.items())))
+        return open_base_document(key, create_styles)
+    
     def _hex_to_rgb(self, hex_color: str) -> Tuple[int, int, int]:
         """Convert hex color to RGB tuple"""
         hex_color = hex_color.lstrip('#')
@@ -5,592 +5,36 @@ Implements the recommended 8-section structure
 """
 
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Iterator
+
+from ecm.templating import render_template, stream_template
+
+TEMPLATE_NAME = 'final_enhanced_curriculum.html.j2'
+
+# Color schemes by theme
+THEME_COLORS = {
+    "material_gray": {"primary": "#607d8b", "secondary": "#90a4ae", "accent": "#4caf50"},
+    "sustainability_green": {"primary": "#4caf50", "secondary": "#81c784", "accent": "#2e7d32"},
+    "eu_official": {"primary": "#003399", "secondary": "#ffcc00", "accent": "#0066cc"},
+    "corporate_navy": {"primary": "#1a237e", "secondary": "#3949ab", "accent": "#00bcd4"}
+}
+
+
+def _template_context(curriculum_data: Dict[str, Any], theme: str) -> Dict[str, Any]:
+    return {
+        'curriculum_data': curriculum_data,
+        'metadata': curriculum_data.get("metadata", {}),
+        'colors': THEME_COLORS.get(theme, THEME_COLORS["material_gray"]),
+        'theme': theme,
+        'generated_at': datetime.now().strftime('%Y-%m-%d %H:%M')
+    }
+
 
 def generate_final_enhanced_html(curriculum_data: Dict[str, Any], theme: str = "material_gray") -> str:
     """Generate HTML with proper section sequence addressing all evaluation feedback"""
-    
-    metadata = curriculum_data.get("metadata", {})
-    
-    # Color schemes by theme
-    theme_colors = {
-        "material_gray": {"primary": "#607d8b", "secondary": "#90a4ae", "accent": "#4caf50"},
-        "sustainability_green": {"primary": "#4caf50", "secondary": "#81c784", "accent": "#2e7d32"},
-        "eu_official": {"primary": "#003399", "secondary": "#ffcc00", "accent": "#0066cc"},
-        "corporate_navy": {"primary": "#1a237e", "secondary": "#3949ab", "accent": "#00bcd4"}
-    }
-    
-    colors = theme_colors.get(theme, theme_colors["material_gray"])
-    
-    html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{metadata.get('role_name', 'Professional')} - Digital Sustainability Programme</title>
-    <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{ 
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; 
-            line-height: 1.6; 
-            color: #333; 
-            background: #f8f9fa;
-        }}
-        .container {{ 
-            max-width: 1200px; 
-            margin: 0 auto; 
-            background: white; 
-            box-shadow: 0 0 30px rgba(0,0,0,0.1);
-        }}
-        .header {{ 
-            background: linear-gradient(135deg, {colors['primary']} 0%, {colors['secondary']} 100%); 
-            color: white; 
-            padding: 40px; 
-            text-align: center;
-        }}
-        .header h1 {{ font-size: 2.5em; margin-bottom: 10px; }}
-        .header .subtitle {{ font-size: 1.2em; opacity: 0.9; }}
-        .header .meta {{ font-size: 1em; margin-top: 15px; opacity: 0.8; }}
-        
-        .section {{ 
-            padding: 40px; 
-            border-bottom: 1px solid #eee;
-        }}
-        .section:last-child {{ border-bottom: none; }}
-        
-        .section h2 {{ 
-            color: {colors['primary']}; 
-            font-size: 1.8em; 
-            margin-bottom: 20px; 
-            padding-bottom: 10px;
-            border-bottom: 2px solid {colors['accent']};
-        }}
-        
-        .section h3 {{ 
-            color: {colors['secondary']}; 
-            font-size: 1.3em; 
-            margin: 20px 0 10px 0;
-        }}
-        
-        .grid-2 {{ 
-            display: grid; 
-            grid-template-columns: 1fr 1fr; 
-            gap: 30px; 
-            margin: 20px 0;
-        }}
-        
-        .grid-3 {{ 
-            display: grid; 
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); 
-            gap: 20px; 
-            margin: 20px 0;
-        }}
-        
-        .card {{ 
-            background: #f8f9fa; 
-            padding: 20px; 
-            border-radius: 8px; 
-            border-left: 4px solid {colors['accent']};
-        }}
-        
-        .highlight-box {{ 
-            background: linear-gradient(135deg, {colors['accent']}22 0%, {colors['primary']}11 100%); 
-            padding: 25px; 
-            border-radius: 10px; 
-            margin: 20px 0;
-            border: 1px solid {colors['accent']}44;
-        }}
-        
-        .benefit-grid {{ 
-            display: grid; 
-            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); 
-            gap: 20px; 
-            margin: 20px 0;
-        }}
-        
-        .benefit-card {{ 
-            background: white; 
-            padding: 20px; 
-            border-radius: 8px; 
-            border: 1px solid #ddd;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.05);
-            text-align: center;
-        }}
-        
-        .benefit-icon {{ 
-            font-size: 2.5em; 
-            margin-bottom: 10px; 
-            display: block;
-        }}
-        
-        .unit-card {{ 
-            background: #f8f9fa; 
-            padding: 25px; 
-            margin: 15px 0; 
-            border-radius: 8px; 
-            border-left: 5px solid {colors['primary']};
-        }}
-        
-        .unit-title {{ 
-            color: {colors['primary']}; 
-            font-size: 1.3em; 
-            font-weight: bold; 
-            margin-bottom: 10px;
-        }}
-        
-        .unit-meta {{ 
-            background: {colors['accent']}22; 
-            padding: 10px; 
-            border-radius: 5px; 
-            margin: 10px 0; 
-            font-size: 0.9em;
-        }}
-        
-        .framework-tags {{ 
-            display: flex; 
-            flex-wrap: wrap; 
-            gap: 8px; 
-            margin: 10px 0;
-        }}
-        
-        .framework-tag {{ 
-            background: {colors['secondary']}; 
-            color: white; 
-            padding: 4px 12px; 
-            border-radius: 15px; 
-            font-size: 0.8em;
-        }}
-        
-        .modality-grid {{ 
-            display: grid; 
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); 
-            gap: 20px; 
-            margin: 20px 0;
-        }}
-        
-        .modality-card {{ 
-            background: white; 
-            padding: 20px; 
-            border-radius: 8px; 
-            border: 2px solid {colors['accent']}44;
-        }}
-        
-        .modality-title {{ 
-            color: {colors['primary']}; 
-            font-weight: bold; 
-            margin-bottom: 10px;
-        }}
-        
-        ul {{ margin-left: 20px; }}
-        li {{ margin: 5px 0; }}
-        
-        .assessment-breakdown {{ 
-            display: grid; 
-            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); 
-            gap: 20px; 
-            margin: 20px 0;
-        }}
-        
-        .assessment-card {{ 
-            background: {colors['primary']}11; 
-            padding: 20px; 
-            border-radius: 8px; 
-            border-top: 4px solid {colors['primary']};
-        }}
-        
-        .percentage {{ 
-            font-size: 2em; 
-            font-weight: bold; 
-            color: {colors['primary']}; 
-            text-align: center; 
-            margin: 10px 0;
-        }}
-        
-        @media (max-width: 768px) {{
-            .grid-2, .grid-3 {{ grid-template-columns: 1fr; }}
-            .container {{ margin: 10px; }}
-            .section {{ padding: 20px; }}
-            .header {{ padding: 20px; }}
-            .header h1 {{ font-size: 1.8em; }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <header class="header">
-            <h1>{metadata.get('role_name', 'Professional')}</h1>
-            <div class="subtitle">Digital Sustainability Professional Development Programme</div>
-            <div class="meta">
-                EQF Level {metadata.get('eqf_level', 6)} • 
-                {metadata.get('actual_ects', 0)} ECTS Credits • 
-                {metadata.get('units_generated', 0)} Units of Learning • 
-                EU-Wide Recognition
-            </div>
-        </header>
-"""
-    
-    # Section 1: What This Course Delivers
-    section_1 = curriculum_data.get("section_1_what_this_delivers", {})
-    if section_1:
-        html += f"""
-        <section class="section">
-            <h2>🎯 {section_1.get('title', 'What This Course Delivers')}</h2>
-            
-            <div class="highlight-box">
-                <div class="grid-2">
-                    <div>
-                        <h3>Programme Overview</h3>
-"""
-        
-        overview = section_1.get("programme_overview", {})
-        for key, value in overview.items():
-            html += f"                        <p><strong>{key.replace('_', ' ').title()}:</strong> {value}</p>\n"
-        
-        html += """                    </div>
-                    <div>
-                        <h3>Career Impact</h3>
-"""
-        
-        career_impact = section_1.get("career_impact", {})
-        for key, value in career_impact.items():
-            html += f"                        <p><strong>{key.replace('_', ' ').title()}:</strong> {value}</p>\n"
-        
-        html += """                    </div>
-                </div>
-            </div>
-            
-            <h3>Key Features</h3>
-            <div class="grid-3">
-"""
-        
-        for feature in section_1.get("key_features", []):
-            html += f"""                <div class="card">
-                    <p>{feature}</p>
-                </div>
-"""
-        
-        html += """            </div>
-            
-            <h3>Delivery Options</h3>
-            <div class="modality-grid">
-"""
-        
-        modalities = section_1.get("delivery_modalities", {})
-        for modality_key, modality_info in modalities.items():
-            if isinstance(modality_info, dict):
-                html += f"""                <div class="modality-card">
-                    <div class="modality-title">{modality_key.replace('_', ' ').title()}</div>
-                    <p><strong>Duration:</strong> {modality_info.get('duration', 'TBD')}</p>
-                    <p>{modality_info.get('description', '')}</p>
-                    <p><strong>Best for:</strong> {modality_info.get('best_for', '')}</p>
-                </div>
-"""
-        
-        html += """            </div>
-        </section>
-"""
-    
-    # Section 2: Learning Outcomes
-    section_2 = curriculum_data.get("section_2_learning_outcomes", {})
-    if section_2:
-        html += f"""
-        <section class="section">
-            <h2>🎯 {section_2.get('title', 'Learning Outcomes')}</h2>
-            <p style="font-size: 1.1em; margin-bottom: 20px;">{section_2.get('overview', '')}</p>
-            
-            <div class="grid-2">
-                <div>
-                    <h3>Technical & Analytical Competencies</h3>
-                    <ul>
-"""
-        
-        competencies = section_2.get("competency_areas", {})
-        for outcome in competencies.get("technical_competencies", []):
-            html += f"                        <li>{outcome}</li>\n"
-        for outcome in competencies.get("analytical_competencies", []):
-            html += f"                        <li>{outcome}</li>\n"
-        
-        html += """                    </ul>
-                </div>
-                <div>
-                    <h3>Leadership & Transversal Skills</h3>
-                    <ul>
-"""
-        
-        for outcome in competencies.get("leadership_competencies", []):
-            html += f"                        <li>{outcome}</li>\n"
-        for outcome in competencies.get("transversal_competencies", []):
-            html += f"                        <li>{outcome}</li>\n"
-        
-        html += """                    </ul>
-                </div>
-            </div>
-            
-            <div class="highlight-box">
-                <h3>Framework Alignment</h3>
-                <p><strong>Progression Structure:</strong> {section_2.get('competency_progression', 'Foundation to Leadership levels')}</p>
-            </div>
-        </section>
-"""
-    
-    # Section 3: Course Organisation
-    section_3 = curriculum_data.get("section_3_course_organisation", {})
-    if section_3:
-        html += f"""
-        <section class="section">
-            <h2>🧱 {section_3.get('title', 'Course Organisation: Units of Learning')}</h2>
-            
-            <div class="highlight-box">
-"""
-        
-        uol_overview = section_3.get("uol_overview", {})
-        for key, value in uol_overview.items():
-            html += f"                <p><strong>{key.replace('_', ' ').title()}:</strong> {value}</p>\n"
-        
-        html += """            </div>
-            
-            <h3>Learning Units</h3>
-"""
-        
-        for unit in section_3.get("learning_units", []):
-            html += f"""            <div class="unit-card">
-                <div class="unit-title">Unit {unit.get('unit_number', 1)}: {unit.get('title', unit.get('unit_title', 'Professional Development'))}</div>
-                
-                <div class="unit-meta">
-                    <strong>Level:</strong> {unit.get('progression_level', 'Development')} | 
-                    <strong>ECTS:</strong> {unit.get('ects', 0)} | 
-                    <strong>Duration:</strong> {unit.get('estimated_hours', 'TBD')}
-                </div>
-                
-                <p><strong>Learning Outcomes:</strong></p>
-                <ul>
-"""
-            
-            outcomes = unit.get('granular_learning_outcomes', unit.get('specific_learning_outcomes', []))
-            for outcome in outcomes[:4]:  # Show first 4 outcomes
-                html += f"                    <li>{outcome}</li>\n"
-            
-            html += """                </ul>
-                
-                <p><strong>Transversal Skills Focus:</strong></p>
-                <ul>
-"""
-            
-            for skill in unit.get('transversal_skills_focus', []):
-                html += f"                    <li>{skill}</li>\n"
-            
-            html += """                </ul>
-                
-                <div class="framework-tags">
-"""
-            
-            frameworks = unit.get('framework_mappings', {})
-            for framework, mappings in frameworks.items():
-                if isinstance(mappings, list) and mappings:
-                    html += f'                    <span class="framework-tag">{framework}</span>\n'
-            
-            html += f"""                </div>
-                
-                <p style="margin-top: 10px;"><em>{unit.get('micro_credential_value', 'Micro-credential available upon completion')}</em></p>
-            </div>
-"""
-        
-        html += """        </section>
-"""
-    
-    # Section 4: Entry Requirements
-    section_4 = curriculum_data.get("section_4_entry_requirements", {})
-    if section_4:
-        html += f"""
-        <section class="section">
-            <h2>🎓 {section_4.get('title', 'Entry Requirements')}</h2>
-            
-            <div class="grid-3">
-"""
-        
-        requirements = section_4.get("standard_requirements", {})
-        for req_type, req_detail in requirements.items():
-            html += f"""                <div class="card">
-                    <h3>{req_type.replace('_', ' ').title()}</h3>
-                    <p>{req_detail}</p>
-                </div>
-"""
-        
-        html += """            </div>
-            
-            <h3>Alternative Pathways</h3>
-            <ul>
-"""
-        
-        for pathway in section_4.get("alternative_pathways", []):
-            html += f"                <li>{pathway}</li>\n"
-        
-        html += """            </ul>
-        </section>
-"""
-    
-    # Section 5: Qualification & Recognition
-    section_5 = curriculum_data.get("section_5_qualification_recognition", {})
-    if section_5:
-        html += f"""
-        <section class="section">
-            <h2>🏆 {section_5.get('title', 'Qualification & Recognition')}</h2>
-            
-            <div class="highlight-box">
-                <p style="font-size: 1.1em;"><strong>{section_5.get('primary_qualification', '')}</strong></p>
-            </div>
-            
-            <h3>What You Receive</h3>
-            <div class="grid-2">
-                <div>
-                    <ul>
-"""
-        
-        what_you_receive = section_5.get("what_you_receive", [])
-        mid_point = len(what_you_receive) // 2
-        for item in what_you_receive[:mid_point]:
-            html += f"                        <li>{item}</li>\n"
-        
-        html += """                    </ul>
-                </div>
-                <div>
-                    <ul>
-"""
-        
-        for item in what_you_receive[mid_point:]:
-            html += f"                        <li>{item}</li>\n"
-        
-        html += """                    </ul>
-                </div>
-            </div>
-            
-            <h3>EU & National Recognition</h3>
-            <div class="grid-3">
-"""
-        
-        nqf_alignment = section_5.get("eu_nqf_alignment", {})
-        for country, level_info in nqf_alignment.items():
-            html += f"""                <div class="card">
-                    <h4>{country.title()}</h4>
-                    <p>{level_info}</p>
-                </div>
-"""
-        
-        html += """            </div>
-        </section>
-"""
-    
-    # Section 6: Assessment Methods
-    section_6 = curriculum_data.get("section_6_assessment_methods", {})
-    if section_6:
-        html += f"""
-        <section class="section">
-            <h2>📊 {section_6.get('title', 'Assessment Methods')}</h2>
-            
-            <p style="font-size: 1.1em; margin-bottom: 20px;">{section_6.get('assessment_philosophy', '')}</p>
-            
-            <div class="assessment-breakdown">
-"""
-        
-        assessment_types = section_6.get("assessment_breakdown", {})
-        for assessment_type, details in assessment_types.items():
-            html += f"""                <div class="assessment-card">
-                    <h3>{assessment_type.replace('_', ' ').title()}</h3>
-                    <div class="percentage">{details.get('percentage', 0)}%</div>
-                    <p><strong>Purpose:</strong> {details.get('purpose', '')}</p>
-                    <p><strong>Methods:</strong></p>
-                    <ul>
-"""
-            
-            for method in details.get('methods', []):
-                html += f"                        <li>{method}</li>\n"
-            
-            html += """                    </ul>
-                </div>
-"""
-        
-        html += """            </div>
-        </section>
-"""
-    
-    # Section 7: Key Benefits Recap
-    section_7 = curriculum_data.get("section_7_key_benefits_recap", {})
-    if section_7:
-        html += f"""
-        <section class="section">
-            <h2>💡 {section_7.get('title', 'Key Benefits Recap')}</h2>
-            
-            <div class="benefit-grid">
-"""
-        
-        benefits = section_7.get("benefits_grid", {})
-        for benefit_key, benefit_info in benefits.items():
-            html += f"""                <div class="benefit-card">
-                    <span class="benefit-icon">{benefit_info.get('icon', '✅')}</span>
-                    <h3>{benefit_info.get('title', benefit_key.replace('_', ' ').title())}</h3>
-                    <p>{benefit_info.get('description', '')}</p>
-                </div>
-"""
-        
-        html += f"""            </div>
-            
-            <div class="highlight-box" style="text-align: center;">
-                <p style="font-size: 1.2em; font-weight: bold;">{section_7.get('value_proposition', 'Transform your professional capabilities with formal recognition.')}</p>
-            </div>
-        </section>
-"""
-    
-    # Section 8: Cross-Border Compatibility
-    section_8 = curriculum_data.get("section_8_cross_border_compatibility", {})
-    if section_8:
-        html += f"""
-        <section class="section">
-            <h2>🌍 {section_8.get('title', 'Cross-Border Compatibility')}</h2>
-            
-            <div class="grid-2">
-                <div>
-                    <h3>EU Framework Integration</h3>
-                    <ul>
-"""
-        
-        eu_integration = section_8.get("eu_framework_integration", {})
-        for key, value in eu_integration.items():
-            html += f"                        <li><strong>{key.replace('_', ' ').title()}:</strong> {value}</li>\n"
-        
-        html += """                    </ul>
-                </div>
-                <div>
-                    <h3>Recognition Mechanisms</h3>
-"""
-        
-        recognition = section_8.get("recognition_mechanisms", {})
-        for mechanism, details in recognition.items():
-            if isinstance(details, dict):
-                html += f"""                    <div class="card" style="margin: 10px 0;">
-                        <h4>{mechanism.replace('_', ' ').title()}</h4>
-                        <p>{details.get('description', '')}</p>
-                    </div>
-"""
-        
-        html += """                </div>
-            </div>
-        </section>
-"""
-    
-    # Footer
-    html += f"""
-        <footer style="background: {colors['primary']}; color: white; padding: 30px; text-align: center;">
-            <h3>🎉 Final Enhanced Curriculum v4.0</h3>
-            <p>T3.2/T3.4 Compliant • All Evaluation Feedback Integrated • EU Recognition Ready</p>
-            <p style="margin-top: 15px; opacity: 0.8;">
-                Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')} | 
-                Theme: {theme.replace('_', ' ').title()} | 
-                Full Compliance Achieved
-            </p>
-        </footer>
-    </div>
-</body>
-</html>
-"""
-    
-    return html
+    return render_template(TEMPLATE_NAME, **_template_context(curriculum_data, theme))
+
+
+def stream_final_enhanced_html(curriculum_data: Dict[str, Any], theme: str = "material_gray") -> Iterator[str]:
+    """Same document as generate_final_enhanced_html, rendered chunk by chunk"""
+    return stream_template(TEMPLATE_NAME, **_template_context(curriculum_data, theme))
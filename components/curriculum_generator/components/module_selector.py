@@ -6,13 +6,22 @@ Selects optimal modules based on topic relevance, EQF level, role requirements,
 from typing import Dict, List, Any, Tuple
 import math
 
+from ecm.ects_solver import solve_ects_selection
+from ecm.prerequisites import PrerequisiteGraph, prerequisite_references
+
 
 class ModuleSelector:
     """Handles module selection for curriculum generation"""
     
-    def __init__(self, domain_knowledge, role_manager=None):
+    def __init__(self, domain_knowledge, role_manager=None, text_index=None,
+                 prerequisite_graph=None, enforce_prerequisites=False):
         self.domain_knowledge = domain_knowledge
         self.role_manager = role_manager
+        # Optional ModuleTextIndex over the catalog modules passed to the selector
+        self.text_index = text_index
+        # Optional catalog-wide PrerequisiteGraph; otherwise the graph of the modules' catalog snapshot
+        self.prerequisite_graph = prerequisite_graph
+        self.enforce_prerequisites = enforce_prerequisites
         
     def select_modules_for_topic(
         self, 
@@ -51,6 +60,15 @@ class ModuleSelector:
             # Select optimal combination to meet ECTS target
             selected_modules = self._select_optimal_combination(scored_modules, target_ects)
             
+            # Report (or add) prerequisites the selection does not cover
+            missing = self.missing_prerequisites(selected_modules, modules)
+            if missing and self.enforce_prerequisites:
+                added = self._missing_prerequisite_modules(missing, modules)
+                selected_modules = added + selected_modules
+                print(f"🔗 Added {len(added)} prerequisite modules: {', '.join(m.get('id', '') for m in added)}")
+            elif missing:
+                print(f"⚠️  Missing prerequisites: {', '.join(missing)}")
+            
             print(f"✅ Selected {len(selected_modules)} modules totaling {sum(m.get('ects', 5) for m in selected_modules)} ECTS")
             
         except Exception as e:
@@ -84,15 +102,13 @@ class ModuleSelector:
     ) -> List[Dict[str, Any]]:
         """Score modules by relevance to topic and role"""
         scored_modules = []
+        modules = [module for module in modules if isinstance(module, dict)]
         
-        for module in modules:
-            if not isinstance(module, dict):
-                continue
-                
+        # Score all modules against the topic in one pass (index fast path when available)
+        topic_scores = self.domain_knowledge.score_modules_relevance(modules, topic, self.text_index)
+        
+        for module, topic_relevance in zip(modules, topic_scores):
             try:
-                # Calculate topic relevance score
-                topic_relevance = self.domain_knowledge.score_module_relevance(module, topic)
-                
                 # Calculate role relevance score from module's role_relevance field
                 role_relevance = 0
                 if role_id and 'role_relevance' in module:
@@ -124,6 +140,30 @@ class ModuleSelector:
     ) -> List[Dict[str, Any]]:
         """Select optimal combination of modules to meet ECTS target"""
         
+        if not scored_modules:
+            return []
+        
+        # Exact solve: most relevant ECTS within the target and the minimum module count
+        min_modules = min(max(3, target_ects // 10), len(scored_modules))
+        selection = solve_ects_selection(
+            [module.get('ects', 5) for module in scored_modules],
+            [module.get('total_relevance_score', 0) for module in scored_modules],
+            target_ects,
+            min_units=min_modules
+        )
+        if selection is not None and selection.indices:
+            return [scored_modules[i] for i in selection.indices]
+        
+        # Infeasible or out of time budget - use the greedy passes
+        return self._select_greedy_combination(scored_modules, target_ects)
+        
+    def _select_greedy_combination(
+        self, 
+        scored_modules: List[Dict[str, Any]], 
+        target_ects: int
+    ) -> List[Dict[str, Any]]:
+        """Greedy fallback: fill the ECTS target in relevance order"""
+        
         selected = []
         current_ects = 0
         used_indices = set()
@@ -244,24 +284,45 @@ class ModuleSelector:
             'missing_keywords': [kw for kw in topic_keywords if kw.lower() not in covered_keywords]
         }
         
+    def _prerequisite_graph(self, modules: List[Dict[str, Any]]) -> PrerequisiteGraph:
+        if self.prerequisite_graph is not None:
+            return self.prerequisite_graph
+        return PrerequisiteGraph.for_modules(modules)
+        
     def get_prerequisite_chain(self, modules: List[Dict[str, Any]]) -> List[str]:
         """Analyze prerequisite relationships between modules"""
-        prerequisites = []
+        modules = [module for module in modules if isinstance(module, dict)]
+        graph = self._prerequisite_graph(modules)
+        
+        # Transitive prerequisites, prerequisites first
+        prerequisites = graph.ids(graph.required(module.get('id') for module in modules))
         
+        # Free-text prerequisites that are not module ids
         for module in modules:
-            if not isinstance(module, dict):
-                continue
-                
-            module_prereqs = module.get('prerequisites', [])
-            if isinstance(module_prereqs, str):
-                module_prereqs = [module_prereqs]
-                
-            for prereq in module_prereqs:
-                if prereq and prereq not in prerequisites:
+            for prereq in prerequisite_references(module):
+                if prereq not in graph and prereq not in prerequisites:
                     prerequisites.append(prereq)
                     
         return prerequisites
         
+    def missing_prerequisites(
+        self, 
+        selected_modules: List[Dict[str, Any]], 
+        all_modules: List[Dict[str, Any]] = None
+    ) -> List[str]:
+        """Module ids required by the selection but not part of it"""
+        graph = self._prerequisite_graph(all_modules or selected_modules)
+        return graph.missing(module.get('id') for module in selected_modules if isinstance(module, dict))
+        
+    def _missing_prerequisite_modules(
+        self, 
+        missing: List[str], 
+        all_modules: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Available modules for missing prerequisite ids (prerequisites first)"""
+        by_id = {module.get('id'): module for module in all_modules if isinstance(module, dict)}
+        return [by_id[module_id] for module_id in missing if module_id in by_id]
+        
     def suggest_additional_modules(
         self, 
         selected_modules: List[Dict[str, Any]], 
@@ -289,19 +350,23 @@ class ModuleSelector:
                 role_skills = []
         
         suggestions = []
+        candidates = [
+            module for module in all_modules
+            if isinstance(module, dict) and module.get('title', '') not in selected_titles
+        ]
         
-        for module in all_modules:
-            if not isinstance(module, dict):
-                continue
-                
-            if module.get('title', '') in selected_titles:
-                continue
-                
+        # Related topic scores for every candidate, one batch per topic
+        related_scores = [
+            self.domain_knowledge.score_modules_relevance(candidates, related_topic, self.text_index)
+            for related_topic in related_topics
+        ]
+        
+        for position, module in enumerate(candidates):
             try:
                 # Check if module covers related topics
                 relevance_to_related = 0
-                for related_topic in related_topics:
-                    relevance_to_related += self.domain_knowledge.score_module_relevance(module, related_topic)
+                for topic_scores in related_scores:
+                    relevance_to_related += topic_scores[position]
                 
                 # Check if module aligns with role skills
                 role_skill_relevance = 0
@@ -6,12 +6,21 @@ Creates structured learning paths and progression routes through the curriculum.
 from typing import Dict, List, Any, Optional, Tuple
 import math
 
+from ecm.prerequisites import PrerequisiteGraph, prerequisite_references
+
 
 class PathwayGenerator:
     """Generates learning pathways and progression routes"""
     
-    def __init__(self, domain_knowledge):
+    def __init__(self, domain_knowledge, prerequisite_graph=None):
         self.domain_knowledge = domain_knowledge
+        # Optional catalog-wide PrerequisiteGraph; otherwise the graph of the modules' catalog snapshot
+        self.prerequisite_graph = prerequisite_graph
+        
+    def _prerequisite_graph(self, modules: List[Dict[str, Any]]) -> PrerequisiteGraph:
+        if self.prerequisite_graph is not None:
+            return self.prerequisite_graph
+        return PrerequisiteGraph.for_modules(modules)
         
     def generate_pathways(
         self,
@@ -67,7 +76,9 @@ class PathwayGenerator:
                 
             return score
             
-        sorted_modules = sorted(modules, key=module_priority)
+        # Prerequisites always come before the modules that need them
+        depths = self._prerequisite_graph(modules).depth(module.get('id') for module in modules)
+        sorted_modules = sorted(modules, key=lambda module: (depths.get(module.get('id'), 0), module_priority(module)))
         
         # Create sequence with timing
         sequence = []
@@ -493,14 +504,25 @@ class PathwayGenerator:
                 "eqf_level": module.get('eqf_level', 6)
             })
             
-        # Create connections based on prerequisites
+        # Create connections based on prerequisites (module ids via the compiled graph)
+        graph = self._prerequisite_graph(modules)
+        positions = {module.get('id'): i for i, module in enumerate(modules)}
+        
         for i, module in enumerate(modules):
-            prereqs = module.get('prerequisites', [])
-            if isinstance(prereqs, str):
-                prereqs = [prereqs] if prereqs else []
-                
-            for prereq in prereqs:
-                # Find prerequisite module
+            for prereq in prerequisite_references(module):
+                if prereq == module.get('id'):
+                    continue
+                    
+                if prereq in graph:
+                    if prereq in positions:
+                        flow["connections"].append({
+                            "from": f"module_{positions[prereq]}",
+                            "to": f"module_{i}",
+                            "type": "prerequisite"
+                        })
+                    continue
+                    
+                # Free-text prerequisite: find matching module titles
                 for j, prereq_module in enumerate(modules):
                     if prereq.lower() in prereq_module.get('title', '').lower():
                         flow["connections"].append({
@@ -509,6 +531,13 @@ class PathwayGenerator:
                             "type": "prerequisite"
                         })
                         
+        # Prerequisite depth within the selection and closure check
+        selected_ids = [module.get('id') for module in modules]
+        for module_id, depth in graph.depth(selected_ids).items():
+            flow["levels"].setdefault(str(depth), []).append(f"module_{positions[module_id]}")
+        flow["missing_prerequisites"] = graph.missing(selected_ids)
+        flow["prerequisite_closed"] = not flow["missing_prerequisites"]
+                        
         return flow
         
     def _generate_competency_progression(
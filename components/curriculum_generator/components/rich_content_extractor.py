@@ -5,39 +5,31 @@ Rich Content Extractor - Utilizes detailed module data from modules_v5.json
 Generates specific, differentiated content instead of generic outcomes
 """
 
-import json
-import os
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Set
 import re
 
+from ecm.catalog import CatalogSnapshot, get_catalog_snapshot
+
 class RichContentExtractor:
     """Extracts rich, specific content from module database"""
     
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, catalog: Optional[CatalogSnapshot] = None):
         self.project_root = project_root
+        self.catalog = catalog if catalog is not None else get_catalog_snapshot(
+            project_root / "input" / "modules" / "modules_v5.json"
+        )
         self.module_database = self._load_full_module_database()
         self.framework_mappings = self._initialize_framework_mappings()
         
     def _load_full_module_database(self) -> List[Dict]:
-        """Load complete module database with all rich content"""
-        module_paths = [
-            self.project_root / "input" / "modules" / "modules_v5.json"
-        ]
+        """Take the complete module database with all rich content from the catalog snapshot"""
+        if not self.catalog.modules:
+            print("⚠️  Full module database not found, content will be limited")
+            return []
         
-        for path in module_paths:
-            if os.path.exists(path):
-                try:
-                    with open(path, 'r', encoding='utf-8') as f:
-                        modules = json.load(f)
-                        print(f"✅ Loaded FULL module database: {len(modules)} modules with rich content")
-                        return modules
-                except Exception as e:
-                    print(f"⚠️  Error loading {path}: {e}")
-                    continue
-        
-        print("⚠️  Full module database not found, content will be limited")
-        return []
+        print(f"✅ Using FULL module database: {len(self.catalog.modules)} modules with rich content")
+        return list(self.catalog.modules)
     
     def _initialize_framework_mappings(self) -> Dict[str, Dict]:
         """Initialize framework mapping templates"""
@@ -9,6 +9,8 @@ from typing import Dict, List, Any, Optional
 import json
 from pathlib import Path
 
+from ecm.tracing import traced
+
 class T32T34ComplianceManager:
     """Manages T3.2/T3.4 compliance requirements"""
     
@@ -236,6 +238,7 @@ class T32T34ComplianceManager:
             }
         }
 
+    @traced('tuning_learning_outcomes', 'learning_unit', args=lambda self, unit, *rest: {'unit': unit.get('title') or unit.get('id')})
     def generate_tuning_learning_outcomes(self, unit: Dict[str, Any], role_id: str, eqf_level: int) -> List[str]:
         """Generate Tuning-style learning outcomes ('The learner will be able to...')"""
         
@@ -284,6 +287,7 @@ class T32T34ComplianceManager:
         
         return outcomes[:5]  # Limit to 5 key outcomes
 
+    @traced('competency_mapping', 'learning_unit', args=lambda self, unit, *rest: {'unit': unit.get('title') or unit.get('id')})
     def generate_competency_mapping(self, unit: Dict[str, Any], role_id: str) -> Dict[str, Any]:
         """Generate explicit competency mapping to frameworks and WP2 role framework"""
         
@@ -386,6 +390,7 @@ class T32T34ComplianceManager:
             }
         }
 
+    @traced('skills_matrix', 'builder')
     def create_skills_matrix(self, curriculum: Dict[str, Any], role_id: str) -> Dict[str, Any]:
         """Create skills matrix showing mapping of micro-units to job-role skills"""
         
@@ -490,6 +495,7 @@ class T32T34ComplianceManager:
         
         return matrix
 
+    @traced('compliance', 'builder')
     def enhance_curriculum_with_compliance(self, curriculum: Dict[str, Any], role_id: str) -> Dict[str, Any]:
         """Enhance curriculum with full T3.2/T3.4 compliance features"""
         
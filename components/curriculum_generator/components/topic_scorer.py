@@ -4,17 +4,36 @@ Consolidated Topic Scorer - TRULY QUIET VERSION
 Fixes verbose debug output and ensures proper scoring.
 """
 
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Sequence, Tuple, Union
+import os
 import re
 from pathlib import Path
 
+import numpy as np
+
+from ecm.score_cache import DEFAULT_MAX_ENTRIES, ScoreCache, module_content_hash
+
+# Bump whenever scoring rules change so cached scores from older versions are ignored
+SCORER_VERSION = "2"
+
+# Boost terms and (name, description, topics) weights used by _apply_topic_boosting
+CARBON_BOOST_TERMS = ['carbon', 'footprint', 'emission', 'greenhouse', 'climate', 'measurement', 'assessment', 'environmental']
+DATA_BOOST_TERMS = ['data', 'analytics', 'analysis', 'visualization', 'intelligence']
+SUSTAINABILITY_BOOST_TERMS = ['sustainable', 'sustainability', 'green', 'environmental']
+CARBON_BOOST_WEIGHTS = (25, 15, 20)
+DATA_BOOST_WEIGHTS = (20, 12, 15)
+SUSTAINABILITY_BOOST_WEIGHTS = (10, 6, 0)
+
 
 class ConsolidatedTopicScorer:
     """Unified topic scoring system - QUIET VERSION"""
     
-    def __init__(self):
+    def __init__(self, cache_size: int = DEFAULT_MAX_ENTRIES, cache_path: Optional[str] = None):
         self.knowledge_base = None
-        self.scoring_cache = {}
+        self.text_index_class = None
+        # Bounded LRU; set TOPIC_SCORE_CACHE_PATH (or pass cache_path) to persist across restarts
+        cache_path = cache_path or os.environ.get('TOPIC_SCORE_CACHE_PATH')
+        self.scoring_cache = ScoreCache(max_entries=cache_size, db_path=cache_path)
         self.debug_mode = False  # ALWAYS OFF unless explicitly enabled
         self.verbose_debug = False
         
@@ -40,8 +59,9 @@ class ConsolidatedTopicScorer:
     def _initialize_knowledge_base(self):
         """Initialize knowledge base with error handling"""
         try:
-            from scripts.curriculum_generator.domain.knowledge_base import DigitalSustainabilityKnowledge
+            from scripts.curriculum_generator.domain.knowledge_base import DigitalSustainabilityKnowledge, ModuleTextIndex
             self.knowledge_base = DigitalSustainabilityKnowledge()
+            self.text_index_class = ModuleTextIndex
             if self.debug_mode:
                 print("✅ Knowledge base initialized")
         except Exception as e:
@@ -63,10 +83,12 @@ class ConsolidatedTopicScorer:
         if target_topic is None:
             return self._score_general_sustainability(module)
         
-        # Check cache first
-        cache_key = f"{module.get('id', 'unknown')}_{target_topic}"
-        if cache_key in self.scoring_cache:
-            return self.scoring_cache[cache_key]
+        # Check cache first (keyed on module content, so catalog edits are never served stale)
+        cache_key = (module_content_hash(module), target_topic, self.scorer_version)
+        cached = self.scoring_cache.get(cache_key)
+        if cached is not None:
+            score, debug_info = cached
+            return score, debug_info
         
         # Score using optimized method
         if self.knowledge_base:
@@ -76,7 +98,7 @@ class ConsolidatedTopicScorer:
         
         # Cache result
         result = (score, debug_info)
-        self.scoring_cache[cache_key] = result
+        self.scoring_cache.put(cache_key, result)
         
         return result
     
@@ -113,46 +135,55 @@ class ConsolidatedTopicScorer:
     ) -> float:
         """Apply topic-specific boosting"""
         
-        module_name = module.get('name', '').lower()
-        module_desc = module.get('description', '').lower()
-        module_topics = module.get('topics', [])
-        module_topics_text = ' '.join(module_topics).lower() if module_topics else ''
+        module_name, module_desc, module_topics_text = self._module_texts(module)
         
         boost = 0.0
         target_lower = target_topic.lower()
         
         # Carbon footprint specific boosting
-        if 'carbon' in target_lower or 'footprint' in target_lower:
-            carbon_terms = ['carbon', 'footprint', 'emission', 'greenhouse', 'climate', 'measurement', 'assessment', 'environmental']
-            for term in carbon_terms:
-                if term in module_name:
-                    boost += 25
-                if term in module_desc:
-                    boost += 15
-                if term in module_topics_text:
-                    boost += 20
+        if self._is_carbon_topic(target_lower):
+            boost += self._term_boost(module_name, module_desc, module_topics_text,
+                                      CARBON_BOOST_TERMS, CARBON_BOOST_WEIGHTS)
         
         # Data analytics boosting
-        if 'data' in target_lower or 'analytics' in target_lower:
-            data_terms = ['data', 'analytics', 'analysis', 'visualization', 'intelligence']
-            for term in data_terms:
-                if term in module_name:
-                    boost += 20
-                if term in module_desc:
-                    boost += 12
-                if term in module_topics_text:
-                    boost += 15
+        if self._is_data_topic(target_lower):
+            boost += self._term_boost(module_name, module_desc, module_topics_text,
+                                      DATA_BOOST_TERMS, DATA_BOOST_WEIGHTS)
         
         # General sustainability boost
-        sustainability_terms = ['sustainable', 'sustainability', 'green', 'environmental']
-        for term in sustainability_terms:
-            if term in module_name:
-                boost += 10
-            if term in module_desc:
-                boost += 6
+        boost += self._term_boost(module_name, module_desc, module_topics_text,
+                                  SUSTAINABILITY_BOOST_TERMS, SUSTAINABILITY_BOOST_WEIGHTS)
         
         return base_score + boost
     
+    @staticmethod
+    def _is_carbon_topic(target_lower: str) -> bool:
+        return 'carbon' in target_lower or 'footprint' in target_lower
+    
+    @staticmethod
+    def _is_data_topic(target_lower: str) -> bool:
+        return 'data' in target_lower or 'analytics' in target_lower
+    
+    @staticmethod
+    def _term_boost(
+        module_name: str,
+        module_desc: str,
+        module_topics_text: str,
+        terms: List[str],
+        weights: Tuple[int, int, int]
+    ) -> float:
+        """Sum the name/description/topics weights of every term found in the module"""
+        name_weight, desc_weight, topics_weight = weights
+        boost = 0.0
+        for term in terms:
+            if term in module_name:
+                boost += name_weight
+            if term in module_desc:
+                boost += desc_weight
+            if topics_weight and term in module_topics_text:
+                boost += topics_weight
+        return boost
+    
     def _score_with_enhanced_fallback(
         self, 
         module: Dict[str, Any], 
@@ -160,53 +191,179 @@ class ConsolidatedTopicScorer:
     ) -> Tuple[float, Dict[str, Any]]:
         """Enhanced fallback scoring"""
         
-        module_name = module.get('name', '').lower()
-        module_desc = module.get('description', '').lower()
-        module_topics = module.get('topics', [])
-        module_topics_text = ' '.join(module_topics).lower() if module_topics else ''
+        module_name, module_desc, module_topics_text = self._module_texts(module)
+        target_words, weighted_terms = self._expand_target_terms(target_topic)
         
+        score = 0.0
+        for term, name_weight, desc_weight, topics_weight in weighted_terms:
+            if term in module_name:
+                score += name_weight
+            if term in module_desc:
+                score += desc_weight
+            if term in module_topics_text:
+                score += topics_weight
+        
+        debug_info = {
+            'method': 'enhanced_fallback',
+            'target_words': list(target_words),
+            'final_score': min(score, 100)
+        }
+        
+        return min(score, 100), debug_info
+    
+    @staticmethod
+    def _module_texts(module: Dict[str, Any]) -> Tuple[str, str, str]:
+        """Lowercased name, description and topics text used by the scorers"""
+        module_topics = module.get('topics', [])
+        return (
+            module.get('name', '').lower(),
+            module.get('description', '').lower(),
+            ' '.join(module_topics).lower() if module_topics else ''
+        )
+    
+    def _expand_target_terms(self, target_topic: str) -> Tuple[set, List[Tuple[str, int, int, int]]]:
+        """Expand a topic into (term, name, description, topics) weights for fallback scoring"""
         target_lower = target_topic.lower()
         target_words = set(target_lower.split())
         
-        score = 0.0
-        
         # Direct topic matching
-        if target_lower in module_name:
-            score += 30
-        if target_lower in module_desc:
-            score += 20
-        if target_lower in module_topics_text:
-            score += 25
+        weighted_terms = [(target_lower, 30, 20, 25)]
         
         # Word-by-word matching
         for word in target_words:
             if len(word) > 2:
-                if word in module_name:
-                    score += 15
-                if word in module_desc:
-                    score += 10
-                if word in module_topics_text:
-                    score += 12
+                weighted_terms.append((word, 15, 10, 12))
         
         # Semantic mapping
         for word in target_words:
-            if word in self.semantic_mappings:
-                related_terms = self.semantic_mappings[word]
-                for term in related_terms:
-                    if term in module_name:
-                        score += 8
-                    if term in module_desc:
-                        score += 5
-                    if term in module_topics_text:
-                        score += 6
+            for term in self.semantic_mappings.get(word, []):
+                weighted_terms.append((term, 8, 5, 6))
         
-        debug_info = {
-            'method': 'enhanced_fallback',
-            'target_words': list(target_words),
-            'final_score': min(score, 100)
-        }
+        return target_words, weighted_terms
+    
+    def score_matrix(
+        self,
+        modules: Sequence[Dict[str, Any]],
+        topics: Sequence[Optional[str]],
+        include_debug: bool = False
+    ) -> Union[np.ndarray, Tuple[np.ndarray, List[List[Dict[str, Any]]]]]:
+        """
+        Score every module against every topic in one batch.
+        
+        Returns a (len(modules), len(topics)) float array with the same values as
+        score_module_topic_relevance; with include_debug=True also returns the
+        per-pair debug info as debug[module_row][topic_column].
+        Module texts, term presence and topic keyword expansion are computed once
+        for the whole batch instead of once per pair; columns already in the
+        scoring cache are not rescored.
+        """
+        modules = list(modules)
+        topics = list(topics)
+        scores = np.zeros((len(modules), len(topics)), dtype=np.float64)
+        debug = [[None] * len(topics) for _ in modules] if include_debug else None
+        
+        module_hashes = [module_content_hash(module) for module in modules]
+        presence_cache = {}
+        
+        # The catalog snapshot's text index when the modules come from one (built once per snapshot)
+        index = self.text_index_class.for_modules(modules) if self.text_index_class and modules else None
+        index_rows = [index.row_of(module) for module in modules] if index is not None else None
+        if index_rows is not None and any(row is None for row in index_rows):
+            index, index_rows = None, None
+        presence_index = index
+        texts = [self._module_texts(module) for module in modules] if index is None else None
+        
+        def term_presence(term: str) -> np.ndarray:
+            """(n_modules, 3) bool array: term in name / description / topics text"""
+            if term not in presence_cache:
+                if presence_index is not None:
+                    presence = np.zeros((len(presence_index), 3), dtype=bool)
+                    for field_column, field in enumerate(('name', 'description', 'topics')):
+                        presence[presence_index.rows_containing(field, term), field_column] = True
+                    presence_cache[term] = presence[index_rows]
+                else:
+                    presence_cache[term] = np.array(
+                        [[term in name, term in desc, term in topics_text] for name, desc, topics_text in texts],
+                        dtype=bool
+                    ).reshape(len(modules), 3)
+            return presence_cache[term]
+        
+        def weighted_sum(weighted_terms) -> np.ndarray:
+            total = np.zeros(len(modules), dtype=np.float64)
+            for term, *weights in weighted_terms:
+                total += term_presence(term) @ np.asarray(weights, dtype=np.float64)
+            return total
+        
+        # Topic independent boosts are shared by every column
+        boosts = None
+        if self.knowledge_base and modules and any(topic is not None for topic in topics):
+            boosts = {
+                'carbon': weighted_sum((term, *CARBON_BOOST_WEIGHTS) for term in CARBON_BOOST_TERMS),
+                'data': weighted_sum((term, *DATA_BOOST_WEIGHTS) for term in DATA_BOOST_TERMS),
+                'sustainability': weighted_sum(
+                    (term, *SUSTAINABILITY_BOOST_WEIGHTS) for term in SUSTAINABILITY_BOOST_TERMS
+                )
+            }
+            # Modules outside a loaded catalog: a batch index is cheaper than per-module
+            # scoring even for a single topic
+            if index is None and self.text_index_class is not None:
+                index = self.text_index_class(modules)
+        
+        general_column = None
+        for column, topic in enumerate(topics):
+            if topic is None:
+                if general_column is None:
+                    general_column = [self._score_general_sustainability(module) for module in modules]
+                column_results = general_column
+            else:
+                keys = [(module_hash, topic, self.scorer_version) for module_hash in module_hashes]
+                column_results = [self.scoring_cache.get(key) for key in keys]
+                if any(result is None for result in column_results):
+                    column_results = self._score_topic_column(
+                        modules, topic, boosts, index, weighted_sum
+                    )
+                    self.scoring_cache.put_many(zip(keys, column_results))
+            
+            for row, (score, debug_info) in enumerate(column_results):
+                scores[row, column] = score
+                if include_debug:
+                    debug[row][column] = debug_info
         
-        return min(score, 100), debug_info
+        return (scores, debug) if include_debug else scores
+    
+    def _score_topic_column(self, modules, topic, boosts, index, weighted_sum) -> List[Tuple[float, Dict[str, Any]]]:
+        """Score all modules against one topic for score_matrix"""
+        if boosts is not None:
+            try:
+                kb_scores = self.knowledge_base.score_modules_relevance(modules, topic, index)
+                target_lower = topic.lower()
+                boost = np.zeros(len(modules), dtype=np.float64)
+                if self._is_carbon_topic(target_lower):
+                    boost += boosts['carbon']
+                if self._is_data_topic(target_lower):
+                    boost += boosts['data']
+                boost += boosts['sustainability']
+                return [
+                    (min(kb_score + extra, 100), {
+                        'method': 'kb_optimized',
+                        'kb_score': kb_score,
+                        'boosted_score': kb_score + extra
+                    })
+                    for kb_score, extra in zip(kb_scores, boost.tolist())
+                ]
+            except Exception:
+                pass
+        
+        target_words, weighted_terms = self._expand_target_terms(topic)
+        column = weighted_sum(weighted_terms).tolist()
+        return [
+            (min(score, 100), {
+                'method': 'enhanced_fallback',
+                'target_words': list(target_words),
+                'final_score': min(score, 100)
+            })
+            for score in column
+        ]
     
     def _score_general_sustainability(self, module: Dict[str, Any]) -> Tuple[float, Dict[str, Any]]:
         """Score for general sustainability relevance"""
@@ -255,6 +412,15 @@ class ConsolidatedTopicScorer:
             'scores_above_60': len([s for s in scores if s > 60])
         }
     
-    def clear_cache(self):
-        """Clear scoring cache"""
-        self.scoring_cache.clear()
+    @property
+    def scorer_version(self) -> str:
+        """Cache key component: scoring rules version and active scoring path"""
+        return f"{SCORER_VERSION}:{'kb' if self.knowledge_base else 'fallback'}"
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss/eviction counters of the scoring cache"""
+        return self.scoring_cache.stats()
+    
+    def clear_cache(self, persistent: bool = False):
+        """Clear scoring cache (and its on-disk store when persistent=True)"""
+        self.scoring_cache.clear(persistent=persistent)
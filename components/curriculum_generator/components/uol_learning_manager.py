@@ -8,6 +8,8 @@ Works with ANY role - creates competency-focused, stackable learning units
 import math
 from typing import Dict, List, Any, Optional
 
+from ecm.tracing import traced
+
 class UOLLearningManager:
     """Manages UOL (Units of Learning) distribution for any role/ECTS combination"""
     
@@ -37,6 +39,7 @@ class UOLLearningManager:
         
         print(f"✅ UOL Learning Manager initialized (GENERAL SOLUTION)")
 
+    @traced('distribute_ects', 'stage')
     def distribute_ects_across_uol(self, total_ects: float, uol: int, role_id: str, topic: str) -> List[Dict[str, Any]]:
         """Distribute ECTS across specified Units of Learning (UOL)"""
         
@@ -11,6 +11,8 @@ from pathlib import Path
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
+from ecm.tracing import traced
+
 class WP3CompliantGenerator:
     """Generates curricula following WP3 standards with named modules, framework mappings, and micro-credentials"""
     
@@ -64,6 +66,7 @@ class WP3CompliantGenerator:
             }
         }
     
+    @traced('wp3_curriculum', 'builder')
     def generate_wp3_compliant_curriculum(self, role_id: str, eqf_level: int, ects: float, 
                                         selected_modules: List[Dict], topic: str) -> Dict:
         """Generate complete WP3-compliant curriculum following ChatGPT's template"""
@@ -6,41 +6,29 @@ Content Specificity Engine - Fixed Module Database Path
 Addresses D2.1 curriculum generation problems with corrected module mappings
 """
 
-import json
 import os
-from pathlib import Path
 from typing import Dict, List, Tuple, Any, Optional
 import logging
 
+from ecm.catalog import CatalogSnapshot, get_catalog_snapshot
+from ecm.tracing import traced
+
 class ContentSpecificityEngine:
     """Enhanced content specificity engine with corrected module references"""
     
-    def __init__(self, modules_path: str = None):
-        # Use absolute path resolution
-        if modules_path is None:
-            project_root = Path(__file__).parent.parent.parent
-            self.modules_path = project_root / "input" / "modules" / "modules_v5.json"
-        else:
-            self.modules_path = Path(modules_path)
+    def __init__(self, catalog: Optional[CatalogSnapshot] = None):
+        # Shared catalog snapshot (parsed once per process)
+        self.catalog = catalog if catalog is not None else get_catalog_snapshot()
         
         self.modules = self._load_modules()
         self.role_preferences = self._initialize_role_preferences()
         self.d21_priority_modules = self._initialize_d21_modules()
         
     def _load_modules(self) -> List[Dict]:
-        """Load module database with proper path resolution"""
-        try:
-            if self.modules_path.exists():
-                with open(self.modules_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                print(f"✅ Loaded {len(data)} modules from {self.modules_path}")
-                return data
-            else:
-                print(f"❌ Module database not found at {self.modules_path}")
-                return []
-        except Exception as e:
-            print(f"⚠️  Error loading modules: {e}")
-            return []
+        """Take the module database from the catalog snapshot"""
+        modules = list(self.catalog.modules)
+        print(f"✅ Using {len(modules)} modules from catalog {self.catalog.version}")
+        return modules
     
     def _initialize_role_preferences(self) -> Dict[str, List[str]]:
         """Initialize content preferences for each role"""
@@ -68,6 +56,7 @@ class ContentSpecificityEngine:
             "business_analysis": ["M51", "M19", "M24"]  # Uses existing analysis modules
         }
     
+    @traced('content_specificity', 'stage')
     def enhance_curriculum(self, curriculum: Dict, role: str, modules_used: List[Dict]) -> Dict:
         """Enhanced curriculum with content specificity engine"""
         print(f"🚀 Enhancing curriculum with specific content for {role}")
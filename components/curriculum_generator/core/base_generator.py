@@ -16,11 +16,13 @@ from scripts.curriculum_generator.domain.educational_profiles import Educational
 class CurriculumGenerator:
     """T3.2/T3.4 compliant curriculum generator with Educational Profiles output"""
 
-    def __init__(self, domain_knowledge, data_loader, role_manager=None):
+    def __init__(self, domain_knowledge, data_loader, role_manager=None, enforce_prerequisites=False):
         """Initialize curriculum generator with domain knowledge and data loader"""
         self.domain_knowledge = domain_knowledge
         self.data_loader = data_loader
         self.role_manager = role_manager
+        # Add missing prerequisite modules to selections instead of only reporting them
+        self.enforce_prerequisites = enforce_prerequisites
 
         # Get project root from data_loader or set default
         if hasattr(data_loader, 'project_root'):
@@ -29,7 +31,9 @@ class CurriculumGenerator:
             project_root = Path(__file__).parent.parent.parent
 
         # Initialize components
-        self.module_selector = ModuleSelector(domain_knowledge, role_manager)
+        self.module_selector = ModuleSelector(
+            domain_knowledge, role_manager, enforce_prerequisites=enforce_prerequisites
+        )
 
         # Don't initialize curriculum_builder here - it needs modules
         self.curriculum_builder = None
@@ -52,7 +56,9 @@ class CurriculumGenerator:
 
         # Initialize curriculum builder with modules (not domain_knowledge)
         from scripts.curriculum_generator.components.curriculum_builder import EnhancedCurriculumBuilder
-        self.curriculum_builder = EnhancedCurriculumBuilder(modules)
+        self.curriculum_builder = EnhancedCurriculumBuilder(
+            modules, enforce_prerequisites=self.enforce_prerequisites
+        )
 
         # Get role information
         role_info = self.domain_knowledge.get_role(role_id)
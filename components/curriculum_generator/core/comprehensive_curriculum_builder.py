@@ -12,6 +12,8 @@ from typing import Dict, List, Any, Optional
 from datetime import datetime
 import random
 
+from ecm.tracing import traced
+
 class ComprehensiveCurriculumBuilder:
     """
     T3.2/T3.4 COMPLIANT Comprehensive Curriculum Builder with GENUINE TARGET AUDIENCE DIFFERENTIATION
@@ -350,6 +352,7 @@ class ComprehensiveCurriculumBuilder:
             ]
         }
 
+    @traced('comprehensive_builder', 'builder')
     def build_complete_curriculum(self, base_curriculum: Dict[str, Any], target_audience: str = "digital_professionals") -> Dict[str, Any]:
         """
         FIXED: Generate complete T3.2/T3.4 compliant curriculum with GENUINE TARGET AUDIENCE DIFFERENTIATION
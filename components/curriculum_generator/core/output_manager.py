@@ -12,12 +12,18 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
+from ecm.assets import AssetWriter, template_asset
+from ecm.templating import render_template
+from ecm.tracing import traced
+
 class OutputManager:
     """Manages output generation for educational profiles and curricula with DOCX support"""
     
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, inline_assets: bool = False):
         self.project_root = project_root
         self.default_output_dir = project_root / 'output'
+        # Link shared assets/<hash>.css files instead of embedding stylesheets
+        self.inline_assets = inline_assets
         
         # Initialize DOCX generator
         try:
@@ -70,7 +76,8 @@ class OutputManager:
             print(f"✅ Educational Profile JSON saved: {json_file.name}")
             
             # Generate and save HTML
-            html_content = self._generate_educational_profile_html(educational_profile)
+            stylesheet = AssetWriter(output_dir, inline=self.inline_assets).tag(template_asset('educational_profile.css'))
+            html_content = self._generate_educational_profile_html(educational_profile, stylesheet)
             html_file = output_dir / f"{filename_base}.html"
             with open(html_file, 'w', encoding='utf-8') as f:
                 f.write(html_content)
@@ -99,6 +106,7 @@ class OutputManager:
             traceback.print_exc()
             return []
     
+    @traced('save', 'render')
     def save_curriculum_with_all_formats(self,
                                        curriculum: Dict[str, Any],
                                        curriculum_html: str,
@@ -278,407 +286,129 @@ Create dashboards to communicate sustainability impact to stakeholders."""
         else:
             return str(data)
     
-    def _generate_educational_profile_html(self, profile: Dict[str, Any]) -> str:
-        """Generate comprehensive HTML for educational profile - FIXED VERSION"""
-        
-        try:
-            metadata = profile.get('metadata', {})
-            role_def = profile.get('role_definition', {})
-            career_prog = profile.get('realistic_career_progression', {})
-            employers = profile.get('typical_employers', {})
-            competencies = profile.get('enhanced_competencies', {})
-            modular = profile.get('modular_structure', {})
-            assessment = profile.get('assessment_methods', {})
-            entry_req = profile.get('entry_requirements', {})
-            cpd = profile.get('cpd_requirements', {})
-            
-            # FIXED: Generate career progression HTML safely
-            career_html = ""
-            if career_prog:
-                entry_level = career_prog.get('entry_level', {})
-                progression_roles = career_prog.get('progression_roles', [])
-                
-                salary_range = entry_level.get('salary_range_eur', {})
-                min_salary = salary_range.get('min', 30000) if isinstance(salary_range, dict) else 30000
-                max_salary = salary_range.get('max', 50000) if isinstance(salary_range, dict) else 50000
-                
-                career_html = f"""
-                <div class="career-entry">
-                    <h4>🎯 Entry Level: {entry_level.get('title', 'Professional')}</h4>
-                    <p><strong>Salary Range:</strong> €{min_salary:,} - €{max_salary:,}</p>
-                    <p><strong>Experience:</strong> {entry_level.get('experience_required', 'Entry level')}</p>
-                </div>
-                <div class="career-progression">
-                    <h4>📈 Career Progression</h4>
-                """
-                
-                for role in progression_roles:
-                    if isinstance(role, dict):  # Safety check
-                        additional_skills = role.get('additional_skills_needed', [])
-                        skills_text = ', '.join(additional_skills) if isinstance(additional_skills, list) else str(additional_skills)
-                        
-                        career_html += f"""
-                        <div class="progression-step">
-                            <h5>{role.get('title', 'Senior Role')}</h5>
-                            <p><strong>Timeline:</strong> {role.get('years_to_achieve', '3-5')} years</p>
-                            <p><strong>Salary Increase:</strong> {role.get('salary_increase_percent', '30-50')}%</p>
-                            <p><strong>Skills Needed:</strong> {skills_text}</p>
-                        </div>
-                        """
-                career_html += "</div>"
-            
-            # FIXED: Generate employers HTML safely
-            employers_html = ""
-            if employers:
-                primary = employers.get('primary_sectors', [])
-                secondary = employers.get('secondary_sectors', [])
-                emerging = employers.get('emerging_opportunities', [])
-                
-                # Ensure lists
-                primary = primary if isinstance(primary, list) else []
-                secondary = secondary if isinstance(secondary, list) else []
-                emerging = emerging if isinstance(emerging, list) else []
-                
-                employers_html = f"""
-                <div class="employer-sectors">
-                    <div class="sector-group">
-                        <h4>🏢 Primary Employers</h4>
-                        <ul>{''.join(f'<li>{sector}</li>' for sector in primary)}</ul>
-                    </div>
-                    <div class="sector-group">
-                        <h4>🏭 Secondary Sectors</h4>
-                        <ul>{''.join(f'<li>{sector}</li>' for sector in secondary)}</ul>
-                    </div>
-                    <div class="sector-group">
-                        <h4>🚀 Emerging Opportunities</h4>
-                        <ul>{''.join(f'<li>{opp}</li>' for opp in emerging)}</ul>
-                    </div>
-                </div>
-                """
-            
-            # FIXED: Generate competencies HTML safely
-            competencies_html = ""
-            if competencies:
-                learning_outcomes = competencies.get('learning_outcomes', [])
-                framework_mappings = competencies.get('framework_mappings', {})
-                core_competencies = competencies.get('core_competencies', [])
-                
-                # Ensure learning_outcomes is a list
-                if isinstance(learning_outcomes, list):
-                    outcomes_list = ''.join(f'<li>{outcome}</li>' for outcome in learning_outcomes)
-                else:
-                    outcomes_list = '<li>Learning outcomes will be defined</li>'
-                
-                # FIXED: Framework mappings safety
-                frameworks_html = ""
-                if isinstance(framework_mappings, dict):
-                    for framework, codes in framework_mappings.items():
-                        framework_name = str(framework).upper().replace('_', '-')
-                        if isinstance(codes, list):
-                            codes_text = ', '.join(str(code) for code in codes[:4])  # Show first 4 codes
-                        else:
-                            codes_text = str(codes)
-                        frameworks_html += f'<span class="framework-badge">{framework_name}: {codes_text}</span>'
-                
-                # FIXED: Core competencies safety
-                competencies_list = ""
-                if isinstance(core_competencies, list):
-                    for comp in core_competencies:
-                        if isinstance(comp, dict):
-                            competencies_list += f"""
-                            <div class="competency-item">
-                                <h5>{comp.get('name', 'Core Competency')}</h5>
-                                <p>{comp.get('description', 'Professional competency')}</p>
-                                <span class="proficiency-badge">{comp.get('proficiency_level', 'Professional')}</span>
-                            </div>
-                            """
-                        else:
-                            # Handle string competencies
-                            competencies_list += f"""
-                            <div class="competency-item">
-                                <h5>{str(comp)}</h5>
-                                <p>Core professional competency</p>
-                                <span class="proficiency-badge">Professional</span>
-                            </div>
-                            """
-                
-                competencies_html = f"""
-                <div class="learning-outcomes">
-                    <h4>🎯 Target LLLearning Outcomes</h4>
-                    <ul>{outcomes_list}</ul>
-                </div>
-                <div class="framework-mappings">
-                    <h4>🗺️ Framework Alignment</h4>
-                    <div class="frameworks-container">{frameworks_html}</div>
-                </div>
-                <div class="core-competencies">
-                    <h4>💪 Core Competencies</h4>
-                    {competencies_list}
-                </div>
-                """
-            
-            # FIXED: Generate modular structure HTML safely
-            modular_html = ""
-            if modular:
-                total_ects = modular.get('total_ects', 60)
-                duration = modular.get('duration_semesters', 2)
-                modules = modular.get('modules', [])
-                semesters = modular.get('semesters', [])
-                
-                modules_list = ""
-                if isinstance(modules, list):
-                    for module in modules:
-                        if isinstance(module, dict):
-                            modules_list += f"""
-                            <div class="module-item">
-                                <h5>{module.get('name', 'Module')} ({module.get('ects', 7.5)} ECTS)</h5>
-                                <p><strong>Semester:</strong> {module.get('semester', 1)} | <strong>Delivery:</strong> {module.get('delivery_mode', 'Blended')}</p>
-                                <p><strong>Relevance:</strong> {module.get('relevance_score', 80)}%</p>
-                            </div>
-                            """
-                
-                semesters_list = ""
-                if isinstance(semesters, list):
-                    for sem in semesters:
-                        if isinstance(sem, dict):
-                            semesters_list += f"""
-                            <div class="semester-item">
-                                <h5>Semester {sem.get('semester_number', 1)}</h5>
-                                <p>{sem.get('ects', 30)} ECTS | {sem.get('modules_count', 4)} modules</p>
-                            </div>
-                            """
-                
-                modular_html = f"""
-                <div class="program-overview">
-                    <h4>📚 Program Structure</h4>
-                    <p><strong>Total:</strong> {total_ects} ECTS | <strong>Duration:</strong> {duration} semester(s)</p>
-                </div>
-                <div class="semester-breakdown">
-                    <h4>📅 Semester Breakdown</h4>
-                    {semesters_list}
-                </div>
-                <div class="modules-list">
-                    <h4>📖 Modules</h4>
-                    {modules_list}
-                </div>
-                """
-            
-            # FIXED: Generate assessment HTML safely
-            assessment_html = ""
-            if assessment:
-                primary_methods = assessment.get('primary_methods', [])
-                practical_comp = assessment.get('practical_components', {})
-                
-                if isinstance(primary_methods, list):
-                    methods_list = ''.join(f'<li>{method}</li>' for method in primary_methods)
-                else:
-                    methods_list = '<li>Assessment methods will be defined</li>'
-                
-                practical_percent = practical_comp.get('percentage', 50) if isinstance(practical_comp, dict) else 50
-                
-                assessment_html = f"""
-                <div class="assessment-methods">
-                    <h4>📝 How You'll Be Assessed</h4>
-                    <ul>{methods_list}</ul>
-                    <p><strong>Practical Components:</strong> {practical_percent}% of assessment</p>
-                    <p><strong>Final Assessment:</strong> {assessment.get('final_assessment', 'Capstone project')}</p>
-                </div>
-                """
+    def _educational_profile_context(self, profile: Dict[str, Any]) -> Dict[str, Any]:
+        """Normalise an educational profile into the values the HTML template shows"""
+        metadata = profile.get('metadata', {})
+        role_def = profile.get('role_definition', {})
+        career_prog = profile.get('realistic_career_progression', {})
+        employers = profile.get('typical_employers', {})
+        competencies = profile.get('enhanced_competencies', {})
+        modular = profile.get('modular_structure', {})
+        assessment = profile.get('assessment_methods', {})
+        entry_req = profile.get('entry_requirements', {})
+        cpd = profile.get('cpd_requirements', {})
+        
+        context = {
+            'career_prog': career_prog,
+            'employers': employers,
+            'competencies': competencies,
+            'modular': modular,
+            'assessment': assessment,
+            'entry_req': entry_req,
+            'cpd': cpd
+        }
+        
+        # FIXED: Career progression safety
+        if career_prog:
+            entry_level = career_prog.get('entry_level', {})
+            salary_range = entry_level.get('salary_range_eur', {})
             
-            # FIXED: Generate entry requirements HTML safely
-            entry_html = ""
-            if entry_req:
-                entry_html = f"""
-                <div class="entry-requirements">
-                    <h4>🎓 Entry Requirements</h4>
-                    <p><strong>Education:</strong> {entry_req.get('formal_education', 'Secondary education')}</p>
-                    <p><strong>Experience:</strong> {entry_req.get('professional_experience', 'No experience required')}</p>
-                    <p><strong>Digital Skills:</strong> {entry_req.get('digital_competencies', 'Basic digital literacy')}</p>
-                    <p><strong>Language:</strong> {entry_req.get('language_requirements', 'English proficiency')}</p>
-                </div>
-                """
+            progression_roles = []
+            for role in career_prog.get('progression_roles', []):
+                if isinstance(role, dict):  # Safety check
+                    additional_skills = role.get('additional_skills_needed', [])
+                    skills_text = ', '.join(additional_skills) if isinstance(additional_skills, list) else str(additional_skills)
+                    progression_roles.append((role, skills_text))
             
-            # FIXED: Generate CPD HTML safely
-            cpd_html = ""
-            if cpd:
-                cert_maint = cpd.get('certification_maintenance', {})
-                micro_learning = cpd.get('micro_learning_opportunities', {})
-                
-                renewal_years = cert_maint.get('renewal_period_years', 3) if isinstance(cert_maint, dict) else 3
-                cpd_hours = cert_maint.get('cpd_hours_required', 40) if isinstance(cert_maint, dict) else 40
-                max_recognition = micro_learning.get('maximum_recognition', 10) if isinstance(micro_learning, dict) else 10
-                
-                cpd_html = f"""
-                <div class="cpd-requirements">
-                    <h4>🔄 Continuing Professional Development</h4>
-                    <p><strong>Renewal Period:</strong> {renewal_years} years</p>
-                    <p><strong>CPD Hours Required:</strong> {cpd_hours} hours</p>
-                    <p><strong>Stackable Credits:</strong> Up to {max_recognition} ECTS per renewal</p>
-                </div>
-                """
-            
-            # Generate the final HTML
-            role_name = role_def.get('name', 'Professional')
-            role_id = role_def.get('id', 'ROLE')
-            role_area = role_def.get('main_area', 'Digital Sustainability')
-            eqf_level = metadata.get('eqf_level', 6)
-            generation_date = metadata.get('generation_date', datetime.now().isoformat())
-            
-            return f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Educational Profile: {role_name} - EQF Level {eqf_level}</title>
-    <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        
-        :root {{
-            --primary-color: #2E7D32;
-            --secondary-color: #1976D2;
-            --accent-color: #FF6F00;
-            --background-color: #FAFAFA;
-            --surface-color: #FFFFFF;
-            --text-color: #212121;
-            --border-color: #E0E0E0;
-        }}
-        
-        body {{ font-family: 'Segoe UI', system-ui, sans-serif; line-height: 1.6; color: var(--text-color); background: var(--background-color); padding: 20px; }}
-        .container {{ max-width: 1200px; margin: 0 auto; }}
-        
-        .header {{ background: linear-gradient(135deg, var(--primary-color) 0%, var(--secondary-color) 100%); color: white; padding: 3rem 2rem; border-radius: 15px; margin-bottom: 2rem; text-align: center; box-shadow: 0 10px 30px rgba(0,0,0,0.2); }}
-        .header h1 {{ font-size: 2.5rem; margin-bottom: 0.5rem; }}
-        .header h2 {{ font-size: 1.5rem; margin-bottom: 1rem; opacity: 0.9; }}
-        .metadata {{ display: flex; justify-content: center; gap: 1rem; flex-wrap: wrap; margin-top: 1rem; }}
-        .badge {{ background: rgba(255,255,255,0.25); padding: 0.5rem 1rem; border-radius: 25px; font-size: 0.9rem; }}
-        
-        .section {{ background: var(--surface-color); margin: 2rem 0; border-radius: 15px; box-shadow: 0 8px 25px rgba(0,0,0,0.1); overflow: hidden; }}
-        .section-header {{ background: linear-gradient(135deg, var(--secondary-color) 0%, #1565C0 100%); color: white; padding: 1.5rem 2rem; font-size: 1.3rem; font-weight: 600; }}
-        .section-content {{ padding: 2rem; }}
-        
-        .two-column {{ display: grid; grid-template-columns: 1fr 1fr; gap: 2rem; }}
-        .three-column {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 2rem; }}
-        
-        .career-entry {{ background: #E8F5E8; padding: 1.5rem; border-radius: 10px; border-left: 5px solid var(--primary-color); margin-bottom: 1.5rem; }}
-        .career-progression {{ background: #FFF3E0; padding: 1.5rem; border-radius: 10px; border-left: 5px solid var(--accent-color); }}
-        .progression-step {{ background: rgba(255,255,255,0.8); padding: 1rem; margin: 1rem 0; border-radius: 8px; border-left: 3px solid var(--accent-color); }}
-        
-        .employer-sectors {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 1.5rem; }}
-        .sector-group {{ background: #F3E5F5; padding: 1.5rem; border-radius: 10px; border-left: 5px solid #9C27B0; }}
-        .sector-group h4 {{ color: #7B1FA2; margin-bottom: 1rem; }}
-        .sector-group ul {{ list-style-type: none; }}
-        .sector-group li {{ padding: 0.3rem 0; }}
-        .sector-group li:before {{ content: "• "; color: #9C27B0; font-weight: bold; }}
-        
-        .learning-outcomes {{ background: #E3F2FD; padding: 1.5rem; border-radius: 10px; border-left: 5px solid var(--secondary-color); margin-bottom: 1.5rem; }}
-        .learning-outcomes ul {{ padding-left: 1.5rem; }}
-        .learning-outcomes li {{ margin: 0.5rem 0; }}
-        
-        .framework-mappings {{ background: #F1F8E9; padding: 1.5rem; border-radius: 10px; border-left: 5px solid #689F38; margin-bottom: 1.5rem; }}
-        .frameworks-container {{ display: flex; gap: 0.5rem; flex-wrap: wrap; margin-top: 1rem; }}
-        .framework-badge {{ background: #C8E6C9; color: #2E7D32; padding: 0.4rem 0.8rem; border-radius: 20px; font-size: 0.85rem; font-weight: 500; }}
-        
-        .core-competencies {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 1rem; }}
-        .competency-item {{ background: #FFF8E1; padding: 1rem; border-radius: 8px; border-left: 3px solid #FFA000; }}
-        .proficiency-badge {{ background: #FF8F00; color: white; padding: 0.2rem 0.6rem; border-radius: 12px; font-size: 0.8rem; }}
+            context.update(
+                entry_level=entry_level,
+                min_salary=salary_range.get('min', 30000) if isinstance(salary_range, dict) else 30000,
+                max_salary=salary_range.get('max', 50000) if isinstance(salary_range, dict) else 50000,
+                progression_roles=progression_roles
+            )
         
-        .program-overview {{ background: #E8EAF6; padding: 1.5rem; border-radius: 10px; border-left: 5px solid #3F51B5; margin-bottom: 1.5rem; }}
-        .semester-breakdown {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 1rem; margin-bottom: 1.5rem; }}
-        .semester-item {{ background: #F3E5F5; padding: 1rem; border-radius: 8px; border-left: 3px solid #9C27B0; }}
-        .modules-list {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 1rem; }}
-        .module-item {{ background: #EFEBE9; padding: 1rem; border-radius: 8px; border-left: 3px solid #8D6E63; }}
+        # FIXED: Employers safety - ensure lists
+        if employers:
+            primary = employers.get('primary_sectors', [])
+            secondary = employers.get('secondary_sectors', [])
+            emerging = employers.get('emerging_opportunities', [])
+            context.update(
+                primary=primary if isinstance(primary, list) else [],
+                secondary=secondary if isinstance(secondary, list) else [],
+                emerging=emerging if isinstance(emerging, list) else []
+            )
         
-        .assessment-methods {{ background: #FFF3E0; padding: 1.5rem; border-radius: 10px; border-left: 5px solid var(--accent-color); }}
-        .assessment-methods ul {{ padding-left: 1.5rem; }}
-        .assessment-methods li {{ margin: 0.5rem 0; }}
+        # FIXED: Competencies safety
+        if competencies:
+            framework_mappings = competencies.get('framework_mappings', {})
+            core_competencies = competencies.get('core_competencies', [])
+            
+            framework_badges = []
+            if isinstance(framework_mappings, dict):
+                for framework, codes in framework_mappings.items():
+                    framework_name = str(framework).upper().replace('_', '-')
+                    if isinstance(codes, list):
+                        codes_text = ', '.join(str(code) for code in codes[:4])  # Show first 4 codes
+                    else:
+                        codes_text = str(codes)
+                    framework_badges.append((framework_name, codes_text))
+            
+            context.update(
+                learning_outcomes=competencies.get('learning_outcomes', []),
+                framework_badges=framework_badges,
+                core_competencies=core_competencies if isinstance(core_competencies, list) else []
+            )
         
-        .entry-requirements {{ background: #E0F2F1; padding: 1.5rem; border-radius: 10px; border-left: 5px solid #00695C; }}
-        .cpd-requirements {{ background: #FCE4EC; padding: 1.5rem; border-radius: 10px; border-left: 5px solid #C2185B; }}
+        # FIXED: Modular structure safety
+        if modular:
+            modules = modular.get('modules', [])
+            semesters = modular.get('semesters', [])
+            context.update(
+                total_ects=modular.get('total_ects', 60),
+                duration=modular.get('duration_semesters', 2),
+                modules=[module for module in modules if isinstance(module, dict)] if isinstance(modules, list) else [],
+                semesters=[sem for sem in semesters if isinstance(sem, dict)] if isinstance(semesters, list) else []
+            )
         
-        .footer {{ text-align: center; padding: 2rem; color: #666; background: rgba(255,255,255,0.8); border-radius: 10px; margin-top: 3rem; }}
+        # FIXED: Assessment safety
+        if assessment:
+            practical_comp = assessment.get('practical_components', {})
+            context.update(
+                primary_methods=assessment.get('primary_methods', []),
+                practical_percent=practical_comp.get('percentage', 50) if isinstance(practical_comp, dict) else 50
+            )
         
-        @media (max-width: 768px) {{ 
-            .two-column, .three-column {{ grid-template-columns: 1fr; }}
-            .metadata {{ flex-direction: column; align-items: center; }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <header class="header">
-            <h1>🎓 Educational Profile</h1>
-            <h2>{role_name} - EQF Level {eqf_level}</h2>
-            <div class="metadata">
-                <span class="badge">Role: {role_id}</span>
-                <span class="badge">Area: {role_area}</span>
-            </div>
-        </header>
+        # FIXED: CPD safety
+        if cpd:
+            cert_maint = cpd.get('certification_maintenance', {})
+            micro_learning = cpd.get('micro_learning_opportunities', {})
+            context.update(
+                renewal_years=cert_maint.get('renewal_period_years', 3) if isinstance(cert_maint, dict) else 3,
+                cpd_hours=cert_maint.get('cpd_hours_required', 40) if isinstance(cert_maint, dict) else 40,
+                max_recognition=micro_learning.get('maximum_recognition', 10) if isinstance(micro_learning, dict) else 10
+            )
         
-        <main>
-            <section class="section">
-                <div class="section-header">💼 Career Progression & Opportunities</div>
-                <div class="section-content">
-                    {career_html}
-                </div>
-            </section>
-            
-            <section class="section">
-                <div class="section-header">🏢 Typical Employers</div>
-                <div class="section-content">
-                    {employers_html}
-                </div>
-            </section>
-            
-            <section class="section">
-                <div class="section-header">🎯 Competences</div>
-                <div class="section-content">
-                    {competencies_html}
-                </div>
-            </section>
-            
-            <section class="section">
-                <div class="section-header">📚 Program Structure</div>
-                <div class="section-content">
-                    {modular_html}
-                </div>
-            </section>
-            
-            <div class="two-column">
-                <section class="section">
-                    <div class="section-header">📝 Assessment</div>
-                    <div class="section-content">
-                        {assessment_html}
-                    </div>
-                </section>
-                
-                <section class="section">
-                    <div class="section-header">🎓 Entry Requirements</div>
-                    <div class="section-content">
-                        {entry_html}
-                    </div>
-                </section>
-            </div>
-            
-            <section class="section">
-                <div class="section-header">🔄 Professional Development</div>
-                <div class="section-content">
-                    {cpd_html}
-                </div>
-            </section>
-        </main>
+        context.update(
+            role_name=role_def.get('name', 'Professional'),
+            role_id=role_def.get('id', 'ROLE'),
+            role_area=role_def.get('main_area', 'Digital Sustainability'),
+            eqf_level=metadata.get('eqf_level', 6),
+            generation_date=metadata.get('generation_date', datetime.now().isoformat())
+        )
+        return context
+    
+    def _generate_educational_profile_html(self, profile: Dict[str, Any], stylesheet: Optional[str] = None) -> str:
+        """Generate comprehensive HTML for educational profile (stylesheet inline unless a tag is given)"""
         
-        <footer class="footer">
-            <p><strong>Educational Profile</strong></p>
-            <p>Generated: {generation_date}</p>
-        </footer>
-    </div>
-</body>
-</html>
-            """
+        try:
+            if stylesheet is None:
+                stylesheet = AssetWriter(inline=True).tag(template_asset('educational_profile.css'))
+            return render_template('educational_profile.html.j2', stylesheet=stylesheet,
+                                   **self._educational_profile_context(profile))
             
         except Exception as e:
             print(f"❌ Error generating HTML: {e}")
             import traceback
             traceback.print_exc()
             return f"<html><body><h1>Error generating profile</h1><p>{str(e)}</p></body></html>"
+
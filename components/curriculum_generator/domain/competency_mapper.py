@@ -5,17 +5,27 @@ Maps curriculum components to comprehensive industry competency frameworks
 Eliminates truncated entries and provides complete competency descriptions
 """
 
+import hashlib
 import json
 import logging
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
+import numpy as np
+
+from ecm.catalog import snapshot_of
+from ecm.keyword_automaton import KeywordAutomaton
+
 logger = logging.getLogger(__name__)
 
 
 class EnhancedCompetencyMapper:
     """Enhanced mapper with comprehensive framework integration"""
     
+    # Score rows kept for modules outside a loaded catalog snapshot (catalog
+    # modules are scored once per snapshot in one matrix instead)
+    MODULE_ROW_CACHE_SIZE = 4096
+    
     def __init__(self, project_root: Path):
         self.project_root = project_root
         self.standards_dir = project_root / 'input' / 'standards'
@@ -26,6 +36,7 @@ class EnhancedCompetencyMapper:
         
         # Build competency lookup tables
         self.competency_database = self._build_competency_database()
+        self._build_competency_index()
         
         print(f"✅ Enhanced Competency Mapper initialized with {len(self.competency_database)} competencies")
         
@@ -98,6 +109,33 @@ class EnhancedCompetencyMapper:
         
         return database
     
+    def _build_competency_index(self):
+        """Lower-cased competency fields in score matrix column order"""
+        self.competency_ids = list(self.competency_database)
+        self._competency_columns = {comp_id: column for column, comp_id in enumerate(self.competency_ids)}
+        self._competency_text = [
+            (
+                competency['title'].lower(),
+                competency['description'].lower(),
+                [example.lower() for example in competency.get('application_examples', [])],
+                [skill.lower() for skill in competency.get('related_skills', [])]
+            )
+            for competency in self.competency_database.values()
+        ]
+        self._greencomp_columns = np.array(
+            [competency['framework'] == 'GreenComp' for competency in self.competency_database.values()], dtype=bool
+        )
+        self._sustainability_columns = np.array(
+            ['sustainability' in description for _, description, _, _ in self._competency_text], dtype=bool
+        )
+        # Identifies the competency database in the catalog snapshot's derived matrices
+        self._database_key = hashlib.sha256(
+            json.dumps(self.competency_database, sort_keys=True, default=str).encode('utf-8')
+        ).hexdigest()
+        self._keyword_hits = {}
+        self._module_score_rows = {}
+        self._role_columns = {}
+    
     def get_competencies_for_role(self, role_id: str, eqf_level: int = 6) -> List[Dict]:
         """Get comprehensive competency mappings for a specific role"""
         
@@ -230,29 +268,146 @@ class EnhancedCompetencyMapper:
     
     def map_module_to_competencies(self, module: Dict, role_id: str, eqf_level: int = 6) -> List[Dict]:
         """Map a specific module to relevant competencies"""
-        
-        module_title = module.get('title', '').lower()
-        module_keywords = [kw.lower() for kw in module.get('keywords', [])]
-        module_description = module.get('description', '').lower()
+        return self._map_score_row(module, self.module_competency_matrix([module])[0], role_id, eqf_level)
+    
+    def _map_score_row(self, module: Dict, score_row: np.ndarray, role_id: str, eqf_level: int) -> List[Dict]:
+        """Top competencies of a module's score row for a role/EQF level"""
+        competencies, columns = self._role_competency_columns(role_id, eqf_level)
+        scores = score_row[columns]
         
         relevant_competencies = []
-        all_competencies = self.get_competencies_for_role(role_id, eqf_level)
+        for position in self._top_competency_positions(scores):
+            comp_mapping = competencies[position].copy()
+            comp_mapping['relevance_score'] = float(scores[position])
+            comp_mapping['module_alignment'] = self._explain_module_alignment(module, comp_mapping)
+            relevant_competencies.append(comp_mapping)
         
-        for comp in all_competencies:
-            relevance_score = self._calculate_module_competency_relevance(
-                module_title, module_keywords, module_description, comp
+        return relevant_competencies
+    
+    def module_competency_matrix(self, modules: List[Dict]) -> np.ndarray:
+        """Relevance of every module (rows) to every competency (columns, in competency_ids order)"""
+        if not modules:
+            return np.zeros((0, len(self.competency_ids)))
+        
+        # Modules taken from a loaded catalog: rows of the snapshot's matrix (built once per snapshot)
+        found = snapshot_of(modules)
+        if found is not None:
+            snapshot, view = found
+            matrix, rows = snapshot.derived(
+                f"competency_matrix:{view}:{self._database_key}",
+                lambda s: self._catalog_matrix(getattr(s, view))
             )
-            
-            if relevance_score > 0.3:  # Relevance threshold
-                comp_mapping = comp.copy()
-                comp_mapping['relevance_score'] = relevance_score
-                comp_mapping['module_alignment'] = self._explain_module_alignment(module, comp)
-                relevant_competencies.append(comp_mapping)
+            return matrix[[rows[id(module)] for module in modules]]
+        
+        self._index_keywords([kw.lower() for module in modules for kw in module.get('keywords', [])])
+        return np.vstack([self._module_score_row(module) for module in modules])
+    
+    def _catalog_matrix(self, modules) -> Tuple[np.ndarray, Dict[int, int]]:
+        """Score matrix of catalog modules and each module object's row (by identity)"""
+        self._index_keywords([kw.lower() for module in modules for kw in module.get('keywords', [])])
+        matrix = np.vstack([self._score_module(module) for module in modules])
+        matrix.setflags(write=False)
+        return matrix, {id(module): row for row, module in enumerate(modules)}
+    
+    def _role_competency_columns(self, role_id: str, eqf_level: int) -> Tuple[List[Dict], np.ndarray]:
+        """Competencies for a role/EQF level and their score matrix columns, computed once"""
+        key = (role_id, eqf_level)
+        if key not in self._role_columns:
+            competencies = self.get_competencies_for_role(role_id, eqf_level)
+            columns = np.array([self._competency_columns[comp['id']] for comp in competencies], dtype=np.int64)
+            self._role_columns[key] = (competencies, columns)
+        return self._role_columns[key]
+    
+    @staticmethod
+    def _top_competency_positions(scores: np.ndarray, limit: int = 6, threshold: float = 0.3) -> np.ndarray:
+        """Positions of the top scores above the threshold, best first, ties in competency order"""
+        candidates = np.flatnonzero(scores > threshold)
+        if len(candidates) > limit:
+            best = np.argpartition(-scores[candidates], limit - 1)[:limit]
+            cutoff = scores[candidates[best]].min()
+            candidates = candidates[scores[candidates] >= cutoff]
+        ranked = candidates[np.argsort(-scores[candidates], kind='stable')]
+        return ranked[:limit]
+    
+    def _index_keywords(self, keywords: List[str]):
+        """Match new keywords against every competency field in one automaton pass"""
+        new_keywords = [keyword for keyword in dict.fromkeys(keywords) if keyword not in self._keyword_hits]
+        if not new_keywords:
+            return
+        
+        automaton = KeywordAutomaton(new_keywords)
+        count = len(self.competency_ids)
+        in_title = np.zeros((len(new_keywords), count), dtype=bool)
+        in_description = np.zeros((len(new_keywords), count), dtype=bool)
+        example_hits = np.zeros((len(new_keywords), count), dtype=np.int64)
+        skill_hits = np.zeros((len(new_keywords), count), dtype=np.int64)
+        
+        for column, (title, description, examples, skills) in enumerate(self._competency_text):
+            in_title[list(automaton.matches(title)), column] = True
+            in_description[list(automaton.matches(description)), column] = True
+            for example in examples:
+                example_hits[list(automaton.matches(example)), column] += 1
+            for skill in skills:
+                skill_hits[list(automaton.matches(skill)), column] += 1
+        
+        for row, keyword in enumerate(new_keywords):
+            self._keyword_hits[keyword] = (in_title[row], in_description[row], example_hits[row], skill_hits[row])
+    
+    def _keyword_competency_hits(self, keyword: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Per competency: keyword in title, in description, and example / skill hit counts"""
+        if keyword not in self._keyword_hits:
+            self._index_keywords([keyword])
+        return self._keyword_hits[keyword]
+    
+    def _module_score_row(self, module: Dict) -> np.ndarray:
+        """Score row of one module against every competency (cached by module content)"""
+        key = (
+            module.get('title', '').lower(),
+            tuple(kw.lower() for kw in module.get('keywords', [])),
+            module.get('description', '').lower()
+        )
+        row = self._module_score_rows.get(key)
+        if row is None:
+            row = self._score_module(module)
+            if len(self._module_score_rows) >= self.MODULE_ROW_CACHE_SIZE:
+                self._module_score_rows.clear()
+            self._module_score_rows[key] = row
+        return row
+    
+    def _score_module(self, module: Dict) -> np.ndarray:
+        """Score row of one module against every competency
+        
+        Adds the same increments in the same order as _calculate_module_competency_relevance,
+        so the scores are identical to the per-competency calculation.
+        """
+        title = module.get('title', '').lower()
+        keywords = [kw.lower() for kw in module.get('keywords', [])]
+        
+        self._index_keywords(keywords)
+        score = np.zeros(len(self.competency_ids))
+        example_hits = np.zeros(len(self.competency_ids), dtype=np.int64)
+        skill_hits = np.zeros(len(self.competency_ids), dtype=np.int64)
         
-        # Sort by relevance score
-        relevant_competencies.sort(key=lambda x: x['relevance_score'], reverse=True)
+        for keyword in keywords:
+            in_title, in_description, in_examples, in_skills = self._keyword_competency_hits(keyword)
+            score[in_title] += 0.3
+            score[in_description] += 0.2
+            example_hits += in_examples
+            skill_hits += in_skills
+        
+        for step in range(int(example_hits.max(initial=0))):
+            score[example_hits > step] += 0.2
+        for step in range(int(skill_hits.max(initial=0))):
+            score[skill_hits > step] += 0.1
+        
+        sustainability_terms = ['sustainability', 'environmental', 'green', 'carbon', 'energy']
+        if any(term in title or term in ' '.join(keywords) for term in sustainability_terms):
+            score[self._greencomp_columns] += 0.3
+            score[self._sustainability_columns] += 0.2
         
-        return relevant_competencies[:6]  # Return top 6 most relevant
+        row = np.minimum(score, 1.0)
+        row.setflags(write=False)
+        return row
     
     def _calculate_module_competency_relevance(self, title: str, keywords: List[str], 
                                              description: str, competency: Dict) -> float:
@@ -319,10 +474,13 @@ class EnhancedCompetencyMapper:
         # Get overall framework alignment
         framework_table = self.generate_complete_framework_table(role_id, eqf_level)
         
+        # Score every module against every competency once; the per-module mapping slices it
+        matrix = self.module_competency_matrix(modules)
+        
         # Map each module
         module_mappings = []
-        for module in modules:
-            module_comps = self.map_module_to_competencies(module, role_id, eqf_level)
+        for module, score_row in zip(modules, matrix):
+            module_comps = self._map_score_row(module, score_row, role_id, eqf_level)
             module_mappings.append({
                 'module_title': module.get('title', ''),
                 'module_ects': module.get('ects', 5),
@@ -336,7 +494,7 @@ class EnhancedCompetencyMapper:
             for comp in module_mapping['competency_mappings']:
                 all_mapped_competencies.add(comp['id'])
         
-        total_available = len(self.get_competencies_for_role(role_id, eqf_level))
+        total_available = len(self._role_competency_columns(role_id, eqf_level)[0])
         coverage_percentage = (len(all_mapped_competencies) / total_available * 100) if total_available > 0 else 0
         
         # Framework distribution
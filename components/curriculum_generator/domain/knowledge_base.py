@@ -5,13 +5,200 @@ Enhanced topic relationships, keywords, and competency mappings.
 Improved scoring for carbon footprint and other key topics.
 """
 
-from typing import Dict, List, Set, Any, Optional
+from typing import Dict, List, Set, Any, Optional, Sequence
+from bisect import bisect_right
 import re
 
+from ecm.catalog import snapshot_of
+
+
+WORD_PATTERN = re.compile(r'\b\w+\b')
+
+# Separator between modules in the concatenated substring corpora
+_CORPUS_SEPARATOR = '\x00'
+
+
+class ModuleTextIndex:
+    """Token and substring index over a module list for score_module_relevance
+    
+    Holds per-field token postings (token -> module rows) and one concatenated
+    lowercase corpus per field, so scoring a topic against every module only
+    touches the postings of the topic keywords plus a few C-level substring scans.
+    Rows follow the order of the module sequence the index was built from.
+    """
+    
+    SUBSTRING_CACHE_SIZE = 4096
+    
+    def __init__(self, modules: Sequence[Dict[str, Any]]):
+        self.modules = modules
+        self._rows_by_identity = {id(module): row for row, module in enumerate(modules)}
+        self.postings = {'name': {}, 'description': {}, 'topics': {}, 'keywords': {}, 'extended_description': {}}
+        self.topic_entry_words = []
+        
+        corpora = {'name': [], 'description': [], 'topics': [], 'all_text': []}
+        
+        for row, module in enumerate(modules):
+            module_name = module.get('name', '').lower()
+            module_desc = module.get('description', '').lower()
+            module_topics = module.get('topics', [])
+            module_topics_text = ' '.join(module_topics).lower() if module_topics else ''
+            extended_desc = module.get('extended_description', '')
+            extended_lower = extended_desc.lower() if extended_desc else ''
+            
+            self._add_postings('name', row, WORD_PATTERN.findall(module_name))
+            self._add_postings('description', row, WORD_PATTERN.findall(module_desc))
+            self._add_postings('topics', row, WORD_PATTERN.findall(module_topics_text))
+            self._add_postings('extended_description', row, WORD_PATTERN.findall(extended_lower))
+            
+            # Legacy 'keywords' field matches whole keywords, not words
+            module_keywords = module.get('keywords', [])
+            if module_keywords:
+                if isinstance(module_keywords, str):
+                    module_keywords = [kw.strip() for kw in module_keywords.split(',')]
+                self._add_postings('keywords', row, [kw.lower() for kw in module_keywords])
+            
+            self.topic_entry_words.append([
+                set(WORD_PATTERN.findall(mod_topic.lower())) for mod_topic in module_topics
+            ] if module_topics else [])
+            
+            corpora['name'].append(module_name)
+            corpora['description'].append(module_desc)
+            corpora['topics'].append(module_topics_text)
+            corpora['all_text'].append(f"{module_name} {module_desc} {extended_lower}")
+        
+        self._corpora = {}
+        for field, texts in corpora.items():
+            starts = []
+            offset = 0
+            for text in texts:
+                starts.append(offset)
+                offset += len(text) + len(_CORPUS_SEPARATOR)
+            self._corpora[field] = (_CORPUS_SEPARATOR.join(texts), starts, texts)
+        self._substring_cache = {}
+    
+    @staticmethod
+    def for_snapshot(snapshot, normalised: bool = False) -> 'ModuleTextIndex':
+        """Return the index for a catalog snapshot (raw or normalised modules), built once"""
+        if normalised:
+            return snapshot.derived('text_index_normalised',
+                                    lambda s: ModuleTextIndex(s.normalised_modules))
+        return snapshot.derived('text_index', lambda s: ModuleTextIndex(s.modules))
+    
+    @staticmethod
+    def for_modules(modules: Sequence[Dict[str, Any]]) -> Optional['ModuleTextIndex']:
+        """The snapshot index covering these module objects, if they come from a loaded catalog"""
+        found = snapshot_of(modules)
+        if found is None:
+            return None
+        snapshot, view = found
+        return ModuleTextIndex.for_snapshot(snapshot, normalised=view == 'normalised_modules')
+    
+    def _add_postings(self, field: str, row: int, tokens: List[str]):
+        postings = self.postings[field]
+        for token in set(tokens):
+            postings.setdefault(token, []).append(row)
+    
+    def __len__(self) -> int:
+        return len(self.modules)
+    
+    def row_of(self, module: Dict[str, Any]) -> Optional[int]:
+        """Row of a module object taken from the indexed sequence (identity lookup)"""
+        return self._rows_by_identity.get(id(module))
+    
+    def rows_containing(self, field: str, term: str) -> List[int]:
+        """Rows whose lowercase field text contains term as a substring"""
+        cache_key = (field, term)
+        cached = self._substring_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        corpus, starts, texts = self._corpora[field]
+        if not term:
+            rows = list(range(len(texts)))
+        elif _CORPUS_SEPARATOR in term:
+            rows = [row for row, text in enumerate(texts) if term in text]
+        else:
+            rows = []
+            position = corpus.find(term)
+            while position != -1:
+                row = bisect_right(starts, position) - 1
+                rows.append(row)
+                if row + 1 >= len(starts):
+                    break
+                position = corpus.find(term, starts[row + 1])
+        
+        if len(self._substring_cache) >= self.SUBSTRING_CACHE_SIZE:
+            self._substring_cache.clear()
+        self._substring_cache[cache_key] = rows
+        return rows
+    
+    def score_topic(self, knowledge: 'DigitalSustainabilityKnowledge', topic: str) -> List[float]:
+        """Scores identical to knowledge.score_module_relevance for every indexed module"""
+        scores = [0.0] * len(self.modules)
+        
+        topic_keywords_set = set(kw.lower() for kw in knowledge.get_topic_keywords(topic))
+        
+        # 1-5. Word matches per field with the score_module_relevance weights
+        for field, weight in knowledge.FIELD_WEIGHTS.items():
+            postings = self.postings[field]
+            for keyword in topic_keywords_set:
+                for row in postings.get(keyword, ()):
+                    scores[row] += weight
+        
+        # 6. Direct topic name matching
+        topic_lower = topic.lower()
+        for row in self.rows_containing('name', topic_lower):
+            scores[row] += 20.0
+        for row in self.rows_containing('description', topic_lower):
+            scores[row] += 15.0
+        
+        # 7. Carbon footprint boosting
+        if 'carbon footprint' in topic_lower or 'carbon' in topic_lower:
+            for term in knowledge.CARBON_BOOST_TERMS:
+                for row in self.rows_containing('name', term):
+                    scores[row] += 10.0
+                for row in self.rows_containing('description', term):
+                    scores[row] += 6.0
+                for row in self.rows_containing('topics', term):
+                    scores[row] += 8.0
+        
+        # 8. Fuzzy topic match in topics array (needs at least one shared word)
+        topic_words_re = set(WORD_PATTERN.findall(topic_lower))
+        candidates = set()
+        for word in topic_words_re:
+            candidates.update(self.postings['topics'].get(word, ()))
+        for row in candidates:
+            for entry_words in self.topic_entry_words[row]:
+                if not entry_words:
+                    continue
+                intersection = len(topic_words_re & entry_words)
+                if intersection / len(topic_words_re | entry_words) >= knowledge.FUZZY_THRESHOLD:
+                    scores[row] += 25.0
+                    break
+        
+        # 9. Semantic matching of topic words anywhere in the module text
+        for topic_word in set(topic_lower.split()):
+            if len(topic_word) > 2:
+                for row in self.rows_containing('all_text', topic_word):
+                    scores[row] += 8.0
+        
+        return [min(score, 100) for score in scores]
+
 
 class DigitalSustainabilityKnowledge:
     """Domain knowledge for Digital Sustainability - PHASE 2 ENHANCED"""
     
+    # score_module_relevance weights per matched word/keyword
+    FIELD_WEIGHTS = {
+        'name': 4.0,
+        'description': 2.5,
+        'topics': 5.0,
+        'keywords': 5.0,
+        'extended_description': 2.0
+    }
+    CARBON_BOOST_TERMS = ['carbon', 'footprint', 'emission', 'measurement', 'assessment', 'environmental', 'data']
+    FUZZY_THRESHOLD = 0.5
+    
     def __init__(self):
         self.domain_name = "Digital Sustainability"
         self._initialize_knowledge_base()
@@ -257,12 +444,12 @@ class DigitalSustainabilityKnowledge:
         # 1. Score based on module name (highest weight)
         name_words = set(re.findall(r'\b\w+\b', module_name))
         name_matches = len(name_words.intersection(topic_keywords_set))
-        score += name_matches * 4.0  # Increased from 3.0
+        score += name_matches * self.FIELD_WEIGHTS['name']  # 4.0, increased from 3.0
         
         # 2. Score based on description
         desc_words = set(re.findall(r'\b\w+\b', module_desc))
         desc_matches = len(desc_words.intersection(topic_keywords_set))
-        score += desc_matches * 2.5  # Increased from 2.0
+        score += desc_matches * self.FIELD_WEIGHTS['description']  # 2.5, increased from 2.0
         
         # 3. Handle module keywords/topics properly
         module_topics = module.get('topics', [])
@@ -270,7 +457,7 @@ class DigitalSustainabilityKnowledge:
             module_topics_text = ' '.join(module_topics).lower()
             topics_words = set(re.findall(r'\b\w+\b', module_topics_text))
             topics_matches = len(topics_words.intersection(topic_keywords_set))
-            score += topics_matches * 5.0  # Increased from 4.0
+            score += topics_matches * self.FIELD_WEIGHTS['topics']  # 5.0, increased from 4.0
         
         # 4. Handle legacy 'keywords' field if it exists
         module_keywords = module.get('keywords', [])
@@ -279,14 +466,14 @@ class DigitalSustainabilityKnowledge:
                 module_keywords = [kw.strip() for kw in module_keywords.split(',')]
             module_keywords_set = set(kw.lower() for kw in module_keywords)
             keyword_matches = len(module_keywords_set.intersection(topic_keywords_set))
-            score += keyword_matches * 5.0  # Increased from 4.0
+            score += keyword_matches * self.FIELD_WEIGHTS['keywords']  # 5.0, increased from 4.0
         
         # 5. Enhanced: Check extended_description field
         extended_desc = module.get('extended_description', '')
         if extended_desc:
             extended_words = set(re.findall(r'\b\w+\b', extended_desc.lower()))
             extended_matches = len(extended_words.intersection(topic_keywords_set))
-            score += extended_matches * 2.0  # Increased from 1.5
+            score += extended_matches * self.FIELD_WEIGHTS['extended_description']  # 2.0, increased from 1.5
         
         # 6. Enhanced: Direct topic name matching (high score)
         topic_lower = topic.lower()
@@ -297,8 +484,7 @@ class DigitalSustainabilityKnowledge:
         
         # 7. PHASE 2: Special boosting for carbon footprint measurement
         if 'carbon footprint' in topic_lower or 'carbon' in topic_lower:
-            carbon_boost_terms = ['carbon', 'footprint', 'emission', 'measurement', 'assessment', 'environmental', 'data']
-            for term in carbon_boost_terms:
+            for term in self.CARBON_BOOST_TERMS:
                 if term in module_name:
                     score += 10.0
                 if term in module_desc:
@@ -323,6 +509,24 @@ class DigitalSustainabilityKnowledge:
         
         return min(score, 100)  # Cap at 100
         
+    def score_modules_relevance(self, modules: Sequence[Dict[str, Any]], topic: str,
+                                index: Optional[ModuleTextIndex] = None) -> List[float]:
+        """Score many modules against a topic; same values as score_module_relevance
+        
+        When the modules are objects from `index` (by default the index of the
+        loaded catalog snapshot they were taken from) the scores come from the
+        index postings instead of re-tokenising each module.
+        """
+        if index is None:
+            index = ModuleTextIndex.for_modules(modules)
+        if index is not None:
+            rows = [index.row_of(module) for module in modules]
+            if all(row is not None for row in rows):
+                topic_scores = index.score_topic(self, topic)
+                return [topic_scores[row] for row in rows]
+        
+        return [self.score_module_relevance(module, topic) for module in modules]
+        
     def _fuzzy_match(self, text1: str, text2: str, threshold: float = 0.5) -> bool:
         """Enhanced fuzzy matching with lower threshold for better matching"""
         words1 = set(re.findall(r'\b\w+\b', text1.lower()))
@@ -4,7 +4,7 @@ Topic relationship management
 Handles topic hierarchies, prerequisites, and learning pathways
 """
 
-from typing import Dict, List, Set, Optional, Tuple
+from typing import Dict, List, Set, Optional, Tuple, Iterable
 import logging
 
 logger = logging.getLogger(__name__)
@@ -16,6 +16,7 @@ class TopicRelationManager:
     def __init__(self, domain_knowledge):
         self.domain_knowledge = domain_knowledge
         self.topic_graph = self._build_topic_graph()
+        self.clear_traversal_cache()
     
     def _build_topic_graph(self) -> Dict[str, Dict]:
         """Build a graph of topic relationships"""
@@ -33,59 +34,94 @@ class TopicRelationManager:
         
         return graph
     
+    def _build_adjacency_index(self) -> Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...], frozenset]]:
+        """Index the graph as (prerequisites, related, eqf levels) tuples for traversal"""
+        return {
+            topic_name: (
+                tuple(topic_info['prerequisites']),
+                tuple(topic_info['related'] or []),
+                frozenset(topic_info['eqf_levels'])
+            )
+            for topic_name, topic_info in self.topic_graph.items()
+        }
+    
+    def clear_traversal_cache(self):
+        """Forget memoised traversals (call after editing topic_graph)"""
+        self._adjacency = self._build_adjacency_index()
+        self._progression_cache = {}
+        self._prerequisite_cache = {}
+    
+    def _progression_steps(self, topic: str, current_eqf: int, progression: List[str]):
+        """Visit order below one topic; yields (topic, eqf) for each child visit"""
+        prerequisites, related, eqf_levels = self._adjacency[topic]
+        
+        # Add prerequisites first
+        for prereq in prerequisites:
+            yield prereq, current_eqf - 1
+        
+        # Add current topic if appropriate for EQF level
+        if current_eqf in eqf_levels:
+            progression.append(topic)
+        
+        # Add related topics at same level
+        for related_topic in related:
+            yield related_topic, current_eqf
+    
     def get_learning_progression(self, start_topic: str, target_eqf: int) -> List[str]:
         """Get suggested learning progression starting from a topic"""
-        progression = []
-        visited = set()
-        
-        def build_progression(topic: str, current_eqf: int):
-            if topic in visited or current_eqf > target_eqf:
-                return
+        key = (start_topic, target_eqf)
+        if key not in self._progression_cache:
+            progression = []
+            visited = {start_topic}
+            stack = []
+            if start_topic in self._adjacency:
+                stack.append(self._progression_steps(start_topic, target_eqf, progression))
             
-            visited.add(topic)
+            # Explicit stack of per-topic step generators instead of recursion
+            while stack:
+                step = next(stack[-1], None)
+                if step is None:
+                    stack.pop()
+                    continue
+                topic, current_eqf = step
+                if topic in visited or current_eqf > target_eqf:
+                    continue
+                visited.add(topic)
+                if topic in self._adjacency:
+                    stack.append(self._progression_steps(topic, current_eqf, progression))
             
-            if topic in self.topic_graph:
-                topic_info = self.topic_graph[topic]
-                
-                # Add prerequisites first
-                for prereq in topic_info['prerequisites']:
-                    if prereq not in visited:
-                        build_progression(prereq, current_eqf - 1)
-                
-                # Add current topic if appropriate for EQF level
-                if current_eqf in topic_info['eqf_levels']:
-                    progression.append(topic)
-                
-                # Add related topics at same level
-                for related in topic_info['related']:
-                    if related not in visited and current_eqf <= target_eqf:
-                        build_progression(related, current_eqf)
-        
-        build_progression(start_topic, target_eqf)
-        return progression
+            self._progression_cache[key] = tuple(progression)
+        return list(self._progression_cache[key])
     
     def find_prerequisite_chain(self, topic: str) -> List[str]:
         """Find the complete prerequisite chain for a topic"""
-        chain = []
-        visited = set()
-        
-        def trace_prerequisites(current_topic: str):
-            if current_topic in visited or current_topic not in self.topic_graph:
-                return
-            
-            visited.add(current_topic)
-            topic_info = self.topic_graph[current_topic]
-            
-            # Add prerequisites first (depth-first)
-            for prereq in topic_info['prerequisites']:
-                trace_prerequisites(prereq)
+        if topic not in self._prerequisite_cache:
+            chain = []
+            if topic in self._adjacency:
+                visited = {topic}
+                stack = [(topic, iter(self._adjacency[topic][0]))]
+                
+                # Depth-first: a topic is added once all its prerequisites are
+                while stack:
+                    current_topic, prerequisites = stack[-1]
+                    prereq = next(prerequisites, None)
+                    if prereq is None:
+                        stack.pop()
+                        chain.append(current_topic)
+                    elif prereq not in visited and prereq in self._adjacency:
+                        visited.add(prereq)
+                        stack.append((prereq, iter(self._adjacency[prereq][0])))
             
-            # Add current topic
-            if current_topic not in chain:
-                chain.append(current_topic)
-        
-        trace_prerequisites(topic)
-        return chain[:-1]  # Exclude the target topic itself
+            self._prerequisite_cache[topic] = tuple(chain[:-1])  # Exclude the target topic itself
+        return list(self._prerequisite_cache[topic])
+    
+    def progressions_for(self, topics: Iterable[str], eqf_levels: Iterable[int]) -> Dict[str, Dict[int, List[str]]]:
+        """Learning progressions for every (topic, EQF level) pair"""
+        eqf_levels = list(eqf_levels)
+        return {
+            topic: {eqf: self.get_learning_progression(topic, eqf) for eqf in eqf_levels}
+            for topic in topics
+        }
     
     def suggest_next_topics(self, completed_topics: List[str], target_eqf: int) -> List[Dict]:
         """Suggest next topics based on completed topics"""
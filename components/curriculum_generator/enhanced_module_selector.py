@@ -6,40 +6,26 @@ Enhanced Module Selector - Fixed Conservative Selection Logic
 Layer 1: Dynamic module selection based on ECTS requirements with improved algorithms
 """
 
-import json
-import os
 import random
 from typing import Dict, List, Tuple, Any, Optional
 import logging
 
+from ecm.catalog import CatalogSnapshot, get_catalog_snapshot
+from ecm.tracing import traced
+
 class EnhancedModuleSelector:
     """Enhanced module selector with improved logic for small curricula"""
     
-    def __init__(self, modules_path: str = "input/modules/modules_v5.json"):
-        self.modules_path = modules_path
+    def __init__(self, catalog: Optional[CatalogSnapshot] = None):
+        self.catalog = catalog if catalog is not None else get_catalog_snapshot()
         self.modules = self._load_modules()
         self.role_preferences = self._initialize_role_preferences()
         
     def _load_modules(self) -> List[Dict]:
-        """Load module database"""
-        try:
-            if os.path.exists(self.modules_path):
-                with open(self.modules_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            else:
-                # Fallback to alternative paths
-                fallback_paths = [
-                    "input/modules/modules_v5.json"
-                ]
-                for path in fallback_paths:
-                    if os.path.exists(path):
-                        with open(path, 'r', encoding='utf-8') as f:
-                            return json.load(f)
-                print(f"⚠️  enhanced_module_selector.py: Module database not found at {self.modules_path}")
-                return []
-        except Exception as e:
-            print(f"⚠️  Error loading modules: {e}")
-            return []
+        """Take the module database from the catalog snapshot"""
+        if not self.catalog.modules:
+            print(f"⚠️  enhanced_module_selector.py: Module catalog {self.catalog.source} is empty")
+        return list(self.catalog.modules)
     
     def _initialize_role_preferences(self) -> Dict[str, List[str]]:
         """Initialize content preferences for each role"""
@@ -56,6 +42,8 @@ class EnhancedModuleSelector:
             "STS": ["technical_implementation", "systems_design"]
         }
     
+    @traced('select_modules', 'stage',
+            args=lambda self, role, topic, eqf_level, ects, *rest, **kwargs: {'role': role, 'eqf_level': eqf_level, 'ects': ects})
     def select_modules(self, role: str, topic: str, eqf_level: int, ects: float, 
                       uol_count: int, **kwargs) -> Tuple[List[Dict], float]:
         """Enhanced module selection with improved logic for small curricula"""
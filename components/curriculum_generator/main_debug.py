@@ -575,7 +575,7 @@ def main():
         print("DEBUG: EnhancedModuleSelector initialized successfully")
 
         print("DEBUG: About to initialize ContentSpecificityEngine")
-        content_specificity_engine = ContentSpecificityEngine(project_root)
+        content_specificity_engine = ContentSpecificityEngine()
         print("DEBUG: ContentSpecificityEngine initialized successfully")
 
         print("DEBUG: About to initialize ModuleContentIntegrator")
@@ -829,7 +829,7 @@ def main():
         # Use content specificity engine to enhance with specific content
         print(f"\n🚀 Enhancing curriculum with content specificity engine...")
         print(f"DEBUG: About to initialize ContentSpecificityEngine")
-        content_specificity_engine = ContentSpecificityEngine(project_root)
+        content_specificity_engine = ContentSpecificityEngine()
         print(f"DEBUG: ContentSpecificityEngine initialized")
         final_curriculum = content_specificity_engine.enhance_curriculum_with_specific_content(
             comprehensive_curriculum, selected_modules
@@ -20,6 +20,7 @@ sys.path.insert(0, str(project_root))
 from scripts.curriculum_generator.core.data_loader import DataLoader
 from scripts.curriculum_generator.domain.role_manager import RoleManager
 from scripts.curriculum_generator.components.curriculum_builder_enhanced import EnhancedT3CurriculumBuilder
+from ecm.tracing import add_profile_arguments, span, traced, tracing
 
 def main():
     """Enhanced main function using our new enhanced builder"""
@@ -39,9 +40,15 @@ def main():
     parser.add_argument('--output-dir', default='output/curricula_enhanced', help='Output directory')
     parser.add_argument('--theme', default='material_gray', help='Visual theme')
     parser.add_argument('--output-json', action='store_true', help='Generate JSON output')
+    add_profile_arguments(parser)
     
     args = parser.parse_args()
     
+    with tracing(args.profile_trace, cprofile=args.profile_cprofile, name='main_enhanced'):
+        run(args)
+
+def run(args):
+    """Build and save one enhanced curriculum for parsed command line options"""
     try:
         print(f"🚀 ENHANCED T3.2/T3.4 Curriculum Generator v4.0")
         print(f"   ✅ Rich Content Integration: Extended descriptions from modules_v5.json")
@@ -109,13 +116,14 @@ def main():
         print(f"   🎯 Profile-Driven: Educational profile competency mapping active")
         print(f"   📝 Language Variety: Dynamic content generation enabled")
         
-        curriculum = enhanced_builder.build_enhanced_curriculum(
-            role_id=args.role,
-            role_name=role_info['name'],
-            topic=args.topic,
-            eqf_level=args.eqf_level,
-            target_ects=target_ects
-        )
+        with span('curriculum', 'curriculum', role=args.role, eqf_level=args.eqf_level, ects=target_ects):
+            curriculum = enhanced_builder.build_enhanced_curriculum(
+                role_id=args.role,
+                role_name=role_info['name'],
+                topic=args.topic,
+                eqf_level=args.eqf_level,
+                target_ects=target_ects
+            )
         
         if not curriculum:
             print("❌ Enhanced curriculum generation failed!")
@@ -195,7 +203,7 @@ def main():
         if args.output_json:
             json_file = output_dir / f"{filename_base}_curriculum.json"
             clean_curriculum = clean_for_json(curriculum)
-            with open(json_file, 'w', encoding='utf-8') as f:
+            with span('render_json', 'render'), open(json_file, 'w', encoding='utf-8') as f:
                 json.dump(clean_curriculum, f, indent=2, ensure_ascii=False)
             output_files.append(json_file)
             print(f"   ✅ Enhanced JSON saved: {json_file}")
@@ -220,6 +228,7 @@ def main():
         traceback.print_exc()
         sys.exit(1)
 
+@traced('render_html', 'render')
 def generate_enhanced_html_v2(curriculum: Dict[str, Any], theme: str) -> str:
     """Generate enhanced HTML with proper rich content display - REMOVED Enhanced Features block"""
     
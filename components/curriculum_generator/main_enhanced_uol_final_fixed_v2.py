@@ -40,6 +40,8 @@ from scripts.curriculum_generator.content_specificity_engine import ContentSpeci
 from scripts.curriculum_generator.module_content_integrator import ModuleContentIntegrator
 from scripts.curriculum_generator.components.wp3_compliant_generator import WP3CompliantGenerator
 from scripts.curriculum_generator.components.wp3_compliant_generator import WP3CompliantGenerator
+from ecm.metrics import REGISTRY
+from ecm.tracing import add_profile_arguments, traced, tracing
 
 def validate_eqf_ects_combination(eqf_level: int, ects: float) -> Tuple[bool, str]:
     """Validate EQF-ECTS combinations to prevent educational fraud"""
@@ -189,6 +191,7 @@ def get_eqf_appropriate_framework_mappings(eqf_level: int, role_id: str, progres
     
     return framework_mappings
 
+@traced('render_html', 'render')
 def generate_comprehensive_html(curriculum: Dict[str, Any], args) -> str:
     """FIXED: Generate comprehensive HTML from complete curriculum with module integration analysis"""
     
@@ -532,8 +535,8 @@ def generate_comprehensive_html(curriculum: Dict[str, Any], args) -> str:
     
     return html_content
 
-def main():
-    """FINAL enhanced main function with MODULE CONTENT INTEGRATION - COMPLETE"""
+def build_parser() -> argparse.ArgumentParser:
+    """Command line options; generate_curriculum takes the parsed namespace"""
     parser = argparse.ArgumentParser(
         description='T3.2/T3.4 COMPLIANT Enhanced UOL Curriculum Generator with Complete Module Integration'
     )
@@ -552,8 +555,488 @@ def main():
     parser.add_argument('--output-json', action='store_true', help='Generate JSON output')
     parser.add_argument('--output-docx', action='store_true', help='Generate DOCX output (requires python-docx)')
     parser.add_argument('--compact-mode', action='store_true', help='Generate compact DOCX format for appendix inclusion')
+    parser.add_argument('--inline-assets', action='store_true', help='Embed stylesheets in HTML files instead of linking shared assets/<hash>.css files')
     parser.add_argument('--force', action='store_true', help='Force generation despite validation warnings')
+    add_profile_arguments(parser)
+    return parser
+
+
+@traced('setup', 'setup')
+def build_generation_components() -> Dict[str, Any]:
+    """Role, module and knowledge-base components shared by every generation run
+    
+    Building them loads the module catalog and all knowledge bases, so long-lived
+    callers (the web worker pool) build them once per process and reuse them.
+    """
+    role_manager = RoleManager(project_root)
+    uol_manager = UOLLearningManager()
+    ep_integrator = EPCurriculumIntegrator(project_root)
+    learning_outcomes_gen = LearningOutcomesGenerator()
+    
+    # FIXED: Initialize all enhanced components
+    enhanced_module_selector = EnhancedModuleSelector()
+    content_specificity_engine = ContentSpecificityEngine()
+    wp3_generator = WP3CompliantGenerator(project_root)
+    wp3_generator = WP3CompliantGenerator(project_root)
+    module_content_integrator = ModuleContentIntegrator(project_root)
+    
+    # Initialize content generator with fallback
+    try:
+        content_generator = GeneralIndustryContentGenerator()
+        print("✅ Loaded 10 role definitions")
+        print("✅ UOL Learning Manager initialized (GENERAL SOLUTION)")
+    except Exception as e:
+        print(f"   ⚠️ Content generator initialization error: {e}")
+        # Enhanced mock class for fallback
+        class EnhancedMockDomainKnowledge:
+            def get_assessment_methods_for_topic(self, topic, eqf_level):
+                return ["practical_esg_project", "case_study", "workplace_application"]
+            
+            def get_industry_relevance(self, topic):
+                return ["ESG Consulting", "Sustainability Management", "Environmental Technology"]
+            
+            def get_all_competency_mappings(self, topic: str, role_id: Optional[str] = None, eqf_level: Optional[int] = None) -> Dict[str, List[str]]:
+                base_mappings = {
+                    "e-CF": [f"A.1: Business Strategy - Professional {topic.lower()} alignment"],
+                    "DigComp": [f"1.2: Data Evaluation - {topic.lower()} data analysis"],
+                    "GreenComp": [f"1.1: Systems Thinking - {topic.lower()} systems understanding"]
+                }
+                
+                if role_id:
+                    role_suffix = f"for {role_id} professionals"
+                    for framework in base_mappings:
+                        base_mappings[framework] = [mapping + f" {role_suffix}" for mapping in base_mappings[framework]]
+                
+                if eqf_level:
+                    eqf_suffix = f"(EQF Level {eqf_level})"
+                    for framework in base_mappings:
+                        base_mappings[framework] = [mapping + f" {eqf_suffix}" for mapping in base_mappings[framework]]
+                
+                return base_mappings
+            
+            def generate_section_8_key_benefits_recap(self, role_id: str, topic: str, actual_ects: float, eqf_level: int):
+                return {"benefits": [f"Enhanced {topic.lower()} capabilities"], "value_proposition": f"Professional development in {topic.lower()}"}
+            
+            def generate_section_9_cross_border_compatibility(self, role_id: str, actual_ects: float, eqf_level: int):
+                return {"eu_recognition": f"EQF Level {eqf_level} recognition", "recognition_mechanisms": ["ECTS compliance"]}
+            
+            def generate_concrete_unit_title(self, unit_number: int, progression_level: str, role_id: str, topic: str):
+                return f"Unit {unit_number}: {topic} {progression_level} Skills"
+            
+            def generate_specific_learning_outcomes(self, unit_title: str, progression_level: str, role_id: str, topic: str, unit_ects: float):
+                return [f"Apply {topic.lower()} skills in professional contexts", f"Demonstrate {progression_level.lower()} competency in {topic.lower()}"]
+            
+            def _clean_topic_name(self, topic: str, *args, **kwargs):
+                if topic and topic.strip() and topic.strip().lower() not in ["eu test", "test"]:
+                    return topic.strip()
+                return "Digital Sustainability"
+        
+        content_generator = EnhancedMockDomainKnowledge()
+        print("   ✅ Enhanced mock content generator initialized")
+    
+    # Initialize comprehensive curriculum builder
+    comprehensive_builder = ComprehensiveCurriculumBuilder()
+    print(f"   ✅ Comprehensive curriculum builder initialized")
+    
+    # Initialize assessment generator
+    try:
+        from scripts.curriculum_generator.core.domain_knowledge_adapter import create_compatible_domain_knowledge
+        adapted_domain = create_compatible_domain_knowledge(content_generator)
+        assessment_gen = AssessmentGenerator(adapted_domain)
+        print(f"✅ ADAPTER: Domain source {type(content_generator).__name__} has native AssessmentGenerator support")
+        print(f"   ✅ AssessmentGenerator initialized with adapted domain knowledge")
+    except Exception as e:
+        print(f"   ⚠️ AssessmentGenerator adaptation error: {e}")
+        assessment_gen = AssessmentGenerator(content_generator)
+        print(f"   ✅ AssessmentGenerator initialized with enhanced mock domain knowledge")
+    
+    return {
+        'role_manager': role_manager,
+        'uol_manager': uol_manager,
+        'ep_integrator': ep_integrator,
+        'learning_outcomes_gen': learning_outcomes_gen,
+        'enhanced_module_selector': enhanced_module_selector,
+        'content_specificity_engine': content_specificity_engine,
+        'wp3_generator': wp3_generator,
+        'module_content_integrator': module_content_integrator,
+        'content_generator': content_generator,
+        'comprehensive_builder': comprehensive_builder,
+        'assessment_gen': assessment_gen
+    }
+
+
+def generation_options(**options) -> argparse.Namespace:
+    """CLI-equivalent options for generate_curriculum, starting from the CLI defaults"""
+    args = build_parser().parse_args([])
+    for name, value in options.items():
+        setattr(args, name, value)
+    return args
+
+
+@traced('curriculum', 'curriculum',
+        args=lambda args, components=None: {'role': args.role, 'eqf_level': args.eqf_level, 'ects': args.ects})
+def generate_curriculum(args, components: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Generate one curriculum from parsed options and return a structured result
+    
+    components come from build_generation_components(); they are built here if omitted.
+    """
+    # Validate EQF-ECTS combination
+    print(f"\n🔍 Validating EQF {args.eqf_level} with {args.ects} ECTS...")
+    is_valid, message = validate_eqf_ects_combination(args.eqf_level, args.ects)
+    
+    if not is_valid:
+        print(f"❌ VALIDATION FAILED: {message}")
+        if not args.force:
+            print(f"\n🛑 Generation stopped. Use --force to override validation.")
+            return {"success": False, "error": f"Validation failed: {message}"}
+        else:
+            print(f"\n⚠️  FORCED OVERRIDE: Proceeding despite validation failure")
+    
+    if message and is_valid:
+        print(f"⚠️  {message}")
+    else:
+        print(f"   ✅ EQF-ECTS combination validated")
+    
+    # Handle compact mode
+    if args.compact_mode:
+        print(f"   📎 Compact mode enabled: Files will be optimized for appendix inclusion")
+        base_output_dir = 'output/compact_appendix'
+    else:
+        base_output_dir = args.output_dir
+    
+    print(f"\n📊 Generating {args.ects} ECTS across {args.uol} units")
+    
+    # Initialize systems (warm components are reused across runs)
+    if components is None:
+        components = build_generation_components()
+    role_manager = components['role_manager']
+    uol_manager = components['uol_manager']
+    ep_integrator = components['ep_integrator']
+    enhanced_module_selector = components['enhanced_module_selector']
+    content_specificity_engine = components['content_specificity_engine']
+    wp3_generator = components['wp3_generator']
+    module_content_integrator = components['module_content_integrator']
+    content_generator = components['content_generator']
+    comprehensive_builder = components['comprehensive_builder']
+    assessment_gen = components['assessment_gen']
+    
+    # Clean topic to preserve meaningful content
+    if args.topic and args.topic.strip() and args.topic.strip().lower() not in ["eu test", "test"]:
+        clean_topic = args.topic.strip()
+    else:
+        # Get role-specific topic for empty/placeholder topics
+        role_topics = {
+            "DAN": "ESG Data Analysis and Reporting",
+            "DSE": "Sustainability Data Engineering", 
+            "DSI": "Sustainability Data Science",
+            "DSM": "Sustainability Program Management",
+            "DSL": "Digital Sustainability Leadership",
+            "DSC": "Digital Sustainability Consulting",
+            "SBA": "Sustainability Business Analysis",
+            "SDD": "Sustainable Software Development",
+            "SSD": "Sustainable Solution Design",
+            "STS": "Sustainability Technical Implementation"
+        }
+        clean_topic = role_topics.get(args.role, "Digital Sustainability")
+    
+    print(f"   🎯 Topic: '{args.topic}' → '{clean_topic}' (role-aligned)")
+    
+    # Validate role
+    role_info = role_manager.get_role(args.role)
+    if not role_info:
+        print(f"❌ Role '{args.role}' not found")
+        return {"success": False, "error": f"Role '{args.role}' not found"}
+    
+    print(f"   ✅ Role: {role_info['name']}")
+    
+    # Get Educational Profile
+    ep_data, ep_source = ep_integrator.get_or_create_ep(args.role, args.eqf_level, clean_topic)
+    if ep_data:
+        print(f"   ✅ Educational Profile: {ep_source}")
+    
+    # STEP 1: Enhanced module selection
+    print(f"\n🔧 Enhanced module selection with content specificity...")
+    selected_modules, selection_metadata = enhanced_module_selector.select_modules(
+        role=args.role,
+        topic=clean_topic,
+        eqf_level=args.eqf_level,
+        ects=args.ects,
+        uol_count=args.uol
+    )
+    
+    print(f"🔧 Enhanced curriculum with smart module selection:")
+    print(f"   📦 {len(selected_modules)} unique modules selected")
+    print(f"   🎯 Role alignment: {selection_metadata['role_alignment']:.1f}%")
+    
+    # Display warnings and recommendations
+    if selection_metadata.get('warnings'):
+        print(f"   ⚠️  SELECTION WARNINGS:")
+        for warning in selection_metadata['warnings']:
+            print(f"      • {warning}")
+    
+    if selection_metadata.get('recommendations'):
+        print(f"   📋 RECOMMENDATIONS:")
+        for rec in selection_metadata['recommendations']:
+            print(f"      • {rec}")
+    
+    # STEP 2: Generate base learning units
+    print(f"\n🧱 Generating base learning units structure...")
+    base_units = uol_manager.distribute_ects_across_uol(
+        total_ects=args.ects,
+        uol=args.uol,
+        role_id=args.role,
+        topic=clean_topic
+    )
+    
+    # STEP 3: MODULE CONTENT INTEGRATION - Replace generic content with module-specific content
+    print(f"\n🔗 Integrating module content into learning units...")
+    enhanced_units = module_content_integrator.integrate_modules_into_units(
+        selected_modules=selected_modules,
+        role=args.role,
+        base_units=base_units,
+        topic=clean_topic,
+        eqf_level=args.eqf_level
+    )
+    
+    # Get integration summary
+    integration_summary = module_content_integrator.get_integration_summary()
+    print(f"🔗 Module integration complete:")
+    print(f"   ✅ {len(enhanced_units)} units processed")
+    print(f"   ⚠️  {integration_summary['warnings_issued']} integration warnings issued")
+    
+    # Add framework mappings to units (keeping existing logic)
+    final_units = []
+    for unit in enhanced_units:
+        # Get EQF-appropriate framework mappings
+        eqf_framework_mappings = get_eqf_appropriate_framework_mappings(
+            eqf_level=args.eqf_level,
+            role_id=args.role,
+            progression_level=unit['progression_level']
+        )
+        
+        # Add framework mappings
+        unit['framework_mappings'] = eqf_framework_mappings
+        unit['keywords'] = [clean_topic, args.role, unit['progression_level']]
+        unit['eqf_validated'] = True
+        unit['esg_enhanced'] = True
+        unit['work_based_learning'] = True
+        unit['role_aligned'] = True
+        
+        final_units.append(unit)
+    
+    # Generate assessment strategy
+    print(f"\n🎯 Generating enhanced assessment strategy...")
+    try:
+        assessment_strategy = assessment_gen.generate_assessment_strategy(
+            topic=clean_topic,
+            eqf_level=args.eqf_level,
+            selected_modules=final_units
+        )
+        print(f"   ✅ Enhanced assessment strategy generated")
+    except Exception as e:
+        print(f"   ⚠️ Assessment generation error: {e}")
+        # Create fallback
+    # Generate WP3-compliant curriculum
+    wp3_curriculum = wp3_generator.generate_wp3_compliant_curriculum(
+        role_id=args.role,
+        eqf_level=args.eqf_level,
+        ects=args.ects,
+        selected_modules=final_units,
+        topic=clean_topic
+    )
+    print(f"✅ WP3-compliant curriculum generated")
+
+    # Generate WP3-compliant curriculum
+    wp3_curriculum = wp3_generator.generate_wp3_compliant_curriculum(
+        role_id=args.role,
+        eqf_level=args.eqf_level,
+        ects=args.ects,
+        selected_modules=final_units,
+        topic=clean_topic
+    )
+    print(f"✅ WP3-compliant curriculum generated")
+
+    assessment_strategy = {
+            "overall_strategy": {
+                "assessment_philosophy": f"Practical {clean_topic} application for EQF Level {args.eqf_level}",
+                "balance_ratios": {"practical": 60, "written": 25, "project": 15}
+            }
+        }
+    print(f"   ✅ Fallback assessment strategy applied")
+    
+    # Create base curriculum
+    base_curriculum = {
+        'metadata': {
+            'role_id': args.role,
+            'role_name': role_info['name'],
+            'topic': clean_topic,
+            'eqf_level': args.eqf_level,
+            'target_ects': args.ects,
+            'actual_ects': sum(unit['ects'] for unit in final_units),
+            'total_ecvet_points': sum(unit['ects'] for unit in final_units),
+            'units_requested': args.uol,
+            'units_generated': len(final_units),
+            'generation_date': datetime.now().isoformat(),
+            'system_version': 'T3.2_T3.4_COMPLIANT_WITH_COMPLETE_MODULE_INTEGRATION',
+            'validation_status': 'PASSED' if is_valid else 'FORCED_OVERRIDE',
+            'compact_mode': args.compact_mode
+        },
+        'learning_units': final_units,
+        'assessment_strategy': assessment_strategy,
+        'selected_modules': selected_modules,
+        'module_selection_metadata': selection_metadata,
+        'module_integration_metadata': integration_summary
+    }
+    
+    # Generate missing sections 8 & 9 BEFORE comprehensive builder
+    print(f"\n🔧 Generating sections 8 & 9...")
+    
+    # Generate Section 8: Key Benefits Summary
+    section_8_data = content_generator.generate_section_8_key_benefits_recap(
+        role_id=args.role,
+        topic=clean_topic,
+        actual_ects=sum(unit['ects'] for unit in final_units),
+        eqf_level=args.eqf_level
+    )
+    base_curriculum['section_8_key_benefits_recap'] = section_8_data
+    print(f"   ✅ Section 8 (Key Benefits): {len(str(section_8_data))} characters")
+    
+    # Generate Section 9: Cross-Border Compatibility 
+    section_9_data = content_generator.generate_section_9_cross_border_compatibility(
+        role_id=args.role,
+        actual_ects=sum(unit['ects'] for unit in final_units),
+        eqf_level=args.eqf_level
+    )
+    base_curriculum['section_9_cross_border_compatibility'] = section_9_data
+    print(f"   ✅ Section 9 (Cross-Border): {len(str(section_9_data))} characters")
+    
+    # Use comprehensive builder to generate ALL T3.2/T3.4 compliant sections
+    print(f"\n🔧 Building comprehensive T3.2/T3.4 compliant curriculum...")
+    comprehensive_curriculum = comprehensive_builder.build_complete_curriculum(base_curriculum)
+    print(f"   ✅ Comprehensive curriculum built with all T3.2/T3.4 compliant sections")
+    
+    # Use content specificity engine to enhance with specific content
+    print(f"\n🚀 Enhancing curriculum with content specificity engine...")
+    final_curriculum = content_specificity_engine.enhance_curriculum(
+        comprehensive_curriculum, args.role, selected_modules
+    )
+    print(f"   ✅ Content specificity enhancement complete")
+    
+    # Generate comprehensive HTML from enhanced curriculum
+    comprehensive_html = generate_comprehensive_html(final_curriculum, args)
+    
+    # Generate outputs
+    from scripts.curriculum_generator.core.output_manager import OutputManager
+    output_manager = OutputManager(project_root, inline_assets=args.inline_assets)
+    
+    output_dir = Path(base_output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    
+    # Save all formats with enhanced content
+    output_files = output_manager.save_curriculum_with_all_formats(
+        curriculum=final_curriculum,
+        curriculum_html=comprehensive_html,
+        output_dir=str(output_dir),
+        topic=clean_topic,
+        eqf_level=args.eqf_level,
+        role_id=args.role,
+        theme_name=args.theme,
+        output_docx=args.output_docx,
+        include_profile=False,
+        compact_mode=args.compact_mode
+    )
+    
+    # Display success summary
+    compliance_metadata = final_curriculum.get('compliance_metadata', {})
+    content_specificity = final_curriculum.get('content_specificity_metadata', {})
+    module_integration = final_curriculum.get('module_integration_metadata', {})
+    t32_compliance = compliance_metadata.get('t32_compliance', {})
+    t34_compliance = compliance_metadata.get('t34_compliance', {})
+    target_audience = compliance_metadata.get('target_audience', 'digital_professionals')
+    
+    # Calculate integration statistics
+    integrated_units = sum(1 for unit in final_units if unit.get('content_source') == 'module_integrated')
+    integration_percentage = (integrated_units / len(final_units) * 100) if final_units else 0
+    
+    print(f"\n🎉 T3.2/T3.4 COMPLIANT CURRICULUM WITH COMPLETE MODULE INTEGRATION SUCCESS!")
+    print(f"   📋 EQF-ECTS validation: {'✅ PASSED' if is_valid else '⚠️ FORCED'}")
+    print(f"   🔧 Comprehensive builder: ✅ ALL SECTIONS POPULATED WITH T3.2/T3.4 CONTENT")
+    print(f"   🎯 Target audience: ✅ GENUINE DIFFERENTIATION for {target_audience.replace('_', ' ').title()}")
+    print(f"   📦 Module selection: ✅ {len(selected_modules)} modules selected with {selection_metadata['role_alignment']:.1f}% role alignment")
+    print(f"   🔗 Module integration: ✅ {integrated_units}/{len(final_units)} units ({integration_percentage:.1f}%) use module-specific content")
+    print(f"   🚀 Content specificity: ✅ D2.1 gap coverage score: {content_specificity.get('d21_gap_analysis', {}).get('content_specificity_score', 0):.1f}%")
+    print(f"   🎯 Topic handling: ✅ FIXED - '{clean_topic}' properly preserved")
+    print(f"   📄 Generated sections: {len([k for k in final_curriculum.keys() if k.startswith('section_')])} complete sections")
+    print(f"   📁 Generated {len(output_files)} files:")
+    
+    for file_path in output_files:
+        file_type = file_path.suffix.upper().lstrip('.')
+        print(f"      📄 {file_type}: {file_path.name}")
+    
+    print(f"\n✅ T3.2 COMPLIANCE ACHIEVED WITH TARGET AUDIENCE DIFFERENTIATION:")
+    for key, value in t32_compliance.items():
+        print(f"   ✅ {key.replace('_', ' ').title()}: {value}")
+    
+    print(f"\n✅ T3.4 COMPLIANCE ACHIEVED:")  
+    for key, value in t34_compliance.items():
+        print(f"   ✅ {key.replace('_', ' ').title()}: {value}")
+    
+    
+    # Display module integration summary
+    print(f"\n🔗 MODULE INTEGRATION SUMMARY:")
+    print(f"   📦 {len(selected_modules)} modules used for content extraction")
+    print(f"   🔗 {integrated_units}/{len(final_units)} units enhanced with module-specific content ({integration_percentage:.1f}%)")
+    print(f"   ⚠️  {module_integration.get('warnings_issued', 0)} integration warnings issued")
+    print(f"   🎯 Module alignment: {module_integration.get('module_alignment', 'Good')}")
+    print(f"   📊 Average relevance: {module_integration.get('average_relevance', 0):.1f}%")
+
+    # Display content specificity warnings and recommendations
+    content_warnings = content_specificity.get('content_warnings', {})
+    if content_warnings.get('warnings'):
+        print(f"\n⚠️  CONTENT SPECIFICITY WARNINGS ({len(content_warnings['warnings'])}):")
+        for warning in content_warnings['warnings']:
+            print(f"   ⚠️  {warning['content_type'].upper()}: {warning['issue']}")
+    
+    if content_warnings.get('unique_recommendations'):
+        print(f"\n📋 CONTENT IMPROVEMENT RECOMMENDATIONS:")
+        for rec in content_warnings['unique_recommendations']:
+            print(f"   📋 {rec}")
+    
+    if args.output_docx and not output_manager.docx_available:
+        print("\n💡 To enable DOCX generation, install: pip install python-docx")
+    
+    # D2.1 gap areas covered by the selected modules
+    selected_ids = {module.get('id') for module in selected_modules}
+    d21_modules = content_specificity_engine.d21_priority_modules
     
+    return {
+        'success': True,
+        'role': args.role,
+        'role_name': role_info['name'],
+        'topic': clean_topic,
+        'eqf_level': args.eqf_level,
+        'target_ects': args.ects,
+        'actual_ects': base_curriculum['metadata']['actual_ects'],
+        'validation_status': base_curriculum['metadata']['validation_status'],
+        'generated_files': [str(file_path) for file_path in output_files],
+        'selected_modules': [module.get('id') for module in selected_modules],
+        'role_alignment': selection_metadata['role_alignment'],
+        'integrated_units': integrated_units,
+        'units_generated': len(final_units),
+        'd21_gap_coverage_score': final_curriculum.get('content_specificity', {}).get('d21_gap_coverage_score'),
+        'd21_gaps_addressed': {
+            'esg_depth': bool(selected_ids & set(d21_modules['esg_reporting'])),
+            'regulatory_skills': bool(selected_ids & set(d21_modules['regulatory_compliance'])),
+            'technical_implementation': bool(selected_ids & set(d21_modules['technical_implementation']))
+        },
+        't32_compliance': t32_compliance,
+        't34_compliance': t34_compliance
+    }
+
+
+def main():
+    """FINAL enhanced main function with MODULE CONTENT INTEGRATION - COMPLETE"""
+    parser = build_parser()
     args = parser.parse_args()
     
     try:
@@ -584,404 +1067,34 @@ def main():
         if not args.role or not args.eqf_level or args.ects is None:
             parser.error("--role, --eqf-level, and --ects are required")
         
-        # Validate EQF-ECTS combination
-        print(f"\n🔍 Validating EQF {args.eqf_level} with {args.ects} ECTS...")
-        is_valid, message = validate_eqf_ects_combination(args.eqf_level, args.ects)
-        
-        if not is_valid:
-            print(f"❌ VALIDATION FAILED: {message}")
-            if not args.force:
-                print(f"\n🛑 Generation stopped. Use --force to override validation.")
-                return
-            else:
-                print(f"\n⚠️  FORCED OVERRIDE: Proceeding despite validation failure")
-        
-        if message and is_valid:
-            print(f"⚠️  {message}")
-        else:
-            print(f"   ✅ EQF-ECTS combination validated")
-        
-        # Handle compact mode
-        if args.compact_mode:
-            print(f"   📎 Compact mode enabled: Files will be optimized for appendix inclusion")
-            base_output_dir = 'output/compact_appendix'
-        else:
-            base_output_dir = args.output_dir
-        
-        print(f"\n📊 Generating {args.ects} ECTS across {args.uol} units")
-        
-        # Initialize systems
-        role_manager = RoleManager(project_root)
-        uol_manager = UOLLearningManager()
-        ep_integrator = EPCurriculumIntegrator(project_root)
-        learning_outcomes_gen = LearningOutcomesGenerator()
-        
-        # FIXED: Initialize all enhanced components
-        enhanced_module_selector = EnhancedModuleSelector()
-        content_specificity_engine = ContentSpecificityEngine()
-        wp3_generator = WP3CompliantGenerator(project_root)
-        wp3_generator = WP3CompliantGenerator(project_root)
-        module_content_integrator = ModuleContentIntegrator(project_root)
-        
-        # Initialize content generator with fallback
-        try:
-            content_generator = GeneralIndustryContentGenerator()
-            print("✅ Loaded 10 role definitions")
-            print("✅ UOL Learning Manager initialized (GENERAL SOLUTION)")
-        except Exception as e:
-            print(f"   ⚠️ Content generator initialization error: {e}")
-            # Enhanced mock class for fallback
-            class EnhancedMockDomainKnowledge:
-                def get_assessment_methods_for_topic(self, topic, eqf_level):
-                    return ["practical_esg_project", "case_study", "workplace_application"]
-                
-                def get_industry_relevance(self, topic):
-                    return ["ESG Consulting", "Sustainability Management", "Environmental Technology"]
-                
-                def get_all_competency_mappings(self, topic: str, role_id: Optional[str] = None, eqf_level: Optional[int] = None) -> Dict[str, List[str]]:
-                    base_mappings = {
-                        "e-CF": [f"A.1: Business Strategy - Professional {topic.lower()} alignment"],
-                        "DigComp": [f"1.2: Data Evaluation - {topic.lower()} data analysis"],
-                        "GreenComp": [f"1.1: Systems Thinking - {topic.lower()} systems understanding"]
-                    }
-                    
-                    if role_id:
-                        role_suffix = f"for {role_id} professionals"
-                        for framework in base_mappings:
-                            base_mappings[framework] = [mapping + f" {role_suffix}" for mapping in base_mappings[framework]]
-                    
-                    if eqf_level:
-                        eqf_suffix = f"(EQF Level {eqf_level})"
-                        for framework in base_mappings:
-                            base_mappings[framework] = [mapping + f" {eqf_suffix}" for mapping in base_mappings[framework]]
-                    
-                    return base_mappings
-                
-                def generate_section_8_key_benefits_recap(self, role_id: str, topic: str, actual_ects: float, eqf_level: int):
-                    return {"benefits": [f"Enhanced {topic.lower()} capabilities"], "value_proposition": f"Professional development in {topic.lower()}"}
-                
-                def generate_section_9_cross_border_compatibility(self, role_id: str, actual_ects: float, eqf_level: int):
-                    return {"eu_recognition": f"EQF Level {eqf_level} recognition", "recognition_mechanisms": ["ECTS compliance"]}
-                
-                def generate_concrete_unit_title(self, unit_number: int, progression_level: str, role_id: str, topic: str):
-                    return f"Unit {unit_number}: {topic} {progression_level} Skills"
-                
-                def generate_specific_learning_outcomes(self, unit_title: str, progression_level: str, role_id: str, topic: str, unit_ects: float):
-                    return [f"Apply {topic.lower()} skills in professional contexts", f"Demonstrate {progression_level.lower()} competency in {topic.lower()}"]
-                
-                def _clean_topic_name(self, topic: str, *args, **kwargs):
-                    if topic and topic.strip() and topic.strip().lower() not in ["eu test", "test"]:
-                        return topic.strip()
-                    return "Digital Sustainability"
-            
-            content_generator = EnhancedMockDomainKnowledge()
-            print("   ✅ Enhanced mock content generator initialized")
-        
-        # Clean topic to preserve meaningful content
-        if args.topic and args.topic.strip() and args.topic.strip().lower() not in ["eu test", "test"]:
-            clean_topic = args.topic.strip()
-        else:
-            # Get role-specific topic for empty/placeholder topics
-            role_topics = {
-                "DAN": "ESG Data Analysis and Reporting",
-                "DSE": "Sustainability Data Engineering", 
-                "DSI": "Sustainability Data Science",
-                "DSM": "Sustainability Program Management",
-                "DSL": "Digital Sustainability Leadership",
-                "DSC": "Digital Sustainability Consulting",
-                "SBA": "Sustainability Business Analysis",
-                "SDD": "Sustainable Software Development",
-                "SSD": "Sustainable Solution Design",
-                "STS": "Sustainability Technical Implementation"
-            }
-            clean_topic = role_topics.get(args.role, "Digital Sustainability")
-        
-        print(f"   🎯 Topic: '{args.topic}' → '{clean_topic}' (role-aligned)")
-        
-        # Initialize comprehensive curriculum builder
-        comprehensive_builder = ComprehensiveCurriculumBuilder()
-        print(f"   ✅ Comprehensive curriculum builder initialized")
-        
-        # Initialize assessment generator
-        try:
-            from scripts.curriculum_generator.core.domain_knowledge_adapter import create_compatible_domain_knowledge
-            adapted_domain = create_compatible_domain_knowledge(content_generator)
-            assessment_gen = AssessmentGenerator(adapted_domain)
-            print(f"✅ ADAPTER: Domain source {type(content_generator).__name__} has native AssessmentGenerator support")
-            print(f"   ✅ AssessmentGenerator initialized with adapted domain knowledge")
-        except Exception as e:
-            print(f"   ⚠️ AssessmentGenerator adaptation error: {e}")
-            assessment_gen = AssessmentGenerator(content_generator)
-            print(f"   ✅ AssessmentGenerator initialized with enhanced mock domain knowledge")
-        
-        # Validate role
-        role_info = role_manager.get_role(args.role)
-        if not role_info:
-            print(f"❌ Role '{args.role}' not found")
-            return
-        
-        print(f"   ✅ Role: {role_info['name']}")
-        
-        # Get Educational Profile
-        ep_data, ep_source = ep_integrator.get_or_create_ep(args.role, args.eqf_level, clean_topic)
-        if ep_data:
-            print(f"   ✅ Educational Profile: {ep_source}")
-        
-        # STEP 1: Enhanced module selection
-        print(f"\n🔧 Enhanced module selection with content specificity...")
-        selected_modules, selection_metadata = enhanced_module_selector.select_modules(
-            role=args.role,
-            topic=clean_topic,
-            eqf_level=args.eqf_level,
-            ects=args.ects,
-            uol_count=args.uol
-        )
-        
-        print(f"🔧 Enhanced curriculum with smart module selection:")
-        print(f"   📦 {len(selected_modules)} unique modules selected")
-        print(f"   🎯 Role alignment: {selection_metadata['role_alignment']:.1f}%")
-        
-        # Display warnings and recommendations
-        if selection_metadata.get('warnings'):
-            print(f"   ⚠️  SELECTION WARNINGS:")
-            for warning in selection_metadata['warnings']:
-                print(f"      • {warning}")
-        
-        if selection_metadata.get('recommendations'):
-            print(f"   📋 RECOMMENDATIONS:")
-            for rec in selection_metadata['recommendations']:
-                print(f"      • {rec}")
-        
-        # STEP 2: Generate base learning units
-        print(f"\n🧱 Generating base learning units structure...")
-        base_units = uol_manager.distribute_ects_across_uol(
-            total_ects=args.ects,
-            uol=args.uol,
-            role_id=args.role,
-            topic=clean_topic
-        )
-        
-        # STEP 3: MODULE CONTENT INTEGRATION - Replace generic content with module-specific content
-        print(f"\n🔗 Integrating module content into learning units...")
-        enhanced_units = module_content_integrator.integrate_modules_into_units(
-            selected_modules=selected_modules,
-            role=args.role,
-            base_units=base_units,
-            topic=clean_topic,
-            eqf_level=args.eqf_level
-        )
-        
-        # Get integration summary
-        integration_summary = module_content_integrator.get_integration_summary()
-        print(f"🔗 Module integration complete:")
-        print(f"   ✅ {len(enhanced_units)} units processed")
-        print(f"   ⚠️  {integration_summary['warnings_issued']} integration warnings issued")
-        
-        # Add framework mappings to units (keeping existing logic)
-        final_units = []
-        for unit in enhanced_units:
-            # Get EQF-appropriate framework mappings
-            eqf_framework_mappings = get_eqf_appropriate_framework_mappings(
-                eqf_level=args.eqf_level,
-                role_id=args.role,
-                progression_level=unit['progression_level']
-            )
-            
-            # Add framework mappings
-            unit['framework_mappings'] = eqf_framework_mappings
-            unit['keywords'] = [clean_topic, args.role, unit['progression_level']]
-            unit['eqf_validated'] = True
-            unit['esg_enhanced'] = True
-            unit['work_based_learning'] = True
-            unit['role_aligned'] = True
-            
-            final_units.append(unit)
-        
-        # Generate assessment strategy
-        print(f"\n🎯 Generating enhanced assessment strategy...")
-        try:
-            assessment_strategy = assessment_gen.generate_assessment_strategy(
-                topic=clean_topic,
-                eqf_level=args.eqf_level,
-                selected_modules=final_units
-            )
-            print(f"   ✅ Enhanced assessment strategy generated")
-        except Exception as e:
-            print(f"   ⚠️ Assessment generation error: {e}")
-            # Create fallback
-        # Generate WP3-compliant curriculum
-        wp3_curriculum = wp3_generator.generate_wp3_compliant_curriculum(
-            role_id=args.role,
-            eqf_level=args.eqf_level,
-            ects=args.ects,
-            selected_modules=final_units,
-            topic=clean_topic
-        )
-        print(f"✅ WP3-compliant curriculum generated")
-
-        # Generate WP3-compliant curriculum
-        wp3_curriculum = wp3_generator.generate_wp3_compliant_curriculum(
-            role_id=args.role,
-            eqf_level=args.eqf_level,
-            ects=args.ects,
-            selected_modules=final_units,
-            topic=clean_topic
-        )
-        print(f"✅ WP3-compliant curriculum generated")
-
-        assessment_strategy = {
-                "overall_strategy": {
-                    "assessment_philosophy": f"Practical {clean_topic} application for EQF Level {args.eqf_level}",
-                    "balance_ratios": {"practical": 60, "written": 25, "project": 15}
-                }
-            }
-        print(f"   ✅ Fallback assessment strategy applied")
-        
-        # Create base curriculum
-        base_curriculum = {
-            'metadata': {
-                'role_id': args.role,
-                'role_name': role_info['name'],
-                'topic': clean_topic,
-                'eqf_level': args.eqf_level,
-                'target_ects': args.ects,
-                'actual_ects': sum(unit['ects'] for unit in final_units),
-                'total_ecvet_points': sum(unit['ects'] for unit in final_units),
-                'units_requested': args.uol,
-                'units_generated': len(final_units),
-                'generation_date': datetime.now().isoformat(),
-                'system_version': 'T3.2_T3.4_COMPLIANT_WITH_COMPLETE_MODULE_INTEGRATION',
-                'validation_status': 'PASSED' if is_valid else 'FORCED_OVERRIDE',
-                'compact_mode': args.compact_mode
-            },
-            'learning_units': final_units,
-            'assessment_strategy': assessment_strategy,
-            'selected_modules': selected_modules,
-            'module_selection_metadata': selection_metadata,
-            'module_integration_metadata': integration_summary
-        }
-        
-        # Generate missing sections 8 & 9 BEFORE comprehensive builder
-        print(f"\n🔧 Generating sections 8 & 9...")
-        
-        # Generate Section 8: Key Benefits Summary
-        section_8_data = content_generator.generate_section_8_key_benefits_recap(
-            role_id=args.role,
-            topic=clean_topic,
-            actual_ects=sum(unit['ects'] for unit in final_units),
-            eqf_level=args.eqf_level
-        )
-        base_curriculum['section_8_key_benefits_recap'] = section_8_data
-        print(f"   ✅ Section 8 (Key Benefits): {len(str(section_8_data))} characters")
-        
-        # Generate Section 9: Cross-Border Compatibility 
-        section_9_data = content_generator.generate_section_9_cross_border_compatibility(
-            role_id=args.role,
-            actual_ects=sum(unit['ects'] for unit in final_units),
-            eqf_level=args.eqf_level
-        )
-        base_curriculum['section_9_cross_border_compatibility'] = section_9_data
-        print(f"   ✅ Section 9 (Cross-Border): {len(str(section_9_data))} characters")
-        
-        # Use comprehensive builder to generate ALL T3.2/T3.4 compliant sections
-        print(f"\n🔧 Building comprehensive T3.2/T3.4 compliant curriculum...")
-        comprehensive_curriculum = comprehensive_builder.build_complete_curriculum(base_curriculum)
-        print(f"   ✅ Comprehensive curriculum built with all T3.2/T3.4 compliant sections")
-        
-        # Use content specificity engine to enhance with specific content
-        print(f"\n🚀 Enhancing curriculum with content specificity engine...")
-        final_curriculum = content_specificity_engine.enhance_curriculum(
-            comprehensive_curriculum, args.role, selected_modules
-        )
-        print(f"   ✅ Content specificity enhancement complete")
-        
-        # Generate comprehensive HTML from enhanced curriculum
-        comprehensive_html = generate_comprehensive_html(final_curriculum, args)
-        
-        # Generate outputs
-        from scripts.curriculum_generator.core.output_manager import OutputManager
-        output_manager = OutputManager(project_root)
-        
-        output_dir = Path(base_output_dir)
-        output_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Save all formats with enhanced content
-        output_files = output_manager.save_curriculum_with_all_formats(
-            curriculum=final_curriculum,
-            curriculum_html=comprehensive_html,
-            output_dir=str(output_dir),
-            topic=clean_topic,
-            eqf_level=args.eqf_level,
-            role_id=args.role,
-            theme_name=args.theme,
-            output_docx=args.output_docx,
-            include_profile=False,
-            compact_mode=args.compact_mode
-        )
-        
-        # Display success summary
-        compliance_metadata = final_curriculum.get('compliance_metadata', {})
-        content_specificity = final_curriculum.get('content_specificity_metadata', {})
-        module_integration = final_curriculum.get('module_integration_metadata', {})
-        t32_compliance = compliance_metadata.get('t32_compliance', {})
-        t34_compliance = compliance_metadata.get('t34_compliance', {})
-        target_audience = compliance_metadata.get('target_audience', 'digital_professionals')
-        
-        # Calculate integration statistics
-        integrated_units = sum(1 for unit in final_units if unit.get('content_source') == 'module_integrated')
-        integration_percentage = (integrated_units / len(final_units) * 100) if final_units else 0
-        
-        print(f"\n🎉 T3.2/T3.4 COMPLIANT CURRICULUM WITH COMPLETE MODULE INTEGRATION SUCCESS!")
-        print(f"   📋 EQF-ECTS validation: {'✅ PASSED' if is_valid else '⚠️ FORCED'}")
-        print(f"   🔧 Comprehensive builder: ✅ ALL SECTIONS POPULATED WITH T3.2/T3.4 CONTENT")
-        print(f"   🎯 Target audience: ✅ GENUINE DIFFERENTIATION for {target_audience.replace('_', ' ').title()}")
-        print(f"   📦 Module selection: ✅ {len(selected_modules)} modules selected with {selection_metadata['role_alignment']:.1f}% role alignment")
-        print(f"   🔗 Module integration: ✅ {integrated_units}/{len(final_units)} units ({integration_percentage:.1f}%) use module-specific content")
-        print(f"   🚀 Content specificity: ✅ D2.1 gap coverage score: {content_specificity.get('d21_gap_analysis', {}).get('content_specificity_score', 0):.1f}%")
-        print(f"   🎯 Topic handling: ✅ FIXED - '{clean_topic}' properly preserved")
-        print(f"   📄 Generated sections: {len([k for k in final_curriculum.keys() if k.startswith('section_')])} complete sections")
-        print(f"   📁 Generated {len(output_files)} files:")
-        
-        for file_path in output_files:
-            file_type = file_path.suffix.upper().lstrip('.')
-            print(f"      📄 {file_type}: {file_path.name}")
-        
-        print(f"\n✅ T3.2 COMPLIANCE ACHIEVED WITH TARGET AUDIENCE DIFFERENTIATION:")
-        for key, value in t32_compliance.items():
-            print(f"   ✅ {key.replace('_', ' ').title()}: {value}")
-        
-        print(f"\n✅ T3.4 COMPLIANCE ACHIEVED:")  
-        for key, value in t34_compliance.items():
-            print(f"   ✅ {key.replace('_', ' ').title()}: {value}")
-        
-        
-        # Display module integration summary
-        print(f"\n🔗 MODULE INTEGRATION SUMMARY:")
-        print(f"   📦 {len(selected_modules)} modules used for content extraction")
-        print(f"   🔗 {integrated_units}/{len(final_units)} units enhanced with module-specific content ({integration_percentage:.1f}%)")
-        print(f"   ⚠️  {module_integration.get('warnings_issued', 0)} integration warnings issued")
-        print(f"   🎯 Module alignment: {module_integration.get('module_alignment', 'Good')}")
-        print(f"   📊 Average relevance: {module_integration.get('average_relevance', 0):.1f}%")
-
-        # Display content specificity warnings and recommendations
-        content_warnings = content_specificity.get('content_warnings', {})
-        if content_warnings.get('warnings'):
-            print(f"\n⚠️  CONTENT SPECIFICITY WARNINGS ({len(content_warnings['warnings'])}):")
-            for warning in content_warnings['warnings']:
-                print(f"   ⚠️  {warning['content_type'].upper()}: {warning['issue']}")
-        
-        if content_warnings.get('unique_recommendations'):
-            print(f"\n📋 CONTENT IMPROVEMENT RECOMMENDATIONS:")
-            for rec in content_warnings['unique_recommendations']:
-                print(f"   📋 {rec}")
-        
-        if args.output_docx and not output_manager.docx_available:
-            print("\n💡 To enable DOCX generation, install: pip install python-docx")
+        with tracing(args.profile_trace, cprofile=args.profile_cprofile, name='main_enhanced_uol'):
+            generate_curriculum(args)
         
     except Exception as e:
         print(f"\n❌ Error: {e}")
         import traceback
         traceback.print_exc()
 
+
+# Process-pool workers (web interface): each worker builds the components once
+_pool_worker_components = None
+
+def init_pool_worker():
+    """Preload the catalog, selectors and knowledge bases in a pool worker process"""
+    global _pool_worker_components
+    _pool_worker_components = build_generation_components()
+
+def generate_in_pool_worker(options: Dict[str, Any]) -> Dict[str, Any]:
+    """Generate one curriculum with the worker's warm components; errors are returned as data"""
+    try:
+        return generate_curriculum(generation_options(**options), _pool_worker_components)
+    except Exception as e:
+        import traceback
+        return {"success": False, "error": f"{type(e).__name__}: {e}", "traceback": traceback.format_exc()}
+    finally:
+        # The pool process's stage timings, for /metrics of the server (ECM_METRICS_DIR)
+        REGISTRY.flush()
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
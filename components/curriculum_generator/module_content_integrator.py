@@ -8,6 +8,8 @@ import json
 import logging
 from pathlib import Path
 
+from ecm.tracing import traced
+
 class ModuleContentIntegrator:
     def __init__(self, project_root):
         """Initialize with proper path handling and logging"""
@@ -53,6 +55,7 @@ class ModuleContentIntegrator:
             print(f"❌ ModuleContentIntegrator: Error loading module database: {e}")
             return []
     
+    @traced('integrate_modules', 'stage')
     def integrate_modules_into_units(self, selected_modules, role, base_units=None, **kwargs):
         """Integrate selected modules into learning units - handles dict or string modules"""
         if not self.module_database:
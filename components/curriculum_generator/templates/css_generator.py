@@ -6,6 +6,8 @@ CSS generation for curriculum visualizations
 from typing import Dict, Optional
 import logging
 
+from ecm.assets import Asset, build_asset
+
 logger = logging.getLogger(__name__)
 
 
@@ -33,6 +35,11 @@ class CSSGenerator:
         else:
             return self._generate_modern_theme_css()
     
+    def curriculum_css_asset(self, theme: str = 'modern') -> Asset:
+        """Minified, content-hashed curriculum CSS, built once per theme and colour set"""
+        key = ('curriculum', theme, tuple(sorted(self.theme_colors.items())))
+        return build_asset('css', key, lambda: self.generate_curriculum_css(theme))
+    
     def _generate_modern_theme_css(self) -> str:
         """Generate modern theme CSS"""
         
@@ -6,6 +6,8 @@ JavaScript generation for curriculum interactivity
 from typing import Dict, List, Optional
 import logging
 
+from ecm.assets import Asset, build_asset
+
 logger = logging.getLogger(__name__)
 
 
@@ -65,6 +67,13 @@ function initializeCurriculumFeatures() {
         
         return js_code
     
+    def curriculum_js_asset(self, features: Optional[Dict[str, bool]] = None) -> Asset:
+        """Minified, content-hashed curriculum JavaScript, built once per feature combination"""
+        if features:
+            self.features.update(features)
+        key = ('curriculum', tuple(sorted(self.features.items())))
+        return build_asset('js', key, self.generate_curriculum_js)
+    
     def _generate_tab_navigation_js(self) -> str:
         """Generate tab navigation JavaScript"""
         
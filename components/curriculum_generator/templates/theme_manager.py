@@ -8,6 +8,8 @@ import json
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+from ecm.assets import Asset, AssetWriter, build_asset
+
 class ThemeManager:
     """Manages Material Design themes for DSCG templates"""
     
@@ -86,12 +88,25 @@ class ThemeManager:
         print(f"✅ Loaded theme CSS: {theme_name}")
         return combined_css
     
+    def get_theme_css_asset(self, theme_name: Optional[str] = None) -> Asset:
+        """Minified, content-hashed theme CSS, loaded once per templates directory and theme"""
+        theme_name = theme_name or self.themes_config["default_theme"]
+        key = ('theme', str(self.templates_dir.resolve()), theme_name)
+        return build_asset('css', key, lambda: self.get_theme_css(theme_name))
+    
     def get_theme_info(self, theme_name: str) -> Dict[str, Any]:
         """Get detailed information about a theme"""
         return self.themes_config["themes"].get(theme_name, {})
     
-    def inject_theme_css(self, html_content: str, theme_name: Optional[str] = None) -> str:
-        """Inject theme CSS directly into HTML content"""
+    def inject_theme_css(self, html_content: str, theme_name: Optional[str] = None,
+                         assets: Optional[AssetWriter] = None) -> str:
+        """Inject theme CSS into HTML content (as a shared asset link when an AssetWriter is given)"""
+        
+        if assets is not None:
+            stylesheet = assets.tag(self.get_theme_css_asset(theme_name))
+            if "</head>" in html_content:
+                return html_content.replace("</head>", f"    {stylesheet}\n</head>")
+            return f"{stylesheet}\n{html_content}"
         
         theme_css = self.get_theme_css(theme_name)
         
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# scripts/curriculum_generator/test_assets.py
+"""
+Tests for the content-hashed static asset bundle.
+Minifiers must keep literals intact, and assets are built and written once.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent / "templates"))
+
+from ecm.assets import AssetWriter, build_asset, minify_css, minify_js, template_asset
+from css_generator import CSSGenerator
+from js_generator import JSGenerator
+
+
+def test_minify_css_keeps_strings():
+    css = """
+    /* header */
+    .a > .b ,  .c {
+        content: "a ,  b { }";
+        color : red ;
+    }
+    @media (max-width: 768px) { .a { margin: 0 auto; } }
+    """
+    assert minify_css(css) == '.a>.b,.c{content:"a ,  b { }";color :red}@media (max-width:768px){.a{margin:0 auto}}'
+
+
+def test_minify_js_keeps_literals_and_line_breaks():
+    js = """
+    // setup
+    const url = 'http://example.org/a';  // trailing
+    const html = `
+        <div>  indented  </div>`;
+    /* block
+       comment */
+    const re = /[/]\\/+/g, half = total / 2;
+    let x = 1
+    let y = 2
+    """
+    assert minify_js(js) == '\n'.join([
+        "const url = 'http://example.org/a';",
+        "const html = `\n        <div>  indented  </div>`;",
+        "const re = /[/]\\/+/g, half = total / 2;",
+        "let x = 1",
+        "let y = 2",
+    ])
+
+
+def test_assets_are_built_once_per_key():
+    calls = []
+
+    def build():
+        calls.append(1)
+        return 'body { color: red; }'
+
+    first = build_asset('css', ('test', 'built-once'), build)
+    second = build_asset('css', ('test', 'built-once'), build)
+    assert first is second and len(calls) == 1
+    assert first.content == 'body{color:red}'
+    assert first.filename == f"{first.digest}.css"
+
+
+def test_writer_links_or_inlines(tmp_path):
+    asset = template_asset('curriculum.css')
+
+    linked = AssetWriter(tmp_path)
+    tag = linked.tag(asset)
+    assert tag == f'<link rel="stylesheet" href="assets/{asset.filename}">'
+    assert (tmp_path / 'assets' / asset.filename).read_text(encoding='utf-8') == asset.content
+    assert linked.tag(asset) == tag
+    assert [path.name for path in (tmp_path / 'assets').iterdir()] == [asset.filename]
+
+    assert AssetWriter(tmp_path, inline=True).tag(asset) == f"<style>{asset.content}</style>"
+    assert AssetWriter().tag(asset).startswith('<style>')
+
+
+def test_generator_assets_follow_their_configuration():
+    css = CSSGenerator()
+    assert css.curriculum_css_asset() is css.curriculum_css_asset()
+    css.theme_colors['primary'] = '#000000'
+    assert css.curriculum_css_asset().digest != CSSGenerator().curriculum_css_asset().digest
+
+    js = JSGenerator()
+    full = js.curriculum_js_asset()
+    reduced = js.curriculum_js_asset({'export_functions': False})
+    assert full.digest != reduced.digest
+    assert AssetWriter().tag(reduced).startswith('<script>')
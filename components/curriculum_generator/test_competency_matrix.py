@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# scripts/curriculum_generator/test_competency_matrix.py
+"""
+Equivalence test for the precomputed module x competency score matrix.
+Maps random modules with EnhancedCompetencyMapper.map_module_to_competencies
+and with the per-competency _calculate_module_competency_relevance loop, and
+requires identical competencies, order and scores.
+"""
+
+import json
+import random
+import sys
+from pathlib import Path
+
+# Add project root and curriculum generator to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from ecm.catalog import get_catalog_snapshot
+from domain.competency_mapper import EnhancedCompetencyMapper
+
+WORDS = ['data', 'green', 'carbon', 'energy', 'cloud', 'ai', 'reporting', 'sustainability',
+         'software', 'design', 'policy', 'risk', 'circular', 'analytics', 'ethics']
+
+
+def _phrase(rng, low=1, high=5):
+    return ' '.join(rng.choice(WORDS) for _ in range(rng.randint(low, high)))
+
+
+def _competency(rng, comp_id):
+    return {
+        'competency_id': comp_id,
+        'title': _phrase(rng, 1, 3).title(),
+        'description': _phrase(rng, 3, 12),
+        'related_skills': [_phrase(rng, 1, 2) for _ in range(rng.randint(0, 4))],
+        'application_examples': [_phrase(rng, 2, 6) for _ in range(rng.randint(0, 3))]
+    }
+
+
+def _write_standards(root: Path, rng) -> None:
+    standards = root / 'input' / 'standards'
+    standards.mkdir(parents=True)
+    ecf = {f"E{i}": _competency(rng, f"E{i}") for i in range(12)}
+    esco = {f"S{i}": _competency(rng, f"S{i}") for i in range(10)}
+    green = {f"G{i}": _competency(rng, f"G{i}") for i in range(8)}
+    all_ids = list(ecf) + list(esco) + list(green)
+    (standards / 'standard_ecf_esco.json').write_text(json.dumps({
+        'e_cf_competencies': {'build': ecf},
+        'esco_competencies': {'skills': esco},
+        'competency_mapping_rules': {
+            'role_mappings': {'DSL': rng.sample(all_ids, 12), 'DAN': rng.sample(all_ids, 6)},
+            'eqf_level_mappings': {str(eqf): rng.sample(all_ids, 8) for eqf in (5, 6, 7)}
+        }
+    }))
+    (standards / 'standard_greencomp.json').write_text(json.dumps({
+        'competency_areas': {'values': green},
+        'role_competency_mappings': {'DSL': list(green)[:4]}
+    }))
+
+
+def _reference_mapping(mapper, module, role_id, eqf_level):
+    title = module.get('title', '').lower()
+    keywords = [kw.lower() for kw in module.get('keywords', [])]
+    description = module.get('description', '').lower()
+    relevant = []
+    for comp in mapper.get_competencies_for_role(role_id, eqf_level):
+        score = mapper._calculate_module_competency_relevance(title, keywords, description, comp)
+        if score > 0.3:
+            relevant.append((comp['id'], score))
+    relevant.sort(key=lambda item: item[1], reverse=True)
+    return relevant[:6]
+
+
+def test_matrix_mapping_matches_reference(tmp_path):
+    rng = random.Random(0)
+    _write_standards(tmp_path, rng)
+    mapper = EnhancedCompetencyMapper(tmp_path)
+    modules = [
+        {'title': _phrase(rng).title(), 'keywords': [_phrase(rng, 1, 1) for _ in range(rng.randint(0, 5))],
+         'description': _phrase(rng, 0, 10)}
+        for _ in range(60)
+    ]
+
+    matrix = mapper.module_competency_matrix(modules)
+    assert matrix.shape == (60, len(mapper.competency_ids))
+
+    for role_id in ('DSL', 'DAN', 'XYZ'):
+        for eqf_level in (5, 6, 7, 8):
+            for module in modules:
+                mapped = mapper.map_module_to_competencies(module, role_id, eqf_level)
+                assert [(comp['id'], comp['relevance_score']) for comp in mapped] == \
+                    _reference_mapping(mapper, module, role_id, eqf_level)
+                assert all('module_alignment' in comp for comp in mapped)
+
+
+def test_report_uses_matrix(tmp_path):
+    _write_standards(tmp_path, random.Random(1))
+    mapper = EnhancedCompetencyMapper(tmp_path)
+    modules = [{'title': 'Green Data Analytics', 'keywords': ['data', 'green'], 'description': 'carbon reporting'}]
+
+    report = mapper.generate_curriculum_competency_report(modules, 'DSL', 6)
+    assert report['coverage_statistics']['total_available_competencies'] == \
+        len(mapper.get_competencies_for_role('DSL', 6))
+    assert report['module_competency_mappings'][0]['competency_mappings'] == \
+        mapper.map_module_to_competencies(modules[0], 'DSL', 6)
+
+
+def test_missing_standards_give_empty_mapping(tmp_path):
+    mapper = EnhancedCompetencyMapper(tmp_path)
+    assert mapper.map_module_to_competencies({'title': 'Data', 'keywords': ['data']}, 'DSL') == []
+    assert mapper.module_competency_matrix([{'title': 'Data'}]).shape == (1, 0)
+
+
+def test_catalog_modules_use_snapshot_matrix(tmp_path, monkeypatch):
+    rng = random.Random(2)
+    _write_standards(tmp_path, rng)
+    mapper = EnhancedCompetencyMapper(tmp_path)
+    modules_file = tmp_path / 'modules.json'
+    modules_file.write_text(json.dumps([
+        {'id': f'M{i}', 'title': _phrase(rng).title(), 'keywords': [_phrase(rng, 1, 1) for _ in range(3)],
+         'description': _phrase(rng, 0, 10)}
+        for i in range(20)
+    ]))
+    modules = list(get_catalog_snapshot(modules_file).modules)
+    copies = [dict(module) for module in modules]
+    expected = mapper.module_competency_matrix(copies)
+    assert expected.any()
+
+    assert (mapper.module_competency_matrix(modules) == expected).all()
+    report = mapper.generate_curriculum_competency_report(copies[:5], 'DSL', 6)
+
+    # Later calls, single modules and reports slice the snapshot's matrix instead of rescoring
+    def rescore(module):
+        raise AssertionError("catalog module rescored")
+    monkeypatch.setattr(mapper, '_score_module', rescore)
+    assert (mapper.module_competency_matrix(modules[::-1]) == expected[::-1]).all()
+    assert mapper.map_module_to_competencies(modules[3], 'DSL', 6) == \
+        mapper._map_score_row(copies[3], expected[3], 'DSL', 6)
+    assert mapper.generate_curriculum_competency_report(modules[:5], 'DSL', 6) == report
+
+
+def test_module_row_cache_is_bounded(tmp_path, monkeypatch):
+    _write_standards(tmp_path, random.Random(3))
+    mapper = EnhancedCompetencyMapper(tmp_path)
+    monkeypatch.setattr(EnhancedCompetencyMapper, 'MODULE_ROW_CACHE_SIZE', 10)
+    for i in range(25):
+        mapper.map_module_to_competencies({'title': f'Module {i}', 'keywords': ['data']}, 'DSL')
+    assert len(mapper._module_score_rows) <= 10
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# scripts/curriculum_generator/test_docx_stream.py
+"""
+Tests for the streaming DOCX writer.
+Streamed documents must read back the same as ones built with python-docx.
+"""
+
+import sys
+from pathlib import Path
+
+from docx import Document
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "analysis" / "scripts"))
+
+from ecm.docx_blocks import PageBreak, Paragraph, Run, Table, add_blocks, heading, labelled
+from ecm.docx_stream import write_docx
+from ecm.docx_templates import open_base_document
+
+
+def _build(doc):
+    doc.styles['Normal'].font.name = 'Calibri'
+
+
+def _text(path):
+    doc = Document(path)
+    lines = [paragraph.text for paragraph in doc.paragraphs]
+    for table in doc.tables:
+        lines.extend(cell.text for row in table.rows for cell in row.cells)
+    return lines
+
+
+def _body(path):
+    return [element.xml for element in Document(path).element.body.iterchildren()]
+
+
+BLOCKS = [
+    Paragraph((Run('Data & <Sustainability>'),), 'Title', WD_ALIGN_PARAGRAPH.CENTER),
+    Paragraph((Run(' Leading space\tand tab\nnew line ', bold=True, size=12, color='666666'),),
+              alignment=WD_ALIGN_PARAGRAPH.JUSTIFY),
+    Paragraph(),
+    heading('Overview', level=1),
+    labelled('Role Focus: ', 'Green software'),
+    Paragraph((Run('Framework: e-CF A.1', italic=True, size=9),)),
+    Table(((Paragraph((Run('ECTS Credits', bold=True),)), Paragraph((Run('5'),))),
+           (Paragraph((Run('Thematic Area', bold=True),)), Paragraph((Run('Energy'),)))), 'Table Grid'),
+    PageBreak(),
+    Paragraph((Run('Footer', size=10),), alignment=WD_ALIGN_PARAGRAPH.CENTER)
+]
+
+
+def test_streamed_blocks_match_python_docx(tmp_path):
+    doc = open_base_document(('test', 'stream'), _build)
+    add_blocks(doc, BLOCKS)
+    doc.save(tmp_path / 'object.docx')
+    write_docx(str(tmp_path / 'stream.docx'), BLOCKS, ('test', 'stream'), _build)
+
+    assert _text(tmp_path / 'stream.docx') == _text(tmp_path / 'object.docx')
+    assert _body(tmp_path / 'stream.docx') == _body(tmp_path / 'object.docx')
+    assert Document(tmp_path / 'stream.docx').styles['Normal'].font.name == 'Calibri'
+
+
+def test_curriculum_docx_backends_match(tmp_path, monkeypatch):
+    # The generator creates its output directory relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    from generate_curricula_toggle import EnhancedD4SCurriculumGenerator
+
+    generator = EnhancedD4SCurriculumGenerator(config_path=str(project_root / 'config' / 'settings.json'))
+    generator.output_dir = tmp_path
+    curriculum = generator.generate_curriculum(generator.curricula_specs[0])
+
+    generator.docx_backend = 'python-docx'
+    object_path = generator.save_curriculum_docx(curriculum, 'object')
+    generator.docx_backend = 'stream'
+    stream_path = generator.save_curriculum_docx(curriculum, 'stream')
+
+    assert _text(stream_path) == _text(object_path)
+    assert len(Document(stream_path).tables) == 1 + len(curriculum['learning_units'])
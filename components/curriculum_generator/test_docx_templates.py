@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# scripts/curriculum_generator/test_docx_templates.py
+"""
+Tests for the cached DOCX base templates.
+Documents opened from a base template must match freshly styled ones.
+"""
+
+import sys
+import zipfile
+from pathlib import Path
+
+from docx import Document
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent / "components"))
+
+from ecm.docx_templates import base_template_bytes, open_base_document
+from docx_generator import DocxGenerator
+
+
+def _parts(path):
+    with zipfile.ZipFile(path) as archive:
+        return {name: archive.read(name) for name in archive.namelist()}
+
+
+def test_base_template_is_built_once_per_key():
+    calls = []
+
+    def build(doc):
+        calls.append(1)
+        doc.styles['Normal'].font.name = 'Calibri'
+
+    first = base_template_bytes(('test', 'built-once'), build)
+    assert base_template_bytes(('test', 'built-once'), build) is first and len(calls) == 1
+
+    # Every document is an independent copy of the template
+    doc = open_base_document(('test', 'built-once'), build)
+    doc.add_paragraph('changed')
+    assert open_base_document(('test', 'built-once'), build).paragraphs == []
+    assert doc.styles['Normal'].font.name == 'Calibri'
+
+
+def test_curriculum_docx_matches_freshly_styled_document(tmp_path):
+    generator = DocxGenerator(project_root)
+    text = "Curriculum of Data Engineer\nEQF Level 6\n1. Overview\nPlain body text"
+    cached = generator.generate_compact_curriculum_docx(text, 'DE', 6, 30, tmp_path / 'cached.docx')
+
+    fresh = Document()
+    generator._create_curriculum_styles(fresh)
+    fresh.save(tmp_path / 'fresh.docx')
+    assert _parts(cached)['word/styles.xml'] == _parts(tmp_path / 'fresh.docx')['word/styles.xml']
+
+
+def test_theme_colors_select_their_own_template(tmp_path):
+    generator = DocxGenerator(project_root)
+    default = generator._new_document('curriculum', generator._create_curriculum_styles)
+    generator.set_theme_colors({'primary': '003399'})
+    themed = generator._new_document('curriculum', generator._create_curriculum_styles)
+
+    assert str(default.styles['DSCG Heading 1'].font.color.rgb) == '607D8B'
+    assert str(themed.styles['DSCG Heading 1'].font.color.rgb) == '003399'
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# scripts/curriculum_generator/test_ects_solver.py
+"""
+Tests for the exact ECTS selection solver and its use in ModuleSelector.
+"""
+
+import itertools
+import random
+import sys
+from pathlib import Path
+
+# Add project root, curriculum generator and its components to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent / "components"))
+
+import numpy as np
+
+from ecm.ects_solver import solve_ects_selection
+from module_selector import ModuleSelector
+
+
+def _brute_force(ects, relevance, target, min_units, max_units, weight_by_ects):
+    best = None
+    for count in range(len(ects) + 1):
+        if count < min_units or (max_units is not None and count > max_units):
+            continue
+        for combination in itertools.combinations(range(len(ects)), count):
+            if sum(ects[i] for i in combination) > target + 1e-9:
+                continue
+            value = sum(relevance[i] * (ects[i] if weight_by_ects else 1) for i in combination)
+            best = value if best is None else max(best, value)
+    return best
+
+
+def test_solver_matches_brute_force():
+    rng = random.Random(7)
+    for _ in range(500):
+        size = rng.randint(0, 8)
+        ects = [rng.choice([0.5, 1, 2, 2.5, 5, 7.5, 10]) for _ in range(size)]
+        relevance = [rng.choice([50, 60, 70, 80, 90, 100]) for _ in range(size)]
+        target = rng.choice([0.5, 1, 2, 5, 7.5, 10, 20, 30])
+        min_units = rng.randint(0, 4)
+        max_units = rng.choice([None, 2, 3, 5])
+        weight_by_ects = rng.random() < 0.5
+
+        expected = _brute_force(ects, relevance, target, min_units, max_units, weight_by_ects)
+        result = solve_ects_selection(ects, relevance, target, min_units, max_units,
+                                      weight_by_ects=weight_by_ects, time_budget=None)
+        if expected is None:
+            assert result is None
+            continue
+        assert result is not None
+        assert abs(result.total_value - expected) < 1e-6
+        assert result.total_ects <= target + 1e-9
+        assert len(result.indices) >= min_units
+        assert max_units is None or len(result.indices) <= max_units
+
+
+def test_solver_hits_target_on_large_catalog():
+    rng = np.random.default_rng(3)
+    ects = rng.choice([0.5, 1, 2, 2.5, 5, 10], 1000)
+    relevance = rng.integers(40, 100, 1000).astype(float)
+
+    result = solve_ects_selection(ects, relevance, 30, min_units=6, time_budget=None)
+    assert result.total_ects == 30
+    assert len(result.indices) >= 6
+
+
+def test_solver_returns_none_when_out_of_time():
+    assert solve_ects_selection([5] * 50, [80] * 50, 60, time_budget=-1) is None
+
+
+def test_module_selector_meets_target_without_overshoot():
+    modules = [
+        {'id': f'M{i}', 'ects': ects, 'total_relevance_score': score}
+        for i, (ects, score) in enumerate([(10, 9.0), (5, 8.5), (5, 8.0), (2.5, 7.0), (2.5, 6.5), (10, 6.0)])
+    ]
+    selector = ModuleSelector(domain_knowledge=None)
+
+    selected = selector._select_optimal_combination(modules, 20)
+    assert sum(module['ects'] for module in selected) == 20
+    assert len(selected) >= 3
+    # Relevance order is preserved
+    scores = [module['total_relevance_score'] for module in selected]
+    assert scores == sorted(scores, reverse=True)
+
+
+if __name__ == "__main__":
+    test_solver_matches_brute_force()
+    test_solver_hits_target_on_large_catalog()
+    test_solver_returns_none_when_out_of_time()
+    test_module_selector_meets_target_without_overshoot()
+    print("✅ ECTS solver tests passed")
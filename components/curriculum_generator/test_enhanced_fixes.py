@@ -39,7 +39,7 @@ def test_large_curriculum_fixes():
         
         module_selector = EnhancedModuleSelector())
         content_integrator = ModuleContentIntegrator(project_root)
-        specificity_engine = ContentSpecificityEngine(project_root)
+        specificity_engine = ContentSpecificityEngine()
         
         print("✅ All components initialized successfully")
         
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# scripts/curriculum_generator/test_jobs.py
+"""
+Tests for the background job brokers and runner.
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from ecm.jobs import (
+    DONE, FAILED, LOST_WORKER_ERROR, MAX_ATTEMPTS, QUEUED, RUNNING,
+    JobResult, JobRunner, MemoryBroker, SQLiteBroker, broker_from_environment, open_broker
+)
+
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def broker(request, tmp_path):
+    if request.param == 'memory':
+        return MemoryBroker()
+    return SQLiteBroker(tmp_path / 'jobs.sqlite3')
+
+
+def _wait(broker, job_id, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while broker.get(job_id).status in (QUEUED, RUNNING):
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    return broker.get(job_id)
+
+
+def test_jobs_are_claimed_in_order(broker):
+    first = broker.submit('curriculum', {'role': 'DAN'})
+    second = broker.submit('curriculum', {'role': 'DSL'})
+    assert broker.queue_depth() == 2 and broker.get(first.id).status == QUEUED
+
+    claimed = broker.claim(timeout=0.1)
+    assert (claimed.id, claimed.params, claimed.status) == (first.id, {'role': 'DAN'}, RUNNING)
+    assert broker.result(first.id) is None
+
+    broker.finish(first.id, JobResult(b'PK', 'application/zip', 'ECM.zip'))
+    assert broker.get(first.id).status == DONE
+    assert broker.result(first.id) == JobResult(b'PK', 'application/zip', 'ECM.zip')
+
+    assert broker.claim(timeout=0.1).id == second.id
+    assert broker.claim(timeout=0.1) is None
+
+
+def test_sqlite_jobs_are_claimed_once_across_connections(tmp_path):
+    path = tmp_path / 'jobs.sqlite3'
+    submitter, worker_a, worker_b = SQLiteBroker(path), SQLiteBroker(path), SQLiteBroker(path)
+    job = submitter.submit('all_curricula', {})
+
+    claims = [worker_a.claim(timeout=0.1), worker_b.claim(timeout=0.1)]
+    assert [claim.id for claim in claims if claim is not None] == [job.id]
+
+
+
+def test_namespaces_share_a_file_but_not_jobs(tmp_path):
+    path = tmp_path / 'jobs.sqlite3'
+    app, enhanced = SQLiteBroker(path, namespace='app'), SQLiteBroker(path, namespace='enhanced_app')
+    job = app.submit('curriculum', {'role': 'DAN'})
+
+    assert enhanced.claim(timeout=0.1) is None and enhanced.get(job.id) is None
+    assert enhanced.queue_depth() == 0 and app.queue_depth() == 1
+    assert app.claim(timeout=0.1).id == job.id
+    with pytest.raises(ValueError):
+        SQLiteBroker(path, namespace='app; DROP TABLE jobs')
+
+
+def test_sqlite_expired_lease_requeues_then_fails(tmp_path):
+    broker = SQLiteBroker(tmp_path / 'jobs.sqlite3', lease=0.05)
+    job = broker.submit('curriculum', {'role': 'DAN'})
+
+    # The worker holding the job disappears; the job is claimed again after its lease
+    assert broker.claim(timeout=0.1).id == job.id
+    assert broker.claim(timeout=0.01) is None
+    for _ in range(MAX_ATTEMPTS - 1):
+        time.sleep(0.06)
+        assert broker.claim(timeout=0.1).id == job.id
+
+    time.sleep(0.06)
+    assert broker.claim(timeout=0.01) is None
+    assert (broker.get(job.id).status, broker.get(job.id).error) == (FAILED, LOST_WORKER_ERROR)
+
+def test_runner_reuses_warm_state_and_records_failures(broker):
+    builds = []
+
+    def handler(params, state):
+        if params.get('fail'):
+            raise ValueError('bad spec')
+        if 'generator' not in state:
+            builds.append(1)
+            state['generator'] = object()
+        return JobResult.from_json({'ects': params['ects']})
+
+    runner = JobRunner(broker, {'curriculum': handler}, workers=1, poll_timeout=0.05).start()
+    try:
+        jobs = [broker.submit('curriculum', {'ects': ects}) for ects in (5, 10)]
+        failed = broker.submit('curriculum', {'fail': True})
+        unknown = broker.submit('unknown', {})
+
+        assert [_wait(broker, job.id).status for job in jobs] == [DONE, DONE]
+        assert broker.result(jobs[1].id).data == b'{"ects": 10}'
+        assert len(builds) == 1
+
+        assert _wait(broker, failed.id).status == FAILED
+        assert broker.get(failed.id).error == 'ValueError: bad spec'
+        assert _wait(broker, unknown.id).status == FAILED
+    finally:
+        runner.stop()
+
+
+def test_unreachable_broker_falls_back(tmp_path):
+    fallback = f"sqlite:///{tmp_path / 'jobs.sqlite3'}"
+    assert isinstance(open_broker('redis://127.0.0.1:1/0', fallback=fallback), SQLiteBroker)
+    assert isinstance(open_broker('memory://'), MemoryBroker)
+    with pytest.raises(ValueError):
+        open_broker('ftp://example.org')
+
+
+def test_explicit_broker_url_overrides_environment(tmp_path, monkeypatch):
+    monkeypatch.setenv('JOB_BROKER_URL', f"sqlite:///{tmp_path / 'env.sqlite3'}")
+    assert isinstance(broker_from_environment(tmp_path / 'jobs.sqlite3', url='memory://'), MemoryBroker)
+    assert isinstance(broker_from_environment(tmp_path / 'jobs.sqlite3'), SQLiteBroker)
+    assert not (tmp_path / 'jobs.sqlite3').exists()
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='needs os.fork')
+def test_sqlite_connection_is_reopened_after_fork(tmp_path):
+    broker = SQLiteBroker(tmp_path / 'jobs.sqlite3')
+    job = broker.submit('curriculum', {'role': 'DAN'})
+    parent_connection = broker._connection()
+
+    pid = os.fork()
+    if pid == 0:
+        # Child: the inherited connection must not be reused
+        ok = False
+        try:
+            claimed = broker.claim(timeout=0.1)
+            ok = broker._connection() is not parent_connection and claimed.id == job.id
+        finally:
+            os._exit(0 if ok else 1)
+    _, status = os.waitpid(pid, 0)
+    assert os.WEXITSTATUS(status) == 0
+    assert broker._connection() is parent_connection
+    assert broker.get(job.id).status == RUNNING
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+# scripts/curriculum_generator/test_keyword_automaton.py
+"""
+Equivalence test for the Aho-Corasick KeywordAutomaton.
+Every reported match set must equal the keywords found with `in`.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from ecm.keyword_automaton import KeywordAutomaton
+
+
+def test_matches_equal_substring_checks():
+    rng = random.Random(0)
+    for _ in range(500):
+        keywords = [''.join(rng.choice('abc') for _ in range(rng.randint(0, 4))) for _ in range(rng.randint(1, 8))]
+        automaton = KeywordAutomaton(keywords)
+        for _ in range(10):
+            text = ''.join(rng.choice('abcd') for _ in range(rng.randint(0, 20)))
+            expected = {keyword_id for keyword_id, keyword in enumerate(keywords) if keyword in text}
+            assert automaton.matches(text) == expected, (keywords, text)
+
+
+def test_overlapping_and_repeated_keywords():
+    automaton = KeywordAutomaton(['carbon', 'carbon footprint', 'bon', 'data', 'data'])
+    assert automaton.matches('measuring carbon footprint data') == {0, 1, 2, 3, 4}
+    assert automaton.matches('carbo') == set()
+
+
+if __name__ == "__main__":
+    test_matches_equal_substring_checks()
+    test_overlapping_and_repeated_keywords()
+    print("✅ KeywordAutomaton matches equal substring checks")
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# scripts/curriculum_generator/test_metrics.py
+"""
+Tests for the Prometheus text exposition of ecm.metrics.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from ecm.metrics import METRICS_DIR_ENV, Registry, register_cache, timed
+
+PID = f'pid="{os.getpid()}"'
+
+
+def _samples(text):
+    return {
+        line.rsplit(' ', 1)[0]: float(line.rsplit(' ', 1)[1])
+        for line in text.splitlines() if not line.startswith('#')
+    }
+
+
+def test_histogram_buckets_are_cumulative(monkeypatch):
+    monkeypatch.delenv(METRICS_DIR_ENV, raising=False)
+    registry = Registry()
+    histogram = registry.histogram('stage_seconds', 'Stage time', buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value, stage='select')
+    histogram.observe(0.2, stage='render "html"')
+
+    text = registry.render()
+    assert '# TYPE stage_seconds histogram' in text
+    samples = _samples(text)
+    assert samples[f'stage_seconds_bucket{{{PID},stage="select",le="0.1"}}'] == 2
+    assert samples[f'stage_seconds_bucket{{{PID},stage="select",le="1.0"}}'] == 3
+    assert samples[f'stage_seconds_bucket{{{PID},stage="select",le="+Inf"}}'] == 4
+    assert samples[f'stage_seconds_count{{{PID},stage="select"}}'] == 4
+    assert samples[f'stage_seconds_sum{{{PID},stage="select"}}'] == 3.65
+    assert samples[f'stage_seconds_count{{{PID},stage="render \\"html\\""}}'] == 1
+
+
+def test_gauges_are_read_at_scrape_time():
+    registry = Registry()
+    depth = [3]
+    registry.gauge('queue_depth', 'Queued jobs', lambda: depth[0])
+    register_cache('response', lambda: {'hits': 3, 'misses': 1}, registry)
+    registry.gauge('broken', 'Unreachable source', lambda: 1 / 0)
+
+    assert _samples(registry.render())['queue_depth'] == 3
+    depth[0] = 0
+    samples = _samples(registry.render())
+    assert samples['queue_depth'] == 0
+    assert samples[f'ecm_response_cache_hit_ratio{{{PID}}}'] == 0.75
+    assert samples[f'ecm_response_cache_hits_total{{{PID}}}'] == 3
+    assert 'broken' not in registry.render()
+
+
+def test_timed_records_generation_stage(monkeypatch):
+    monkeypatch.delenv(METRICS_DIR_ENV, raising=False)
+    from ecm.metrics import GENERATION_STAGE_SECONDS, REGISTRY
+
+    @timed('unit_test_stage')
+    def stage():
+        return 'done'
+
+    assert stage() == 'done' and stage.__name__ == 'stage'
+    assert _samples(REGISTRY.render())[f'ecm_generation_stage_seconds_count{{{PID},stage="unit_test_stage"}}'] == 1
+    assert GENERATION_STAGE_SECONDS.name in REGISTRY.render()
+
+
+def test_metrics_directory_sums_processes(tmp_path, monkeypatch):
+    from ecm.metrics import REGISTRY
+    monkeypatch.setenv(METRICS_DIR_ENV, str(tmp_path))
+    histogram = REGISTRY.histogram('unit_test_fork_seconds', 'Stage time', buckets=(0.1, 1.0))
+    histogram.observe(0.05, stage='select')
+
+    pid = os.fork()
+    if pid == 0:
+        # Another worker: starts empty, its observations reach the parent through the directory
+        try:
+            histogram.observe(0.5, stage='select')
+            histogram.observe(0.5, stage='render')
+            REGISTRY.flush()
+        finally:
+            os._exit(0)
+    os.waitpid(pid, 0)
+
+    samples = _samples(REGISTRY.render())
+    assert samples['unit_test_fork_seconds_count{stage="select"}'] == 2
+    assert samples['unit_test_fork_seconds_bucket{stage="select",le="0.1"}'] == 1
+    assert samples['unit_test_fork_seconds_count{stage="render"}'] == 1
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted([f'{os.getpid()}.json', f'{pid}.json'])
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# scripts/curriculum_generator/test_module_facets.py
+"""
+Tests for the faceted module index.
+Counts and search results must match a direct walk over the catalog.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from ecm.catalog import CatalogSnapshot, get_catalog_snapshot
+from ecm.module_facets import FacetQuery, ModuleFacetIndex, module_facet_values
+
+
+def _categorise(module):
+    return ['data_analytics'] if 'data' in module.get('name', '').lower() else ['general']
+
+
+MODULES = [
+    {'id': 'M1', 'name': 'Carbon Data Analytics', 'eqf_level': 5, 'thematic_area': 'Data',
+     'delivery_methods': ['online'], 'skills': ['carbon_accounting'], 'role_relevance': {'DAN': 95, 'DSM': 40}},
+    {'id': 'M2', 'name': 'Green Software', 'eqf_level': 6, 'thematic_area': 'Technical',
+     'delivery_methods': ['online', 'blended'], 'skills': ['green_computing'], 'role_relevance': {'DAN': 60}},
+    {'id': 'M3', 'name': 'ESG Data Reporting', 'description': 'Carbonisation of reports',
+     'eqf_level': 6, 'thematic_area': 'Data', 'delivery_methods': ['blended'], 'role_relevance': {'DAN': 85}}
+]
+
+
+@pytest.fixture
+def index():
+    return ModuleFacetIndex.from_snapshot(CatalogSnapshot.from_modules(MODULES), _categorise)
+
+
+def test_counts_match_catalog_walk():
+    snapshot = get_catalog_snapshot()
+    index = ModuleFacetIndex.from_snapshot(snapshot)
+    expected = {}
+    for module in snapshot.modules:
+        for facet, values in module_facet_values(module).items():
+            for value in values:
+                expected.setdefault(facet, {}).setdefault(value, 0)
+                expected[facet][value] += 1
+    assert {facet: counts for facet, counts in index.counts.items() if counts} == expected
+    assert len(index) == len(snapshot.modules)
+
+
+def test_for_snapshot_is_cached_per_categoriser():
+    class Selector:
+        def classify(self, module):
+            return ['data_analytics'] if 'Data' in module['name'] else []
+
+    snapshot = CatalogSnapshot.from_modules(MODULES)
+    selector = Selector()
+    plain = ModuleFacetIndex.for_snapshot(snapshot)
+    categorised = ModuleFacetIndex.for_snapshot(snapshot, selector.classify)
+
+    assert plain.counts['category'] == {}
+    assert categorised.counts['category'] == {'data_analytics': 2}
+    assert ModuleFacetIndex.for_snapshot(snapshot) is plain
+    # A bound method is a new object per access but the same categoriser
+    assert ModuleFacetIndex.for_snapshot(snapshot, selector.classify) is categorised
+    assert ModuleFacetIndex.for_snapshot(snapshot, Selector().classify) is not categorised
+
+
+def test_filters_and_prefix_search(index):
+    result = index.search(FacetQuery.from_args(['eqf:6', 'role:DAN:high']))
+    assert [module['id'] for module in result['modules']] == ['M3']
+    assert result['facets']['delivery_method'] == {'blended': 1}
+
+    result = index.search(FacetQuery.from_args([], q='carbon'))
+    assert [module['id'] for module in result['modules']] == ['M1', 'M3']
+    assert result['facets']['category'] == {'data_analytics': 2}
+
+    result = index.search(FacetQuery.from_args(['skill:green_computing'], q='soft'))
+    assert [module['id'] for module in result['modules']] == ['M2']
+
+
+def test_pagination(index):
+    first = index.search(FacetQuery.from_args([], page=1, per_page=2))
+    second = index.search(FacetQuery.from_args([], page=2, per_page=2))
+    assert first['total'] == 3 and first['pages'] == 2
+    assert [m['id'] for m in first['modules'] + second['modules']] == ['M1', 'M2', 'M3']
+    assert first['facets'] is index.counts
+
+
+@pytest.mark.parametrize('facets, page', [(['colour:red'], 1), (['eqf'], 1), ([], 0), ([], 'x')])
+def test_invalid_queries(facets, page):
+    with pytest.raises(ValueError):
+        FacetQuery.from_args(facets, page=page)
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# scripts/curriculum_generator/test_module_table.py
+"""
+Tests that ModuleTable ranking matches the per-module loop it replaced.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from ecm.catalog import get_catalog_snapshot
+from ecm.module_table import ModuleTable
+
+
+def _sorted_selection(modules, role_id, min_eqf, max_eqf, min_relevance):
+    """The filter + sort in select_appropriate_learning_units_strict_eqf before ModuleTable"""
+    suitable = []
+    for module in modules:
+        eqf = module.get('eqf_level', 6)
+        relevance = module.get('role_relevance', {}).get(role_id, 0)
+        if eqf < min_eqf or eqf > max_eqf or relevance < min_relevance:
+            continue
+        suitable.append({'id': module.get('id', 'UNKNOWN'), 'relevance': relevance})
+    suitable.sort(key=lambda x: x['relevance'], reverse=True)
+    return [unit['id'] for unit in suitable]
+
+
+@pytest.mark.parametrize('min_relevance', [50, 60])
+def test_rank_matches_sorted_selection_on_catalog(min_relevance):
+    snapshot = get_catalog_snapshot()
+    table = ModuleTable.for_snapshot(snapshot)
+    assert table.role_ids
+
+    compared = 0
+    for role_id in table.role_ids + ('UNKNOWN_ROLE',):
+        for eqf_level in range(4, 9):
+            min_eqf = max(eqf_level - 1, 4)
+            expected = _sorted_selection(snapshot.modules, role_id, min_eqf, eqf_level, min_relevance)
+            ranked = [table.module_ids[row] for row in table.rank(role_id, min_eqf, eqf_level, min_relevance)]
+            assert ranked == expected, (role_id, eqf_level)
+            compared += len(expected)
+    assert compared > 0
+
+
+def test_score_grid_matches_per_cell_rank():
+    snapshot = get_catalog_snapshot()
+    table = ModuleTable.for_snapshot(snapshot)
+    role_ids = table.role_ids + ('UNKNOWN_ROLE',)
+    eqf_levels = list(range(4, 9))
+    grid = table.score_grid(role_ids, eqf_levels, min_relevance=60)
+
+    assert grid['role_ids'] == list(role_ids) and grid['eqf_levels'] == eqf_levels
+    assert grid['count'].sum() > 0
+    for r, role_id in enumerate(role_ids):
+        for e, eqf_level in enumerate(eqf_levels):
+            rows = table.rank(role_id, max(eqf_level - 1, 4), eqf_level, 60)
+            relevance = table.role_relevance(role_id)[rows]
+            assert sorted(np.flatnonzero(grid['eligible'][r, e])) == sorted(rows)
+            assert grid['count'][r, e] == len(rows)
+            assert grid['total_ects'][r, e] == pytest.approx(table.ects[rows].sum())
+            assert grid['mean_relevance'][r, e] == pytest.approx(relevance.mean() if len(rows) else 0.0)
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# scripts/curriculum_generator/test_module_text_index.py
+"""
+Equivalence test for the ModuleTextIndex fast path.
+Scores every module against every topic with the indexed scorer and with
+DigitalSustainabilityKnowledge.score_module_relevance and requires identical results.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root, curriculum generator and its components to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent / "components"))
+
+from ecm.catalog import get_catalog_snapshot
+from core.data_loader import DataLoader
+from domain.knowledge_base import DigitalSustainabilityKnowledge, ModuleTextIndex
+from module_selector import ModuleSelector
+
+EXTRA_TOPICS = [
+    "Carbon", "AI", "data", "Digital Sustainability", "ESG Reporting and Compliance",
+    "carbon footprint measurement", "Green   Software", "Sustainable Finance", "IoT", ""
+]
+
+SYNTHETIC_MODULES = [
+    {
+        'id': 'T1',
+        'name': 'Carbon Footprint Measurement for AI',
+        'description': 'Measuring greenhouse gas emissions of machine learning models',
+        'keywords': 'carbon, Footprint ,ai',
+        'topics': []
+    },
+    {
+        'id': 'T2',
+        'name': 'Data',
+        'description': '',
+        'extended_description': 'Environmental DATA analytics and reporting',
+        'keywords': ['Energy', 'green'],
+        'topics': ['Carbon Footprint', 'Data Center Sustainability', '']
+    },
+    {'id': 'T3', 'name': '', 'description': ''}
+]
+
+
+def _assert_equivalent(knowledge, modules, topics):
+    index = ModuleTextIndex(modules)
+    for topic in topics:
+        indexed = index.score_topic(knowledge, topic)
+        expected = [knowledge.score_module_relevance(module, topic) for module in modules]
+        assert indexed == expected, f"Score mismatch for topic {topic!r}"
+
+
+def test_index_matches_score_module_relevance_on_catalog():
+    knowledge = DigitalSustainabilityKnowledge()
+    snapshot = get_catalog_snapshot()
+    topics = knowledge.get_all_topics() + EXTRA_TOPICS
+
+    _assert_equivalent(knowledge, snapshot.modules, topics)
+    _assert_equivalent(knowledge, snapshot.normalised_modules, topics)
+
+
+def test_index_matches_score_module_relevance_on_edge_cases():
+    knowledge = DigitalSustainabilityKnowledge()
+    _assert_equivalent(knowledge, SYNTHETIC_MODULES, knowledge.get_all_topics() + EXTRA_TOPICS)
+
+
+def test_score_modules_relevance_uses_snapshot_index():
+    knowledge = DigitalSustainabilityKnowledge()
+    snapshot = get_catalog_snapshot()
+    index = ModuleTextIndex.for_snapshot(snapshot)
+    assert ModuleTextIndex.for_snapshot(snapshot) is index
+
+    # Subset in a different order, plus a module that is not in the index
+    subset = list(reversed(snapshot.modules[:20]))
+    topic = "Carbon Footprint Measurement"
+    expected = [knowledge.score_module_relevance(module, topic) for module in subset]
+    assert knowledge.score_modules_relevance(subset, topic, index) == expected
+
+    mixed = subset + [dict(SYNTHETIC_MODULES[0])]
+    expected_mixed = expected + [knowledge.score_module_relevance(mixed[-1], topic)]
+    assert knowledge.score_modules_relevance(mixed, topic, index) == expected_mixed
+
+
+
+def test_module_selector_uses_catalog_index_without_wiring(monkeypatch):
+    knowledge = DigitalSustainabilityKnowledge()
+    modules = DataLoader(project_root).load_modules("input/modules/modules_v5.json")
+    topic = "Carbon Footprint Measurement"
+    expected = ModuleSelector(knowledge).select_modules_for_topic(topic, 6, 30, [dict(m) for m in modules], 'DAN')
+
+    # Modules handed out by the DataLoader are the snapshot's objects: no per-module scoring
+    def per_module(*args):
+        raise AssertionError("score_module_relevance called; the catalog index was not used")
+    monkeypatch.setattr(knowledge, 'score_module_relevance', per_module)
+    selected = ModuleSelector(knowledge).select_modules_for_topic(topic, 6, 30, modules, 'DAN')
+    assert selected and [m['id'] for m in selected] == [m['id'] for m in expected]
+    assert ModuleTextIndex.for_modules(modules) is ModuleTextIndex.for_snapshot(get_catalog_snapshot(), normalised=True)
+    assert ModuleTextIndex.for_modules([dict(modules[0])]) is None
+
+if __name__ == "__main__":
+    test_index_matches_score_module_relevance_on_catalog()
+    test_index_matches_score_module_relevance_on_edge_cases()
+    test_score_modules_relevance_uses_snapshot_index()
+    print("✅ ModuleTextIndex scores match score_module_relevance")
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# scripts/curriculum_generator/test_pareto_search.py
+"""
+Tests for the Pareto search over learning unit selections.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+
+from ecm.catalog import get_catalog_snapshot
+from ecm.ects_solver import solve_ects_selection
+from ecm.pareto import ObjectiveMatrix, ParetoProblem, pareto_fronts
+
+PROBLEMS = [
+    ParetoProblem('DSL_7_Advanced', 'DSL', 30.0, 6, 7, 60),
+    ParetoProblem('DAN_5_Analysis', 'DAN', 7.5, 4, 5, 60),
+    ParetoProblem('DAN_5_Basic', 'DAN', 0.5, 4, 5, 50)
+]
+
+
+def _objective_vector(solution):
+    objectives = solution['objectives']
+    return np.array([-objectives['coverage'], objectives['total_ects'], -objectives['sharing']])
+
+
+def test_fronts_are_feasible_and_non_dominated():
+    snapshot = get_catalog_snapshot()
+    ects_by_id = {module['id']: module.get('ects_points', 5) for module in snapshot.modules}
+
+    for result in pareto_fronts(snapshot, PROBLEMS):
+        front = result['front']
+        assert front, result['spec_id']
+        for solution in front:
+            assert solution['learning_unit_ids']
+            assert sum(ects_by_id[unit_id] for unit_id in solution['learning_unit_ids']) <= result['target_ects']
+
+        vectors = [_objective_vector(solution) for solution in front]
+        for i, first in enumerate(vectors):
+            for j, second in enumerate(vectors):
+                if i != j:
+                    assert not ((second <= first).all() and (second < first).any())
+
+
+def test_front_contains_the_coverage_optimum():
+    snapshot = get_catalog_snapshot()
+    matrix = ObjectiveMatrix.for_snapshot(snapshot)
+    problem = PROBLEMS[0]
+
+    columns = matrix.columns(problem)
+    optimum = solve_ects_selection(columns['ects'], columns['relevance'], problem.target_ects,
+                                   min_units=1, time_budget=None)
+    best_coverage = float(columns['coverage'][optimum.indices].sum())
+
+    front = pareto_fronts(snapshot, [problem])[0]['front']
+    assert abs(front[0]['objectives']['coverage'] - best_coverage) < 1e-9
+
+
+def test_process_pool_matches_sequential_search():
+    snapshot = get_catalog_snapshot()
+    options = {'population_size': 24, 'generations': 10}
+    assert pareto_fronts(snapshot, PROBLEMS, jobs=2, **options) == pareto_fronts(snapshot, PROBLEMS, **options)
+
+
+if __name__ == "__main__":
+    test_fronts_are_feasible_and_non_dominated()
+    test_front_contains_the_coverage_optimum()
+    test_process_pool_matches_sequential_search()
+    print("✅ Pareto search tests passed")
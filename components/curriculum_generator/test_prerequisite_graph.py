@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# scripts/curriculum_generator/test_prerequisite_graph.py
+"""
+Tests for the compiled prerequisite graph and the components that use it.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# Add project root, curriculum generator and its components to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent / "components"))
+
+from core.data_loader import DataLoader
+from ecm.catalog import get_catalog_snapshot
+from ecm.prerequisites import PrerequisiteGraph
+from module_selector import ModuleSelector
+from pathway_generator import PathwayGenerator
+
+MODULES = [
+    {'id': 'A', 'title': 'Foundations', 'prerequisites': ['A']},
+    {'id': 'B', 'title': 'Data Analytics', 'prerequisites': ['A']},
+    {'id': 'C', 'title': 'Machine Learning', 'prerequisites': ['B']},
+    {'id': 'D', 'title': 'Cycle One', 'prerequisites': ['E']},
+    {'id': 'E', 'title': 'Cycle Two', 'prerequisites': ['D', 'Z9']},
+    {'id': 'F', 'title': 'Capstone', 'prerequisites': 'C'}
+]
+
+
+def _reachable(modules, start):
+    edges = {m['id']: [p for p in ([m['prerequisites']] if isinstance(m['prerequisites'], str) else m['prerequisites'])
+                       if p != m['id']] for m in modules}
+    seen, stack = set(), list(edges[start])
+    while stack:
+        node = stack.pop()
+        if node in seen or node not in edges:
+            continue
+        seen.add(node)
+        stack.extend(edges[node])
+    return seen
+
+
+def test_catalog_graph_reports_self_loop():
+    graph = PrerequisiteGraph.for_snapshot(get_catalog_snapshot())
+    assert 'M1' in graph.self_loops
+    assert 'M1' not in graph.prerequisites_of('M1')
+    assert graph.prerequisites_of('M4') == ['M1', 'M3']
+
+
+def test_closure_matches_graph_walk():
+    rng = random.Random(0)
+    for _ in range(300):
+        size = rng.randint(1, 12)
+        modules = [
+            {'id': f'X{i}', 'prerequisites': [f'X{rng.randrange(size + 1)}' for _ in range(rng.randint(0, 3))]}
+            for i in range(size)
+        ]
+        graph = PrerequisiteGraph.from_modules(modules)
+        for module in modules:
+            assert set(graph.prerequisites_of(module['id'])) | (
+                {module['id']} & set(graph.ids(graph.closure[graph.index[module['id']]]))
+            ) == _reachable(modules, module['id'])
+
+
+def test_missing_closed_and_order():
+    graph = PrerequisiteGraph.from_modules(MODULES)
+
+    assert graph.self_loops == ('A',)
+    assert graph.cycles == (('D', 'E'),)
+    assert graph.unknown_references == {'E': ('Z9',)}
+    assert graph.missing(['F']) == ['A', 'B', 'C']
+    assert graph.is_closed(['A', 'B', 'C'])
+    assert not graph.is_closed(['C'])
+    assert graph.topological_sort(['F', 'C', 'A', 'B']) == ['A', 'B', 'C', 'F']
+    assert graph.depth(['A', 'C', 'F']) == {'A': 0, 'C': 0, 'F': 1}
+
+
+def test_selector_and_pathway_use_graph():
+    graph = PrerequisiteGraph.from_modules(MODULES)
+    selector = ModuleSelector(domain_knowledge=None, prerequisite_graph=graph)
+    selected = [MODULES[2], MODULES[5]]
+
+    assert selector.get_prerequisite_chain(selected) == ['A', 'B', 'C']
+    assert selector.missing_prerequisites(selected) == ['A', 'B']
+
+    flow = PathwayGenerator(domain_knowledge=None, prerequisite_graph=graph)._generate_prerequisite_flow(
+        [MODULES[5], MODULES[2], MODULES[1]]
+    )
+    assert {(c['from'], c['to']) for c in flow['connections']} == {('module_1', 'module_0'), ('module_2', 'module_1')}
+    assert flow['missing_prerequisites'] == ['A']
+    assert flow['levels'] == {'0': ['module_2'], '1': ['module_1'], '2': ['module_0']}
+
+
+def test_selector_uses_snapshot_graph_without_wiring(monkeypatch):
+    modules = DataLoader(project_root).load_modules("input/modules/modules_v5.json")
+    graph = PrerequisiteGraph.for_snapshot(get_catalog_snapshot())
+
+    # Modules handed out by the DataLoader resolve to the snapshot graph: nothing is recompiled
+    def compile_graph(modules):
+        raise AssertionError("prerequisite graph recompiled")
+    monkeypatch.setattr(PrerequisiteGraph, 'from_modules', compile_graph)
+
+    assert PrerequisiteGraph.for_modules(modules) is graph
+    by_id = {module['id']: module for module in modules}
+    selector = ModuleSelector(domain_knowledge=None)
+    missing = selector.missing_prerequisites([by_id['M4']], modules)
+    assert missing == graph.missing(['M4']) == ['M1', 'M3']
+    assert [m['id'] for m in selector._missing_prerequisite_modules(missing, modules)] == ['M1', 'M3']
+
+
+if __name__ == "__main__":
+    test_catalog_graph_reports_self_loop()
+    test_closure_matches_graph_walk()
+    test_missing_closed_and_order()
+    test_selector_and_pathway_use_graph()
+    print("✅ Prerequisite graph tests passed")
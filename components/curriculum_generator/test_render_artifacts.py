@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# scripts/curriculum_generator/test_render_artifacts.py
+"""
+Tests for in-memory curriculum rendering.
+render_json/html/docx must match the saved files without writing any.
+"""
+
+import json
+import sys
+from io import BytesIO
+from pathlib import Path
+
+from docx import Document
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "analysis" / "scripts"))
+
+
+def _text(source):
+    return [paragraph.text for paragraph in Document(source).paragraphs]
+
+
+def test_rendered_artifacts_match_saved_files(tmp_path, monkeypatch):
+    # The generator creates its output directory relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    from generate_curricula_toggle import EnhancedD4SCurriculumGenerator
+
+    generator = EnhancedD4SCurriculumGenerator(config_path=str(project_root / 'config' / 'settings.json'))
+    generator.output_dir = tmp_path / 'unused'
+    curriculum = generator.generate_curriculum(generator.curricula_specs[0])
+
+    rendered_json = generator.render_json(curriculum)
+    rendered_html = generator.render_html(curriculum).decode('utf-8')
+    rendered_docx = generator.render_docx(curriculum)
+    assert not generator.output_dir.exists()
+
+    assert json.loads(rendered_json) == json.loads(json.dumps(curriculum))
+    # Downloads are standalone: no link to a shared assets/ directory
+    assert '<style>' in rendered_html and 'assets/' not in rendered_html
+    assert curriculum['curriculum_identification']['formatted_title'] in rendered_html
+
+    generator.output_dir = tmp_path
+    json_path, _, docx_path = generator.save_curriculum_files(curriculum, 'saved')
+    assert json_path.read_bytes() == rendered_json
+    assert _text(BytesIO(rendered_docx)) == _text(docx_path)
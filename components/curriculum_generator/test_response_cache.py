@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# scripts/curriculum_generator/test_response_cache.py
+"""
+Tests for the keyed response cache and its conditional responses.
+"""
+
+import sys
+from pathlib import Path
+
+from flask import Flask
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from ecm.response_cache import CachedResponse, ResponseCache, cache_key
+
+
+def _app(cache, **config):
+    app = Flask(__name__)
+    cache.init_app(app, {'CACHE_TYPE': 'SimpleCache', **config})
+    builds = []
+
+    def build(role):
+        builds.append(role)
+        return CachedResponse.from_json({'role': role})
+
+    @app.route('/role/<role>')
+    def role_info(role):
+        return cache.get_or_build('role_info', {'role': role}, app.config['CATALOG_VERSION'],
+                                  lambda: build(role)).to_response()
+
+    app.config['CATALOG_VERSION'] = 'v1'
+    return app, builds
+
+
+def test_cache_key_normalises_parameters():
+    key = cache_key('preview', {'role': ' DAN ', 'topic': None, 'eqf_level': 6}, 'v1')
+    assert key == cache_key('preview', {'eqf_level': 6, 'role': 'DAN'}, 'v1')
+    assert key != cache_key('preview', {'eqf_level': 6, 'role': 'DAN'}, 'v2')
+    assert key != cache_key('role_info', {'eqf_level': 6, 'role': 'DAN'}, 'v1')
+
+
+def test_repeated_requests_hit_and_revalidate():
+    cache = ResponseCache()
+    app, builds = _app(cache)
+    client = app.test_client()
+
+    first = client.get('/role/DAN')
+    second = client.get('/role/DAN')
+    assert first.get_json() == second.get_json() == {'role': 'DAN'}
+    assert builds == ['DAN'] and cache.stats()['hits'] == 1
+    assert first.headers['ETag'] and first.headers['Last-Modified']
+
+    not_modified = client.get('/role/DAN', headers={'If-None-Match': first.headers['ETag']})
+    assert not_modified.status_code == 304 and not_modified.data == b''
+    assert client.get('/role/DAN', headers={'If-None-Match': '"other"'}).status_code == 200
+
+
+def test_catalog_change_misses():
+    cache = ResponseCache()
+    app, builds = _app(cache)
+    client = app.test_client()
+
+    client.get('/role/DAN')
+    app.config['CATALOG_VERSION'] = 'v2'
+    client.get('/role/DAN')
+    assert builds == ['DAN', 'DAN']
+
+
+def test_filesystem_backend_is_shared(tmp_path):
+    config = {'CACHE_TYPE': 'FileSystemCache', 'CACHE_DIR': str(tmp_path / 'responses')}
+    first, first_builds = _app(ResponseCache(), **config)
+    second, second_builds = _app(ResponseCache(), **config)
+
+    first.test_client().get('/role/DSL')
+    response = second.test_client().get('/role/DSL')
+    assert response.get_json() == {'role': 'DSL'}
+    assert first_builds == ['DSL'] and second_builds == []
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# scripts/curriculum_generator/test_templating.py
+"""
+Tests for the shared Jinja2 template environment.
+Streamed and string rendering must produce the same document.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+from jinja2 import UndefinedError
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent / "components"))
+
+from ecm.templating import STREAM_BUFFER, get_environment, render_template, stream_template, write_template
+from final_html_generator import _template_context, generate_final_enhanced_html, stream_final_enhanced_html
+
+TEMPLATE = 'final_enhanced_curriculum.html.j2'
+
+
+def _curriculum(units: int):
+    return {
+        'metadata': {'role_name': 'Data Engineer', 'eqf_level': 6, 'ects': 30},
+        'curriculum_structure': {
+            'section_2_pedagogical_structure': {
+                'units': [{'title': f'Unit {i}', 'ects': 5} for i in range(units)]
+            }
+        }
+    }
+
+
+def test_streamed_document_equals_rendered_document():
+    for units in (0, 3, 200):
+        data = _curriculum(units)
+        chunks = list(stream_final_enhanced_html(data, 'eu_official'))
+        assert ''.join(chunks) == generate_final_enhanced_html(data, 'eu_official')
+        # Pieces are batched rather than handed out one by one
+        pieces = list(get_environment().get_template(TEMPLATE).generate(**_template_context(data, 'eu_official')))
+        assert len(chunks) == -(-len(pieces) // STREAM_BUFFER)
+
+
+def test_write_template_streams_to_file(tmp_path):
+    context = _template_context(_curriculum(5), 'material_gray')
+    path = write_template(TEMPLATE, tmp_path / 'curriculum.html', **context)
+    assert path.read_text(encoding='utf-8') == render_template(TEMPLATE, **context)
+
+
+def test_missing_variables_fail_loudly():
+    with pytest.raises(UndefinedError):
+        render_template(TEMPLATE)
+    with pytest.raises(UndefinedError):
+        ''.join(stream_template(TEMPLATE))
+
+
+def test_environment_is_shared():
+    assert get_environment() is get_environment()
+
+
+def test_label_filter_matches_the_old_method_calls():
+    template = get_environment().from_string("{{ key|label }}")
+    for key in ('quality_assurance', 'co2_reporting', "e-cf_partner's_view"):
+        assert template.render(key=key) == key.replace('_', ' ').title()
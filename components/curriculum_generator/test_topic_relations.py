@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# scripts/curriculum_generator/test_topic_relations.py
+"""
+Tests for the iterative TopicRelationManager traversals.
+Compares them with the original recursive versions on random topic graphs
+and checks that deep graphs no longer hit the recursion limit.
+"""
+
+import random
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add project root and curriculum generator to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from domain.topic_relations import TopicRelationManager
+
+
+def _knowledge(edges):
+    """Minimal domain knowledge: {topic: (prerequisites, related, eqf_levels)}"""
+    topics = {
+        name: SimpleNamespace(
+            related_topics=related, prerequisite_topics=prerequisites, specializations=[],
+            eqf_levels=eqf_levels, keywords=[], industry_relevance=[]
+        )
+        for name, (prerequisites, related, eqf_levels) in edges.items()
+    }
+    return SimpleNamespace(topics=topics, get_specializations=lambda topic: [])
+
+
+def _recursive_progression(graph, start_topic, target_eqf):
+    progression, visited = [], set()
+
+    def build_progression(topic, current_eqf):
+        if topic in visited or current_eqf > target_eqf:
+            return
+        visited.add(topic)
+        if topic in graph:
+            for prereq in graph[topic]['prerequisites']:
+                if prereq not in visited:
+                    build_progression(prereq, current_eqf - 1)
+            if current_eqf in graph[topic]['eqf_levels']:
+                progression.append(topic)
+            for related in graph[topic]['related']:
+                if related not in visited:
+                    build_progression(related, current_eqf)
+
+    build_progression(start_topic, target_eqf)
+    return progression
+
+
+def _recursive_chain(graph, topic):
+    chain, visited = [], set()
+
+    def trace_prerequisites(current_topic):
+        if current_topic in visited or current_topic not in graph:
+            return
+        visited.add(current_topic)
+        for prereq in graph[current_topic]['prerequisites']:
+            trace_prerequisites(prereq)
+        chain.append(current_topic)
+
+    trace_prerequisites(topic)
+    return chain[:-1]
+
+
+def test_traversals_match_recursive_versions():
+    rng = random.Random(0)
+    for _ in range(200):
+        names = [f"T{i}" for i in range(rng.randint(1, 15))]
+        pool = names + ["Unknown"]
+        edges = {
+            name: (rng.sample(pool, rng.randint(0, 2)), rng.sample(pool, rng.randint(0, 2)),
+                   sorted(rng.sample(range(4, 9), rng.randint(1, 5))))
+            for name in names
+        }
+        manager = TopicRelationManager(_knowledge(edges))
+        for topic in pool:
+            assert manager.find_prerequisite_chain(topic) == _recursive_chain(manager.topic_graph, topic)
+            for eqf in range(4, 9):
+                expected = _recursive_progression(manager.topic_graph, topic, eqf)
+                assert manager.get_learning_progression(topic, eqf) == expected
+
+
+def test_memoised_results_are_copies():
+    manager = TopicRelationManager(_knowledge({'A': ([], ['B'], [6]), 'B': (['A'], [], [6])}))
+    progression = manager.get_learning_progression('A', 6)
+    progression.append('mutated')
+    assert manager.get_learning_progression('A', 6) == ['A', 'B']
+    assert manager.progressions_for(['A', 'B'], [5, 6]) == {
+        'A': {5: [], 6: ['A', 'B']},
+        'B': {5: [], 6: ['B']}
+    }
+
+
+def test_deep_graph_does_not_recurse():
+    depth = sys.getrecursionlimit() * 3
+    edges = {f"T{i}": ([f"T{i - 1}"] if i else [], [f"T{i + 1}"], [6]) for i in range(depth)}
+    manager = TopicRelationManager(_knowledge(edges))
+
+    chain = manager.find_prerequisite_chain(f"T{depth - 1}")
+    assert chain == [f"T{i}" for i in range(depth - 1)]
+    assert len(manager.get_learning_progression("T0", 6)) == depth
+
+
+if __name__ == "__main__":
+    test_traversals_match_recursive_versions()
+    test_memoised_results_are_copies()
+    test_deep_graph_does_not_recurse()
+    print("✅ TopicRelationManager traversal tests passed")
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# scripts/curriculum_generator/test_topic_score_cache.py
+"""
+Tests for the bounded, optionally persistent topic scoring cache.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root, curriculum generator and its components to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent / "components"))
+
+from ecm import score_cache
+from ecm.catalog import freeze
+from ecm.score_cache import ScoreCache, module_content_hash
+from topic_scorer import ConsolidatedTopicScorer
+
+MODULE = {
+    'id': 'M1',
+    'name': 'Carbon Footprint Measurement',
+    'description': 'Measuring emissions of data centres',
+    'topics': ['Carbon Footprint']
+}
+
+
+def test_lru_bound_and_counters():
+    cache = ScoreCache(max_entries=2)
+    cache.put(('a', 't', 'v'), 1)
+    cache.put(('b', 't', 'v'), 2)
+    assert cache.get(('a', 't', 'v')) == 1   # 'a' becomes most recently used
+    cache.put(('c', 't', 'v'), 3)             # evicts 'b'
+
+    assert cache.get(('b', 't', 'v')) is None
+    assert cache.get(('c', 't', 'v')) == 3
+    stats = cache.stats()
+    assert (stats['entries'], stats['hits'], stats['misses'], stats['evictions']) == (2, 2, 1, 1)
+
+
+def test_module_edit_is_not_served_stale():
+    scorer = ConsolidatedTopicScorer()
+    first, _ = scorer.score_module_topic_relevance(MODULE, "Carbon Footprint")
+    assert scorer.score_module_topic_relevance(dict(MODULE), "Carbon Footprint")[0] == first
+    assert scorer.cache_stats()['hits'] == 1
+
+    edited = dict(MODULE, name='Stakeholder Communication', description='', topics=[])
+    assert scorer.score_module_topic_relevance(edited, "Carbon Footprint")[0] != first
+    assert scorer.cache_stats()['misses'] == 2
+
+
+def test_snapshot_module_hash_is_computed_once(monkeypatch):
+    frozen = freeze(MODULE)
+    expected = module_content_hash(MODULE)
+    assert module_content_hash(frozen) == expected
+
+    def rehash(module):
+        raise AssertionError("snapshot module hashed twice")
+    monkeypatch.setattr(score_cache, '_content_hash', rehash)
+    assert module_content_hash(frozen) == expected
+    assert ConsolidatedTopicScorer().score_module_topic_relevance(frozen, "Carbon Footprint")[0] > 0
+
+
+def test_persistent_cache_survives_restart(tmp_path):
+    db_path = tmp_path / "cache" / "topic_scores.sqlite"
+    scorer = ConsolidatedTopicScorer(cache_path=str(db_path))
+    expected = scorer.score_module_topic_relevance(MODULE, "Data Analytics")
+    matrix = scorer.score_matrix([MODULE], ["Carbon", "Green Software"])
+
+    restarted = ConsolidatedTopicScorer(cache_path=str(db_path))
+    assert restarted.score_module_topic_relevance(MODULE, "Data Analytics") == expected
+    assert (restarted.score_matrix([MODULE], ["Carbon", "Green Software"]) == matrix).all()
+    stats = restarted.cache_stats()
+    assert stats['disk_hits'] == 3 and stats['misses'] == 0
+
+    restarted.clear_cache(persistent=True)
+    key = (module_content_hash(MODULE), "Data Analytics", restarted.scorer_version)
+    assert ConsolidatedTopicScorer(cache_path=str(db_path)).scoring_cache.get(key) is None
+
+
+if __name__ == "__main__":
+    import tempfile
+    test_lru_bound_and_counters()
+    test_module_edit_is_not_served_stale()
+    with tempfile.TemporaryDirectory() as tmp:
+        test_persistent_cache_survives_restart(Path(tmp))
+    print("✅ Topic score cache tests passed")
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# scripts/curriculum_generator/test_topic_scorer_matrix.py
+"""
+Equivalence test for ConsolidatedTopicScorer.score_matrix.
+Every cell of the batched matrix must match score_module_topic_relevance
+for both the knowledge base and the fallback scoring paths.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root, curriculum generator and its components to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent / "components"))
+
+from ecm.catalog import get_catalog_snapshot
+from topic_scorer import ConsolidatedTopicScorer
+from domain.knowledge_base import DigitalSustainabilityKnowledge, ModuleTextIndex
+
+TOPICS = [
+    "Carbon Footprint Measurement", "Data Analytics", "AI for sustainability",
+    "Green Software", "ESG Reporting", "digital", None, "Carbon"
+]
+
+
+def _fallback_scorer():
+    scorer = ConsolidatedTopicScorer()
+    scorer.knowledge_base = None
+    scorer.text_index_class = None
+    return scorer
+
+
+def _kb_scorer():
+    scorer = ConsolidatedTopicScorer()
+    scorer.knowledge_base = DigitalSustainabilityKnowledge()
+    scorer.text_index_class = ModuleTextIndex
+    return scorer
+
+
+def _assert_matrix_matches_pairs(make_scorer, modules, topics):
+    matrix, debug = make_scorer().score_matrix(modules, topics, include_debug=True)
+    assert matrix.shape == (len(modules), len(topics))
+
+    # Separate scorer so pairwise results do not come from the matrix's cache entries
+    pair_scorer = make_scorer()
+    for row, module in enumerate(modules):
+        for column, topic in enumerate(topics):
+            score, debug_info = pair_scorer.score_module_topic_relevance(module, topic)
+            assert matrix[row, column] == score, f"{module.get('id')} / {topic!r}"
+            assert debug[row][column] == debug_info
+
+
+def test_score_matrix_matches_pairwise_fallback():
+    modules = list(get_catalog_snapshot().modules)
+    _assert_matrix_matches_pairs(_fallback_scorer, modules, TOPICS)
+
+
+def test_score_matrix_matches_pairwise_knowledge_base():
+    modules = list(get_catalog_snapshot().modules)
+    _assert_matrix_matches_pairs(_kb_scorer, modules, TOPICS)
+
+
+def test_score_matrix_without_debug_and_empty_inputs():
+    scorer = _fallback_scorer()
+    modules = list(get_catalog_snapshot().modules[:5])
+
+    matrix = scorer.score_matrix(modules, ["Data"])
+    assert matrix.shape == (5, 1)
+    assert scorer.score_matrix([], TOPICS).shape == (0, len(TOPICS))
+    assert scorer.score_matrix(modules, []).shape == (5, 0)
+
+
+def test_single_topic_uses_snapshot_index(monkeypatch):
+    snapshot = get_catalog_snapshot()
+    modules = list(snapshot.modules)
+    index = ModuleTextIndex.for_snapshot(snapshot)
+    expected = _kb_scorer().score_matrix([dict(module) for module in modules], ["Data Analytics"])
+
+    # Snapshot modules score from the snapshot's index: no new index, no per-module text scans
+    def rebuild(self, modules):
+        raise AssertionError("text index rebuilt")
+    def score_one(self, module, topic):
+        raise AssertionError("module scored individually")
+    def scan(module):
+        raise AssertionError("module text scanned")
+    monkeypatch.setattr(ModuleTextIndex, '__init__', rebuild)
+    monkeypatch.setattr(DigitalSustainabilityKnowledge, 'score_module_relevance', score_one)
+    monkeypatch.setattr(ConsolidatedTopicScorer, '_module_texts', staticmethod(scan))
+
+    assert ModuleTextIndex.for_modules(modules) is index
+    assert (_kb_scorer().score_matrix(modules, ["Data Analytics"]) == expected).all()
+
+
+if __name__ == "__main__":
+    test_score_matrix_matches_pairwise_fallback()
+    test_score_matrix_matches_pairwise_knowledge_base()
+    test_score_matrix_without_debug_and_empty_inputs()
+    print("✅ score_matrix matches score_module_topic_relevance")
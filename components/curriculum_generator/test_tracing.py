@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# scripts/curriculum_generator/test_tracing.py
+"""
+Tests for the Chrome trace events written by ecm.tracing.
+"""
+
+import json
+import pstats
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from ecm.metrics import timed
+from ecm.tracing import active_tracer, span, traced, tracing
+
+
+@traced('unit', 'learning_unit', args=lambda number: {'number': number})
+def _build_unit(number):
+    with span('outcomes', 'learning_unit'):
+        return sum(range(1000 * number))
+
+
+def _spans(path):
+    events = json.loads(Path(path).read_text())['traceEvents']
+    return [event for event in events if event['ph'] == 'X']
+
+
+def test_nested_spans(tmp_path):
+    trace_file = tmp_path / 'trace.json'
+    with tracing(trace_file, name='run'):
+        for number in (1, 2):
+            _build_unit(number)
+    assert active_tracer() is None
+
+    spans = _spans(trace_file)
+    assert [event['name'] for event in spans] == ['run', 'unit', 'outcomes', 'unit', 'outcomes']
+    run, first_unit, first_outcomes = spans[:3]
+    assert first_unit['args'] == {'number': 1}
+    assert run['ts'] <= first_unit['ts'] <= first_outcomes['ts']
+    assert first_outcomes['ts'] + first_outcomes['dur'] <= first_unit['ts'] + first_unit['dur']
+    assert not (tmp_path / 'trace.pstats').exists()
+
+
+def test_no_tracer_is_a_no_op(tmp_path):
+    with tracing(None) as tracer:
+        assert tracer is None and active_tracer() is None
+        assert _build_unit(1) == sum(range(1000))
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_cprofile_on_outermost_span(tmp_path):
+    @timed('unit_test_traced_stage')
+    def stage():
+        return _build_unit(3)
+
+    trace_file = tmp_path / 'trace.json'
+    with tracing(trace_file, cprofile=True, name='run'):
+        stage()
+
+    spans = {event['name']: event for event in _spans(trace_file)}
+    assert set(spans) == {'run', 'unit_test_traced_stage', 'unit', 'outcomes'}
+    functions = [entry['function'] for entry in spans['run']['args']['cprofile']]
+    assert any(function.startswith('_build_unit') for function in functions)
+    assert 'cprofile' not in spans['unit']['args']
+
+    stats = pstats.Stats(str(tmp_path / 'trace.pstats'))
+    assert any(function == '_build_unit' for _, _, function in stats.stats)
+
+
+def test_profiled_streamed_response(tmp_path):
+    from ecm.jobs import MemoryBroker
+    from web.app import create_app
+
+    app = create_app('testing')
+    app.config.update(ALLOW_PROFILING=True, TRACE_DIR=tmp_path)
+    # Jobs stay in process, so the test writes only under tmp_path
+    assert isinstance(app.config['JOB_RUNNER'].broker, MemoryBroker)
+    response = app.test_client().post('/generate_all_curricula', headers={'X-ECM-Profile': '1'})
+    body = response.get_data()
+    response.close()
+
+    assert response.status_code == 200 and body[:2] == b'PK'
+    trace_file = tmp_path / response.headers['X-ECM-Profile-Trace'].rsplit('/', 1)[1]
+    names = [event['name'] for event in _spans(trace_file)]
+    assert names[0] == 'generate_all_curricula'
+    assert names.count('curriculum') == 10
+    assert active_tracer() is None
@@ -10,6 +10,8 @@ import json
 from typing import Dict, List, Any, Tuple
 from datetime import datetime
 
+from ecm.tracing import traced
+
 class WorkBasedLearningFramework:
     """Comprehensive work-based learning implementation framework"""
     
@@ -450,6 +452,7 @@ class WorkBasedLearningFramework:
             }
         }
     
+    @traced('work_based_learning_plan', 'builder')
     def generate_work_based_learning_plan(self, curriculum: Dict) -> Dict:
         """Generate comprehensive work-based learning implementation plan"""
         
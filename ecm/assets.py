@@ -0,0 +1,182 @@
+"""
+Static asset bundle.
+Stylesheets and scripts shared by generated HTML documents are built once per
+theme/feature combination, minified and written as content-hashed files
+(assets/<hash>.css|js) next to the documents. Bulk runs then write each asset
+once and browsers cache it across documents; inline mode embeds the minified
+text instead, for standalone files.
+"""
+
+import hashlib
+import os
+import re
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Hashable, Optional, Tuple, Union
+
+from ecm.templating import render_template
+
+
+ASSET_DIR_NAME = 'assets'
+
+_CSS_STRING = re.compile(r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')')
+_CSS_COMMENT = re.compile(r'/\*.*?\*/', re.S)
+_CSS_SPACE = re.compile(r'\s+')
+_CSS_PUNCTUATION = re.compile(r'\s*([{};,>])\s*')
+_CSS_COLON = re.compile(r':\s+')
+
+# Characters after which a '/' starts a regular expression literal rather than a division
+_JS_REGEX_PREFIX = set('(,=:[!&|?{};+-*%<>~^')
+
+
+def minify_css(css: str) -> str:
+    """Drop comments and redundant whitespace; string literals are kept as written"""
+    parts = _CSS_STRING.split(_CSS_COMMENT.sub('', css))
+    for i in range(0, len(parts), 2):
+        code = _CSS_SPACE.sub(' ', parts[i])
+        code = _CSS_PUNCTUATION.sub(r'\1', code)
+        parts[i] = _CSS_COLON.sub(':', code).replace(';}', '}')
+    return ''.join(parts).strip()
+
+
+def minify_js(js: str) -> str:
+    """Drop comments, indentation and blank lines
+
+    Line breaks are kept so automatic semicolon insertion still applies;
+    string, template and regular expression literals are copied untouched.
+    """
+    out = []
+    line = []
+    i, length = 0, len(js)
+    previous = ''  # last significant character outside literals and comments
+
+    def end_line():
+        text = ''.join(line).strip()
+        if text:
+            out.append(text)
+        line.clear()
+
+    while i < length:
+        char = js[i]
+        if char == '\n':
+            end_line()
+            i += 1
+        elif js.startswith('//', i):
+            while i < length and js[i] != '\n':
+                i += 1
+        elif js.startswith('/*', i):
+            end = js.find('*/', i + 2)
+            end = length if end == -1 else end + 2
+            if '\n' in js[i:end]:
+                end_line()
+            else:
+                line.append(' ')
+            i = end
+        elif char in '\'"`' or (char == '/' and (previous in _JS_REGEX_PREFIX or not previous)):
+            # Copy a literal up to its unescaped closing delimiter
+            start = i
+            i += 1
+            in_class = False
+            while i < length:
+                if js[i] == '\\':
+                    i += 2
+                    continue
+                if char == '/':
+                    if js[i] == '[':
+                        in_class = True
+                    elif js[i] == ']':
+                        in_class = False
+                    elif js[i] == '/' and not in_class:
+                        break
+                elif js[i] == char:
+                    break
+                i += 1
+            i += 1
+            if char == '/':
+                # Regular expression flags
+                while i < length and js[i].isalpha():
+                    i += 1
+            line.append(js[start:i])
+            previous = char
+        else:
+            line.append(char)
+            if not char.isspace():
+                previous = char
+            i += 1
+    end_line()
+    return '\n'.join(out)
+
+
+_MINIFIERS = {'css': minify_css, 'js': minify_js}
+
+
+@dataclass(frozen=True)
+class Asset:
+    """A minified stylesheet or script, named by its content hash"""
+
+    kind: str      # 'css' or 'js'
+    content: str
+    digest: str
+
+    @property
+    def filename(self) -> str:
+        return f"{self.digest}.{self.kind}"
+
+
+_assets: Dict[Tuple[str, Hashable], Asset] = {}
+_assets_lock = threading.Lock()
+
+
+def build_asset(kind: str, key: Hashable, build: Callable[[], str]) -> Asset:
+    """Build, minify and hash an asset once per (kind, key) in this process"""
+    cache_key = (kind, key)
+    asset = _assets.get(cache_key)
+    if asset is None:
+        content = _MINIFIERS[kind](build())
+        digest = hashlib.sha256(content.encode('utf-8')).hexdigest()[:16]
+        with _assets_lock:
+            asset = _assets.setdefault(cache_key, Asset(kind=kind, content=content, digest=digest))
+    return asset
+
+
+def template_asset(name: str, **context: Hashable) -> Asset:
+    """Asset rendered from ecm/templates/assets/<name>; context values must be hashable"""
+    kind = name.rsplit('.', 2)[1] if name.endswith('.j2') else name.rsplit('.', 1)[1]
+    key = (name, tuple(sorted(context.items())))
+    return build_asset(kind, key, lambda: render_template(f'{ASSET_DIR_NAME}/{name}', **context))
+
+
+class AssetWriter:
+    """HTML tags for the assets of documents written to one directory"""
+
+    def __init__(self, output_dir: Optional[Union[str, Path]] = None, inline: bool = False):
+        # Without an output directory there is nowhere to link to
+        self.inline = inline or output_dir is None
+        self.asset_dir = None if output_dir is None else Path(output_dir) / ASSET_DIR_NAME
+        self._written = set()
+
+    def tag(self, asset: Asset) -> str:
+        if self.inline:
+            if asset.kind == 'css':
+                return f"<style>{asset.content}</style>"
+            return f"<script>{asset.content}</script>"
+
+        self.write(asset)
+        href = f"{ASSET_DIR_NAME}/{asset.filename}"
+        if asset.kind == 'css':
+            return f'<link rel="stylesheet" href="{href}">'
+        return f'<script src="{href}"></script>'
+
+    def write(self, asset: Asset) -> Path:
+        """Write the asset file once; the hashed name makes existing files safe to reuse"""
+        path = self.asset_dir / asset.filename
+        if asset.filename not in self._written:
+            if not path.exists():
+                self.asset_dir.mkdir(parents=True, exist_ok=True)
+                # Parallel workers may write the same asset; publish it atomically
+                temporary = path.with_name(f".{asset.filename}.{os.getpid()}.{threading.get_ident()}")
+                temporary.write_text(asset.content, encoding='utf-8')
+                os.replace(temporary, path)
+            self._written.add(asset.filename)
+        return path
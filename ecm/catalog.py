@@ -0,0 +1,352 @@
+"""
+Module catalog service.
+Parses modules_v5.json once per process, validates it once and hands out an
+immutable, content-hashed snapshot shared by every curriculum component.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Sequence, Tuple, Callable
+
+from ecm.metrics import stage_timer
+from ecm.tracing import span
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+DEFAULT_MODULES_FILE = PROJECT_ROOT / "input" / "modules" / "modules_v5.json"
+
+# Fields every learning unit must carry (EnhancedD4SCurriculumGenerator.validate_data_integrity)
+REQUIRED_FIELDS = ('id', 'name', 'eqf_level', 'ects_points', 'role_relevance')
+
+
+class FrozenDict(dict):
+    """Read-only dict; still a dict for isinstance checks and json.dump"""
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Catalog snapshot data is read-only; copy it before modifying")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+
+class FrozenList(list):
+    """Read-only list; still a list for isinstance checks and json.dump"""
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Catalog snapshot data is read-only; copy it before modifying")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = clear = extend = insert = pop = remove = reverse = sort = _readonly
+
+    def __reduce__(self):
+        return (FrozenList, (list(self),))
+
+
+def freeze(value: Any) -> Any:
+    """Recursively convert dicts and lists into their read-only counterparts"""
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return FrozenList(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Recursively copy frozen catalog data into plain, mutable dicts and lists"""
+    if isinstance(value, dict):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [thaw(item) for item in value]
+    return value
+
+
+def extract_module_list(data: Any) -> List[Dict[str, Any]]:
+    """Handle the different JSON structures used for module files"""
+    if isinstance(data, list):
+        return data
+    if isinstance(data, dict):
+        if 'modules' in data:
+            return data['modules']
+        if 'data' in data:
+            return data['data']
+        # Assume the dict values are modules
+        return list(data.values())
+    raise ValueError("Invalid modules file format")
+
+
+def normalise_module(module: Dict[str, Any], index: int) -> Optional[Dict[str, Any]]:
+    """Validate module structure and add missing fields (DataLoader rules)"""
+    if not isinstance(module, dict):
+        return None
+
+    # Check for title field (could be 'title' or 'name')
+    title = module.get('title') or module.get('name')
+    if not title:
+        return None
+
+    keywords = module.get('keywords', module.get('skills', []))
+    # Normalize keywords to list of strings
+    if isinstance(keywords, str):
+        keywords = [kw.strip() for kw in keywords.split(',') if kw.strip()]
+    # Copy so the skills below are never appended to the source list
+    keywords = list(keywords) if isinstance(keywords, list) else []
+
+    # Add skills to keywords for better matching
+    skills = module.get('skills', [])
+    if isinstance(skills, list):
+        keywords.extend(skills)
+
+    # Normalize learning outcomes
+    learning_outcomes = module.get('learning_outcomes', {})
+    if isinstance(learning_outcomes, dict):
+        # Convert dict format to list
+        learning_outcomes = [
+            f"{key.title()}: {value}" for key, value in learning_outcomes.items() if value
+        ]
+    elif isinstance(learning_outcomes, str):
+        learning_outcomes = [learning_outcomes]
+    elif not isinstance(learning_outcomes, list):
+        learning_outcomes = []
+
+    return {
+        'title': title,  # Standardize to 'title'
+        'name': title,   # Keep original 'name' for compatibility
+        'id': module.get('id', f'M{index+1}'),
+        'description': module.get('description', ''),
+        'extended_description': module.get('extended_description', ''),
+        'keywords': keywords,
+        'learning_outcomes': learning_outcomes,
+        'ects': module.get('ects_points', module.get('ects', 5)),
+        'eqf_level': module.get('eqf_level', 6),
+        'duration_weeks': module.get('duration_weeks', 1),
+        'prerequisites': module.get('prerequisites', []),
+        'assessment_methods': module.get('assessment_methods', []),
+        'competencies': module.get('competencies', {}),
+        'topics': module.get('topics', []),
+        'complexity': module.get('complexity', 'intermediate'),
+        'thematic_area': module.get('thematic_area', 'General'),
+        'delivery_methods': module.get('delivery_methods', ['online']),
+        'module_type': module.get('module_type', ['theoretical']),
+        'skills': skills,
+        'role_relevance': module.get('role_relevance', {}),
+        'is_work_based': module.get('is_work_based', False),
+        'micro_credentials': module.get('micro_credentials', {}),
+        'institutional_framework': module.get('institutional_framework', {}),
+        'quality_assurance': module.get('quality_assurance', {})
+    }
+
+
+def normalise_modules(modules: List[Any]) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """Normalise all modules, returning the valid ones and the skip warnings"""
+    normalised = []
+    warnings = []
+
+    for i, module in enumerate(modules):
+        normalised_module = normalise_module(module, i)
+        if normalised_module is None:
+            if not isinstance(module, dict):
+                warnings.append(f"Skipping invalid module at index {i}: not a dictionary")
+            else:
+                warnings.append(f"Skipping module at index {i}: missing 'title' or 'name' field")
+            continue
+        normalised.append(normalised_module)
+
+    return normalised, warnings
+
+
+def check_integrity(modules: List[Any]) -> List[str]:
+    """Return an error for every learning unit missing a required field"""
+    errors = []
+    for i, module in enumerate(modules):
+        if not isinstance(module, dict):
+            errors.append(f"Learning unit {i+1} is not an object")
+            continue
+        for required_field in REQUIRED_FIELDS:
+            if required_field not in module:
+                errors.append(
+                    f"Learning unit {i+1} (ID: {module.get('id', 'unknown')}) missing field: {required_field}"
+                )
+    return errors
+
+
+def compute_content_hash(modules: List[Any]) -> str:
+    """Hash the module content independently of file formatting"""
+    canonical = json.dumps(modules, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    """Immutable view of one version of the module catalog"""
+
+    source: str
+    content_hash: str
+    modules: Tuple[Dict[str, Any], ...]
+    normalised_modules: Tuple[Dict[str, Any], ...]
+    by_id: Dict[str, Dict[str, Any]]
+    integrity_errors: Tuple[str, ...]
+    normalisation_warnings: Tuple[str, ...]
+    loaded_at: str
+    _derived: Dict[str, Any] = field(default_factory=dict, repr=False, compare=False)
+    _derived_lock: Any = field(default_factory=threading.RLock, repr=False, compare=False)
+
+    @classmethod
+    def from_modules(cls, modules: List[Any], source: str = '<memory>') -> 'CatalogSnapshot':
+        """Validate and freeze an already parsed module list"""
+        normalised, warnings = normalise_modules(modules)
+        frozen_modules = tuple(freeze(module) for module in modules)
+        by_id = FrozenDict(
+            (module['id'], module) for module in frozen_modules
+            if isinstance(module, dict) and 'id' in module
+        )
+        return cls(
+            source=source,
+            content_hash=compute_content_hash(modules),
+            modules=frozen_modules,
+            normalised_modules=tuple(freeze(module) for module in normalised),
+            by_id=by_id,
+            integrity_errors=tuple(check_integrity(modules)),
+            normalisation_warnings=tuple(warnings),
+            loaded_at=datetime.now().isoformat()
+        )
+
+    @property
+    def version(self) -> str:
+        """Short content hash used to tag derived data and cache keys"""
+        return self.content_hash[:12]
+
+    def __len__(self) -> int:
+        return len(self.modules)
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        # Derived views are rebuilt lazily in the receiving process
+        state['_derived'] = {}
+        state['_derived_lock'] = None
+        return state
+
+    def __setstate__(self, state):
+        state['_derived_lock'] = threading.RLock()
+        for key, value in state.items():
+            object.__setattr__(self, key, value)
+
+    def require_integrity(self) -> None:
+        """Raise on the first learning unit missing a required field - NO FALLBACKS"""
+        if self.integrity_errors:
+            raise ValueError(self.integrity_errors[0])
+
+    def derived(self, name: str, builder: Callable[['CatalogSnapshot'], Any]) -> Any:
+        """Build a derived view (index, matrix, ...) once per snapshot and reuse it"""
+        try:
+            return self._derived[name]
+        except KeyError:
+            pass
+        with self._derived_lock:
+            if name not in self._derived:
+                self._derived[name] = builder(self)
+            return self._derived[name]
+
+    def view_of(self, modules: Sequence[Any]) -> Optional[str]:
+        """'modules' or 'normalised_modules' when every given object is taken from that
+        tuple of this snapshot (identity, not equality); None otherwise"""
+        if not modules:
+            return None
+        members = self.derived('module_identities', lambda snapshot: {
+            'modules': frozenset(map(id, snapshot.modules)),
+            'normalised_modules': frozenset(map(id, snapshot.normalised_modules))
+        })
+        for view, identities in members.items():
+            if all(id(module) in identities for module in modules):
+                return view
+        return None
+
+
+class ModuleCatalog:
+    """Process-wide owner of one modules file; reloads only when the file changes"""
+
+    def __init__(self, modules_file: Path):
+        self.modules_file = Path(modules_file)
+        self._snapshot = None
+        self._file_signature = None
+        self._lock = threading.Lock()
+
+    def _current_signature(self) -> Tuple[int, int]:
+        stat = os.stat(self.modules_file)
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _load(self) -> CatalogSnapshot:
+        with stage_timer('catalog_load'), span('catalog_load', 'stage', source=self.modules_file.name):
+            return self._parse()
+
+    def _parse(self) -> CatalogSnapshot:
+        if not self.modules_file.exists():
+            raise FileNotFoundError(f"Modules file not found: {self.modules_file}")
+
+        try:
+            with open(self.modules_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON in modules file: {e}")
+
+        snapshot = CatalogSnapshot.from_modules(extract_module_list(data), source=str(self.modules_file))
+        print(f"📦 Module catalog: {len(snapshot)} modules from {self.modules_file.name} (version {snapshot.version})")
+        return snapshot
+
+    def snapshot(self) -> CatalogSnapshot:
+        """Return the current snapshot, parsing the file on first use"""
+        if self._snapshot is None:
+            with self._lock:
+                if self._snapshot is None:
+                    self._file_signature = self._current_signature()
+                    self._snapshot = self._load()
+        return self._snapshot
+
+    def refresh(self) -> CatalogSnapshot:
+        """Re-read the file if it changed on disk and return the (possibly new) snapshot"""
+        with self._lock:
+            signature = self._current_signature()
+            if self._snapshot is None or signature != self._file_signature:
+                snapshot = self._load()
+                self._file_signature = signature
+                self._snapshot = snapshot
+        return self._snapshot
+
+
+_catalogs: Dict[str, ModuleCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_module_catalog(modules_file: Optional[Path] = None) -> ModuleCatalog:
+    """Return the process-wide catalog for a modules file (default: modules_v5.json)"""
+    path = Path(modules_file) if modules_file else DEFAULT_MODULES_FILE
+    key = str(path.resolve())
+    with _catalogs_lock:
+        if key not in _catalogs:
+            _catalogs[key] = ModuleCatalog(path)
+        return _catalogs[key]
+
+
+def get_catalog_snapshot(modules_file: Optional[Path] = None) -> CatalogSnapshot:
+    """Shortcut for get_module_catalog(modules_file).snapshot()"""
+    return get_module_catalog(modules_file).snapshot()
+
+
+def snapshot_of(modules: Sequence[Any]) -> Optional[Tuple[CatalogSnapshot, str]]:
+    """Loaded snapshot (and view, see CatalogSnapshot.view_of) the module objects come from.
+    Lets components that only receive a module list reuse the snapshot's derived
+    indexes; never parses a file."""
+    with _catalogs_lock:
+        snapshots = [catalog._snapshot for catalog in _catalogs.values() if catalog._snapshot is not None]
+    for snapshot in snapshots:
+        view = snapshot.view_of(modules)
+        if view is not None:
+            return snapshot, view
+    return None
@@ -0,0 +1,98 @@
+"""
+DOCX document blocks.
+Generators describe a document as a sequence of paragraphs, tables and page
+breaks; a backend renders them, either through python-docx (add_blocks) or as
+streamed WordprocessingML (ecm.docx_stream). Both produce the same document.
+"""
+
+from dataclasses import dataclass
+from typing import Iterable, Optional, Tuple, Union
+
+from docx.document import Document as DocumentObject
+from docx.enum.text import WD_BREAK
+from docx.shared import Pt, RGBColor
+
+
+@dataclass(frozen=True)
+class Run:
+    """Text with optional character formatting; size in points, color as RRGGBB"""
+
+    text: str
+    bold: bool = False
+    italic: bool = False
+    size: Optional[float] = None
+    color: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class Paragraph:
+    """Runs in one paragraph; style is a style name, alignment a WD_ALIGN_PARAGRAPH member"""
+
+    runs: Tuple[Run, ...] = ()
+    style: Optional[str] = None
+    alignment: Optional[object] = None
+
+
+@dataclass(frozen=True)
+class Table:
+    """Grid of single-paragraph cells"""
+
+    rows: Tuple[Tuple[Paragraph, ...], ...]
+    style: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class PageBreak:
+    pass
+
+
+Block = Union[Paragraph, Table, PageBreak]
+
+
+def heading(text: str, level: int = 1) -> Paragraph:
+    """Same paragraph as Document.add_heading(text, level)"""
+    return Paragraph((Run(text),) if text else (), 'Title' if level == 0 else f'Heading {level}')
+
+
+def labelled(label: str, value: str) -> Paragraph:
+    """Bold label followed by its value"""
+    return Paragraph((Run(label, bold=True), Run(value)))
+
+
+def _add_runs(paragraph, runs: Iterable[Run]) -> None:
+    for run in runs:
+        r = paragraph.add_run(run.text)
+        if run.bold:
+            r.bold = True
+        if run.italic:
+            r.italic = True
+        if run.size is not None:
+            r.font.size = Pt(run.size)
+        if run.color is not None:
+            r.font.color.rgb = RGBColor.from_string(run.color)
+
+
+def add_blocks(doc: DocumentObject, blocks: Iterable[Block]) -> None:
+    """Render blocks into a python-docx document"""
+    for block in blocks:
+        if isinstance(block, Paragraph):
+            paragraph = doc.add_paragraph(style=block.style)
+            if block.alignment is not None:
+                paragraph.alignment = block.alignment
+            _add_runs(paragraph, block.runs)
+        elif isinstance(block, Table):
+            table = doc.add_table(rows=len(block.rows), cols=len(block.rows[0]) if block.rows else 0)
+            if block.style is not None:
+                table.style = block.style
+            for row, cells in zip(table.rows, block.rows):
+                for cell, content in zip(row.cells, cells):
+                    paragraph = cell.paragraphs[0]
+                    if content.style is not None:
+                        paragraph.style = content.style
+                    if content.alignment is not None:
+                        paragraph.alignment = content.alignment
+                    _add_runs(paragraph, content.runs)
+        elif isinstance(block, PageBreak):
+            doc.add_paragraph().add_run().add_break(WD_BREAK.PAGE)
+        else:
+            raise TypeError(f"Unsupported DOCX block: {block!r}")
@@ -0,0 +1,164 @@
+"""
+Streaming DOCX writer.
+Renders ecm.docx_blocks straight into the word/document.xml entry of a zip
+archive, one XML fragment per block, instead of building the body as
+python-docx objects. All other parts are copied from the cached base template.
+"""
+
+import re
+import threading
+import zipfile
+from dataclasses import dataclass
+from io import BytesIO
+from typing import BinaryIO, Callable, Dict, Hashable, Iterable, Union
+from xml.sax.saxutils import escape
+
+from docx import Document
+from docx.document import Document as DocumentObject
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.shared import Emu
+
+from ecm.docx_blocks import Block, PageBreak, Paragraph, Run, Table
+from ecm.docx_templates import base_template_bytes
+
+
+DOCUMENT_PART = 'word/document.xml'
+
+# Same tab / line break translation as python-docx's Run.text setter
+_SPECIAL_CHARACTERS = re.compile(r'([\t\n\r])')
+
+_TABLE_LOOK = ('<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0" '
+               'w:noHBand="0" w:noVBand="1" w:val="04A0"/>')
+
+
+@dataclass
+class _TemplateLayout:
+    """document.xml of a base template split around the body's sectPr"""
+
+    head: bytes
+    tail: bytes
+    block_width: int
+    style_ids: Dict[str, str]
+    document: DocumentObject
+
+    def style_id(self, name: str) -> str:
+        style_id = self.style_ids.get(name)
+        if style_id is None:
+            style_id = self.style_ids.setdefault(name, self.document.styles[name].style_id)
+        return style_id
+
+
+_layouts: Dict[Hashable, _TemplateLayout] = {}
+_layouts_lock = threading.Lock()
+
+
+def _template_layout(key: Hashable, build: Callable[[DocumentObject], None]) -> _TemplateLayout:
+    layout = _layouts.get(key)
+    if layout is None:
+        template = base_template_bytes(key, build)
+        with zipfile.ZipFile(BytesIO(template)) as archive:
+            document_xml = archive.read(DOCUMENT_PART)
+        split = document_xml.rindex(b'<w:sectPr')
+        document = Document(BytesIO(template))
+        section = document.sections[-1]
+        block_width = section.page_width - section.left_margin - section.right_margin
+        with _layouts_lock:
+            layout = _layouts.setdefault(key, _TemplateLayout(
+                document_xml[:split], document_xml[split:], block_width, {}, document
+            ))
+    return layout
+
+
+def _text_xml(text: str) -> str:
+    parts = []
+    for piece in _SPECIAL_CHARACTERS.split(text):
+        if piece == '\t':
+            parts.append('<w:tab/>')
+        elif piece in ('\n', '\r'):
+            parts.append('<w:br/>')
+        elif piece:
+            space = ' xml:space="preserve"' if piece != piece.strip() else ''
+            parts.append(f'<w:t{space}>{escape(piece)}</w:t>')
+    return ''.join(parts)
+
+
+def _run_xml(run: Run) -> str:
+    properties = []
+    if run.bold:
+        properties.append('<w:b/>')
+    if run.italic:
+        properties.append('<w:i/>')
+    if run.color is not None:
+        properties.append(f'<w:color w:val="{run.color.upper()}"/>')
+    if run.size is not None:
+        properties.append(f'<w:sz w:val="{round(run.size * 2)}"/>')
+    rpr = f'<w:rPr>{"".join(properties)}</w:rPr>' if properties else ''
+    return f'<w:r>{rpr}{_text_xml(run.text)}</w:r>'
+
+
+def _paragraph_xml(paragraph: Paragraph, layout: _TemplateLayout) -> str:
+    properties = []
+    if paragraph.style is not None:
+        properties.append(f'<w:pStyle w:val="{layout.style_id(paragraph.style)}"/>')
+    if paragraph.alignment is not None:
+        properties.append(f'<w:jc w:val="{WD_ALIGN_PARAGRAPH.to_xml(paragraph.alignment)}"/>')
+    if not properties and not paragraph.runs:
+        return '<w:p/>'
+    ppr = f'<w:pPr>{"".join(properties)}</w:pPr>' if properties else ''
+    return f'<w:p>{ppr}{"".join(_run_xml(run) for run in paragraph.runs)}</w:p>'
+
+
+def _table_xml(table: Table, layout: _TemplateLayout) -> str:
+    cols = len(table.rows[0]) if table.rows else 0
+    # Equal column widths across the text block, as Document.add_table does
+    width = Emu(layout.block_width // cols).twips if cols else 0
+    style = f'<w:tblStyle w:val="{layout.style_id(table.style)}"/>' if table.style is not None else ''
+    parts = [
+        f'<w:tbl><w:tblPr>{style}<w:tblW w:type="auto" w:w="0"/>{_TABLE_LOOK}</w:tblPr><w:tblGrid>',
+        f'<w:gridCol w:w="{width}"/>' * cols,
+        '</w:tblGrid>'
+    ]
+    cell_properties = f'<w:tcPr><w:tcW w:type="dxa" w:w="{width}"/></w:tcPr>'
+    for row in table.rows:
+        parts.append('<w:tr>')
+        for content in row:
+            parts.append(f'<w:tc>{cell_properties}{_paragraph_xml(content, layout)}</w:tc>')
+        parts.append('</w:tr>')
+    parts.append('</w:tbl>')
+    return ''.join(parts)
+
+
+def _block_xml(block: Block, layout: _TemplateLayout) -> str:
+    if isinstance(block, Paragraph):
+        return _paragraph_xml(block, layout)
+    if isinstance(block, Table):
+        return _table_xml(block, layout)
+    if isinstance(block, PageBreak):
+        return '<w:p><w:r><w:br w:type="page"/></w:r></w:p>'
+    raise TypeError(f"Unsupported DOCX block: {block!r}")
+
+
+def write_docx(target: Union[str, BinaryIO], blocks: Iterable[Block], key: Hashable,
+               build: Callable[[DocumentObject], None]) -> None:
+    """Write blocks as a .docx based on the cached base template for key"""
+    layout = _template_layout(key, build)
+    template = base_template_bytes(key, build)
+
+    with zipfile.ZipFile(BytesIO(template)) as source, \
+            zipfile.ZipFile(target, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for item in source.infolist():
+            if item.filename != DOCUMENT_PART:
+                archive.writestr(item, source.read(item.filename))
+                continue
+            entry = zipfile.ZipInfo(DOCUMENT_PART, item.date_time)
+            entry.compress_type = zipfile.ZIP_DEFLATED
+            with archive.open(entry, 'w') as stream:
+                stream.write(layout.head)
+                for block in blocks:
+                    stream.write(_block_xml(block, layout).encode('utf-8'))
+                stream.write(layout.tail)
+
+
+def clear_layouts() -> None:
+    with _layouts_lock:
+        _layouts.clear()
@@ -0,0 +1,40 @@
+"""
+DOCX base templates.
+Styled empty documents are built once per style set and theme colours, saved
+and cached as bytes; each new document is opened from an in-memory copy
+instead of creating a fresh Document() and adding the same styles again.
+"""
+
+import threading
+from io import BytesIO
+from typing import Callable, Dict, Hashable
+
+from docx import Document
+from docx.document import Document as DocumentObject
+
+
+_base_templates: Dict[Hashable, bytes] = {}
+_base_templates_lock = threading.Lock()
+
+
+def base_template_bytes(key: Hashable, build: Callable[[DocumentObject], None]) -> bytes:
+    """Saved base template for key; build styles a fresh Document() on first use"""
+    template = _base_templates.get(key)
+    if template is None:
+        document = Document()
+        build(document)
+        buffer = BytesIO()
+        document.save(buffer)
+        with _base_templates_lock:
+            template = _base_templates.setdefault(key, buffer.getvalue())
+    return template
+
+
+def open_base_document(key: Hashable, build: Callable[[DocumentObject], None]) -> DocumentObject:
+    """New document opened from the cached base template for key"""
+    return Document(BytesIO(base_template_bytes(key, build)))
+
+
+def clear_base_templates() -> None:
+    with _base_templates_lock:
+        _base_templates.clear()
@@ -0,0 +1,133 @@
+"""
+ECTS selection solver.
+Exact 0/1 knapsack over learning unit candidates: ECTS is discretised in
+0.25 steps and the solver maximises total relevance without exceeding the
+ECTS target while respecting a minimum (and optional maximum) unit count.
+Callers keep their greedy pass as the fallback when the problem is
+infeasible or the time budget runs out.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+
+ECTS_STEP = 0.25
+DEFAULT_TIME_BUDGET = 0.05  # seconds
+
+
+@dataclass(frozen=True)
+class EctsSelection:
+    """Solver result; indices refer to the candidate arrays, in candidate order"""
+
+    indices: List[int]
+    total_ects: float
+    total_value: float
+
+
+def _prune_candidates(weights: np.ndarray, values: np.ndarray, capacity: int,
+                      max_units: Optional[int]) -> np.ndarray:
+    """Keep only candidates that can appear in an optimal selection
+
+    No selection holds more than capacity // w units of weight w (or more than
+    max_units units), and swapping a unit for a better one of the same weight
+    never hurts, so only the best units of each weight are kept.
+    """
+    usable = np.flatnonzero((weights > 0) & (weights <= capacity))
+    kept = []
+    for weight in np.unique(weights[usable]):
+        group = usable[weights[usable] == weight]
+        limit = capacity // int(weight)
+        if max_units is not None:
+            limit = min(limit, max_units)
+        # Stable sort: ties keep candidate order
+        best = group[np.argsort(-values[group], kind='stable')][:limit]
+        kept.append(best)
+    if not kept:
+        return np.array([], dtype=np.int64)
+    return np.sort(np.concatenate(kept))
+
+
+def solve_ects_selection(ects: Sequence[float], relevance: Sequence[float], target_ects: float,
+                         min_units: int = 0, max_units: Optional[int] = None,
+                         weight_by_ects: bool = True, step: float = ECTS_STEP,
+                         time_budget: Optional[float] = DEFAULT_TIME_BUDGET) -> Optional[EctsSelection]:
+    """Pick the candidates with the highest total relevance within target_ects
+
+    With weight_by_ects each unit contributes relevance x ECTS, so the target
+    is filled with the most relevant credits rather than the most units.
+    Returns None when no selection satisfies the unit count limits or when
+    the time budget (seconds, None = unlimited) is exceeded.
+    """
+    started = time.perf_counter()
+    ects = np.asarray(ects, dtype=np.float64)
+    relevance = np.asarray(relevance, dtype=np.float64)
+    if ects.shape != relevance.shape:
+        raise ValueError("ects and relevance must have the same length")
+    if max_units is not None and max_units < min_units:
+        return None
+
+    capacity = int(np.floor(target_ects / step + 1e-9))
+    weights = np.rint(ects / step).astype(np.int64)
+    values = relevance * ects if weight_by_ects else relevance
+
+    candidates = _prune_candidates(weights, values, capacity, max_units)
+    if len(candidates) < min_units:
+        return None
+
+    # Count layers: 0..max_units exactly, or 0..min_units with the last layer
+    # meaning "min_units or more" when there is no maximum
+    capped = max_units is None
+    layers = (min_units if capped else max_units) + 1
+
+    best = np.full((layers, capacity + 1), -np.inf)
+    best[0, 0] = 0.0
+    taken = np.zeros((len(candidates), layers, capacity + 1), dtype=bool)
+    stayed = np.zeros((len(candidates), capacity + 1), dtype=bool)
+
+    with_unit = np.empty_like(best)
+    for position, candidate in enumerate(candidates):
+        if time_budget is not None and time.perf_counter() - started > time_budget:
+            return None
+
+        weight = int(weights[candidate])
+        value = values[candidate]
+        with_unit.fill(-np.inf)
+        with_unit[1:, weight:] = best[:-1, :capacity + 1 - weight] + value
+        if capped:
+            from_top = best[-1, :capacity + 1 - weight] + value
+            stayed[position, weight:] = from_top > with_unit[-1, weight:]
+            np.maximum(with_unit[-1, weight:], from_top, out=with_unit[-1, weight:])
+
+        np.greater(with_unit, best, out=taken[position])
+        np.maximum(best, with_unit, out=best)
+
+    # Feasible final states; ties prefer the fuller selection
+    feasible = best[-1:] if capped else best[min_units:]
+    if not np.isfinite(feasible).any():
+        return None
+    layer_offset = layers - 1 if capped else min_units
+    flat_scores = feasible[:, ::-1].ravel()
+    layer, reversed_cell = divmod(int(np.argmax(flat_scores)), capacity + 1)
+    layer += layer_offset
+    cell = capacity - reversed_cell
+
+    chosen = []
+    for position in range(len(candidates) - 1, -1, -1):
+        if not taken[position, layer, cell]:
+            continue
+        candidate = candidates[position]
+        chosen.append(int(candidate))
+        stay = capped and layer == layers - 1 and stayed[position, cell]
+        cell -= int(weights[candidate])
+        if not stay:
+            layer -= 1
+
+    chosen.sort()
+    return EctsSelection(
+        indices=chosen,
+        total_ects=float(ects[chosen].sum()) if chosen else 0.0,
+        total_value=float(values[chosen].sum()) if chosen else 0.0
+    )
@@ -0,0 +1,487 @@
+"""
+Background generation jobs.
+Web requests submit a job and return at once; worker threads claim jobs from a
+broker, run them with warm per-thread state (generators built once per worker)
+and store the result for the status/result endpoints. Brokers: Redis
+(redis://), SQLite (sqlite:///path, shared by every process on one host) and
+in-process (memory://, single-process development servers only). Each
+application uses its own namespace (Redis key prefix, SQLite table), so apps
+sharing a broker URL never claim each other's jobs.
+"""
+
+import json
+import os
+import queue
+import re
+import sqlite3
+import threading
+import time
+import traceback
+import uuid
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Union
+
+from ecm.metrics import REGISTRY
+
+
+QUEUED, RUNNING, DONE, FAILED = 'queued', 'running', 'done', 'failed'
+
+# Finished jobs and their results are kept this long (seconds)
+DEFAULT_RETENTION = 24 * 60 * 60
+
+# A running job is requeued when its worker has not finished it within the lease
+# (the worker process died or was recycled); after MAX_ATTEMPTS claims it fails
+DEFAULT_LEASE = 30 * 60
+MAX_ATTEMPTS = 3
+LOST_WORKER_ERROR = 'WorkerLost: job was not finished within its lease'
+
+_NAMESPACE = re.compile(r'^[A-Za-z0-9_]+$')
+
+
+def _check_namespace(namespace: Optional[str]) -> Optional[str]:
+    if namespace is not None and not _NAMESPACE.match(namespace):
+        raise ValueError(f"Invalid job namespace {namespace!r}; use letters, digits and underscores")
+    return namespace
+
+
+@dataclass(frozen=True)
+class JobResult:
+    """Payload of a finished job, served as-is by the result endpoint"""
+
+    data: bytes
+    content_type: str = 'application/json'
+    filename: Optional[str] = None
+
+    @classmethod
+    def from_json(cls, value: Any) -> 'JobResult':
+        return cls(json.dumps(value, ensure_ascii=False).encode('utf-8'))
+
+
+@dataclass
+class Job:
+    id: str
+    kind: str
+    params: Dict[str, Any]
+    status: str = QUEUED
+    error: Optional[str] = None
+    created: float = field(default_factory=time.time)
+    started: Optional[float] = None
+    finished: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class Broker:
+    """Job queue and result store"""
+
+    def submit(self, kind: str, params: Dict[str, Any]) -> Job:
+        raise NotImplementedError
+
+    def claim(self, timeout: float) -> Optional[Job]:
+        """Oldest queued job, marked running; None if nothing arrives within timeout.
+        Shared brokers first requeue running jobs whose lease has expired."""
+        raise NotImplementedError
+
+    def finish(self, job_id: str, result: JobResult) -> None:
+        raise NotImplementedError
+
+    def fail(self, job_id: str, error: str) -> None:
+        raise NotImplementedError
+
+    def get(self, job_id: str) -> Optional[Job]:
+        raise NotImplementedError
+
+    def result(self, job_id: str) -> Optional[JobResult]:
+        raise NotImplementedError
+
+    def queue_depth(self) -> int:
+        raise NotImplementedError
+
+
+class MemoryBroker(Broker):
+    """In-process broker; jobs are only visible to the process that submitted them
+    (and die with it, so they need no lease)"""
+
+    def __init__(self, retention: float = DEFAULT_RETENTION):
+        self.retention = retention
+        self._jobs: Dict[str, Job] = {}
+        self._results: Dict[str, JobResult] = {}
+        self._queue: 'queue.Queue[str]' = queue.Queue()
+        self._lock = threading.Lock()
+
+    def submit(self, kind, params):
+        job = Job(uuid.uuid4().hex, kind, dict(params))
+        with self._lock:
+            self._expire(job.created)
+            self._jobs[job.id] = job
+        self._queue.put(job.id)
+        return job
+
+    def _expire(self, now):
+        for job_id in [job.id for job in self._jobs.values() if job.finished and now - job.finished > self.retention]:
+            del self._jobs[job_id]
+            self._results.pop(job_id, None)
+
+    def claim(self, timeout):
+        try:
+            job_id = self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+        with self._lock:
+            job = self._jobs[job_id]
+            job.status, job.started = RUNNING, time.time()
+            return Job(**job.to_dict())
+
+    def finish(self, job_id, result):
+        with self._lock:
+            self._results[job_id] = result
+            job = self._jobs[job_id]
+            job.status, job.finished = DONE, time.time()
+
+    def fail(self, job_id, error):
+        with self._lock:
+            job = self._jobs[job_id]
+            job.status, job.error, job.finished = FAILED, error, time.time()
+
+    def get(self, job_id):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return None if job is None else Job(**job.to_dict())
+
+    def result(self, job_id):
+        return self._results.get(job_id)
+
+    def queue_depth(self):
+        return self._queue.qsize()
+
+
+class SQLiteBroker(Broker):
+    """Broker in one SQLite file; claims are atomic across threads and processes"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS {table} (
+            id TEXT PRIMARY KEY,
+            kind TEXT NOT NULL,
+            params TEXT NOT NULL,
+            status TEXT NOT NULL,
+            error TEXT,
+            created REAL NOT NULL,
+            started REAL,
+            finished REAL,
+            result BLOB,
+            content_type TEXT,
+            filename TEXT,
+            attempts INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE INDEX IF NOT EXISTS {table}_queue ON {table} (status, created);
+    """
+    POLL_INTERVAL = 0.2
+
+    def __init__(self, path: Union[str, Path], retention: float = DEFAULT_RETENTION,
+                 namespace: Optional[str] = None, lease: float = DEFAULT_LEASE):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.retention = retention
+        self.lease = lease
+        self.table = f"jobs_{namespace}" if _check_namespace(namespace) else 'jobs'
+        self._local = threading.local()
+        connection = self._connection()
+        connection.executescript(self.SCHEMA.format(table=self.table))
+        columns = {row[1] for row in connection.execute(f'PRAGMA table_info({self.table})')}
+        if 'attempts' not in columns:
+            connection.execute(f'ALTER TABLE {self.table} ADD COLUMN attempts INTEGER NOT NULL DEFAULT 0')
+
+    def _connection(self) -> sqlite3.Connection:
+        """Connection of the calling thread, reopened in a forked child (gunicorn --preload
+        builds the broker in the master; SQLite connections must not cross a fork)"""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None or self._local.pid != os.getpid():
+            # Autocommit; claims open their own IMMEDIATE transaction
+            connection = sqlite3.connect(str(self.path), timeout=30, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            self._local.connection, self._local.pid = connection, os.getpid()
+        return connection
+
+    @staticmethod
+    def _job(row) -> Job:
+        job_id, kind, params, status, error, created, started, finished = row
+        return Job(job_id, kind, json.loads(params), status, error, created, started, finished)
+
+    def submit(self, kind, params):
+        job = Job(uuid.uuid4().hex, kind, dict(params))
+        connection = self._connection()
+        connection.execute(f'DELETE FROM {self.table} WHERE finished < ?', (job.created - self.retention,))
+        connection.execute(
+            f'INSERT INTO {self.table} (id, kind, params, status, created) VALUES (?, ?, ?, ?, ?)',
+            (job.id, job.kind, json.dumps(job.params), job.status, job.created)
+        )
+        return job
+
+    def _requeue_expired(self, connection, now):
+        expired = now - self.lease
+        connection.execute(
+            f'UPDATE {self.table} SET status = ?, finished = ?, error = ? '
+            'WHERE status = ? AND started < ? AND attempts >= ?',
+            (FAILED, now, LOST_WORKER_ERROR, RUNNING, expired, MAX_ATTEMPTS)
+        )
+        connection.execute(
+            f'UPDATE {self.table} SET status = ?, started = NULL WHERE status = ? AND started < ?',
+            (QUEUED, RUNNING, expired)
+        )
+
+    def claim(self, timeout):
+        deadline = time.monotonic() + timeout
+        connection = self._connection()
+        while True:
+            connection.execute('BEGIN IMMEDIATE')
+            try:
+                self._requeue_expired(connection, time.time())
+                row = connection.execute(
+                    f'SELECT id, kind, params, status, error, created, started, finished FROM {self.table} '
+                    'WHERE status = ? ORDER BY created LIMIT 1', (QUEUED,)
+                ).fetchone()
+                if row is not None:
+                    started = time.time()
+                    connection.execute(
+                        f'UPDATE {self.table} SET status = ?, started = ?, attempts = attempts + 1 WHERE id = ?',
+                        (RUNNING, started, row[0])
+                    )
+            finally:
+                connection.execute('COMMIT')
+            if row is not None:
+                job = self._job(row)
+                job.status, job.started = RUNNING, started
+                return job
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            time.sleep(min(self.POLL_INTERVAL, remaining))
+
+    def finish(self, job_id, result):
+        self._connection().execute(
+            f'UPDATE {self.table} SET status = ?, finished = ?, result = ?, content_type = ?, filename = ? WHERE id = ?',
+            (DONE, time.time(), result.data, result.content_type, result.filename, job_id)
+        )
+
+    def fail(self, job_id, error):
+        self._connection().execute(
+            f'UPDATE {self.table} SET status = ?, finished = ?, error = ? WHERE id = ?', (FAILED, time.time(), error, job_id)
+        )
+
+    def get(self, job_id):
+        row = self._connection().execute(
+            f'SELECT id, kind, params, status, error, created, started, finished FROM {self.table} WHERE id = ?', (job_id,)
+        ).fetchone()
+        return None if row is None else self._job(row)
+
+    def result(self, job_id):
+        row = self._connection().execute(
+            f'SELECT result, content_type, filename FROM {self.table} WHERE id = ? AND status = ?', (job_id, DONE)
+        ).fetchone()
+        return None if row is None else JobResult(row[0], row[1], row[2])
+
+    def queue_depth(self):
+        return self._connection().execute(f'SELECT COUNT(*) FROM {self.table} WHERE status = ?', (QUEUED,)).fetchone()[0]
+
+
+class RedisBroker(Broker):
+    """Broker on a Redis server: one hash per job, a list as the queue and a
+    processing list holding claimed jobs until they finish (BLMOVE, Redis 6.2+)"""
+
+    def __init__(self, url: str, prefix: str = 'ecm:jobs', retention: float = DEFAULT_RETENTION,
+                 namespace: Optional[str] = None, lease: float = DEFAULT_LEASE):
+        import redis
+
+        self.client = redis.Redis.from_url(url)
+        self.client.ping()
+        self.prefix = f"{prefix}:{namespace}" if _check_namespace(namespace) else prefix
+        self.retention = int(retention)
+        self.lease = lease
+        self.queue_key = f"{self.prefix}:queue"
+        self.processing_key = f"{self.prefix}:processing"
+
+    def _key(self, job_id):
+        return f"{self.prefix}:job:{job_id}"
+
+    def submit(self, kind, params):
+        job = Job(uuid.uuid4().hex, kind, dict(params))
+        pipeline = self.client.pipeline()
+        pipeline.hset(self._key(job.id), mapping={
+            'kind': kind, 'params': json.dumps(job.params), 'status': job.status, 'created': job.created
+        })
+        pipeline.rpush(self.queue_key, job.id)
+        pipeline.execute()
+        return job
+
+    def _requeue_expired(self, now):
+        for raw_id in self.client.lrange(self.processing_key, 0, -1):
+            job_id = raw_id.decode('utf-8')
+            status, started, attempts = self.client.hmget(self._key(job_id), 'status', 'started', 'attempts')
+            if status is None or status.decode('utf-8') in (DONE, FAILED):
+                self.client.lrem(self.processing_key, 0, raw_id)
+                continue
+            if started is None:
+                # Claimed but not yet marked; start the lease from now
+                self.client.hsetnx(self._key(job_id), 'started', now)
+                continue
+            if now - float(started) < self.lease:
+                continue
+            # LREM is atomic, so only one worker requeues a given job
+            if not self.client.lrem(self.processing_key, 1, raw_id):
+                continue
+            if int(attempts or 0) >= MAX_ATTEMPTS:
+                self.fail(job_id, LOST_WORKER_ERROR)
+            else:
+                pipeline = self.client.pipeline()
+                pipeline.hset(self._key(job_id), 'status', QUEUED)
+                pipeline.hdel(self._key(job_id), 'started')
+                pipeline.lpush(self.queue_key, job_id)
+                pipeline.execute()
+
+    def claim(self, timeout):
+        self._requeue_expired(time.time())
+        # BLMOVE takes whole seconds here; 0 would block forever
+        job_id = self.client.blmove(self.queue_key, self.processing_key, max(1, int(round(timeout))), 'LEFT', 'RIGHT')
+        if job_id is None:
+            return None
+        job_id = job_id.decode('utf-8')
+        pipeline = self.client.pipeline()
+        pipeline.hset(self._key(job_id), mapping={'status': RUNNING, 'started': time.time()})
+        pipeline.hincrby(self._key(job_id), 'attempts', 1)
+        pipeline.execute()
+        return self.get(job_id)
+
+    def _close(self, job_id, mapping):
+        pipeline = self.client.pipeline()
+        pipeline.hset(self._key(job_id), mapping=mapping)
+        pipeline.expire(self._key(job_id), self.retention)
+        pipeline.lrem(self.processing_key, 0, job_id)
+        pipeline.execute()
+
+    def finish(self, job_id, result):
+        self._close(job_id, {
+            'status': DONE, 'finished': time.time(), 'result': result.data,
+            'content_type': result.content_type, 'filename': result.filename or ''
+        })
+
+    def fail(self, job_id, error):
+        self._close(job_id, {'status': FAILED, 'finished': time.time(), 'error': error})
+
+    def get(self, job_id):
+        fields = self.client.hmget(self._key(job_id), 'kind', 'params', 'status', 'error', 'created', 'started', 'finished')
+        if fields[0] is None:
+            return None
+        kind, params, status, error, created, started, finished = (
+            None if value is None else value.decode('utf-8') for value in fields
+        )
+        return Job(job_id, kind, json.loads(params), status, error, float(created),
+                   None if started is None else float(started), None if finished is None else float(finished))
+
+    def result(self, job_id):
+        status, data, content_type, filename = self.client.hmget(
+            self._key(job_id), 'status', 'result', 'content_type', 'filename'
+        )
+        if status != DONE.encode('utf-8'):
+            return None
+        return JobResult(data, content_type.decode('utf-8'), filename.decode('utf-8') or None)
+
+    def queue_depth(self):
+        return self.client.llen(self.queue_key)
+
+
+def open_broker(url: Optional[str], fallback: Optional[str] = None, namespace: Optional[str] = None,
+                lease: float = DEFAULT_LEASE) -> Broker:
+    """Broker for memory://, sqlite:///path or redis:// URLs
+
+    If the broker cannot be opened (redis not installed, server unreachable)
+    and a fallback URL is given, the fallback broker is used instead.
+    """
+    try:
+        if not url or url.startswith('memory:'):
+            return MemoryBroker()
+        if url.startswith('sqlite:///'):
+            return SQLiteBroker(url[len('sqlite:///'):], namespace=namespace, lease=lease)
+        if url.startswith(('redis://', 'rediss://', 'unix://')):
+            return RedisBroker(url, namespace=namespace, lease=lease)
+        raise ValueError(f"Unsupported job broker URL: {url}")
+    except Exception as e:
+        if fallback is None or fallback == url:
+            raise
+        print(f"⚠️ Job broker {url} unavailable ({type(e).__name__}: {e}); using {fallback}")
+        return open_broker(fallback, namespace=namespace, lease=lease)
+
+
+def broker_from_environment(sqlite_path: Union[str, Path], namespace: Optional[str] = None,
+                            url: Optional[str] = None) -> Broker:
+    """url if given, else JOB_BROKER_URL, else REDIS_URL, else SQLite at sqlite_path
+    (also the fallback). namespace keeps one application's jobs apart from others
+    on the same broker; JOB_LEASE_SECONDS overrides the lease of running jobs."""
+    sqlite_url = f"sqlite:///{sqlite_path}"
+    url = url or os.environ.get('JOB_BROKER_URL') or os.environ.get('REDIS_URL') or sqlite_url
+    lease = float(os.environ.get('JOB_LEASE_SECONDS', DEFAULT_LEASE))
+    return open_broker(url, fallback=sqlite_url, namespace=namespace, lease=lease)
+
+
+# handler(params, state) -> JobResult; state is a per-worker-thread dict for warm generators
+JobHandler = Callable[[Dict[str, Any], Dict[Any, Any]], JobResult]
+
+
+class JobRunner:
+    """Worker threads running jobs from a broker
+
+    Each thread keeps its own state dict across jobs, so handlers build their
+    generators once per worker. start() is idempotent and restarts the threads
+    in a forked child process (e.g. gunicorn workers).
+    """
+
+    def __init__(self, broker: Broker, handlers: Dict[str, JobHandler], workers: int = 2, poll_timeout: float = 1.0):
+        self.broker = broker
+        self.handlers = dict(handlers)
+        self.workers = max(1, workers)
+        self.poll_timeout = poll_timeout
+        self._threads = []
+        self._pid = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+    def start(self) -> 'JobRunner':
+        with self._lock:
+            if self._pid != os.getpid():
+                self._stop.clear()
+                self._threads = [
+                    threading.Thread(target=self._work, name=f"ecm-job-worker-{i}", daemon=True)
+                    for i in range(self.workers)
+                ]
+                for thread in self._threads:
+                    thread.start()
+                self._pid = os.getpid()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._pid = None
+
+    def _work(self) -> None:
+        state: Dict[Any, Any] = {}
+        while not self._stop.is_set():
+            job = self.broker.claim(self.poll_timeout)
+            if job is not None:
+                self.run(job, state)
+
+    def run(self, job: Job, state: Dict[Any, Any]) -> None:
+        handler = self.handlers.get(job.kind)
+        try:
+            if handler is None:
+                raise KeyError(f"No handler for job kind '{job.kind}'")
+            self.broker.finish(job.id, handler(job.params, state))
+        except Exception as e:
+            print(f"❌ Job {job.id} ({job.kind}) failed: {type(e).__name__}: {e}")
+            traceback.print_exc()
+            self.broker.fail(job.id, f"{type(e).__name__}: {e}")
+        finally:
+            # Stage timings of the job become visible to scrapes of other workers
+            REGISTRY.flush()
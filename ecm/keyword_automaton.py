@@ -0,0 +1,80 @@
+"""
+Keyword automaton.
+Aho-Corasick matcher over a set of keywords: one pass over a text reports
+every keyword that occurs in it as a substring, so matching many keywords
+against many texts is linear in the text length instead of keywords x texts
+`in` checks.
+"""
+
+from collections import deque
+from typing import Dict, List, Iterable, Set
+
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton; match ids are positions in the keywords list"""
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: List[str] = list(keywords)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+        # Nearest state on the fail chain that ends a keyword (0 = none)
+        self._output_link: List[int] = [0]
+        # The empty string occurs in every text
+        self._always = [keyword_id for keyword_id, keyword in enumerate(self.keywords) if keyword == '']
+
+        for keyword_id, keyword in enumerate(self.keywords):
+            if keyword:
+                self._add(keyword, keyword_id)
+        self._link()
+
+    def _add(self, keyword: str, keyword_id: int) -> None:
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._output_link.append(0)
+            state = next_state
+        self._output[state].append(keyword_id)
+
+    def _link(self) -> None:
+        """Breadth-first fail and output links"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                fail = self._fail[child]
+                self._output_link[child] = fail if self._output[fail] else self._output_link[fail]
+
+    def matches(self, text: str) -> Set[int]:
+        """Ids of every keyword that occurs in text"""
+        goto, fail = self._goto, self._fail
+        reached = set()
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if state:
+                reached.add(state)
+
+        found = set(self._always)
+        seen = set()
+        for state in reached:
+            # Walk output links until a state whose outputs were already collected
+            while state and state not in seen:
+                seen.add(state)
+                found.update(self._output[state])
+                state = self._output_link[state]
+        return found
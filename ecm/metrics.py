@@ -0,0 +1,292 @@
+"""
+Process metrics in the Prometheus text exposition format.
+Histograms for the generation pipeline stages, plus gauges whose values are
+read at scrape time (cache hit ratios, job queue depth). No client library is
+needed; REGISTRY.render() produces the /metrics body.
+
+Each process keeps its own values. With ECM_METRICS_DIR set, every process
+(gunicorn workers, generation pool processes) writes its histograms to a file
+in that directory and a scrape of any worker sums them all; without it the
+histograms and cache counters carry a pid label for the process that served
+the scrape.
+"""
+
+import bisect
+import functools
+import json
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from ecm.tracing import active_tracer
+
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Seconds; generation stages range from sub-millisecond renders to multi-second selections
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+Labels = Tuple[Tuple[str, str], ...]
+GaugeValue = Union[float, Dict[Labels, float]]
+
+# Directory shared by the processes of one service; empty it when the service starts
+METRICS_DIR_ENV = 'ECM_METRICS_DIR'
+
+
+def metrics_dir() -> Optional[Path]:
+    """Multiprocess metrics directory, or None when each process reports alone"""
+    directory = os.environ.get(METRICS_DIR_ENV)
+    return Path(directory) if directory else None
+
+
+def _pid_labels() -> Labels:
+    return (('pid', str(os.getpid())),)
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(str(value))}"' for name, value in labels) + '}'
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    return repr(float(value))
+
+
+class Histogram:
+    """Cumulative-bucket histogram with optional labels"""
+
+    def __init__(self, name: str, documentation: str, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[Labels, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        # Per series: one count per bucket (le semantics), the +Inf count, then the sum
+        position = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0.0] * (len(self.buckets) + 2)
+            series[position] += 1
+            series[-1] += value
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def series(self) -> Dict[Labels, List[float]]:
+        """Copy of the per-series bucket counts and sum"""
+        with self._lock:
+            return {labels: list(values) for labels, values in self._series.items()}
+
+    def merge(self, series: Dict[Labels, List[float]]) -> None:
+        """Add another process's series (same buckets) to this histogram"""
+        with self._lock:
+            for labels, values in series.items():
+                current = self._series.get(labels)
+                if current is None:
+                    self._series[labels] = list(values)
+                else:
+                    self._series[labels] = [a + b for a, b in zip(current, values)]
+
+    def samples(self, extra_labels: Labels = ()) -> List[str]:
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} histogram']
+        for labels, values in sorted(self.series().items()):
+            labels = extra_labels + labels
+            cumulative = 0.0
+            for bound, count in zip(self.buckets + (math.inf,), values[:-1]):
+                cumulative += count
+                bucket_labels = labels + (('le', _format_value(bound)),)
+                lines.append(f'{self.name}_bucket{_format_labels(bucket_labels)} {_format_value(cumulative)}')
+            lines.append(f'{self.name}_sum{_format_labels(labels)} {_format_value(values[-1])}')
+            lines.append(f'{self.name}_count{_format_labels(labels)} {_format_value(cumulative)}')
+        return lines
+
+
+class Gauge:
+    """Value read from a callback at scrape time; the callback may return {labels: value}"""
+
+    def __init__(self, name: str, documentation: str, callback: Callable[[], GaugeValue],
+                 metric_type: str = 'gauge'):
+        self.name = name
+        self.documentation = documentation
+        self.callback = callback
+        self.metric_type = metric_type
+
+    def samples(self) -> List[str]:
+        try:
+            value = self.callback()
+        except Exception:
+            # A failing source (e.g. an unreachable broker) drops its samples, not the scrape
+            return []
+        values = value if isinstance(value, dict) else {(): value}
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} {self.metric_type}']
+        for labels, sample in sorted(values.items()):
+            lines.append(f'{self.name}{_format_labels(labels)} {_format_value(sample)}')
+        return lines
+
+
+class Registry:
+    """Named metrics rendered together"""
+
+    def __init__(self):
+        self._metrics: Dict[str, Union[Histogram, Gauge]] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: Union[Histogram, Gauge]) -> Union[Histogram, Gauge]:
+        """Add a metric; registering a name again replaces the earlier one"""
+        with self._lock:
+            self._metrics[metric.name] = metric
+        return metric
+
+    def histogram(self, name: str, documentation: str, buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if isinstance(metric, Histogram):
+                return metric
+        return self.register(Histogram(name, documentation, buckets))
+
+    def gauge(self, name: str, documentation: str, callback: Callable[[], GaugeValue],
+              metric_type: str = 'gauge') -> Gauge:
+        return self.register(Gauge(name, documentation, callback, metric_type))
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = dict(self._metrics)
+        directory = metrics_dir()
+        if directory is None:
+            sections = {
+                name: metric.samples(_pid_labels()) if isinstance(metric, Histogram) else metric.samples()
+                for name, metric in metrics.items()
+            }
+        else:
+            # Histograms of every process in the directory (this one included), summed
+            self.flush()
+            sections = {name: metric.samples() for name, metric in metrics.items() if isinstance(metric, Gauge)}
+            for histogram in _read_histograms(directory):
+                sections[histogram.name] = histogram.samples()
+        lines = []
+        for name in sorted(sections):
+            lines.extend(sections[name])
+        return '\n'.join(lines) + '\n'
+
+    def reset_after_fork(self) -> None:
+        """Start empty series in a forked child; the parent's values stay the parent's"""
+        self._lock = threading.Lock()
+        for metric in self._metrics.values():
+            if isinstance(metric, Histogram):
+                metric._lock = threading.Lock()
+                metric._series = {}
+
+    def flush(self) -> None:
+        """Write this process's histograms to the metrics directory (no-op without one)"""
+        directory = metrics_dir()
+        if directory is None:
+            return
+        with self._lock:
+            histograms = [metric for metric in self._metrics.values() if isinstance(metric, Histogram)]
+        data = {
+            histogram.name: {
+                'documentation': histogram.documentation,
+                'buckets': list(histogram.buckets),
+                'series': [[list(map(list, labels)), values] for labels, values in histogram.series().items()]
+            }
+            for histogram in histograms
+        }
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f'{os.getpid()}.json'
+        temporary = path.with_suffix('.tmp')
+        temporary.write_text(json.dumps(data), encoding='utf-8')
+        os.replace(temporary, path)
+
+
+def _read_histograms(directory: Path) -> List[Histogram]:
+    """Sum the histograms written by every process to the metrics directory"""
+    merged: Dict[str, Histogram] = {}
+    for path in sorted(directory.glob('*.json')):
+        try:
+            data = json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            continue
+        for name, metric in data.items():
+            histogram = merged.get(name)
+            if histogram is None:
+                histogram = merged[name] = Histogram(name, metric['documentation'], metric['buckets'])
+            if list(histogram.buckets) != metric['buckets']:
+                # Written with other bucket bounds (e.g. by an older release); not summable
+                continue
+            histogram.merge({
+                tuple(tuple(label) for label in labels): values for labels, values in metric['series']
+            })
+    return list(merged.values())
+
+
+REGISTRY = Registry()
+
+# Forked gunicorn workers and pool processes would otherwise report (and write)
+# the series they inherited, e.g. the preloading master's catalog load, again
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(before=REGISTRY.flush, after_in_child=REGISTRY.reset_after_fork)
+
+GENERATION_STAGE_SECONDS = REGISTRY.histogram(
+    'ecm_generation_stage_seconds',
+    'Time spent in each curriculum generation stage'
+)
+
+
+def stage_timer(stage: str):
+    """Context manager recording one generation stage"""
+    return GENERATION_STAGE_SECONDS.time(stage=stage)
+
+
+def timed(stage: str, args: Optional[Callable[..., Dict[str, Any]]] = None):
+    """Decorator recording every call of a function as a generation stage.
+    While a profile trace is active (ecm.tracing) each call is also a span;
+    args(*call_args) adds span arguments."""
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*call_args, **call_kwargs):
+            tracer = active_tracer()
+            if tracer is None:
+                with stage_timer(stage):
+                    return function(*call_args, **call_kwargs)
+            span_args = args(*call_args, **call_kwargs) if args else None
+            with stage_timer(stage), tracer.span(stage, 'stage', span_args):
+                return function(*call_args, **call_kwargs)
+        return wrapper
+    return decorator
+
+
+def register_cache(name: str, stats: Callable[[], Dict[str, float]], registry: Optional[Registry] = None) -> None:
+    """Hit/miss counters and hit ratio of a cache exposing stats() -> {'hits', 'misses'},
+    labelled with the pid of the process whose cache they describe"""
+    registry = registry or REGISTRY
+    registry.gauge(f'ecm_{name}_cache_hits_total', f'{name} cache hits',
+                   lambda: {_pid_labels(): stats()['hits']}, 'counter')
+    registry.gauge(f'ecm_{name}_cache_misses_total', f'{name} cache misses',
+                   lambda: {_pid_labels(): stats()['misses']}, 'counter')
+
+    def hit_ratio():
+        counts = stats()
+        lookups = counts['hits'] + counts['misses']
+        return {_pid_labels(): counts['hits'] / lookups if lookups else 0.0}
+
+    registry.gauge(f'ecm_{name}_cache_hit_ratio', f'{name} cache hits / lookups', hit_ratio)
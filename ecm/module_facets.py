@@ -0,0 +1,224 @@
+"""
+Faceted module index.
+Built once per catalog snapshot: posting sets per facet value (content
+category, EQF level, thematic area, delivery method, role relevance bucket,
+skill), a prefix-searchable word index and precomputed module summaries, so
+the module explorer and search API never walk the whole catalog per request.
+"""
+
+import bisect
+import re
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+from ecm.catalog import CatalogSnapshot
+
+
+FACETS = ('category', 'eqf', 'thematic_area', 'delivery_method', 'role', 'skill')
+
+# role_relevance score (0-100) -> bucket, checked top down
+RELEVANCE_BUCKETS = ((80, 'high'), (50, 'medium'), (0, 'low'))
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+_WORD = re.compile(r'\w+')
+
+# Fields searched by the q parameter
+SEARCH_FIELDS = ('id', 'name', 'description', 'thematic_area', 'skills', 'topics')
+
+
+def relevance_bucket(score: float) -> str:
+    for threshold, bucket in RELEVANCE_BUCKETS:
+        if score >= threshold:
+            return bucket
+    return RELEVANCE_BUCKETS[-1][1]
+
+
+def _words(value: Any) -> Iterable[str]:
+    if isinstance(value, str):
+        return _WORD.findall(value.lower().replace('_', ' '))
+    if isinstance(value, (list, tuple)):
+        return [word for item in value for word in _words(item)]
+    return []
+
+
+def _categoriser_key(categorise: Optional[Callable[..., Any]]) -> str:
+    """Identity of a categoriser; bound methods are new objects on every attribute
+    access, so they are identified by their function and instance"""
+    if categorise is None:
+        return 'none'
+    owner = getattr(categorise, '__self__', None)
+    function = getattr(categorise, '__func__', categorise)
+    return f"{getattr(function, '__qualname__', 'categorise')}:{id(function)}:{id(owner)}"
+
+
+def module_facet_values(module: Dict[str, Any],
+                        categorise: Optional[Callable[[Dict[str, Any]], Iterable[str]]] = None
+                        ) -> Dict[str, Tuple[str, ...]]:
+    """Facet values of one module; role buckets read 'DAN:high'"""
+    values = {
+        'category': tuple(categorise(module)) if categorise else (),
+        'eqf': (str(module.get('eqf_level', 6)),),
+        'thematic_area': (module.get('thematic_area', 'General'),),
+        'delivery_method': tuple(module.get('delivery_methods', ())),
+        'role': tuple(
+            f"{role_id}:{relevance_bucket(score)}"
+            for role_id, score in sorted(module.get('role_relevance', {}).items())
+        ),
+        'skill': tuple(module.get('skills', ()))
+    }
+    # A value listed twice counts once
+    return {facet: tuple(dict.fromkeys(items)) for facet, items in values.items()}
+
+
+def module_summary(module: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'id': module.get('id', 'UNKNOWN'),
+        'name': module.get('name', ''),
+        'description': module.get('description', ''),
+        'eqf_level': module.get('eqf_level', 6),
+        'ects_points': module.get('ects_points', 0),
+        'thematic_area': module.get('thematic_area', 'General'),
+        'delivery_methods': list(module.get('delivery_methods', ()))
+    }
+
+
+@dataclass(frozen=True, eq=False)
+class FacetQuery:
+    """Parsed /api/modules parameters"""
+
+    filters: Tuple[Tuple[str, str], ...] = ()
+    q: str = ''
+    page: int = 1
+    per_page: int = DEFAULT_PAGE_SIZE
+
+    @classmethod
+    def from_args(cls, facets: Sequence[str], q: Optional[str] = None, page: Any = 1,
+                  per_page: Any = DEFAULT_PAGE_SIZE) -> 'FacetQuery':
+        """Build from request arguments; facet filters are 'name:value' and combine with AND"""
+        filters = []
+        for item in facets:
+            name, separator, value = item.partition(':')
+            if not separator or name not in FACETS:
+                raise ValueError(f"Invalid facet filter {item!r}; expected one of {', '.join(FACETS)} as name:value")
+            filters.append((name, value))
+        try:
+            page, per_page = int(page), int(per_page)
+        except (TypeError, ValueError):
+            raise ValueError("page and per_page must be integers")
+        if page < 1 or not 1 <= per_page <= MAX_PAGE_SIZE:
+            raise ValueError(f"page must be >= 1 and per_page between 1 and {MAX_PAGE_SIZE}")
+        return cls(tuple(filters), (q or '').strip(), page, per_page)
+
+
+@dataclass(frozen=True, eq=False)
+class ModuleFacetIndex:
+    """Facet postings over CatalogSnapshot.modules (row i == modules[i])"""
+
+    version: str
+    summaries: Tuple[Dict[str, Any], ...]
+    postings: Dict[str, Dict[str, FrozenSet[int]]]
+    counts: Dict[str, Dict[str, int]]
+    vocabulary: Tuple[str, ...]
+    word_rows: Dict[str, FrozenSet[int]]
+    # Categoriser the category facet was built with; keeps it (and its owner) alive
+    # while the index is cached, so its identity in the derived key stays unique
+    categorise: Optional[Callable[[Dict[str, Any]], Iterable[str]]] = field(default=None, repr=False)
+
+    @classmethod
+    def from_snapshot(cls, snapshot: CatalogSnapshot,
+                      categorise: Optional[Callable[[Dict[str, Any]], Iterable[str]]] = None
+                      ) -> 'ModuleFacetIndex':
+        """Build the index once; use ModuleFacetIndex.for_snapshot to share it"""
+        postings: Dict[str, Dict[str, set]] = {facet: {} for facet in FACETS}
+        word_rows: Dict[str, set] = {}
+
+        for row, module in enumerate(snapshot.modules):
+            for facet, values in module_facet_values(module, categorise).items():
+                for value in values:
+                    postings[facet].setdefault(value, set()).add(row)
+            for field_name in SEARCH_FIELDS:
+                for word in _words(module.get(field_name)):
+                    word_rows.setdefault(word, set()).add(row)
+
+        frozen = {
+            facet: {value: frozenset(rows) for value, rows in sorted(values.items())}
+            for facet, values in postings.items()
+        }
+        return cls(
+            version=snapshot.version,
+            summaries=tuple(module_summary(module) for module in snapshot.modules),
+            postings=frozen,
+            counts={facet: {value: len(rows) for value, rows in values.items()} for facet, values in frozen.items()},
+            vocabulary=tuple(sorted(word_rows)),
+            word_rows={word: frozenset(rows) for word, rows in word_rows.items()},
+            categorise=categorise
+        )
+
+    @staticmethod
+    def for_snapshot(snapshot: CatalogSnapshot,
+                     categorise: Optional[Callable[[Dict[str, Any]], Iterable[str]]] = None
+                     ) -> 'ModuleFacetIndex':
+        """Return the index for a snapshot and categoriser, building it on first use"""
+        return snapshot.derived(f"module_facets:{_categoriser_key(categorise)}",
+                                lambda catalog: ModuleFacetIndex.from_snapshot(catalog, categorise))
+
+    def __len__(self) -> int:
+        return len(self.summaries)
+
+    def _prefix_rows(self, prefix: str) -> FrozenSet[int]:
+        """Rows containing a word that starts with prefix"""
+        rows = set()
+        start = bisect.bisect_left(self.vocabulary, prefix)
+        for word in self.vocabulary[start:]:
+            if not word.startswith(prefix):
+                break
+            rows |= self.word_rows[word]
+        return frozenset(rows)
+
+    def matching_rows(self, query: FacetQuery) -> Optional[FrozenSet[int]]:
+        """Rows matching every filter and search word; None means the whole catalog"""
+        rows = None
+        for facet, value in query.filters:
+            posting = self.postings[facet].get(value, frozenset())
+            rows = posting if rows is None else rows & posting
+        for word in _words(query.q):
+            matches = self._prefix_rows(word)
+            rows = matches if rows is None else rows & matches
+        return rows
+
+    def facet_counts(self, rows: Optional[FrozenSet[int]]) -> Dict[str, Dict[str, int]]:
+        """Per facet value counts within the matching rows"""
+        if rows is None:
+            return self.counts
+        counts = {}
+        for facet, values in self.postings.items():
+            counts[facet] = {}
+            for value, posting in values.items():
+                count = len(posting & rows)
+                if count:
+                    counts[facet][value] = count
+        return counts
+
+    def search(self, query: FacetQuery) -> Dict[str, Any]:
+        """One page of module summaries with the total and facet counts"""
+        rows = self.matching_rows(query)
+        total = len(self) if rows is None else len(rows)
+        start = (query.page - 1) * query.per_page
+        if rows is None:
+            page_rows: List[int] = list(range(start, min(start + query.per_page, total)))
+        else:
+            page_rows = sorted(rows)[start:start + query.per_page]
+
+        return {
+            'catalog_version': self.version,
+            'total': total,
+            'page': query.page,
+            'per_page': query.per_page,
+            'pages': (total + query.per_page - 1) // query.per_page,
+            'filters': [f"{facet}:{value}" for facet, value in query.filters],
+            'q': query.q,
+            'modules': [self.summaries[row] for row in page_rows],
+            'facets': self.facet_counts(rows)
+        }
@@ -0,0 +1,134 @@
+"""
+Columnar module table.
+NumPy view of a catalog snapshot (EQF, ECTS and a dense module x role relevance
+matrix) so learning unit selection becomes mask + argsort instead of a Python
+loop over every module dict.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ecm.catalog import CatalogSnapshot
+
+
+# Defaults used by the generator when a field is missing
+DEFAULT_EQF_LEVEL = 6
+DEFAULT_ECTS_POINTS = 5
+
+
+@dataclass(frozen=True, eq=False)
+class ModuleTable:
+    """Column arrays aligned with CatalogSnapshot.modules (row i == modules[i])"""
+
+    module_ids: Tuple[str, ...]
+    role_ids: Tuple[str, ...]
+    role_index: Dict[str, int]
+    eqf: np.ndarray        # int64, shape (n_modules,)
+    ects: np.ndarray       # float64, shape (n_modules,)
+    relevance: np.ndarray  # float64, shape (n_modules, n_roles); 0 where not rated
+
+    @classmethod
+    def from_snapshot(cls, snapshot: CatalogSnapshot) -> 'ModuleTable':
+        """Build the columns once; use ModuleTable.for_snapshot to share it"""
+        modules = snapshot.modules
+        role_ids = sorted({
+            role_id
+            for module in modules
+            for role_id in module.get('role_relevance', {})
+        })
+        role_index = {role_id: i for i, role_id in enumerate(role_ids)}
+
+        eqf = np.fromiter(
+            (module.get('eqf_level', DEFAULT_EQF_LEVEL) for module in modules),
+            dtype=np.int64, count=len(modules)
+        )
+        ects = np.fromiter(
+            (module.get('ects_points', DEFAULT_ECTS_POINTS) for module in modules),
+            dtype=np.float64, count=len(modules)
+        )
+        relevance = np.zeros((len(modules), len(role_ids)), dtype=np.float64)
+        for row, module in enumerate(modules):
+            for role_id, value in module.get('role_relevance', {}).items():
+                relevance[row, role_index[role_id]] = value
+
+        for column in (eqf, ects, relevance):
+            column.setflags(write=False)
+
+        return cls(
+            module_ids=tuple(module.get('id', 'UNKNOWN') for module in modules),
+            role_ids=tuple(role_ids),
+            role_index=role_index,
+            eqf=eqf,
+            ects=ects,
+            relevance=relevance
+        )
+
+    @staticmethod
+    def for_snapshot(snapshot: CatalogSnapshot) -> 'ModuleTable':
+        """Return the table for a snapshot, building it on first use"""
+        return snapshot.derived('module_table', ModuleTable.from_snapshot)
+
+    def __len__(self) -> int:
+        return len(self.module_ids)
+
+    def role_relevance(self, role_id: str) -> np.ndarray:
+        """Relevance column for one role (all zeros for an unknown role)"""
+        column = self.role_index.get(role_id)
+        if column is None:
+            return np.zeros(len(self), dtype=np.float64)
+        return self.relevance[:, column]
+
+    def eligible_mask(self, role_id: str, min_eqf: int, max_eqf: int,
+                      min_relevance: float) -> np.ndarray:
+        """Modules inside the EQF window with enough relevance for the role"""
+        return (
+            (self.eqf >= min_eqf)
+            & (self.eqf <= max_eqf)
+            & (self.role_relevance(role_id) >= min_relevance)
+        )
+
+    def rank(self, role_id: str, min_eqf: int, max_eqf: int, min_relevance: float,
+             limit: Optional[int] = None) -> np.ndarray:
+        """Row indices of eligible modules, most relevant first
+
+        Ties keep catalog order, matching a stable sort on relevance.
+        """
+        rows = np.flatnonzero(self.eligible_mask(role_id, min_eqf, max_eqf, min_relevance))
+        scores = self.role_relevance(role_id)[rows]
+        ranked = rows[np.argsort(-scores, kind='stable')]
+        return ranked if limit is None else ranked[:limit]
+
+    def score_grid(self, role_ids: Sequence[str], eqf_levels: Sequence[int],
+                   min_relevance: float, eqf_window: int = 1,
+                   min_eqf_floor: int = 4) -> Dict[str, Any]:
+        """Score every (role, programme EQF level) combination in one call
+
+        A module is eligible for programme level L when its EQF lies in
+        [max(L - eqf_window, min_eqf_floor), L] and its relevance for the role
+        reaches min_relevance. Returns arrays indexed [role, eqf_level].
+        """
+        levels = np.asarray(eqf_levels, dtype=np.int64)
+        relevance = np.stack([self.role_relevance(role_id) for role_id in role_ids])  # (R, N)
+
+        lower = np.maximum(levels - eqf_window, min_eqf_floor)[:, None]                # (E, 1)
+        in_window = (self.eqf[None, :] >= lower) & (self.eqf[None, :] <= levels[:, None])  # (E, N)
+        relevant = relevance >= min_relevance                                            # (R, N)
+        eligible = relevant[:, None, :] & in_window[None, :, :]                          # (R, E, N)
+
+        count = eligible.sum(axis=2)
+        total_ects = (eligible * self.ects[None, None, :]).sum(axis=2)
+        relevance_sum = (eligible * relevance[:, None, :]).sum(axis=2)
+        mean_relevance = np.divide(
+            relevance_sum, count, out=np.zeros_like(relevance_sum), where=count > 0
+        )
+
+        return {
+            'role_ids': list(role_ids),
+            'eqf_levels': levels.tolist(),
+            'eligible': eligible,
+            'count': count,
+            'total_ects': total_ects,
+            'mean_relevance': mean_relevance
+        }
@@ -0,0 +1,270 @@
+"""
+Pareto search over learning unit subsets.
+NSGA-II style search per curriculum spec for the trade-off between competence
+coverage, ECTS used and learning unit sharing across roles. Objective values
+come from one module x objective matrix per catalog snapshot, so every spec
+(and every worker process) only slices precomputed columns.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Any, Sequence
+
+import numpy as np
+
+from ecm.catalog import CatalogSnapshot
+from ecm.ects_solver import ECTS_STEP, solve_ects_selection
+from ecm.module_table import ModuleTable
+
+
+# Relevance a learning unit needs for another role before it counts as shared with it
+# (most units score 60+ for every role, so the bar sits at the top third)
+SHARING_RELEVANCE = 80
+OBJECTIVES = ('coverage', 'total_ects', 'sharing')
+
+
+@dataclass(frozen=True)
+class ParetoProblem:
+    """One curriculum spec reduced to what the search needs"""
+
+    spec_id: str
+    role_id: str
+    target_ects: float
+    min_eqf: int
+    max_eqf: int
+    min_relevance: float
+
+
+@dataclass(frozen=True, eq=False)
+class ObjectiveMatrix:
+    """Per-module objective inputs, aligned with ModuleTable rows"""
+
+    table: ModuleTable
+    shared_roles: np.ndarray  # int64 (n_modules, n_roles): other roles a module is shareable with
+
+    @classmethod
+    def from_snapshot(cls, snapshot: CatalogSnapshot) -> 'ObjectiveMatrix':
+        table = ModuleTable.for_snapshot(snapshot)
+        shareable = table.relevance >= SHARING_RELEVANCE
+        # For role r: number of roles other than r the module is shareable with
+        shared_roles = shareable.sum(axis=1, keepdims=True) - shareable
+        shared_roles.setflags(write=False)
+        return cls(table=table, shared_roles=shared_roles)
+
+    @staticmethod
+    def for_snapshot(snapshot: CatalogSnapshot) -> 'ObjectiveMatrix':
+        """Return the matrix for a snapshot, building it on first use"""
+        return snapshot.derived('objective_matrix', ObjectiveMatrix.from_snapshot)
+
+    def columns(self, problem: ParetoProblem) -> Dict[str, np.ndarray]:
+        """Candidate rows and their objective columns for one problem"""
+        table = self.table
+        rows = table.rank(problem.role_id, problem.min_eqf, problem.max_eqf, problem.min_relevance)
+        ects = table.ects[rows]
+        relevance = table.role_relevance(problem.role_id)[rows]
+
+        role_column = table.role_index.get(problem.role_id)
+        other_roles = max(len(table.role_ids) - 1, 1)
+        if role_column is None:
+            sharing = np.zeros(len(rows))
+        else:
+            sharing = self.shared_roles[rows, role_column] / other_roles
+
+        return {
+            'rows': rows,
+            'ects': ects,
+            'relevance': relevance,
+            # Coverage: relevance-weighted share of the target credits
+            'coverage': relevance * ects / (100.0 * problem.target_ects),
+            # Sharing is averaged over the selected ECTS; keep the weighted numerator
+            'sharing_ects': sharing * ects
+        }
+
+
+def _evaluate(population: np.ndarray, columns: Dict[str, np.ndarray]) -> np.ndarray:
+    """Objective vectors (to minimise) for a boolean population"""
+    weights = population.astype(np.float64)
+    total_ects = weights @ columns['ects']
+    coverage = weights @ columns['coverage']
+    sharing = np.divide(weights @ columns['sharing_ects'], total_ects,
+                        out=np.zeros_like(total_ects), where=total_ects > 0)
+    return np.stack([-coverage, total_ects, -sharing], axis=1)
+
+
+def _non_dominated_ranks(objectives: np.ndarray) -> np.ndarray:
+    """Front index per individual (0 = non-dominated)"""
+    no_worse = (objectives[:, None, :] <= objectives[None, :, :]).all(axis=2)
+    better = (objectives[:, None, :] < objectives[None, :, :]).any(axis=2)
+    dominates = no_worse & better                  # [i, j]: i dominates j
+    dominated_by = dominates.sum(axis=0)
+
+    ranks = np.full(len(objectives), -1, dtype=np.int64)
+    front = 0
+    current = np.flatnonzero(dominated_by == 0)
+    while current.size:
+        ranks[current] = front
+        dominated_by = dominated_by - dominates[current].sum(axis=0)
+        dominated_by[ranks >= 0] = -1
+        current = np.flatnonzero(dominated_by == 0)
+        front += 1
+    return ranks
+
+
+def _crowding_distance(objectives: np.ndarray, ranks: np.ndarray) -> np.ndarray:
+    distance = np.zeros(len(objectives))
+    for front in np.unique(ranks):
+        members = np.flatnonzero(ranks == front)
+        if len(members) <= 2:
+            distance[members] = np.inf
+            continue
+        for column in range(objectives.shape[1]):
+            values = objectives[members, column]
+            order = members[np.argsort(values, kind='stable')]
+            span = values.max() - values.min()
+            distance[order[0]] = distance[order[-1]] = np.inf
+            if span > 0:
+                sorted_values = objectives[order, column]
+                distance[order[1:-1]] += (sorted_values[2:] - sorted_values[:-2]) / span
+    return distance
+
+
+def _repair(population: np.ndarray, columns: Dict[str, np.ndarray], target_ects: float) -> np.ndarray:
+    """Drop the least relevant units until each individual fits the ECTS target"""
+    ects = columns['ects']
+    drop_order = np.argsort(columns['relevance'], kind='stable')
+    fits = ects <= target_ects + 1e-9
+    population &= fits[None, :]
+
+    for individual in np.flatnonzero(population @ ects > target_ects + 1e-9):
+        selected = population[individual]
+        for column in drop_order:
+            if selected[column]:
+                selected[column] = False
+                if selected @ ects <= target_ects + 1e-9:
+                    break
+
+    # Never return an empty curriculum when some unit fits
+    if fits.any():
+        best_fitting = np.flatnonzero(fits)[0]  # rows are ranked by relevance
+        population[~population.any(axis=1), best_fitting] = True
+    return population
+
+
+def search_pareto_front(columns: Dict[str, np.ndarray], target_ects: float,
+                        population_size: int = 64, generations: int = 60,
+                        seed: int = 0) -> List[Dict[str, Any]]:
+    """NSGA-II over boolean selections of the candidate columns
+
+    Returns the non-dominated selections as candidate positions plus their
+    objective values, highest coverage first.
+    """
+    n_candidates = len(columns['ects'])
+    if n_candidates == 0 or not (columns['ects'] <= target_ects + 1e-9).any():
+        return []
+
+    rng = np.random.default_rng(seed)
+    fill = min(1.0, target_ects / max(columns['ects'].sum(), ECTS_STEP))
+    population = rng.random((population_size, n_candidates)) < rng.uniform(0.1, 1.0, (population_size, 1)) * fill
+
+    # Seed the coverage extreme with the exact ECTS solver result
+    solved = solve_ects_selection(columns['ects'], columns['relevance'], target_ects,
+                                  min_units=1, time_budget=None)
+    if solved is not None:
+        population[0] = False
+        population[0, solved.indices] = True
+    population = _repair(population, columns, target_ects)
+
+    mutation_rate = 1.0 / n_candidates
+    for _ in range(generations):
+        objectives = _evaluate(population, columns)
+        ranks = _non_dominated_ranks(objectives)
+        crowding = _crowding_distance(objectives, ranks)
+
+        # Binary tournament on (rank, crowding)
+        contenders = rng.integers(0, population_size, (population_size, 2))
+        first, second = contenders[:, 0], contenders[:, 1]
+        first_wins = (ranks[first] < ranks[second]) | (
+            (ranks[first] == ranks[second]) & (crowding[first] >= crowding[second])
+        )
+        parents = population[np.where(first_wins, first, second)]
+
+        # Uniform crossover between consecutive parents, then bit-flip mutation
+        partners = np.roll(parents, 1, axis=0)
+        offspring = np.where(rng.random(parents.shape) < 0.5, parents, partners)
+        offspring ^= rng.random(offspring.shape) < mutation_rate
+        offspring = _repair(offspring, columns, target_ects)
+
+        # Elitist survival over parents + offspring
+        combined = np.concatenate([population, offspring])
+        combined_objectives = _evaluate(combined, columns)
+        combined_ranks = _non_dominated_ranks(combined_objectives)
+        combined_crowding = _crowding_distance(combined_objectives, combined_ranks)
+        survivors = np.lexsort((-combined_crowding, combined_ranks))[:population_size]
+        population = combined[survivors]
+
+    objectives = _evaluate(population, columns)
+    front = population[_non_dominated_ranks(objectives) == 0]
+    front = np.unique(front, axis=0)
+    front_objectives = _evaluate(front, columns)
+
+    results = []
+    for selection, values in zip(front, front_objectives):
+        results.append({
+            'positions': np.flatnonzero(selection).tolist(),
+            'objectives': {
+                'coverage': float(-values[0]),
+                'total_ects': float(values[1]),
+                'sharing': float(-values[2])
+            }
+        })
+    results.sort(key=lambda item: (-item['objectives']['coverage'], item['objectives']['total_ects']))
+    return results
+
+
+def pareto_front_for_problem(matrix: ObjectiveMatrix, problem: ParetoProblem,
+                             **search_options) -> Dict[str, Any]:
+    """Pareto front for one spec, with learning unit ids instead of positions"""
+    columns = matrix.columns(problem)
+    module_ids = matrix.table.module_ids
+    front = search_pareto_front(columns, problem.target_ects, **search_options)
+    return {
+        'spec_id': problem.spec_id,
+        'role_id': problem.role_id,
+        'target_ects': problem.target_ects,
+        'candidate_units': len(columns['rows']),
+        'objectives': list(OBJECTIVES),
+        'front': [
+            {
+                'learning_unit_ids': [module_ids[columns['rows'][position]] for position in solution['positions']],
+                'objectives': solution['objectives']
+            }
+            for solution in front
+        ]
+    }
+
+
+_worker_matrix = None
+
+
+def _init_pareto_worker(snapshot: CatalogSnapshot) -> None:
+    """Build the objective matrix once per worker process"""
+    global _worker_matrix
+    _worker_matrix = ObjectiveMatrix.for_snapshot(snapshot)
+
+
+def _pareto_front_in_worker(problem: ParetoProblem, search_options: Dict[str, Any]) -> Dict[str, Any]:
+    return pareto_front_for_problem(_worker_matrix, problem, **search_options)
+
+
+def pareto_fronts(snapshot: CatalogSnapshot, problems: Sequence[ParetoProblem],
+                  jobs: int = 1, **search_options) -> List[Dict[str, Any]]:
+    """Pareto fronts for several specs, in problem order (jobs > 1 uses a process pool)"""
+    if jobs <= 1 or len(problems) <= 1:
+        matrix = ObjectiveMatrix.for_snapshot(snapshot)
+        return [pareto_front_for_problem(matrix, problem, **search_options) for problem in problems]
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(problems)),
+                             initializer=_init_pareto_worker,
+                             initargs=(snapshot,)) as executor:
+        futures = [executor.submit(_pareto_front_in_worker, problem, search_options) for problem in problems]
+        return [future.result() for future in futures]
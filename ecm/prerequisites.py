@@ -0,0 +1,246 @@
+"""
+Compiled prerequisite graph.
+Module prerequisites compiled once per catalog snapshot into integer ids, a
+topological order, cycle reports and a transitive closure stored as integer
+bitsets, so closure and "what is missing" checks on a selection are a handful
+of bit operations instead of repeated list walks.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Any, Iterable, Tuple
+
+from ecm.catalog import CatalogSnapshot, snapshot_of
+
+
+def prerequisite_references(module: Dict[str, Any]) -> List[str]:
+    """Prerequisite entries of a module as a list of non-empty strings"""
+    prerequisites = module.get('prerequisites', [])
+    if isinstance(prerequisites, str):
+        prerequisites = [prerequisites]
+    if not isinstance(prerequisites, (list, tuple)):
+        return []
+    return [str(reference) for reference in prerequisites if reference]
+
+
+def _strongly_connected_components(successors: List[List[int]]) -> List[List[int]]:
+    """Iterative Tarjan; components come out dependencies-first"""
+    count = len(successors)
+    index = [-1] * count
+    lowlink = [0] * count
+    on_stack = [False] * count
+    stack = []
+    components = []
+    counter = 0
+
+    for root in range(count):
+        if index[root] != -1:
+            continue
+        work = [(root, 0)]
+        while work:
+            node, edge = work.pop()
+            if edge == 0:
+                index[node] = lowlink[node] = counter
+                counter += 1
+                stack.append(node)
+                on_stack[node] = True
+            if edge < len(successors[node]):
+                work.append((node, edge + 1))
+                child = successors[node][edge]
+                if index[child] == -1:
+                    work.append((child, 0))
+                elif on_stack[child]:
+                    lowlink[node] = min(lowlink[node], index[child])
+                continue
+            # All edges done: propagate lowlink to the parent and pop a component
+            if work:
+                parent = work[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[node])
+            if lowlink[node] == index[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = False
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(sorted(component))
+    return components
+
+
+@dataclass(frozen=True, eq=False)
+class PrerequisiteGraph:
+    """Prerequisite DAG over module ids; bit i of a mask stands for module_ids[i]"""
+
+    module_ids: Tuple[str, ...]
+    index: Dict[str, int]
+    direct: Tuple[Tuple[int, ...], ...]   # direct prerequisite ids per module (self-loops removed)
+    closure: Tuple[int, ...]              # transitive prerequisite bitset per module
+    topological_position: Tuple[int, ...]
+    self_loops: Tuple[str, ...]
+    cycles: Tuple[Tuple[str, ...], ...]
+    unknown_references: Dict[str, Tuple[str, ...]]
+
+    @classmethod
+    def from_modules(cls, modules: Iterable[Dict[str, Any]]) -> 'PrerequisiteGraph':
+        modules = [module for module in modules if isinstance(module, dict) and 'id' in module]
+        module_ids = tuple(dict.fromkeys(module['id'] for module in modules))
+        index = {module_id: i for i, module_id in enumerate(module_ids)}
+
+        references: List[List[str]] = [[] for _ in module_ids]
+        for module in modules:
+            references[index[module['id']]].extend(prerequisite_references(module))
+
+        direct = []
+        self_loops = []
+        unknown = {}
+        for node, node_references in enumerate(references):
+            prerequisites = []
+            for reference in node_references:
+                target = index.get(reference)
+                if target is None:
+                    unknown.setdefault(module_ids[node], []).append(reference)
+                elif target == node:
+                    if module_ids[node] not in self_loops:
+                        self_loops.append(module_ids[node])
+                elif target not in prerequisites:
+                    prerequisites.append(target)
+            direct.append(tuple(prerequisites))
+
+        components = _strongly_connected_components([list(prerequisites) for prerequisites in direct])
+
+        closure = [0] * len(module_ids)
+        topological_position = [0] * len(module_ids)
+        cycles = []
+        position = 0
+        for component in components:
+            reach = 0
+            for node in component:
+                for prerequisite in direct[node]:
+                    reach |= (1 << prerequisite) | closure[prerequisite]
+            if len(component) > 1:
+                cycles.append(tuple(module_ids[node] for node in component))
+            for node in component:
+                closure[node] = reach
+                topological_position[node] = position
+                position += 1
+
+        return cls(
+            module_ids=module_ids,
+            index=index,
+            direct=tuple(direct),
+            closure=tuple(closure),
+            topological_position=tuple(topological_position),
+            self_loops=tuple(self_loops),
+            cycles=tuple(cycles),
+            unknown_references={key: tuple(value) for key, value in unknown.items()}
+        )
+
+    @staticmethod
+    def for_snapshot(snapshot: CatalogSnapshot) -> 'PrerequisiteGraph':
+        """Return the graph for a snapshot, compiling it on first use"""
+        return snapshot.derived('prerequisite_graph', lambda s: PrerequisiteGraph.from_modules(s.modules))
+
+    @staticmethod
+    def for_modules(modules: Iterable[Dict[str, Any]]) -> 'PrerequisiteGraph':
+        """Catalog graph when the module objects come from a loaded snapshot (compiled
+        once per snapshot), otherwise a graph compiled from the given modules only"""
+        modules = [module for module in modules if isinstance(module, dict)]
+        found = snapshot_of(modules)
+        if found is not None:
+            return PrerequisiteGraph.for_snapshot(found[0])
+        return PrerequisiteGraph.from_modules(modules)
+
+    def __len__(self) -> int:
+        return len(self.module_ids)
+
+    def __contains__(self, module_id: str) -> bool:
+        return module_id in self.index
+
+    def mask(self, module_ids: Iterable[str]) -> int:
+        """Bitset of the known ids in module_ids"""
+        bits = 0
+        for module_id in module_ids:
+            node = self.index.get(module_id)
+            if node is not None:
+                bits |= 1 << node
+        return bits
+
+    def ids(self, bits: int) -> List[str]:
+        """Module ids of a bitset, in topological order (prerequisites first)"""
+        nodes = []
+        while bits:
+            low = bits & -bits
+            nodes.append(low.bit_length() - 1)
+            bits ^= low
+        nodes.sort(key=self.topological_position.__getitem__)
+        return [self.module_ids[node] for node in nodes]
+
+    def required(self, module_ids: Iterable[str]) -> int:
+        """Bitset of every transitive prerequisite of a selection"""
+        bits = 0
+        for module_id in module_ids:
+            node = self.index.get(module_id)
+            if node is not None:
+                bits |= self.closure[node]
+        return bits
+
+    def missing(self, module_ids: Iterable[str]) -> List[str]:
+        """Transitive prerequisites not in the selection, prerequisites first"""
+        module_ids = list(module_ids)
+        return self.ids(self.required(module_ids) & ~self.mask(module_ids))
+
+    def is_closed(self, module_ids: Iterable[str]) -> bool:
+        """True when every transitive prerequisite of the selection is selected"""
+        module_ids = list(module_ids)
+        return self.required(module_ids) & ~self.mask(module_ids) == 0
+
+    def prerequisites_of(self, module_id: str, transitive: bool = True) -> List[str]:
+        """Prerequisites of one module, prerequisites first"""
+        node = self.index.get(module_id)
+        if node is None:
+            return []
+        if transitive:
+            return [prerequisite for prerequisite in self.ids(self.closure[node]) if prerequisite != module_id]
+        return self.ids(sum(1 << prerequisite for prerequisite in self.direct[node]))
+
+    def topological_sort(self, module_ids: Iterable[str]) -> List[str]:
+        """Order a selection so prerequisites come first (unknown ids keep their place at the end)"""
+        module_ids = list(module_ids)
+        known = [module_id for module_id in module_ids if module_id in self.index]
+        known.sort(key=lambda module_id: self.topological_position[self.index[module_id]])
+        return known + [module_id for module_id in module_ids if module_id not in self.index]
+
+    def depth(self, module_ids: Iterable[str]) -> Dict[str, int]:
+        """Longest prerequisite chain below each selected module, counting selected modules only"""
+        selection = self.mask(module_ids)
+        depths: Dict[str, int] = {}
+        for module_id in self.ids(selection):
+            node = self.index[module_id]
+            below = [
+                depths[self.module_ids[prerequisite]] + 1
+                for prerequisite in self.direct[node]
+                if selection >> prerequisite & 1 and self.module_ids[prerequisite] in depths
+            ]
+            depths[module_id] = max(below, default=0)
+        return depths
+
+    def report(self) -> Dict[str, Any]:
+        """Graph summary with the data problems found while compiling"""
+        return {
+            'modules': len(self.module_ids),
+            'edges': sum(len(prerequisites) for prerequisites in self.direct),
+            'self_loops': list(self.self_loops),
+            'cycles': [list(cycle) for cycle in self.cycles],
+            'unknown_references': {key: list(value) for key, value in self.unknown_references.items()}
+        }
+
+    def warnings(self) -> List[str]:
+        """Human readable versions of the report's data problems"""
+        messages = [f"{module_id} lists itself as a prerequisite" for module_id in self.self_loops]
+        messages += [f"Prerequisite cycle: {' -> '.join(cycle)}" for cycle in self.cycles]
+        messages += [
+            f"{module_id} references unknown prerequisites: {', '.join(references)}"
+            for module_id, references in self.unknown_references.items()
+        ]
+        return messages
+
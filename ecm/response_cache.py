@@ -0,0 +1,152 @@
+"""
+Response cache.
+Rendered responses are stored under (endpoint, normalised parameters, catalog
+content hash) in a Flask-Caching backend chosen by config: SimpleCache
+(in-process), FileSystemCache (shared by every worker on one host) or
+RedisCache. A catalog edit changes the key, so stale entries are never served.
+Entries carry an ETag and Last-Modified time, and conditional GETs are
+answered with 304 Not Modified.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from flask import current_app, request
+from flask_caching import Cache
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+DEFAULT_CACHE_DIR = PROJECT_ROOT / "output" / "cache" / "responses"
+
+# Entries live this long (seconds); the catalog hash in the key handles content changes
+DEFAULT_TIMEOUT = 24 * 60 * 60
+
+
+def normalise_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop unset values and strip strings so equivalent requests share a key"""
+    normalised = {}
+    for name, value in params.items():
+        if isinstance(value, str):
+            value = value.strip()
+        if value is None or value == '':
+            continue
+        if isinstance(value, (list, tuple)):
+            value = list(value)
+        normalised[name] = value
+    return normalised
+
+
+def cache_key(endpoint: str, params: Dict[str, Any], catalog_version: str) -> str:
+    """Key of a response: endpoint, normalised parameters and catalog content hash"""
+    canonical = json.dumps(
+        {'endpoint': endpoint, 'params': normalise_params(params), 'catalog': catalog_version},
+        sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str
+    )
+    return f"ecm:{endpoint}:{hashlib.sha256(canonical.encode('utf-8')).hexdigest()}"
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """Rendered response body with its validators"""
+
+    data: bytes
+    content_type: str = 'application/json'
+    filename: Optional[str] = None
+    etag: str = ''
+    last_modified: float = field(default_factory=time.time)
+
+    @classmethod
+    def build(cls, data: bytes, content_type: str = 'application/json',
+              filename: Optional[str] = None) -> 'CachedResponse':
+        return cls(data, content_type, filename, hashlib.sha256(data).hexdigest()[:32])
+
+    @classmethod
+    def from_json(cls, value: Any) -> 'CachedResponse':
+        return cls.build(json.dumps(value, ensure_ascii=False).encode('utf-8'))
+
+    def to_response(self):
+        """Flask response with ETag and Last-Modified; 304 for a matching conditional GET"""
+        response = current_app.response_class(self.data, mimetype=self.content_type)
+        if self.filename:
+            response.headers['Content-Disposition'] = f'attachment; filename="{self.filename}"'
+        response.set_etag(self.etag)
+        response.last_modified = self.last_modified
+        # Clients may keep the body but must revalidate it
+        response.cache_control.no_cache = True
+        return response.make_conditional(request)
+
+
+def cache_config_from_environment() -> Dict[str, Any]:
+    """Flask-Caching settings: CACHE_TYPE=SimpleCache|FileSystemCache|RedisCache|NullCache"""
+    settings = {
+        'CACHE_TYPE': os.environ.get('CACHE_TYPE', 'SimpleCache'),
+        'CACHE_DEFAULT_TIMEOUT': int(os.environ.get('CACHE_DEFAULT_TIMEOUT', DEFAULT_TIMEOUT)),
+        'CACHE_DIR': os.environ.get('CACHE_DIR', str(DEFAULT_CACHE_DIR)),
+        'CACHE_THRESHOLD': int(os.environ.get('CACHE_THRESHOLD', 500))
+    }
+    redis_url = os.environ.get('CACHE_REDIS_URL') or os.environ.get('REDIS_URL')
+    if redis_url:
+        settings['CACHE_REDIS_URL'] = redis_url
+    return settings
+
+
+class ResponseCache:
+    """Keyed response cache with hit/miss counters"""
+
+    def __init__(self, app=None, config: Optional[Dict[str, Any]] = None):
+        self._cache = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        if app is not None:
+            self.init_app(app, config)
+
+    def init_app(self, app, config: Optional[Dict[str, Any]] = None) -> None:
+        for name, value in cache_config_from_environment().items():
+            app.config.setdefault(name, value)
+        app.config.update(config or {})
+        if app.config['CACHE_TYPE'] == 'FileSystemCache':
+            Path(app.config['CACHE_DIR']).mkdir(parents=True, exist_ok=True)
+        # Bound to the app, so job worker threads can use it outside a request
+        self._cache = Cache(app)
+
+    def get(self, endpoint: str, params: Dict[str, Any], catalog_version: str) -> Optional[CachedResponse]:
+        entry = self._cache.get(cache_key(endpoint, params, catalog_version)) if self._cache else None
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return entry
+
+    def set(self, endpoint: str, params: Dict[str, Any], catalog_version: str, entry: CachedResponse) -> None:
+        if self._cache is not None:
+            self._cache.set(cache_key(endpoint, params, catalog_version), entry)
+
+    def get_or_build(self, endpoint: str, params: Dict[str, Any], catalog_version: str,
+                     build: Callable[[], CachedResponse]) -> CachedResponse:
+        """Cached entry, or the result of build() stored for the next request"""
+        entry = self.get(endpoint, params, catalog_version)
+        if entry is None:
+            entry = build()
+            self.set(endpoint, params, catalog_version, entry)
+        return entry
+
+    def clear(self) -> None:
+        if self._cache is not None:
+            self._cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': round(self.hits / lookups, 4) if lookups else 0.0
+            }
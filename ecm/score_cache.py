@@ -0,0 +1,160 @@
+"""
+Bounded score cache.
+In-memory LRU for (module content hash, topic, scorer version) scores with an
+optional SQLite backing store, so long-lived workers stay bounded and warm
+restarts reuse scores computed by earlier processes.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+
+from ecm.catalog import FrozenDict
+
+DEFAULT_MAX_ENTRIES = 50000
+
+# (module content hash, topic, scorer version)
+CacheKey = Tuple[str, str, str]
+
+
+def module_content_hash(module: Dict[str, Any]) -> str:
+    """Hash one module's content; edits to the module change the cache key.
+    Read-only catalog snapshot modules cannot change, so their hash is computed once"""
+    if isinstance(module, FrozenDict):
+        content_hash = module.__dict__.get('_content_hash')
+        if content_hash is None:
+            content_hash = module.__dict__['_content_hash'] = _content_hash(module)
+        return content_hash
+    return _content_hash(module)
+
+
+def _content_hash(module: Dict[str, Any]) -> str:
+    canonical = json.dumps(module, sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class ScoreCache:
+    """Thread-safe LRU with hit/miss/eviction counters and optional SQLite persistence"""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, db_path: Optional[Path] = None):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.db_path = Path(db_path) if db_path else None
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._connection = None
+        self._connection_pid = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.disk_hits = 0
+
+    @staticmethod
+    def _disk_key(key: CacheKey) -> str:
+        return '\x1f'.join(key)
+
+    def _db(self) -> Optional[sqlite3.Connection]:
+        """Open the backing store lazily, once per process (safe after fork)"""
+        if self.db_path is None:
+            return None
+        if self._connection is None or self._connection_pid != os.getpid():
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("CREATE TABLE IF NOT EXISTS scores (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            connection.commit()
+            self._connection = connection
+            self._connection_pid = os.getpid()
+        return self._connection
+
+    def _remember(self, key: CacheKey, value: Any) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def get(self, key: CacheKey) -> Optional[Any]:
+        """Return the cached value or None; disk hits are promoted into memory"""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+
+            db = self._db()
+            if db is not None:
+                row = db.execute(
+                    "SELECT value FROM scores WHERE key = ?", (self._disk_key(key),)
+                ).fetchone()
+                if row is not None:
+                    value = json.loads(row[0])
+                    self._remember(key, value)
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return value
+
+            self.misses += 1
+            return None
+
+    def put(self, key: CacheKey, value: Any) -> None:
+        """Store a JSON-serialisable value in memory and, if configured, on disk"""
+        with self._lock:
+            self._remember(key, value)
+            db = self._db()
+            if db is not None:
+                db.execute(
+                    "INSERT OR REPLACE INTO scores (key, value) VALUES (?, ?)",
+                    (self._disk_key(key), json.dumps(value, default=str))
+                )
+                db.commit()
+
+    def put_many(self, items) -> None:
+        """Store several (key, value) pairs with a single disk commit"""
+        items = list(items)
+        with self._lock:
+            for key, value in items:
+                self._remember(key, value)
+            db = self._db()
+            if db is not None:
+                db.executemany(
+                    "INSERT OR REPLACE INTO scores (key, value) VALUES (?, ?)",
+                    [(self._disk_key(key), json.dumps(value, default=str)) for key, value in items]
+                )
+                db.commit()
+
+    def clear(self, persistent: bool = False) -> None:
+        """Drop the in-memory entries (and the disk store when persistent=True)"""
+        with self._lock:
+            self._entries.clear()
+            db = self._db() if persistent else None
+            if db is not None:
+                db.execute("DELETE FROM scores")
+                db.commit()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: CacheKey) -> bool:
+        return key in self._entries
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for monitoring cache effectiveness"""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'disk_hits': self.disk_hits,
+            'hit_ratio': self.hits / lookups if lookups else 0.0,
+            'persistent': self.db_path is not None
+        }
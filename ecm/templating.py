@@ -0,0 +1,85 @@
+"""
+Template rendering.
+One Jinja2 Environment for every generated HTML document: templates are
+compiled once per process (and cached as bytecode across processes), and
+documents are streamed to files or HTTP responses chunk by chunk instead of
+being assembled as one large string first.
+"""
+
+import os
+import threading
+from itertools import islice
+from pathlib import Path
+from typing import Any, Iterator, Optional, Union
+
+from jinja2 import BytecodeCache, Environment, FileSystemBytecodeCache, FileSystemLoader, StrictUndefined
+
+
+TEMPLATE_DIR = Path(__file__).parent / 'templates'
+# Template output pieces joined per streamed chunk; single pieces are a few
+# bytes each and handing them out one by one costs more than rendering them
+STREAM_BUFFER = 256
+
+_environment: Optional[Environment] = None
+_environment_lock = threading.Lock()
+
+
+def _label(key: str) -> str:
+    """'quality_assurance' -> 'Quality Assurance' (str.title, unlike Jinja's title filter)"""
+    return key.replace('_', ' ').title()
+
+
+def create_environment(bytecode_cache: Optional[BytecodeCache] = None) -> Environment:
+    """New environment with the ECM template settings, filters and tests"""
+    environment = Environment(
+        loader=FileSystemLoader(str(TEMPLATE_DIR)),
+        bytecode_cache=bytecode_cache,
+        # Missing data fails loudly, as the f-string builders did
+        undefined=StrictUndefined,
+        # Documents embed prepared HTML fragments and were never escaped
+        autoescape=False,
+        trim_blocks=True,
+        lstrip_blocks=True,
+        auto_reload=False
+    )
+    environment.tests['list'] = lambda value: isinstance(value, list)
+    environment.filters['label'] = _label
+    return environment
+
+
+def get_environment() -> Environment:
+    """Shared environment; ECM_TEMPLATE_CACHE_DIR overrides the bytecode cache directory"""
+    global _environment
+    if _environment is None:
+        with _environment_lock:
+            if _environment is None:
+                cache_dir = os.getenv('ECM_TEMPLATE_CACHE_DIR')
+                if cache_dir:
+                    Path(cache_dir).mkdir(parents=True, exist_ok=True)
+                _environment = create_environment(FileSystemBytecodeCache(cache_dir))
+    return _environment
+
+
+def stream_template(name: str, **context: Any) -> Iterator[str]:
+    """Render a template chunk by chunk (for files and streamed HTTP responses)"""
+    # Batched with islice rather than TemplateStream.enable_buffering, whose
+    # per-piece Python loop costs more than the rendering it batches
+    pieces = get_environment().get_template(name).generate(**context)
+    while True:
+        chunk = list(islice(pieces, STREAM_BUFFER))
+        if not chunk:
+            return
+        yield ''.join(chunk)
+
+
+def render_template(name: str, **context: Any) -> str:
+    """Render a template to a string"""
+    return get_environment().get_template(name).render(**context)
+
+
+def write_template(name: str, path: Union[str, Path], **context: Any) -> Path:
+    """Stream a rendered template straight into a file"""
+    path = Path(path)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.writelines(stream_template(name, **context))
+    return path
@@ -0,0 +1,200 @@
+"""
+Chrome trace event profiling.
+span() and @traced record nested complete ('X') events for the run or request
+that activated a Tracer; with no active tracer they cost one ContextVar lookup.
+The JSON written by tracing() opens in chrome://tracing, Perfetto and
+speedscope. With cProfile enabled, the outermost span of each thread is
+profiled: its hottest functions are attached to the span's args and all
+profiles are merged into <trace>.pstats for pstats/snakeviz.
+"""
+
+import argparse
+import cProfile
+import functools
+import json
+import os
+import pstats
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Union
+
+
+# Functions listed per profiled span, by cumulative time
+DEFAULT_TOP_FUNCTIONS = 25
+
+ArgsBuilder = Callable[..., Dict[str, Any]]
+
+_current: ContextVar[Optional['Tracer']] = ContextVar('ecm_tracer', default=None)
+
+
+def _function_label(key) -> str:
+    filename, line, function = key
+    return f"{function} ({Path(filename).name}:{line})" if line else function
+
+
+class Tracer:
+    """Collects span events of one run; thread-safe"""
+
+    def __init__(self, cprofile: bool = False, top_functions: int = DEFAULT_TOP_FUNCTIONS):
+        self.cprofile = cprofile
+        self.top_functions = top_functions
+        self.events: List[Dict[str, Any]] = []
+        self.pid = os.getpid()
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._threads: Dict[int, str] = {}
+        self._stats: Optional[pstats.Stats] = None
+
+    def _now(self) -> float:
+        """Microseconds since the tracer started"""
+        return (time.perf_counter() - self._origin) * 1e6
+
+    def _start_profiler(self) -> Optional[cProfile.Profile]:
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Another profiler already owns this thread
+            return None
+        return profiler
+
+    def _profile_args(self, profiler: cProfile.Profile) -> List[Dict[str, Any]]:
+        stats = pstats.Stats(profiler)
+        with self._lock:
+            if self._stats is None:
+                self._stats = pstats.Stats(profiler)
+            else:
+                self._stats.add(profiler)
+        hottest = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)
+        return [
+            {
+                'function': _function_label(key),
+                'calls': calls,
+                'own_s': round(own_time, 6),
+                'cumulative_s': round(cumulative_time, 6)
+            }
+            for key, (_, calls, own_time, cumulative_time, _) in hottest[:self.top_functions]
+        ]
+
+    @contextmanager
+    def span(self, name: str, category: str = 'ecm', args: Optional[Dict[str, Any]] = None) -> Iterator[None]:
+        depth = getattr(self._local, 'depth', 0)
+        profiler = self._start_profiler() if self.cprofile and depth == 0 else None
+        self._local.depth = depth + 1
+        start = self._now()
+        try:
+            yield
+        finally:
+            duration = self._now() - start
+            self._local.depth = depth
+            event = {
+                'name': name, 'cat': category, 'ph': 'X',
+                'ts': round(start, 3), 'dur': round(duration, 3),
+                'pid': self.pid, 'tid': threading.get_ident(),
+                'args': dict(args or {})
+            }
+            if profiler is not None:
+                profiler.disable()
+                event['args']['cprofile'] = self._profile_args(profiler)
+            with self._lock:
+                self._threads.setdefault(event['tid'], threading.current_thread().name)
+                self.events.append(event)
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            events = sorted(self.events, key=lambda event: event['ts'])
+            threads = dict(self._threads)
+        metadata = [
+            {'name': 'thread_name', 'ph': 'M', 'pid': self.pid, 'tid': tid, 'args': {'name': name}}
+            for tid, name in threads.items()
+        ]
+        return {'traceEvents': metadata + events, 'displayTimeUnit': 'ms'}
+
+    def to_json(self) -> bytes:
+        return json.dumps(self.to_dict(), ensure_ascii=False, default=str).encode('utf-8')
+
+    def write(self, path: Union[str, Path]) -> List[Path]:
+        """Write the trace (and merged .pstats when profiling); returns the written paths"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(self.to_json())
+        written = [path]
+        if self._stats is not None:
+            stats_path = path.with_suffix('.pstats')
+            self._stats.dump_stats(str(stats_path))
+            written.append(stats_path)
+        return written
+
+
+def active_tracer() -> Optional[Tracer]:
+    return _current.get()
+
+
+def activate(tracer: Optional[Tracer]):
+    """Make tracer current in this context; pass the returned token to deactivate()"""
+    return _current.set(tracer)
+
+
+def deactivate(token) -> None:
+    _current.reset(token)
+
+
+def span(name: str, category: str = 'ecm', **args: Any):
+    """Context manager recording a span when a tracer is active"""
+    tracer = _current.get()
+    if tracer is None:
+        return nullcontext()
+    return tracer.span(name, category, args)
+
+
+def traced(name: Optional[str] = None, category: str = 'ecm', args: Optional[ArgsBuilder] = None):
+    """Decorator recording every call as a span; args(*call_args) adds span arguments"""
+    def decorator(function):
+        span_name = name or function.__qualname__
+
+        @functools.wraps(function)
+        def wrapper(*call_args, **call_kwargs):
+            tracer = _current.get()
+            if tracer is None:
+                return function(*call_args, **call_kwargs)
+            span_args = args(*call_args, **call_kwargs) if args else None
+            with tracer.span(span_name, category, span_args):
+                return function(*call_args, **call_kwargs)
+        return wrapper
+    return decorator
+
+
+@contextmanager
+def tracing(path: Optional[Union[str, Path]], cprofile: bool = False, name: str = 'run') -> Iterator[Optional[Tracer]]:
+    """Trace everything inside the block into path; does nothing when path is None"""
+    if not path:
+        yield None
+        return
+    tracer = Tracer(cprofile=cprofile)
+    token = activate(tracer)
+    try:
+        with tracer.span(name, 'run'):
+            yield tracer
+    finally:
+        deactivate(token)
+        written = tracer.write(path)
+        print(f"📈 Profile trace: {', '.join(str(item) for item in written)} ({len(tracer.events)} spans)")
+
+
+def add_profile_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument('--profile-trace', metavar='OUT.json',
+                        help='Write a Chrome trace event file (chrome://tracing, Perfetto, speedscope)')
+    parser.add_argument('--profile-cprofile', action='store_true',
+                        help='With --profile-trace: attach cProfile stats to top-level spans and write OUT.pstats')
+
+
+def cli_tracing(description: Optional[str] = None, argv: Optional[Sequence[str]] = None, name: str = 'run'):
+    """tracing() configured from --profile-trace/--profile-cprofile, for scripts without other options"""
+    parser = argparse.ArgumentParser(description=description)
+    add_profile_arguments(parser)
+    args = parser.parse_args(argv)
+    return tracing(args.profile_trace, cprofile=args.profile_cprofile, name=name)
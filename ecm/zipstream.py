@@ -0,0 +1,45 @@
+"""
+Streaming ZIP archives.
+Entries are compressed as they arrive and handed out as byte chunks, so an
+HTTP response can start with the first file instead of waiting for a complete
+archive on disk. The sink is not seekable, which makes zipfile write each
+entry's sizes and CRC in a data descriptor after its data.
+"""
+
+import io
+import zipfile
+from typing import Iterable, Iterator, List, Tuple
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only, unseekable buffer drained after every entry"""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b''.join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def stream_zip(entries: Iterable[Tuple[str, bytes]],
+               compression: int = zipfile.ZIP_DEFLATED) -> Iterator[bytes]:
+    """ZIP archive of (name, data) entries, yielded chunk by chunk as entries arrive"""
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, 'w', compression) as archive:
+        for name, data in entries:
+            archive.writestr(name, data)
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+    # Central directory, written when the archive closes
+    yield sink.drain()
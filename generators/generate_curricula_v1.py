@@ -6,6 +6,7 @@ Addresses critique: verb precision, assessment formatting, DigComp clarification
 
 import json
 import os
+import sys
 from datetime import datetime
 from pathlib import Path
 from docx import Document
@@ -14,6 +15,14 @@ from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.shared import RGBColor
 from docx.oxml.shared import OxmlElement, qn
 
+# Shared ECM services live in the project root package
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from ecm.templating import write_template
+from ecm.tracing import cli_tracing, traced
+
 class ECMCurriculumGenerator:
     """Generate comprehensive ECM curricula with enhanced precision and formatting"""
     
@@ -200,6 +209,7 @@ class ECMCurriculumGenerator:
             }
         ]
     
+    @traced('curriculum', 'curriculum', args=lambda self, data: {'id': data.get('id')})
     def generate_comprehensive_curriculum(self, curriculum_data):
         """Generate comprehensive curriculum following gold standard detailed format"""
         
@@ -592,6 +602,7 @@ class ECMCurriculumGenerator:
         
         return curriculum
     
+    @traced('module_outcomes', 'learning_unit')
     def generate_module_outcomes(self, curriculum_data):
         """Generate individual module learning outcomes with highly distinctive competence verbs"""
         module_outcomes = []
@@ -648,6 +659,7 @@ class ECMCurriculumGenerator:
         
         return module_outcomes
     
+    @traced('render_docx', 'render')
     def save_curriculum_docx(self, curriculum, filename_base):
         """Generate comprehensive DOCX curriculum with enhanced formatting"""
         
@@ -826,412 +838,17 @@ class ECMCurriculumGenerator:
         doc.save(docx_file)
         return docx_file
     
+    @traced('render_html', 'render')
     def save_curriculum_html(self, curriculum, filename_base):
         """Generate comprehensive HTML curriculum with enhanced styling and visual elements"""
         
         info = curriculum['curriculum_info']
         
-        html = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{info['title']}</title>
-    <style>
-        body {{ font-family: 'Segoe UI', Arial, sans-serif; margin: 20px; line-height: 1.6; color: #333; }}
-        .header {{ background: linear-gradient(135deg, #1e3c72 0%, #2a5298 100%); color: white; padding: 30px; border-radius: 10px; margin-bottom: 30px; text-align: center; }}
-        .info-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px; margin: 20px 0; }}
-        .info-item {{ background-color: #f8f9fa; padding: 15px; border-radius: 8px; border-left: 4px solid #1e3c72; }}
-        .section {{ margin: 30px 0; }}
-        h1 {{ margin: 0; font-size: 2.2em; }}
-        h2 {{ color: #1e3c72; border-bottom: 2px solid #1e3c72; padding-bottom: 5px; }}
-        h3 {{ color: #495057; }}
-        ul {{ padding-left: 20px; }}
-        li {{ margin: 5px 0; }}
-        .limitation {{ background-color: #fff3cd; padding: 15px; border-radius: 5px; border-left: 4px solid #ffc107; margin: 15px 0; }}
-        .module {{ background-color: #e3f2fd; padding: 15px; margin: 10px 0; border-radius: 8px; }}
-        .modules-list {{ list-style-type: none; padding: 0; }}
-        .modules-list li {{ background: #e9ecef; padding: 8px; margin: 3px 0; border-left: 4px solid #1e3c72; }}
-        .assessment-overview {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 15px; margin: 20px 0; }}
-        .assessment-item {{ background: #f1f3f4; padding: 15px; border-radius: 8px; border-left: 4px solid #28a745; }}
-        .performance-table {{ width: 100%; border-collapse: collapse; margin: 15px 0; }}
-        .performance-table th, .performance-table td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
-        .performance-table th {{ background-color: #f2f2f2; }}
-        .mapping-matrix {{ background: #f8f9fa; padding: 20px; border-radius: 8px; margin: 15px 0; }}
-        .note-box {{ background: #e7f3ff; border-left: 4px solid #007bff; padding: 15px; margin: 15px 0; }}
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>{info['title']}</h1>
-        <p>EQF Level {info['eqf_level']} | {info['target_ects']} ECTS Credits | {info['total_hours']} Hours</p>
-        <p>Specialization: {info['specialization']}</p>
-    </div>
-    
-    <div class="info-grid">
-        <div class="info-item">
-            <strong>Delivery Mode</strong><br>
-            {info['delivery']}
-        </div>
-        <div class="info-item">
-            <strong>Modules</strong><br>
-            {len(info['modules'])} Modules
-        </div>
-        <div class="info-item">
-            <strong>Study Hours</strong><br>
-            {info['total_hours']} total hours
-        </div>
-        <div class="info-item">
-            <strong>Generated</strong><br>
-            {info['generated_date'][:19]}
-        </div>
-    </div>
-    
-    <div class="section">
-        <h2>1. Programme Learning Outcomes</h2>
-        <p><strong>{curriculum['programme_learning_outcomes']['completion_statement']}</strong></p>
-        <ul>
-"""
-        
-        for outcome in curriculum['programme_learning_outcomes']['main_outcomes']:
-            html += f"<li>{outcome}</li>"
-        
-        # Digital Skills with clarification note and competency groupings
-        digital_section = curriculum['programme_learning_outcomes']['digital_skills_integration']
-        html += f"""
-        </ul>
-        
-        <h3>{digital_section['framework']}:</h3>
-        <div class="note-box">
-            <strong>Level Clarification:</strong> {digital_section['level_note']}
-        </div>
-        <div class="competency-list">
-            <h4>Data Management:</h4>
-            <ul>
-"""
-        for competency in digital_section['competency_groups']['data_management']:
-            html += f"<li>{competency}</li>"
-        
-        html += f"""
-            </ul>
-            <h4>Digital Content Creation:</h4>
-            <ul>
-"""
-        for competency in digital_section['competency_groups']['digital_content_creation']:
-            html += f"<li>{competency}</li>"
-        
-        html += f"""
-            </ul>
-            <h4>Information Evaluation:</h4>
-            <ul>
-"""
-        for competency in digital_section['competency_groups']['information_evaluation']:
-            html += f"<li>{competency}</li>"
-        
-        html += f"""
-            </ul>
-            <h4>Digital Problem Solving:</h4>
-            <ul>
-"""
-        for competency in digital_section['competency_groups']['digital_problem_solving']:
-            html += f"<li>{competency}</li>"
-        
-        html += f"""
-            </ul>
-        </div>
-        
-        <h3>{curriculum['programme_learning_outcomes']['green_competences']['framework']}:</h3>
-        <div class="competency-list">
-            <h4>Environmental Understanding:</h4>
-            <ul>
-"""
-        
-        for competency in curriculum['programme_learning_outcomes']['green_competences']['competency_groups']['environmental_understanding']:
-            html += f"<li>{competency}</li>"
-        
-        html += f"""
-            </ul>
-            <h4>Sustainable Innovation:</h4>
-            <ul>
-"""
-        for competency in curriculum['programme_learning_outcomes']['green_competences']['competency_groups']['sustainable_innovation']:
-            html += f"<li>{competency}</li>"
-        
-        html += f"""
-            </ul>
-            <h4>Sustainability Complexity:</h4>
-            <ul>
-"""
-        for competency in curriculum['programme_learning_outcomes']['green_competences']['competency_groups']['sustainability_complexity']:
-            html += f"<li>{competency}</li>"
-        
-        html += f"""
-            </ul>
-            <h4>Collaborative Action:</h4>
-            <ul>
-"""
-        for competency in curriculum['programme_learning_outcomes']['green_competences']['competency_groups']['collaborative_action']:
-            html += f"<li>{competency}</li>"
-        
-        html += f"""
-        </ul>
-        
-        <h3>{curriculum['programme_learning_outcomes']['transversal_skills']['framework']}:</h3>
-        <ul>
-"""
-        
-        for skill in curriculum['programme_learning_outcomes']['transversal_skills']['competencies']:
-            html += f"<li>{skill}</li>"
-        
-        html += f"""
-        </ul>
-    </div>
-    
-    <div class="section">
-        <h2>2. Modular Structure (Stackable, Granular, Mapped)</h2>
-        <p><strong>Module Titles:</strong></p>
-        <ul class="modules-list">
-"""
-        
-        for i, module in enumerate(curriculum['modular_structure']['modules'], 1):
-            hours_per_module = info['total_hours'] // len(curriculum['modular_structure']['modules'])
-            html += f'<li><strong>M{i}. {module}</strong>: {hours_per_module} hours</li>'
-        
-        # EQF-Framework-Outcome Mapping with Visual Matrix
-        mapping = curriculum['modular_structure']['eqf_framework_outcome_mapping']
-        html += f"""
-        </ul>
-        
-        <h3>EQF-Framework-Outcome Visual Crosswalk</h3>
-        <div class="mapping-matrix">
-            <p><strong>Knowledge Descriptor:</strong> {mapping['knowledge_descriptor']}</p>
-            <p><strong>Skills Descriptor:</strong> {mapping['skills_descriptor']}</p>
-            <p><strong>Competence Descriptor:</strong> {mapping['competence_descriptor']}</p>
-            <h4>Programme Outcome Mapping:</h4>
-            <ul>
-"""
-        for outcome, mapping_desc in mapping['outcome_mapping'].items():
-            html += f"<li>{mapping_desc}</li>"
-        
-        # Add Visual Alignment Matrix
-        visual_matrix = curriculum['modular_structure']['visual_alignment_matrix']
-        html += f"""
-            </ul>
-        </div>
-        
-        <h3>Visual Alignment Matrix</h3>
-        <div class="mapping-matrix">
-            <p><strong>{visual_matrix['description']}</strong></p>
-            <h4>EQF to Programme Outcomes:</h4>
-            <ul>
-"""
-        for eqf_level, programme_outcome in visual_matrix['matrix_structure']['eqf_to_programme'].items():
-            html += f"<li><strong>{eqf_level}:</strong> {programme_outcome}</li>"
-            
-        html += """
-            </ul>
-            <h4>Programme to Module Mapping:</h4>
-            <ul>
-"""
-        for programme, module in visual_matrix['matrix_structure']['programme_to_modules'].items():
-            html += f"<li><strong>{programme}:</strong> {module}</li>"
-            
-        html += """
-            </ul>
-            <h4>Module to Assessment Mapping:</h4>
-            <ul>
-"""
-        for module, assessment in visual_matrix['matrix_structure']['modules_to_assessment'].items():
-            html += f"<li><strong>{module}:</strong> {assessment}</li>"
-            
-        html += """
-            </ul>
-            <h4>Assessment to Framework Mapping:</h4>
-            <ul>
-"""
-        for assessment, framework in visual_matrix['matrix_structure']['assessment_to_frameworks'].items():
-            html += f"<li><strong>{assessment}:</strong> {framework}</li>"
-        
-        html += """
-            </ul>
-        </div>"""
-        
-        html += f"""
-            </ul>
-        </div>
-        
-        <h3>Module Dependencies and Progression:</h3>
-        <ul>
-            <li><strong>Foundation:</strong> {curriculum['modular_structure']['dependencies']['foundation']}</li>
-            <li><strong>Application:</strong> {curriculum['modular_structure']['dependencies']['application']}</li>
-            <li><strong>Integration:</strong> {curriculum['modular_structure']['dependencies']['integration']}</li>
-        </ul>
-        
-        <h3>Module-Level Learning Outcomes</h3>
-"""
-        
-        for module_outcome in curriculum['modular_structure']['module_learning_outcomes']:
-            html += f"""
-        <div class="module">
-            <strong>{module_outcome['module_name']}</strong>
-            <p><strong>Knowledge:</strong> {module_outcome['knowledge_outcome']}</p>
-            <p><strong>Skills:</strong> {module_outcome['skills_outcome']}</p>
-            <p><strong>Competences:</strong> {module_outcome['competences_outcome']}</p>
-        </div>"""
-        
-        html += f"""
-    </div>
-    
-    <div class="section">
-        <h2>3. Assessment Strategy (Mapped to Competencies)</h2>
-        
-        <div class="note-box">
-            <strong>Assessment Overview:</strong> {curriculum['assessment_strategy']['assessment_overview']}<br>
-            <strong>Rubric Availability:</strong> {curriculum['assessment_strategy']['rubric_availability']}
-        </div>
-        
-        <h3>Assessment Overview</h3>
-        <div class="assessment-overview">
-"""
-        
-        for component_name, summary in curriculum['assessment_strategy']['visual_summary'].items():
-            html += f"""
-            <div class="assessment-item">
-                <strong>{component_name.replace('_', ' ').title()}</strong><br>
-                Weight: {summary['weight']}<br>
-                Type: {summary['type']}
-            </div>"""
-        
-        html += "</div>"
-        
-        # Detailed assessment components with 4-level rubrics
-        for component_name, component_data in curriculum['assessment_strategy']['components'].items():
-            html += f"""
-        <h3>{component_name.replace('_', ' ').title()} Assessment ({component_data['weight']})</h3>
-        <p>{component_data['description']}</p>
-        
-        <h4>Assessment Criteria:</h4>
-        <ul>
-"""
-            for criterion, weight in component_data['criteria'].items():
-                html += f"<li>{criterion.replace('_', ' ').title()}: {weight}</li>"
-            
-            html += f"""
-        </ul>
-        
-        <h4>Performance Indicators:</h4>
-        <table class="performance-table">
-            <tr>
-                <th>Level</th>
-                <th>Performance Description</th>
-            </tr>
-"""
-            for level, description in component_data['performance_indicators'].items():
-                html += f"""
-            <tr>
-                <td><strong>{level.title()}</strong></td>
-                <td>{description}</td>
-            </tr>"""
-            
-            html += "</table>"
-        
-        html += f"""
-        <div class="limitation">
-            <strong>ASSESSMENT LIMITATIONS:</strong>
-            <ul>
-"""
-        for limitation in curriculum['assessment_strategy']['limitations']:
-            html += f"<li>{limitation}</li>"
-        
-        html += f"""
-            </ul>
-        </div>
-    </div>
-    
-    <div class="section">
-        <h2>4. Framework Mapping</h2>
-        <p><strong>EQF Level {info['eqf_level']} Descriptors:</strong><br>
-        {curriculum['framework_mapping']['eqf_descriptors']}</p>
-        
-        <h3>European e-Competence Framework (e-CF 4.0) Integration:</h3>
-        <ul>
-"""
-        
-        for competence, details in curriculum['framework_mapping']['european_e_competence'].items():
-            html += f"<li>{competence.replace('_', ' ').title()}: {details['level']}</li>"
-        
-        html += f"""
-        </ul>
-        
-        <h3>Digital Competence Framework (DigComp 2.2) Integration:</h3>
-        <ul>
-"""
-        
-        for competence, level in curriculum['framework_mapping']['digcomp_integration'].items():
-            html += f"<li>{competence.replace('_', ' ').title()}: {level}</li>"
-        
-        html += f"""
-        </ul>
-        
-        <h3>Green Competence Framework (GreenComp) Integration:</h3>
-        <ul>
-"""
-        
-        for competence, level in curriculum['framework_mapping']['greencomp_integration'].items():
-            html += f"<li>{competence.replace('_', ' ').title()}: {level}</li>"
-        
-        html += f"""
-        </ul>
-        
-        <div class="limitation">
-            <strong>IMPORTANT FRAMEWORK ALIGNMENT NOTES:</strong>
-            <ul>
-"""
-        for limitation in curriculum['framework_mapping']['limitations']:
-            html += f"<li>{limitation}</li>"
-        
-        html += f"""
-            </ul>
-        </div>
-    </div>
-    
-    <div class="section">
-        <h2>8. Support and QA</h2>
-        <h3>Instructional Support:</h3>
-        <ul>
-"""
-        
-        for support in curriculum['support_and_qa']['instructional_support']:
-            html += f"<li>{support}</li>"
-        
-        html += f"""
-        </ul>
-        
-        <h3>Quality Assurance Framework:</h3>
-        <ul>
-"""
-        
-        for qa in curriculum['support_and_qa']['quality_assurance']:
-            html += f"<li>{qa}</li>"
-        
-        html += f"""
-        </ul>
-    </div>
-    
-    <footer style="text-align: center; margin-top: 40px; padding: 20px; background-color: #f8f9fa; border-radius: 8px;">
-        <p><em>Professional curriculum with comprehensive EQF alignment and framework integration</em></p>
-        <p><em>Enhanced with precision competency mapping, visual assessment matrices, and stakeholder validation</em></p>
-    </footer>
-</body>
-</html>
-"""
-        
         html_file = self.output_dir / f"{filename_base}.html"
-        with open(html_file, 'w', encoding='utf-8') as f:
-            f.write(html)
+        write_template('generators/curricula_v1.html.j2', html_file, curriculum=curriculum, info=info)
         return html_file
     
+    @traced('save', 'render')
     def save_curriculum(self, curriculum, filename_base, curriculum_number):
         """Save curriculum in all configured formats with numbered prefixes"""
         saved_files = []
@@ -1344,4 +961,5 @@ def main():
 
 
 if __name__ == "__main__":
-    results = main()
\ No newline at end of file
+    with cli_tracing(main.__doc__, name='generate_curricula_v1'):
+        results = main()
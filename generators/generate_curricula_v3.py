@@ -8,6 +8,7 @@ NO DigComp mappings as per requirements
 
 import json
 import os
+import sys
 from datetime import datetime
 from pathlib import Path
 from docx import Document
@@ -16,6 +17,14 @@ from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.shared import RGBColor
 from docx.oxml.shared import OxmlElement, qn
 
+# Shared ECM services live in the project root package
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from ecm.templating import write_template
+from ecm.tracing import cli_tracing, traced
+
 class ECMCurriculumGenerator:
     """Generate comprehensive ECM curricula from JSON input with enhanced precision and professional formatting"""
     
@@ -324,6 +333,7 @@ class ECMCurriculumGenerator:
             }
         ]
     
+    @traced('curriculum', 'curriculum', args=lambda self, data: {'id': data.get('id')})
     def generate_comprehensive_curriculum(self, curriculum_data):
         """Generate comprehensive curriculum following gold standard detailed format with enhanced autonomy language"""
         
@@ -690,6 +700,7 @@ class ECMCurriculumGenerator:
         
         return curriculum
     
+    @traced('module_outcomes', 'learning_unit')
     def generate_module_outcomes(self, curriculum_data):
         """Generate individual module learning outcomes with highly distinctive competence verbs"""
         module_outcomes = []
@@ -746,6 +757,7 @@ class ECMCurriculumGenerator:
         
         return module_outcomes
     
+    @traced('render_docx', 'render')
     def save_curriculum_docx(self, curriculum, filename_base):
         """Generate comprehensive DOCX curriculum with enhanced formatting"""
         
@@ -814,152 +826,17 @@ class ECMCurriculumGenerator:
         doc.save(docx_file)
         return docx_file
     
+    @traced('render_html', 'render')
     def save_curriculum_html(self, curriculum, filename_base):
         """Generate comprehensive HTML curriculum with enhanced styling"""
         
         info = curriculum['curriculum_info']
         
-        html = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{info['title']}</title>
-    <style>
-        body {{ font-family: 'Segoe UI', Arial, sans-serif; margin: 20px; line-height: 1.6; color: #333; }}
-        .header {{ background: linear-gradient(135deg, #1e3c72 0%, #2a5298 100%); color: white; padding: 30px; border-radius: 10px; margin-bottom: 30px; text-align: center; }}
-        .info-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px; margin: 20px 0; }}
-        .info-item {{ background-color: #f8f9fa; padding: 15px; border-radius: 8px; border-left: 4px solid #1e3c72; }}
-        .section {{ margin: 30px 0; }}
-        h1 {{ margin: 0; font-size: 2.2em; }}
-        h2 {{ color: #1e3c72; border-bottom: 2px solid #1e3c72; padding-bottom: 5px; }}
-        h3 {{ color: #495057; }}
-        ul {{ padding-left: 20px; }}
-        li {{ margin: 5px 0; }}
-        .limitation {{ background-color: #fff3cd; padding: 15px; border-radius: 5px; border-left: 4px solid #ffc107; margin: 15px 0; }}
-        .module {{ background-color: #e3f2fd; padding: 15px; margin: 10px 0; border-radius: 8px; }}
-        .note-box {{ background: #e7f3ff; border-left: 4px solid #007bff; padding: 15px; margin: 15px 0; }}
-        .pedagogical-arc {{ background: #f1f8e9; border-left: 4px solid #4caf50; padding: 15px; margin: 15px 0; font-weight: bold; }}
-        .competency-group {{ background: #f8f9fa; padding: 15px; margin: 10px 0; border-radius: 8px; border-left: 4px solid #28a745; }}
-        .source-info {{ background: #e8f4fd; border-left: 4px solid #17a2b8; padding: 10px; margin: 10px 0; font-style: italic; }}
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>{info['title']}</h1>
-        <p>EQF Level {info['eqf_level']} | {info['target_ects']} ECTS Credits | {info['total_hours']} Hours</p>
-        <p>Specialization: {info['specialization']}</p>
-    </div>
-    
-    <div class="info-grid">
-        <div class="info-item">
-            <strong>Delivery Mode</strong><br>
-            {info['delivery']}
-        </div>
-        <div class="info-item">
-            <strong>Pedagogical Arc</strong><br>
-            {info['pedagogical_arc']}
-        </div>
-        <div class="info-item">
-            <strong>Modules</strong><br>
-            {len(info['modules'])} Modules
-        </div>
-        <div class="info-item">
-            <strong>Study Hours</strong><br>
-            {info['total_hours']} total hours
-        </div>
-        <div class="info-item">
-            <strong>Generated</strong><br>
-            {info['generated_date'][:19]}
-        </div>
-    </div>
-    
-    {f'<div class="source-info"><strong>Source:</strong> {info["source_data"]}</div>' if 'source_data' in info else ''}
-    
-    <div class="pedagogical-arc">
-        <strong>Pedagogical Progression:</strong> {info['pedagogical_arc']}
-    </div>
-    
-    <div class="section">
-        <h2>Module Themes</h2>
-        <ol>
-"""
-        
-        for module in info['modules']:
-            html += f"            <li>{module}</li>\n"
-        
-        html += """
-        </ol>
-    </div>
-    
-    <div class="section">
-        <h2>Programme Learning Outcomes</h2>
-        <p><em>Upon successful completion, participants will be able to:</em></p>
-        <ol>
-"""
-        
-        for outcome in curriculum['programme_learning_outcomes']['main_outcomes']:
-            html += f"            <li>{outcome}</li>\n"
-        
-        # Add enhanced programme outcome if available
-        enhanced_outcome = curriculum['programme_learning_outcomes'].get('enhanced_programme_outcome')
-        if enhanced_outcome:
-            html += f"""
-        </ol>
-        <div class="note-box">
-            <strong>Enhanced Programme Outcome:</strong> {enhanced_outcome}
-        </div>
-        <ol start="{len(curriculum['programme_learning_outcomes']['main_outcomes']) + 1}">
-"""
-        
-        html += """
-        </ol>
-    </div>
-    
-    <div class="section">
-        <h2>Green Competencies Framework</h2>
-"""
-        
-        green_comp = curriculum['programme_learning_outcomes']['green_competences']
-        for group_name, competencies in green_comp['competency_groups'].items():
-            group_title = group_name.replace('_', ' ').title()
-            html += f"""
-        <div class="competency-group">
-            <h3>{group_title}</h3>
-            <ul>
-"""
-            for competency in competencies:
-                html += f"                <li>{competency}</li>\n"
-            html += "            </ul>\n        </div>\n"
-        
-        html += f"""
-    </div>
-    
-    <div class="section">
-        <h2>Assessment Strategy</h2>
-        <div class="note-box">
-            <strong>Assessment Overview:</strong> {curriculum['assessment_strategy']['assessment_overview']}
-        </div>
-        <div class="note-box">
-            <strong>Rubric Availability:</strong> {curriculum['assessment_strategy']['rubric_availability']}
-        </div>
-    </div>
-    
-    <footer style="text-align: center; margin-top: 40px; padding: 20px; background-color: #f8f9fa; border-radius: 8px;">
-        <p><em>Professional curriculum with comprehensive EQF alignment and framework integration</em></p>
-        <p><em>Enhanced with explicit module themes, refined autonomy language, and pedagogical progression</em></p>
-        <p><em>Generated from JSON input data with professional standards enhancement</em></p>
-    </footer>
-</body>
-</html>
-"""
-        
         html_file = self.output_dir / f"{filename_base}.html"
-        with open(html_file, 'w', encoding='utf-8') as f:
-            f.write(html)
+        write_template('generators/curricula_v3.html.j2', html_file, curriculum=curriculum, info=info)
         return html_file
     
+    @traced('save', 'render')
     def save_curriculum(self, curriculum, filename_base, curriculum_number):
         """Save curriculum in all configured formats with numbered prefixes"""
         saved_files = []
@@ -1079,4 +956,5 @@ def main():
 
 
 if __name__ == "__main__":
-    results = main()
+    with cli_tracing(main.__doc__, name='generate_curricula_v3'):
+        results = main()
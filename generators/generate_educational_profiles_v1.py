@@ -6,6 +6,7 @@ Addresses critique: EQF verb consistency, visual rubric formatting, expanded Gre
 
 import json
 import os
+import sys
 from datetime import datetime
 from pathlib import Path
 from docx import Document
@@ -13,6 +14,14 @@ from docx.shared import Inches, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.oxml.shared import OxmlElement, qn
 
+# Shared ECM services live in the project root package
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from ecm.templating import write_template
+from ecm.tracing import cli_tracing, traced
+
 class ECMProfilesGenerator:
     """Generate comprehensive educational profiles with enhanced EQF compliance and formatting"""
     
@@ -420,6 +429,7 @@ class ECMProfilesGenerator:
             }
         ]
     
+    @traced('profile', 'curriculum', args=lambda self, data: {'id': data.get('id')})
     def generate_comprehensive_profile(self, profile_data):
         """Generate comprehensive educational profile with enhanced EQF compliance"""
         
@@ -668,6 +678,7 @@ class ECMProfilesGenerator:
         
         return profile
     
+    @traced('render_docx', 'render')
     def save_profile_docx(self, profile, filename_base):
         """Generate comprehensive DOCX profile with enhanced visual formatting"""
         
@@ -747,227 +758,17 @@ class ECMProfilesGenerator:
         doc.save(docx_file)
         return docx_file
     
+    @traced('render_html', 'render')
     def save_profile_html(self, profile, filename_base):
         """Generate comprehensive HTML profile with enhanced visual formatting"""
         
         info = profile['profile_info']
         
-        html = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{info['title']}</title>
-    <style>
-        body {{ font-family: 'Segoe UI', Arial, sans-serif; margin: 20px; line-height: 1.6; color: #333; }}
-        .header {{ background: linear-gradient(135deg, #2c5aa0 0%, #1e3c72 100%); color: white; padding: 30px; border-radius: 10px; margin-bottom: 30px; text-align: center; }}
-        .info-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 15px; margin: 20px 0; }}
-        .info-item {{ background-color: #f8f9fa; padding: 15px; border-radius: 8px; border-left: 4px solid #2c5aa0; }}
-        .section {{ margin: 30px 0; }}
-        .unit-card {{ background: #f1f3f4; padding: 20px; margin: 15px 0; border-radius: 8px; border-left: 4px solid #28a745; }}
-        .rubric-container {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 15px; margin: 20px 0; }}
-        .rubric-level {{ padding: 15px; border-radius: 8px; margin: 5px 0; }}
-        .level-excellent {{ background-color: #d4edda; border-left: 4px solid #28a745; }}
-        .level-good {{ background-color: #d1ecf1; border-left: 4px solid #17a2b8; }}
-        .level-satisfactory {{ background-color: #fff3cd; border-left: 4px solid #ffc107; }}
-        .level-needs-improvement {{ background-color: #f8d7da; border-left: 4px solid #dc3545; }}
-        h1 {{ margin: 0; font-size: 2.2em; }}
-        h2 {{ color: #2c5aa0; border-bottom: 2px solid #2c5aa0; padding-bottom: 5px; }}
-        h3 {{ color: #495057; }}
-        .competency-list {{ background: #e3f2fd; padding: 15px; border-radius: 8px; margin: 10px 0; }}
-        .note-box {{ background: #e7f3ff; border-left: 4px solid #007bff; padding: 15px; margin: 15px 0; }}
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>{info['title']}</h1>
-        <p>EQF Level {info['eqf_level']} | {info['target_ects']} ECTS | {info['total_hours']} Hours</p>
-    </div>
-    
-    <div class="info-grid">
-        <div class="info-item">
-            <strong>Delivery Modes</strong><br>
-            {', '.join(info['delivery_modes'])}
-        </div>
-        <div class="info-item">
-            <strong>Target Sectors</strong><br>
-            {', '.join(info['target_sectors'])}
-        </div>
-        <div class="info-item">
-            <strong>Total Units</strong><br>
-            {profile['unit_breakdown']['total_units']} Units
-        </div>
-        <div class="info-item">
-            <strong>Generated</strong><br>
-            {info['generated_date'][:19]}
-        </div>
-    </div>
-    
-    <div class="section">
-        <h2>Programme Goal</h2>
-        <p><strong>Primary Objective:</strong> {profile['programme_goal']['primary_objective']}</p>
-        <p><strong>Learning Approach:</strong> {profile['programme_goal']['learning_approach']}</p>
-        <p><strong>Professional Context:</strong> {profile['programme_goal']['professional_context']}</p>
-    </div>
-    
-    <div class="section">
-        <h2>Complexity Level Description</h2>
-        <div class="note-box">
-            <strong>EQF Alignment:</strong> {profile['complexity_description']['eqf_alignment']}
-        </div>
-        <p><strong>Cognitive Demands:</strong> {profile['complexity_description']['cognitive_demands']}</p>
-        <p><strong>Operational Requirements:</strong> {profile['complexity_description']['operational_requirements']}</p>
-        <p><strong>Responsibility Scope:</strong> {profile['complexity_description']['responsibility_scope']}</p>
-    </div>
-    
-    <div class="section">
-        <h2>Unit Breakdown</h2>
-"""
-        
-        for i, unit in enumerate(profile['unit_breakdown']['units'], 1):
-            html += f"""
-        <div class="unit-card">
-            <h3>Unit {i}: {unit['name']} ({unit['ects']} ECTS)</h3>
-            <p><strong>Complexity:</strong> {unit['complexity']}</p>
-            <p><strong>Knowledge:</strong> {unit['knowledge']}</p>
-            <p><strong>Skills:</strong> {unit['skills']}</p>
-            <p><strong>Competences:</strong> {unit['competences']}</p>
-        </div>"""
-        
-        # Digital Competencies with competency groupings
-        digital = profile['digital_competencies']
-        html += f"""
-    </div>
-    
-    <div class="section">
-        <h2>Digital Competencies</h2>
-        <div class="note-box">
-            <strong>Framework:</strong> {digital['framework']}<br>
-            <strong>Level Clarification:</strong> {digital['level_clarification']}
-        </div>
-        <div class="competency-list">
-            <h4>Data Management:</h4>
-            <ul>
-"""
-        for competency in digital['competency_groups']['data_management']:
-            html += f"<li>{competency}</li>"
-        
-        html += f"""
-            </ul>
-            <h4>Digital Content Creation:</h4>
-            <ul>
-"""
-        for competency in digital['competency_groups']['digital_content_creation']:
-            html += f"<li>{competency}</li>"
-        
-        html += f"""
-            </ul>
-            <h4>Digital Collaboration:</h4>
-            <ul>
-"""
-        for competency in digital['competency_groups']['digital_collaboration']:
-            html += f"<li>{competency}</li>"
-        
-        html += f"""
-            </ul>
-            <h4>Digital Problem Solving:</h4>
-            <ul>
-"""
-        for competency in digital['competency_groups']['digital_problem_solving']:
-            html += f"<li>{competency}</li>"
-        
-        # Green Competencies with competency groupings
-        green = profile['green_competencies']
-        html += f"""
-        </ul>
-        </div>
-    </div>
-    
-    <div class="section">
-        <h2>Green Competencies</h2>
-        <div class="note-box">
-            <strong>Framework:</strong> {green['framework']}
-        </div>
-        <div class="competency-list">
-            <h4>Environmental Understanding:</h4>
-            <ul>
-"""
-        for competency in green['competency_groups']['environmental_understanding']:
-            html += f"<li>{competency}</li>"
-        
-        html += f"""
-            </ul>
-            <h4>Sustainable Innovation:</h4>
-            <ul>
-"""
-        for competency in green['competency_groups']['sustainable_innovation']:
-            html += f"<li>{competency}</li>"
-        
-        html += f"""
-            </ul>
-            <h4>Sustainability Complexity:</h4>
-            <ul>
-"""
-        for competency in green['competency_groups']['sustainability_complexity']:
-            html += f"<li>{competency}</li>"
-        
-        html += f"""
-            </ul>
-            <h4>Collaborative Action:</h4>
-            <ul>
-"""
-        for competency in green['competency_groups']['collaborative_action']:
-            html += f"<li>{competency}</li>"
-        
-        # Assessment Framework with visual rubrics
-        assessment = profile['assessment_framework']
-        html += f"""
-            </ul>
-        </div>
-    </div>
-    
-    <div class="section">
-        <h2>Assessment Framework</h2>
-        <div class="note-box">
-            <strong>Assessment Philosophy:</strong> {assessment['assessment_philosophy']}
-        </div>
-"""
-        
-        for component_name, component in assessment['components'].items():
-            html += f"""
-        <h3>{component_name.replace('_', ' ').title()} ({component['weight']})</h3>
-        <p>{component['description']}</p>
-        
-        <div class="rubric-container">
-"""
-            for level, details in component['rubric_levels'].items():
-                level_class = f"level-{level.replace(' ', '-')}"
-                html += f"""
-            <div class="rubric-level {level_class}">
-                <strong>{level.title()}</strong><br>
-                <strong>Criteria:</strong> {details['criteria']}<br>
-                <strong>Indicators:</strong> {details['indicators']}
-            </div>"""
-            
-            html += "</div>"
-        
-        html += f"""
-    </div>
-    
-    <footer style="text-align: center; margin-top: 40px; padding: 20px; background-color: #f8f9fa; border-radius: 8px;">
-        <p><em>Professional educational profile with comprehensive EQF alignment and CEN/TS 17699 compliance</em></p>
-        <p><em>Enhanced with visual assessment rubrics, expanded framework coverage, and stakeholder validation</em></p>
-    </footer>
-</body>
-</html>
-"""
-        
         html_file = self.output_dir / f"{filename_base}.html"
-        with open(html_file, 'w', encoding='utf-8') as f:
-            f.write(html)
+        write_template('generators/profiles_v1.html.j2', html_file, profile=profile, info=info)
         return html_file
     
+    @traced('save', 'render')
     def save_profile(self, profile, filename_base, profile_number):
         """Save profile in all configured formats with numbered prefixes"""
         saved_files = []
@@ -1083,4 +884,5 @@ def main():
 
 
 if __name__ == "__main__":
-    results = main()
\ No newline at end of file
+    with cli_tracing(main.__doc__, name='generate_educational_profiles_v1'):
+        results = main()
@@ -7,6 +7,7 @@ NO DigComp mappings as per requirements
 
 import json
 import os
+import sys
 from datetime import datetime
 from pathlib import Path
 from docx import Document
@@ -14,6 +15,14 @@ from docx.shared import Inches, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.oxml.shared import OxmlElement, qn
 
+# Shared ECM services live in the project root package
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from ecm.templating import write_template
+from ecm.tracing import cli_tracing, traced
+
 class ECMProfilesGenerator:
     """Generate comprehensive educational profiles from JSON input with enhanced professional standards"""
     
@@ -268,6 +277,7 @@ class ECMProfilesGenerator:
             
         return delivery_modes
     
+    @traced('profile', 'curriculum', args=lambda self, data: {'id': data.get('id')})
     def generate_comprehensive_profile(self, profile_data):
         """Generate comprehensive educational profile with enhanced professional standards"""
         
@@ -540,6 +550,7 @@ class ECMProfilesGenerator:
         
         return profile
     
+    @traced('render_docx', 'render')
     def save_profile_docx(self, profile, filename_base):
         """Generate comprehensive DOCX profile with enhanced visual formatting"""
         
@@ -585,120 +596,17 @@ class ECMProfilesGenerator:
         doc.save(docx_file)
         return docx_file
     
+    @traced('render_html', 'render')
     def save_profile_html(self, profile, filename_base):
         """Generate comprehensive HTML profile with enhanced visual formatting and assessment rubrics"""
         
         info = profile['profile_info']
         
-        html = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{info['title']}</title>
-    <style>
-        body {{ font-family: 'Segoe UI', Arial, sans-serif; margin: 20px; line-height: 1.6; color: #333; }}
-        .header {{ background: linear-gradient(135deg, #2c5aa0 0%, #1e3c72 100%); color: white; padding: 30px; border-radius: 10px; margin-bottom: 30px; text-align: center; }}
-        .info-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 15px; margin: 20px 0; }}
-        .info-item {{ background-color: #f8f9fa; padding: 15px; border-radius: 8px; border-left: 4px solid #2c5aa0; }}
-        .section {{ margin: 30px 0; }}
-        .unit-card {{ background: #f1f3f4; padding: 20px; margin: 15px 0; border-radius: 8px; border-left: 4px solid #28a745; }}
-        .rubric-container {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 15px; margin: 20px 0; }}
-        .rubric-level {{ padding: 15px; border-radius: 8px; margin: 5px 0; }}
-        .level-excellent {{ background-color: #d4edda; border-left: 4px solid #28a745; }}
-        .level-good {{ background-color: #d1ecf1; border-left: 4px solid #17a2b8; }}
-        .level-satisfactory {{ background-color: #fff3cd; border-left: 4px solid #ffc107; }}
-        .level-needs-improvement {{ background-color: #f8d7da; border-left: 4px solid #dc3545; }}
-        h1 {{ margin: 0; font-size: 2.2em; }}
-        h2 {{ color: #2c5aa0; border-bottom: 2px solid #2c5aa0; padding-bottom: 5px; }}
-        h3 {{ color: #495057; }}
-        .competency-list {{ background: #e3f2fd; padding: 15px; border-radius: 8px; margin: 10px 0; }}
-        .note-box {{ background: #e7f3ff; border-left: 4px solid #007bff; padding: 15px; margin: 15px 0; }}
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>{info['title']}</h1>
-        <p>EQF Level {info['eqf_level']} | {info['target_ects']} ECTS | {info['total_hours']} Hours</p>
-    </div>
-    
-    <div class="section">
-        <h2>Unit Learning Outcomes</h2>
-        <div class="note-box">
-            <strong>Units Summary:</strong> {profile['unit_breakdown']['units_summary']}
-        </div>
-"""
-        
-        # Add unit outcomes
-        for unit in profile['unit_learning_outcomes']['units']:
-            html += f"""
-        <div class="unit-card">
-            <h3>{unit['unit_name']} ({unit['unit_ects']} ECTS)</h3>
-            <p><strong>Complexity:</strong> {unit['complexity_level']}</p>
-            <p><strong>Knowledge:</strong> {unit['knowledge_outcome']}</p>
-            <p><strong>Skills:</strong> {unit['skills_outcome']}</p>
-            <p><strong>Competences:</strong> {unit['competence_outcome']}</p>
-        </div>
-"""
-        
-        # Add visual assessment rubric
-        assessment = profile['assessment_framework']
-        html += f"""
-    </div>
-    
-    <div class="section">
-        <h2>Visual Assessment Rubric</h2>
-        <div class="note-box">
-            <strong>Assessment Philosophy:</strong> {assessment['assessment_philosophy']}
-        </div>
-        <div class="rubric-container">
-"""
-        
-        for level, details in assessment['visual_assessment_criteria']['performance_levels'].items():
-            html += f"""
-            <div class="rubric-level level-{level.replace('_', '-')}">
-                <h4>{level.replace('_', ' ').title()}</h4>
-                <p><strong>{details['descriptor']}</strong></p>
-                <ul>
-"""
-            for char in details['characteristics']:
-                html += f"                    <li>{char}</li>\n"
-            html += "                </ul>\n            </div>\n"
-        
-        html += f"""
-        </div>
-    </div>
-    
-    <div class="section">
-        <h2>Recognition of Prior Learning</h2>
-        <div class="note-box">
-            <strong>RPL Pathway:</strong> {profile['recognition_of_prior_learning']['rpl_pathway']}
-        </div>
-        <p><strong>Maximum Recognition:</strong> {profile['recognition_of_prior_learning']['recognition_limits']['maximum_credit']}</p>
-    </div>
-    
-    <div class="section">
-        <h2>Quality Assurance</h2>
-        <div class="note-box">
-            <strong>Update Cycles:</strong> {profile['validation_framework']['quality_assurance']['update_cycles']}
-        </div>
-    </div>
-    
-    <footer style="text-align: center; margin-top: 40px; padding: 20px; background-color: #f8f9fa; border-radius: 8px;">
-        <p><em>Professional educational profile with comprehensive EQF alignment and enhanced standards</em></p>
-        <p><em>Enhanced with explicit unit outcomes, visual assessment rubrics, and comprehensive stakeholder validation</em></p>
-        <p><em>Generated from educational_profiles.json input data</em></p>
-    </footer>
-</body>
-</html>
-"""
-        
         html_file = self.output_dir / f"{filename_base}.html"
-        with open(html_file, 'w', encoding='utf-8') as f:
-            f.write(html)
+        write_template('generators/profiles_v3.html.j2', html_file, profile=profile, info=info)
         return html_file
     
+    @traced('save', 'render')
     def save_profile(self, profile, filename_base, profile_number):
         """Save profile in all configured formats with numbered prefixes"""
         saved_files = []
@@ -819,4 +727,5 @@ def main():
 
 
 if __name__ == "__main__":
-    results = main()
+    with cli_tracing(main.__doc__, name='generate_educational_profiles_v3'):
+        results = main()
@@ -4,14 +4,17 @@ Educational Curriculum Modeller (ECM) - Web Interface
 Complete Flask application for localhost testing and deployment
 """
 
-from flask import Flask, render_template, request, jsonify, send_file, flash, redirect, url_for, abort
+from flask import Flask, Response, g, render_template, request, jsonify, send_file, send_from_directory, flash, redirect, url_for, abort, stream_with_context
 import os
 import sys
-import json
 import traceback
+import functools
+import gc
+import threading
 from pathlib import Path
-import tempfile
 import zipfile
+import mimetypes
+from io import BytesIO
 from datetime import datetime
 import logging
 
@@ -23,11 +26,132 @@ sys.path.insert(0, str(PROJECT_ROOT / "analysis" / "scripts"))
 # Import ECM components
 try:
     from generate_curricula_toggle import EnhancedD4SCurriculumGenerator
+    from ecm.zipstream import stream_zip
+    from ecm.jobs import JobResult, JobRunner, broker_from_environment
+    from ecm.response_cache import CachedResponse, ResponseCache
     ECM_AVAILABLE = True
 except ImportError as e:
     print(f"Warning: ECM components not available: {e}")
     ECM_AVAILABLE = False
 
+from ecm.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, REGISTRY, register_cache
+from ecm.tracing import Tracer, activate, active_tracer, deactivate
+
+# One generator per process: catalog, roles and curricula specs are only read
+# after construction, so requests and job threads can share it
+_shared_generator = None
+_shared_generator_lock = threading.Lock()
+
+def shared_generator():
+    """Process-wide curriculum generator, built on first use"""
+    global _shared_generator
+    if _shared_generator is None:
+        with _shared_generator_lock:
+            if _shared_generator is None:
+                _shared_generator = EnhancedD4SCurriculumGenerator()
+    return _shared_generator
+
+def preload_generator():
+    """Build the shared generator before gunicorn forks its workers (--preload).
+    gc.freeze() moves it to the permanent generation, so collections in the
+    workers do not touch its objects and the pages stay shared copy-on-write."""
+    generator = shared_generator()
+    gc.freeze()
+    return generator
+
+def find_curriculum_spec(generator, role_id, eqf_level, ects):
+    """Standard curriculum specification matching the request, or a custom one"""
+    for spec in generator.curricula_specs:
+        if (spec['role_id'] == role_id and 
+            spec['eqf_level'] == eqf_level and 
+            abs(spec['ects'] - ects) < 0.1):
+            return spec
+    
+    # Create custom curriculum specification
+    return {
+        'number': '99',
+        'id': f'{role_id}_{eqf_level}_Custom',
+        'title': f'Custom {role_id} Programme',
+        'role_id': role_id,
+        'eqf_level': eqf_level,
+        'ects': ects,
+        'description': f'Custom curriculum for {role_id} at EQF {eqf_level}',
+        'target_audience': 'Custom professional development programme',
+        'filename': f'custom_{role_id}_{eqf_level}_{int(ects*10)}',
+        'pathway_position': f'Custom Level {eqf_level} Professional Development'
+    }
+
+def package_artifacts(artifacts, zip_filename):
+    """(filename, data) of a single artifact, or of a ZIP holding all of them"""
+    if len(artifacts) == 1:
+        return artifacts[0]
+    
+    zip_buffer = BytesIO()
+    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zipf:
+        for filename, data in artifacts:
+            zipf.writestr(filename, data)
+    return zip_filename, zip_buffer.getvalue()
+
+def _form_flag(params, name):
+    """Checkbox value from a submitted form or JSON body"""
+    return params.get(name) in ('on', 'true', '1', True)
+
+def _requested_formats(params):
+    return [fmt for fmt in ('json', 'html', 'docx') if _form_flag(params, f'output_{fmt}')]
+
+def _content_type(filename):
+    return mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+
+def _job_result(filename, data):
+    return JobResult(data, _content_type(filename), filename)
+
+# Rendered downloads, keyed by request parameters and the catalog content hash
+response_cache = ResponseCache() if ECM_AVAILABLE else None
+
+def curriculum_download(role_id, eqf_level, ects, formats):
+    """Curriculum rendered in the requested formats, served from the response cache when possible"""
+    generator = shared_generator()
+    
+    def build():
+        spec = find_curriculum_spec(generator, role_id, eqf_level, ects)
+        curriculum = generator.generate_curriculum(spec)
+        renderers = {'json': generator.render_json, 'html': generator.render_html, 'docx': generator.render_docx}
+        artifacts = [(f"{spec['filename']}.{fmt}", renderers[fmt](curriculum)) for fmt in formats]
+        
+        # Single file is sent directly, several as a ZIP
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M')
+        filename, data = package_artifacts(artifacts, f"ECM_{role_id}_EQF{eqf_level}_{ects}ECTS_{timestamp}.zip")
+        return CachedResponse.build(data, _content_type(filename), filename)
+    
+    # A profiled request measures generation, not a cache hit
+    if active_tracer() is not None:
+        return build()
+    
+    params = {'role': role_id, 'eqf_level': eqf_level, 'ects': ects, 'formats': formats}
+    return response_cache.get_or_build('generate_curriculum', params, generator.catalog_snapshot.version, build)
+
+def run_curriculum_job(params, state):
+    """Background variant of /generate_curriculum"""
+    formats = _requested_formats(params)
+    if not formats:
+        raise ValueError('Please select at least one output format')
+    
+    entry = curriculum_download(params.get('role'), int(params.get('eqf_level', 6)),
+                                float(params.get('ects', 5.0)), formats)
+    return JobResult(entry.data, entry.content_type, entry.filename)
+
+def run_all_curricula_job(params, state):
+    """Background variant of /generate_all_curricula"""
+    generator = shared_generator()
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M')
+    data = b''.join(stream_zip(generator.iter_curricula_artifacts()))
+    return _job_result(f"ECM_All_Curricula_{timestamp}.zip", data)
+
+JOB_HANDLERS = {
+    'curriculum': run_curriculum_job,
+    'all_curricula': run_all_curricula_job
+}
+
 def create_app(config_name='development'):
     """Create and configure Flask application"""
     app = Flask(__name__)
@@ -38,14 +162,96 @@ def create_app(config_name='development'):
     app.config['PROJECT_ROOT'] = PROJECT_ROOT
     app.config['DEBUG'] = True if config_name == 'development' else False
     
+    app.config['JOB_WORKERS'] = int(os.environ.get('JOB_WORKERS', 2))
+    # Tests keep jobs in process; otherwise broker_from_environment picks the broker
+    app.config['JOB_BROKER_URL'] = 'memory://' if config_name == 'testing' else None
+    app.config['PRELOAD_GENERATOR'] = config_name == 'production'
+    app.config['ALLOW_PROFILING'] = config_name == 'development' or os.environ.get('ECM_ALLOW_PROFILING') == '1'
+    app.config['TRACE_DIR'] = PROJECT_ROOT / "output" / "traces"
+    
     # Ensure output directories exist
     output_dir = PROJECT_ROOT / "output" / "curricula"
     output_dir.mkdir(parents=True, exist_ok=True)
     
+    # Background jobs: Redis when configured, otherwise SQLite shared by all workers on this host
+    job_runner = None
+    if ECM_AVAILABLE:
+        job_broker = broker_from_environment(PROJECT_ROOT / "output" / "jobs" / "jobs.sqlite3", namespace='app',
+                                             url=app.config['JOB_BROKER_URL'])
+        job_runner = JobRunner(job_broker, JOB_HANDLERS, workers=app.config['JOB_WORKERS'])
+    app.config['JOB_RUNNER'] = job_runner
+    
+    # In production the app is created in the gunicorn master, so workers inherit a warm generator
+    if ECM_AVAILABLE and app.config['PRELOAD_GENERATOR']:
+        preload_generator()
+    
+    # CACHE_TYPE selects the backend: SimpleCache, FileSystemCache (CACHE_DIR) or RedisCache
+    if response_cache is not None:
+        response_cache.init_app(app)
+    
+    # Sampled when /metrics is scraped
+    if response_cache is not None:
+        register_cache('response', response_cache.stats)
+    if job_runner is not None:
+        REGISTRY.gauge('ecm_job_queue_depth', 'Generation jobs waiting for a worker', job_runner.broker.queue_depth)
+    
     # Setup logging
     logging.basicConfig(level=logging.INFO)
     logger = logging.getLogger(__name__)
     
+    # Per-request profiling: "X-ECM-Profile: 1" records spans, "X-ECM-Profile: cprofile" adds cProfile.
+    # The trace is written to TRACE_DIR and served from the URL in X-ECM-Profile-Trace.
+    @app.before_request
+    def start_request_trace():
+        mode = request.headers.get('X-ECM-Profile')
+        if not mode or not app.config['ALLOW_PROFILING']:
+            return
+        endpoint = request.endpoint or 'request'
+        name = f"{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}_{endpoint}.json"
+        tracer = Tracer(cprofile=mode.strip().lower() == 'cprofile')
+        token = activate(tracer)
+        span_context = tracer.span(endpoint, 'request', {'method': request.method, 'path': request.path})
+        span_context.__enter__()
+        g.request_trace = (name, tracer, token, span_context)
+    
+    def finish_request_trace(trace):
+        """Close the request span and write the trace"""
+        name, tracer, token, span_context = trace
+        span_context.__exit__(None, None, None)
+        deactivate(token)
+        try:
+            tracer.write(app.config['TRACE_DIR'] / name)
+        except OSError as e:
+            logger.warning(f"Could not write profile trace {name}: {e}")
+    
+    @app.after_request
+    def add_trace_header(response):
+        if 'request_trace' in g:
+            response.headers['X-ECM-Profile-Trace'] = url_for('profile_trace', name=g.request_trace[0])
+            # A streamed body is generated after teardown (which may run twice under
+            # stream_with_context); keep tracing until the server closes the response
+            if response.is_streamed:
+                response.call_on_close(functools.partial(finish_request_trace, g.pop('request_trace')))
+        return response
+    
+    @app.teardown_request
+    def write_request_trace(error=None):
+        trace = g.pop('request_trace', None)
+        if trace is not None:
+            finish_request_trace(trace)
+    
+    @app.teardown_request
+    def flush_metrics(error=None):
+        # With ECM_METRICS_DIR set, /metrics on any worker includes this request's stages
+        REGISTRY.flush()
+    
+    @app.route('/profiles/<name>')
+    def profile_trace(name):
+        """Chrome trace (or .pstats) written for a profiled request"""
+        if not app.config['ALLOW_PROFILING']:
+            abort(404)
+        return send_from_directory(app.config['TRACE_DIR'], name)
+    
     @app.route('/')
     def index():
         """Home page"""
@@ -109,108 +315,17 @@ def create_app(config_name='development'):
             role_id = request.form.get('role')
             eqf_level = int(request.form.get('eqf_level', 6))
             ects = float(request.form.get('ects', 5.0))
-            visual_mapping = request.form.get('visual_mapping') == 'on'
             
             # Output format selection
-            output_json = request.form.get('output_json') == 'on'
-            output_html = request.form.get('output_html') == 'on'
-            output_docx = request.form.get('output_docx') == 'on'
-            
-            if not any([output_json, output_html, output_docx]):
+            formats = _requested_formats(request.form)
+            if not formats:
                 flash('Please select at least one output format', 'warning')
                 return redirect(url_for('generator'))
             
-            # Initialize enhanced curriculum generator
-            generator = EnhancedD4SCurriculumGenerator(
-                visual_mapping=visual_mapping
-            )
-            
-            # Find matching curriculum specification
-            matching_spec = None
-            for spec in generator.curricula_specs:
-                if (spec['role_id'] == role_id and 
-                    spec['eqf_level'] == eqf_level and 
-                    abs(spec['ects'] - ects) < 0.1):
-                    matching_spec = spec
-                    break
-            
-            if not matching_spec:
-                # Create custom curriculum specification
-                matching_spec = {
-                    'number': '99',
-                    'id': f'{role_id}_{eqf_level}_Custom',
-                    'title': f'Custom {role_id} Programme',
-                    'role_id': role_id,
-                    'eqf_level': eqf_level,
-                    'ects': ects,
-                    'description': f'Custom curriculum for {role_id} at EQF {eqf_level}',
-                    'target_audience': 'Custom professional development programme',
-                    'filename': f'custom_{role_id}_{eqf_level}_{int(ects*10)}',
-                    'pathway_position': f'Custom Level {eqf_level} Professional Development'
-                }
-            
-            # Generate curriculum
-            logger.info(f"Generating curriculum: {matching_spec['id']}")
-            curriculum = generator.generate_curriculum(matching_spec)
-            
-            # Create temporary directory for outputs
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-                
-                # Generate files
-                generated_files = []
-                
-                if output_json:
-                    json_path = temp_path / f"{matching_spec['filename']}.json"
-                    with open(json_path, 'w', encoding='utf-8') as f:
-                        json.dump(curriculum, f, indent=2, ensure_ascii=False)
-                    generated_files.append(json_path)
-                
-                if output_html:
-                    html_path = generator.save_curriculum_html(curriculum, matching_spec['filename'])
-                    # Copy to temp directory
-                    temp_html_path = temp_path / f"{matching_spec['filename']}.html"
-                    temp_html_path.write_text(html_path.read_text(encoding='utf-8'), encoding='utf-8')
-                    generated_files.append(temp_html_path)
-                
-                if output_docx:
-                    try:
-                        docx_path = generator.save_curriculum_docx(curriculum, matching_spec['filename'])
-                        # Copy to temp directory
-                        temp_docx_path = temp_path / f"{matching_spec['filename']}.docx"
-                        temp_docx_path.write_bytes(docx_path.read_bytes())
-                        generated_files.append(temp_docx_path)
-                    except Exception as e:
-                        logger.warning(f"DOCX generation failed: {e}")
-                        flash('DOCX generation failed. Install python-docx: pip install python-docx', 'warning')
-                
-                if not generated_files:
-                    flash('No files generated', 'error')
-                    return redirect(url_for('generator'))
-                
-                # If single file, send directly
-                if len(generated_files) == 1:
-                    file_path = generated_files[0]
-                    return send_file(
-                        file_path,
-                        as_attachment=True,
-                        download_name=file_path.name
-                    )
-                
-                # If multiple files, create ZIP
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M')
-                zip_filename = f"ECM_{role_id}_EQF{eqf_level}_{ects}ECTS_{timestamp}.zip"
-                zip_path = temp_path / zip_filename
-                
-                with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                    for file_path in generated_files:
-                        zipf.write(file_path, file_path.name)
-                
-                return send_file(
-                    zip_path,
-                    as_attachment=True,
-                    download_name=zip_filename
-                )
+            # Identical requests against the same catalog are served from the response cache
+            logger.info(f"Curriculum download: {role_id} EQF {eqf_level} {ects} ECTS ({', '.join(formats)})")
+            entry = curriculum_download(role_id, eqf_level, ects, formats)
+            return entry.to_response()
         
         except Exception as e:
             logger.error(f"Curriculum generation error: {e}")
@@ -225,31 +340,18 @@ def create_app(config_name='development'):
             return jsonify({'error': 'ECM components not available'}), 500
         
         try:
-            visual_mapping = request.form.get('visual_mapping') == 'on'
+            generator = shared_generator()
             
-            # Initialize generator
-            generator = EnhancedD4SCurriculumGenerator(visual_mapping=visual_mapping)
-            
-            # Generate all curricula
+            # Stream the ZIP: each curriculum's entries go out as soon as it is generated
             logger.info("Generating all 10 standard curricula...")
-            generated_files = generator.generate_all_curricula()
-            
-            # Create ZIP with all generated files
             timestamp = datetime.now().strftime('%Y%m%d_%H%M')
             zip_filename = f"ECM_All_Curricula_{timestamp}.zip"
             
-            with tempfile.NamedTemporaryFile(suffix='.zip', delete=False) as temp_zip:
-                with zipfile.ZipFile(temp_zip.name, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                    for file_path in generated_files:
-                        file_path = Path(file_path)
-                        if file_path.exists():
-                            zipf.write(file_path, file_path.name)
-                
-                return send_file(
-                    temp_zip.name,
-                    as_attachment=True,
-                    download_name=zip_filename
-                )
+            return Response(
+                stream_with_context(stream_zip(generator.iter_curricula_artifacts())),
+                mimetype='application/zip',
+                headers={'Content-Disposition': f'attachment; filename="{zip_filename}"'}
+            )
         
         except Exception as e:
             logger.error(f"All curricula generation error: {e}")
@@ -257,6 +359,49 @@ def create_app(config_name='development'):
             flash(f'Generation error: {str(e)}', 'error')
             return redirect(url_for('generator'))
     
+    @app.route('/jobs/<kind>', methods=['POST'])
+    def submit_job(kind):
+        """Queue a generation job; returns immediately with its status and result URLs"""
+        if job_runner is None:
+            return jsonify({'error': 'ECM components not available'}), 500
+        if kind not in JOB_HANDLERS:
+            return jsonify({'error': f'Unknown job kind: {kind}', 'kinds': sorted(JOB_HANDLERS)}), 404
+        
+        params = request.get_json(silent=True) or request.form.to_dict()
+        job = job_runner.broker.submit(kind, params)
+        # Worker threads start on first use, in the process that serves requests
+        job_runner.start()
+        
+        return jsonify({
+            'job_id': job.id,
+            'status': job.status,
+            'status_url': url_for('job_status', job_id=job.id),
+            'result_url': url_for('job_result', job_id=job.id)
+        }), 202
+    
+    @app.route('/jobs/<job_id>', methods=['GET'])
+    def job_status(job_id):
+        """Job status record"""
+        job = job_runner.broker.get(job_id) if job_runner else None
+        if job is None:
+            return jsonify({'error': 'Unknown job'}), 404
+        return jsonify(job.to_dict())
+    
+    @app.route('/jobs/<job_id>/result')
+    def job_result(job_id):
+        """Result of a finished job; 409 while it is still queued or running"""
+        job = job_runner.broker.get(job_id) if job_runner else None
+        if job is None:
+            return jsonify({'error': 'Unknown job'}), 404
+        result = job_runner.broker.result(job_id)
+        if result is None:
+            status_code = 500 if job.status == 'failed' else 409
+            return jsonify({'error': job.error or 'Job not finished', 'status': job.status}), status_code
+        if result.filename:
+            return send_file(BytesIO(result.data), mimetype=result.content_type,
+                             as_attachment=True, download_name=result.filename)
+        return app.response_class(result.data, mimetype=result.content_type)
+    
     @app.route('/analysis')
     def analysis():
         """Analysis dashboard"""
@@ -307,6 +452,22 @@ def create_app(config_name='development'):
             'timestamp': datetime.now().isoformat()
         })
     
+    @app.route('/health')
+    def health():
+        """Liveness check (Docker HEALTHCHECK)"""
+        return jsonify({
+            'status': 'ok' if ECM_AVAILABLE else 'degraded',
+            'ecm_available': ECM_AVAILABLE,
+            'pid': os.getpid(),
+            'timestamp': datetime.now().isoformat()
+        })
+    
+    @app.route('/metrics')
+    def metrics():
+        """Prometheus metrics: histograms of all workers with ECM_METRICS_DIR set,
+        otherwise of this worker (pid label); cache counters are per worker (pid label)"""
+        return Response(REGISTRY.render(), content_type=METRICS_CONTENT_TYPE)
+    
     @app.route('/check_dependencies')
     def check_dependencies():
         """Check system dependencies"""
@@ -6,23 +6,33 @@ Integrates all enhanced features: D2.1 compliance, smart module selection, bulk
 
 from flask import Flask, render_template, request, jsonify, send_file, flash, redirect, url_for
 import json
-import subprocess
 import sys
 from pathlib import Path
 from datetime import datetime
 import os
 import tempfile
+import threading
 import zipfile
 from typing import Dict, List, Any, Optional
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError as FuturesTimeoutError
+from concurrent.futures.process import BrokenProcessPool
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from ecm.catalog import compute_content_hash
+from ecm.jobs import JobResult, JobRunner, broker_from_environment
+from ecm.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, REGISTRY, register_cache
+from ecm.module_facets import DEFAULT_PAGE_SIZE, FacetQuery, ModuleFacetIndex
+from ecm.response_cache import CachedResponse, ResponseCache
+
 # Import enhanced components
 try:
     from scripts.curriculum_generator.components.enhanced_module_selector import EnhancedModuleSelector
     from scripts.curriculum_generator.components.content_specificity_engine import ContentSpecificityEngine
+    from scripts.curriculum_generator.main_enhanced_uol_final_fixed_v2 import init_pool_worker, generate_in_pool_worker
+    from ecm.catalog import get_catalog_snapshot
     ENHANCED_FEATURES_AVAILABLE = True
 except ImportError as e:
     print(f"⚠️ Enhanced features not available: {e}")
@@ -31,20 +41,42 @@ except ImportError as e:
 app = Flask(__name__)
 app.secret_key = 'dscg_enhanced_secret_key_2025'
 
+# Role metadata and module previews; CACHE_TYPE selects the backend
+response_cache = ResponseCache(app)
+
+# Generation worker processes, each with the catalog and knowledge bases preloaded
+GENERATION_WORKERS = int(os.environ.get('GENERATION_WORKERS', 2))
+
+# D2.1 priority bulk run: one programme per gap tracked on the dashboard, for a
+# role whose content preferences cover it (ContentSpecificityEngine.role_preferences)
+D21_PRIORITY_CURRICULA = [
+    {"role": "DAN", "eqf_level": 6, "ects": 10.0, "uol": 4, "topic": "ESG Data Analysis and Reporting"},
+    {"role": "DSM", "eqf_level": 6, "ects": 10.0, "uol": 4, "topic": "Sustainability Program Management"},
+    {"role": "SDD", "eqf_level": 6, "ects": 10.0, "uol": 4, "topic": "Sustainable Software Development"}
+]
+
 class EnhancedDSCGWebInterface:
     """Enhanced web interface with intelligent module selection and D2.1 compliance"""
     
     def __init__(self):
         self.project_root = project_root
         if ENHANCED_FEATURES_AVAILABLE:
-            self.module_selector = EnhancedModuleSelector(project_root)
-            self.content_engine = ContentSpecificityEngine(project_root)
+            # One shared catalog snapshot for all components
+            self.catalog = get_catalog_snapshot()
+            self.module_selector = EnhancedModuleSelector(catalog=self.catalog)
+            self.content_engine = ContentSpecificityEngine(catalog=self.catalog)
         else:
             self.module_selector = None
             self.content_engine = None
         
         self.roles_data = self._load_roles()
+        self.roles_version = compute_content_hash(self.roles_data)[:12]
         self.generation_history = []
+        # Created on first use, so forked server workers each get their own pool
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        # Timed-out generations still occupying a worker (running work cannot be cancelled)
+        self._timed_out = set()
         
     def _load_roles(self) -> Dict[str, Any]:
         """Load role definitions"""
@@ -57,6 +89,16 @@ class EnhancedDSCGWebInterface:
             print(f"❌ Error loading roles: {e}")
             return {}
     
+    @property
+    def catalog_version(self) -> str:
+        """Content version of the catalog and roles, part of every response cache key"""
+        catalog = self.catalog.version if ENHANCED_FEATURES_AVAILABLE else 'unavailable'
+        return f"{catalog}:{self.roles_version}"
+    
+    def module_facets(self) -> ModuleFacetIndex:
+        """Facet index of the current catalog snapshot, built once per snapshot"""
+        return ModuleFacetIndex.for_snapshot(self.catalog, self.module_selector.classify_module_content)
+    
     def get_role_info(self, role_id: str) -> Dict[str, Any]:
         """Get detailed role information"""
         role = self.roles_data.get(role_id, {})
@@ -103,116 +145,157 @@ class EnhancedDSCGWebInterface:
         except Exception as e:
             return {"error": f"Module selection failed: {str(e)}"}
     
+    def _generation_pool(self) -> ProcessPoolExecutor:
+        """Persistent worker processes with the catalog and knowledge bases preloaded"""
+        # Request and job threads race for the first pool; only one may create it
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=GENERATION_WORKERS,
+                    initializer=init_pool_worker
+                )
+            return self._pool
+    
+    def _discard_pool(self, pool: ProcessPoolExecutor) -> None:
+        """Drop a broken pool, unless another thread has already replaced it"""
+        with self._pool_lock:
+            if self._pool is pool:
+                self._pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+    
+    def _collect(self, futures: List[Future], timeout: float) -> List[Dict[str, Any]]:
+        """Wait for pool results; on timeout, cancel what is still queued and track what is running"""
+        try:
+            return [future.result(timeout=timeout) for future in futures]
+        except FuturesTimeoutError:
+            for future in futures:
+                if not future.cancel() and not future.done():
+                    self._timed_out.add(future)
+                    future.add_done_callback(self._timed_out.discard)
+            raise
+    
+    @property
+    def timed_out_generations(self) -> int:
+        """Generations that timed out but are still running in a worker"""
+        return len(self._timed_out)
+    
+    def _run_in_pool(self, options: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        """Generate one curriculum in the pool; the result is the generator's structured record"""
+        pool = self._generation_pool()
+        try:
+            return self._collect([pool.submit(generate_in_pool_worker, options)], timeout)[0]
+        except BrokenProcessPool as e:
+            # A worker died (or failed to preload); start a fresh pool on the next request
+            self._discard_pool(pool)
+            return {"success": False, "error": f"Generation worker failed: {e}"}
+    
     def generate_curriculum_enhanced(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """Generate curriculum with enhanced features"""
+        if not ENHANCED_FEATURES_AVAILABLE:
+            return {"success": False, "error": "Enhanced generator not available", "enhanced_features_used": False}
+        
         try:
-            # Build command for enhanced generation
-            cmd = [
-                "python3", 
-                str(self.project_root / "scripts/curriculum_generator/main_enhanced_uol_final_fixed_v2.py"),
-                "--role", config["role"],
-                "--eqf-level", str(config["eqf_level"]),
-                "--ects", str(config["ects"]),
-                "--uol", str(config["uol"]),
-                "--topic", config["topic"],
-                "--theme", config.get("theme", "eu_official"),
-                "--output-json",
-                "--force"
-            ]
-            
-            if config.get("generate_docx", False):
-                cmd.append("--output-docx")
-            
-            # Execute generation
-            result = subprocess.run(cmd, capture_output=True, text=True, 
-                                  cwd=self.project_root, timeout=120)
+            options = {
+                "role": config["role"],
+                "eqf_level": int(config["eqf_level"]),
+                "ects": float(config["ects"]),
+                "uol": int(config["uol"]),
+                "topic": config["topic"],
+                "theme": config.get("theme", "eu_official"),
+                "output_json": True,
+                "output_docx": bool(config.get("generate_docx", False)),
+                "force": True
+            }
             
-            success = result.returncode == 0
+            result = self._run_in_pool(options, timeout=120)
             
-            if success:
-                # Extract generated files information
-                output_lines = result.stdout.split('\n')
-                generated_files = []
-                compliance_score = None
-                d21_gaps = {}
-                
-                for line in output_lines:
-                    if "Generated" in line and ("JSON:" in line or "HTML:" in line or "DOCX:" in line):
-                        generated_files.append(line.strip())
-                    elif "Role Alignment:" in line:
-                        try:
-                            compliance_score = float(line.split("Role Alignment:")[1].split("%")[0].strip())
-                        except:
-                            pass
-                    elif "ESG Depth:" in line:
-                        d21_gaps["esg_depth"] = "Covered" in line
-                    elif "Regulatory Skills:" in line:
-                        d21_gaps["regulatory_skills"] = "Covered" in line
-                    elif "Technical Implementation:" in line:
-                        d21_gaps["technical_implementation"] = "Covered" in line
-                
+            if result["success"]:
                 # Store in generation history
                 generation_record = {
                     "config": config,
                     "timestamp": datetime.now().isoformat(),
                     "success": True,
-                    "compliance_score": compliance_score,
-                    "d21_gaps_addressed": d21_gaps,
-                    "generated_files": generated_files
+                    "compliance_score": result["role_alignment"],
+                    "d21_gaps_addressed": result["d21_gaps_addressed"],
+                    "generated_files": result["generated_files"]
                 }
                 self.generation_history.append(generation_record)
                 
                 return {
                     "success": True,
                     "message": "Curriculum generated successfully with enhanced module selection",
-                    "compliance_score": compliance_score,
-                    "d21_gaps_addressed": d21_gaps,
-                    "generated_files": generated_files,
+                    "compliance_score": result["role_alignment"],
+                    "d21_gaps_addressed": result["d21_gaps_addressed"],
+                    "generated_files": result["generated_files"],
+                    "curriculum": result,
                     "enhanced_features_used": True
                 }
             else:
-                error_msg = result.stderr if result.stderr else "Unknown generation error"
                 return {
                     "success": False,
-                    "error": error_msg,
+                    "error": result.get("error") or "Unknown generation error",
                     "enhanced_features_used": ENHANCED_FEATURES_AVAILABLE
                 }
                 
-        except subprocess.TimeoutExpired:
+        except FuturesTimeoutError:
             return {"success": False, "error": "Generation timeout (120 seconds)"}
         except Exception as e:
             return {"success": False, "error": f"Generation exception: {str(e)}"}
     
     def bulk_generate_d21_priority(self) -> Dict[str, Any]:
         """Run bulk generation for D2.1 priority areas"""
+        if not ENHANCED_FEATURES_AVAILABLE:
+            return {"success": False, "error": "Enhanced generator not available"}
+        
         try:
-            cmd = [
-                "python3",
-                str(self.project_root / "scripts/enhanced_bulk_generator.py"),
-                "--mode", "d21-priority",
-                "--formats", "json", "html"
+            pool = self._generation_pool()
+            futures = [
+                pool.submit(generate_in_pool_worker, dict(options, output_json=True, force=True))
+                for options in D21_PRIORITY_CURRICULA
             ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, 
-                                  cwd=self.project_root, timeout=600)
-            
-            if result.returncode == 0:
-                return {
-                    "success": True,
-                    "message": "D2.1 priority curricula generated successfully",
-                    "output": result.stdout
-                }
-            else:
-                return {
-                    "success": False,
-                    "error": result.stderr or "Bulk generation failed"
-                }
+            results = self._collect(futures, timeout=600)
+        except BrokenProcessPool as e:
+            self._discard_pool(pool)
+            return {"success": False, "error": f"Generation worker failed: {e}"}
+        except FuturesTimeoutError:
+            return {"success": False, "error": "Bulk generation timeout (600 seconds per curriculum)"}
         except Exception as e:
             return {"success": False, "error": str(e)}
+        
+        failed = [result for result in results if not result["success"]]
+        if failed:
+            return {
+                "success": False,
+                "error": "; ".join(result["error"] for result in failed),
+                "curricula": results
+            }
+        return {
+            "success": True,
+            "message": "D2.1 priority curricula generated successfully",
+            "curricula": results
+        }
 
 # Initialize enhanced interface
 enhanced_interface = EnhancedDSCGWebInterface()
 
+# Background jobs run on the shared interface, so its selectors and catalog stay warm
+JOB_HANDLERS = {
+    'curriculum': lambda params, state: JobResult.from_json(enhanced_interface.generate_curriculum_enhanced(params)),
+    'bulk_d21': lambda params, state: JobResult.from_json(enhanced_interface.bulk_generate_d21_priority())
+}
+job_runner = JobRunner(
+    broker_from_environment(project_root / "output" / "jobs" / "jobs.sqlite3", namespace='enhanced_app'),
+    JOB_HANDLERS,
+    workers=int(os.environ.get('JOB_WORKERS', 2))
+)
+
+# Sampled when /metrics is scraped; generation itself runs in the pool processes,
+# whose stage timings reach /metrics through ECM_METRICS_DIR
+register_cache('response', response_cache.stats)
+REGISTRY.gauge('ecm_job_queue_depth', 'Generation jobs waiting for a worker', job_runner.broker.queue_depth)
+REGISTRY.gauge('ecm_generation_timed_out_running', 'Timed-out generations still occupying a pool worker',
+               lambda: enhanced_interface.timed_out_generations)
+
 @app.route('/')
 def index():
     """Enhanced home page"""
@@ -227,21 +310,28 @@ def generator():
                          roles=enhanced_interface.roles_data,
                          enhanced_available=ENHANCED_FEATURES_AVAILABLE)
 
-@app.route('/api/preview_modules', methods=['POST'])
+@app.route('/api/preview_modules', methods=['GET', 'POST'])
 def api_preview_modules():
-    """API endpoint for module selection preview"""
-    data = request.json
+    """API endpoint for module selection preview (JSON body, or query string for cacheable GETs)"""
+    data = request.json if request.method == 'POST' else request.args
     
     if not enhanced_interface.module_selector:
         return jsonify({"error": "Enhanced module selection not available"})
     
-    preview = enhanced_interface.preview_module_selection(
-        data.get('role'),
-        data.get('topic', 'Digital Sustainability'),
-        int(data.get('eqf_level', 6))
-    )
+    params = {
+        "role": data.get('role'),
+        "topic": data.get('topic', 'Digital Sustainability'),
+        "eqf_level": int(data.get('eqf_level', 6))
+    }
+    entry = response_cache.get('preview_modules', params, enhanced_interface.catalog_version)
+    if entry is None:
+        preview = enhanced_interface.preview_module_selection(params['role'], params['topic'], params['eqf_level'])
+        entry = CachedResponse.from_json(preview)
+        # Failed selections are retried on the next request
+        if preview.get('success'):
+            response_cache.set('preview_modules', params, enhanced_interface.catalog_version, entry)
     
-    return jsonify(preview)
+    return entry.to_response()
 
 @app.route('/api/generate_curriculum', methods=['POST'])
 def api_generate_curriculum():
@@ -257,11 +347,71 @@ def api_bulk_generate_d21():
     result = enhanced_interface.bulk_generate_d21_priority()
     return jsonify(result)
 
+@app.route('/api/jobs/<kind>', methods=['POST'])
+def api_submit_job(kind):
+    """API endpoint queueing a generation job; returns immediately"""
+    if kind not in JOB_HANDLERS:
+        return jsonify({"error": f"Unknown job kind: {kind}", "kinds": sorted(JOB_HANDLERS)}), 404
+    
+    job = job_runner.broker.submit(kind, request.get_json(silent=True) or {})
+    job_runner.start()
+    
+    return jsonify({
+        "job_id": job.id,
+        "status": job.status,
+        "status_url": url_for('api_job_status', job_id=job.id),
+        "result_url": url_for('api_job_result', job_id=job.id)
+    }), 202
+
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def api_job_status(job_id):
+    """API endpoint for job status"""
+    job = job_runner.broker.get(job_id)
+    if job is None:
+        return jsonify({"error": "Unknown job"}), 404
+    return jsonify(job.to_dict())
+
+@app.route('/api/jobs/<job_id>/result')
+def api_job_result(job_id):
+    """API endpoint for the result of a finished job"""
+    job = job_runner.broker.get(job_id)
+    if job is None:
+        return jsonify({"error": "Unknown job"}), 404
+    result = job_runner.broker.result(job_id)
+    if result is None:
+        status_code = 500 if job.status == 'failed' else 409
+        return jsonify({"error": job.error or "Job not finished", "status": job.status}), status_code
+    return app.response_class(result.data, mimetype=result.content_type)
+
 @app.route('/api/role_info/<role_id>')
 def api_role_info(role_id):
     """API endpoint for detailed role information"""
-    role_info = enhanced_interface.get_role_info(role_id)
-    return jsonify(role_info)
+    entry = response_cache.get_or_build(
+        'role_info', {"role": role_id}, enhanced_interface.catalog_version,
+        lambda: CachedResponse.from_json(enhanced_interface.get_role_info(role_id))
+    )
+    return entry.to_response()
+
+@app.route('/health')
+def health():
+    """Liveness check"""
+    return jsonify({
+        "status": "ok" if ENHANCED_FEATURES_AVAILABLE else "degraded",
+        "enhanced_available": ENHANCED_FEATURES_AVAILABLE,
+        "pid": os.getpid(),
+        "timestamp": datetime.now().isoformat()
+    })
+
+@app.teardown_request
+def flush_metrics(error=None):
+    # With ECM_METRICS_DIR set, /metrics on any worker includes this request's stages
+    REGISTRY.flush()
+
+@app.route('/metrics')
+def metrics():
+    """Prometheus metrics: histograms of all server and pool processes with ECM_METRICS_DIR
+    set, otherwise of this process only (pid label); cache counters are per process (pid label)"""
+    return app.response_class(REGISTRY.render(), content_type=METRICS_CONTENT_TYPE)
 
 @app.route('/dashboard')
 def dashboard():
@@ -303,29 +453,43 @@ def modules():
         flash("Enhanced module features not available", "warning")
         return redirect(url_for('index'))
     
-    # Get module statistics
-    modules = enhanced_interface.module_selector.modules_data
+    # Counts come from the per-snapshot facet index, not a walk over every module
+    facets = enhanced_interface.module_facets()
     module_stats = {
-        "total_modules": len(modules),
-        "by_category": {},
-        "by_eqf_level": {},
-        "by_thematic_area": {}
+        "total_modules": len(facets),
+        "by_category": facets.counts["category"],
+        "by_eqf_level": {f"EQF {eqf}": count for eqf, count in facets.counts["eqf"].items()},
+        "by_thematic_area": facets.counts["thematic_area"]
     }
     
-    for module in modules:
-        categories = enhanced_interface.module_selector.classify_module_content(module)
-        for category in categories:
-            module_stats["by_category"][category] = module_stats["by_category"].get(category, 0) + 1
-        
-        eqf = module.get("eqf_level", 6)
-        module_stats["by_eqf_level"][f"EQF {eqf}"] = module_stats["by_eqf_level"].get(f"EQF {eqf}", 0) + 1
-        
-        area = module.get("thematic_area", "General")
-        module_stats["by_thematic_area"][area] = module_stats["by_thematic_area"].get(area, 0) + 1
-    
     return render_template('enhanced_modules.html', 
                          module_stats=module_stats,
-                         sample_modules=modules[:10])  # Show first 10 as samples
+                         facets=facets.counts,
+                         sample_modules=enhanced_interface.module_selector.modules_data[:10])  # Show first 10 as samples
+
+@app.route('/api/modules')
+def api_modules():
+    """API endpoint for module search: ?facet=name:value (repeatable), q=text, page=, per_page="""
+    if not enhanced_interface.module_selector:
+        return jsonify({"error": "Enhanced module features not available"}), 503
+    
+    try:
+        query = FacetQuery.from_args(
+            request.args.getlist('facet'),
+            request.args.get('q'),
+            request.args.get('page', 1),
+            request.args.get('per_page', DEFAULT_PAGE_SIZE)
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    
+    params = {"facet": sorted(request.args.getlist('facet')), "q": query.q,
+              "page": query.page, "per_page": query.per_page}
+    entry = response_cache.get_or_build(
+        'modules', params, enhanced_interface.catalog_version,
+        lambda: CachedResponse.from_json(enhanced_interface.module_facets().search(query))
+    )
+    return entry.to_response()
 
 if __name__ == '__main__':
     print("🚀 Starting Enhanced DSCG Web Interface")